@@ -564,6 +564,8 @@ cdef CObjectLocationPtrToDict(CObjectLocation* c_object_location):
             The hex IDs of the nodes that have a copy of this object.
         - object_size:
             The size of data + metadata in bytes.
+        - did_spill:
+            Whether the object has been spilled to external storage.
     """
     object_size = c_object_location.GetObjectSize()
 
@@ -586,6 +588,7 @@ cdef CObjectLocationPtrToDict(CObjectLocation* c_object_location):
     return {
         "node_ids": list(node_ids),
         "object_size": object_size,
+        "did_spill": c_object_location.IsSpilled(),
     }
 
 
@@ -1,6 +1,6 @@
 import os
 import warnings
-from typing import Dict, List, Optional, Union, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Union, Any
 
 import numpy as np
 import pandas as pd
@@ -9,6 +9,9 @@ import torch
 import ray
 from ray.air.util.data_batch_conversion import _unwrap_ndarray_object_type_if_needed
 
+if TYPE_CHECKING:
+    import pyarrow
+
 
 def get_device() -> Union[torch.device, List[torch.device]]:
     """Gets the correct torch device configured for this process.
@@ -175,6 +178,7 @@ def convert_ndarray_to_torch_tensor(
     ndarray: np.ndarray,
     dtype: Optional[torch.dtype] = None,
     device: Optional[str] = None,
+    pin_memory: bool = False,
 ) -> torch.Tensor:
     """Convert a NumPy ndarray to a Torch Tensor.
 
@@ -184,6 +188,8 @@ def convert_ndarray_to_torch_tensor(
             inferred from the NumPy ndarray data.
         device: The device on which the tensor(s) should be placed; if None, the Torch
             tensor(s) will be constructed on the CPU.
+        pin_memory: Whether to stage the tensor in pinned memory, so that it's copied
+            to the device asynchronously. Ignored if CUDA is not available.
 
     Returns: A Torch Tensor.
     """
@@ -206,13 +212,17 @@ def convert_ndarray_to_torch_tensor(
     # torch/csrc/utils/tensor_numpy.cpp#L198-L206
     with warnings.catch_warnings():
         warnings.simplefilter("ignore")
-        return torch.as_tensor(ndarray, dtype=dtype, device=device)
+        if not _should_pin_memory(pin_memory):
+            return torch.as_tensor(ndarray, dtype=dtype, device=device)
+        tensor = torch.as_tensor(ndarray, dtype=dtype).pin_memory()
+    return _to_device(tensor, device=device)
 
 
 def convert_ndarray_batch_to_torch_tensor_batch(
     ndarrays: Union[np.ndarray, Dict[str, np.ndarray]],
     dtypes: Optional[Union[torch.dtype, Dict[str, torch.dtype]]] = None,
     device: Optional[str] = None,
+    pin_memory: bool = False,
 ) -> Union[torch.Tensor, Dict[str, torch.Tensor]]:
     """Convert a NumPy ndarray batch to a Torch Tensor batch.
 
@@ -222,19 +232,17 @@ def convert_ndarray_batch_to_torch_tensor_batch(
             will be inferred from the NumPy ndarray data.
         device: The device on which the tensor(s) should be placed; if None, the Torch
             tensor(s) will be constructed on the CPU.
+        pin_memory: Whether to stage the tensor(s) in pinned memory, so that they're
+            copied to the device asynchronously. Ignored if CUDA is not available.
 
     Returns: A (dict of) Torch Tensor(s).
     """
     if isinstance(ndarrays, np.ndarray):
         # Single-tensor case.
-        if isinstance(dtypes, dict):
-            if len(dtypes) != 1:
-                raise ValueError(
-                    "When constructing a single-tensor batch, only a single dtype "
-                    f"should be given, instead got: {dtypes}"
-                )
-            dtypes = next(iter(dtypes.values()))
-        batch = convert_ndarray_to_torch_tensor(ndarrays, dtype=dtypes, device=device)
+        dtypes = _get_single_tensor_dtype(dtypes)
+        batch = convert_ndarray_to_torch_tensor(
+            ndarrays, dtype=dtypes, device=device, pin_memory=pin_memory
+        )
     else:
         # Multi-tensor case.
         batch = {
@@ -242,6 +250,7 @@ def convert_ndarray_batch_to_torch_tensor_batch(
                 col_ndarray,
                 dtype=dtypes[col_name] if isinstance(dtypes, dict) else dtypes,
                 device=device,
+                pin_memory=pin_memory,
             )
             for col_name, col_ndarray in ndarrays.items()
         }
@@ -249,6 +258,158 @@ def convert_ndarray_batch_to_torch_tensor_batch(
     return batch
 
 
+def convert_arrow_batch_to_torch_tensor_batch(
+    table: "pyarrow.Table",
+    dtypes: Optional[Union[torch.dtype, Dict[str, torch.dtype]]] = None,
+    device: Optional[str] = None,
+    pin_memory: bool = False,
+) -> Union[torch.Tensor, Dict[str, torch.Tensor]]:
+    """Convert an Arrow table batch to a Torch Tensor batch.
+
+    Fixed-shape tensor columns and numeric columns without nulls are converted
+    directly from their Arrow buffers. If a column has a single chunk (and no pinned
+    staging is requested), the CPU tensor is a zero-copy view of the Arrow buffer;
+    otherwise its chunks are copied once into a single (pinned) tensor. All other
+    columns are converted through NumPy, as in
+    `convert_ndarray_batch_to_torch_tensor_batch`.
+
+    Args:
+        table: The Arrow table that we wish to convert to a Torch Tensor batch.
+        dtypes: A (dict of) Torch dtype(s) for the created tensor; if None, the dtype
+            will be inferred from the column data.
+        device: The device on which the tensor(s) should be placed; if None, the Torch
+            tensor(s) will be constructed on the CPU.
+        pin_memory: Whether to stage the tensor(s) in pinned memory, so that they're
+            copied to the device asynchronously. Ignored if CUDA is not available.
+
+    Returns: A (dict of) Torch Tensor(s), with the same structure as the NumPy batch
+        format of the table.
+    """
+    from ray.data.block import BlockAccessor
+
+    accessor = BlockAccessor.for_block(table)
+    if accessor.is_tensor_wrapper():
+        # Single-tensor case.
+        return _convert_arrow_column_to_torch_tensor(
+            accessor,
+            table.column_names[0],
+            dtype=_get_single_tensor_dtype(dtypes),
+            device=device,
+            pin_memory=pin_memory,
+        )
+    # Multi-tensor case.
+    return {
+        col_name: _convert_arrow_column_to_torch_tensor(
+            accessor,
+            col_name,
+            dtype=dtypes[col_name] if isinstance(dtypes, dict) else dtypes,
+            device=device,
+            pin_memory=pin_memory,
+        )
+        for col_name in table.column_names
+    }
+
+
+def _convert_arrow_column_to_torch_tensor(
+    accessor: "ray.data._internal.arrow_block.ArrowBlockAccessor",
+    col_name: str,
+    dtype: Optional[torch.dtype],
+    device: Optional[str],
+    pin_memory: bool,
+) -> torch.Tensor:
+    views = _get_arrow_column_ndarray_views(accessor.to_arrow()[col_name])
+    if not views:
+        # The column can't be viewed without copying, or is empty.
+        return convert_ndarray_to_torch_tensor(
+            accessor.to_numpy(col_name),
+            dtype=dtype,
+            device=device,
+            pin_memory=pin_memory,
+        )
+    pin_memory = _should_pin_memory(pin_memory)
+    if len(views) == 1 and not pin_memory:
+        return convert_ndarray_to_torch_tensor(views[0], dtype=dtype, device=device)
+    # Copy the chunks into a single staging tensor.
+    shape = (sum(len(view) for view in views),) + views[0].shape[1:]
+    staging = torch.empty(
+        shape, dtype=_get_torch_dtype(views[0].dtype), pin_memory=pin_memory
+    )
+    staging_ndarray = staging.numpy()
+    offset = 0
+    for view in views:
+        staging_ndarray[offset : offset + len(view)] = view
+        offset += len(view)
+    return _to_device(staging, device=device, dtype=dtype)
+
+
+def _get_arrow_column_ndarray_views(
+    column: "pyarrow.ChunkedArray",
+) -> Optional[List[np.ndarray]]:
+    """Return zero-copy NumPy views of the chunks of the column, or None if the
+    column can't be converted without copying.
+    """
+    import pyarrow
+
+    from ray.air.util.tensor_extensions.arrow import ArrowTensorType
+
+    if isinstance(column.type, ArrowTensorType):
+        value_type = column.type.storage_type.value_type
+    else:
+        value_type = column.type
+    # Boolean arrays are bit-packed, so they can't be viewed by NumPy.
+    if not (
+        pyarrow.types.is_integer(value_type) or pyarrow.types.is_floating(value_type)
+    ):
+        return None
+    views = []
+    for chunk in column.chunks:
+        if chunk.null_count > 0:
+            return None
+        if isinstance(column.type, ArrowTensorType):
+            # This creates an ndarray view of the tensor storage buffer.
+            views.append(chunk.to_numpy())
+        else:
+            views.append(chunk.to_numpy(zero_copy_only=True))
+    return views
+
+
+def _get_single_tensor_dtype(
+    dtypes: Optional[Union[torch.dtype, Dict[str, torch.dtype]]],
+) -> Optional[torch.dtype]:
+    if isinstance(dtypes, dict):
+        if len(dtypes) != 1:
+            raise ValueError(
+                "When constructing a single-tensor batch, only a single dtype "
+                f"should be given, instead got: {dtypes}"
+            )
+        dtypes = next(iter(dtypes.values()))
+    return dtypes
+
+
+def _get_torch_dtype(dtype: np.dtype) -> torch.dtype:
+    return torch.from_numpy(np.empty(0, dtype=dtype)).dtype
+
+
+def _should_pin_memory(pin_memory: bool) -> bool:
+    return pin_memory and torch.cuda.is_available()
+
+
+def _to_device(
+    tensor: torch.Tensor,
+    device: Optional[str] = None,
+    dtype: Optional[torch.dtype] = None,
+) -> torch.Tensor:
+    """Move the tensor to the device and dtype, if given.
+
+    Pinned tensors are copied to the device asynchronously.
+    """
+    if device is not None:
+        tensor = tensor.to(device=device, non_blocking=tensor.is_pinned())
+    if dtype is not None:
+        tensor = tensor.to(dtype=dtype)
+    return tensor
+
+
 def load_torch_model(
     saved_model: Union[torch.nn.Module, Dict],
     model_definition: Optional[torch.nn.Module] = None,
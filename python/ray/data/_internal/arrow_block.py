@@ -8,6 +8,7 @@ from typing import (
     Dict,
     Iterator,
     List,
+    NamedTuple,
     Optional,
     Tuple,
     TypeVar,
@@ -25,7 +26,7 @@ from ray.data._internal.numpy_support import (
 )
 from ray.data._internal.table_block import TableBlockAccessor, TableBlockBuilder
 from ray.data._internal.util import _truncated_repr
-from ray.data.aggregate import AggregateFn
+from ray.data.aggregate import AggregateFn, Count, Max, Mean, Min, Sum
 from ray.data.block import (
     Block,
     BlockAccessor,
@@ -47,6 +48,7 @@ if TYPE_CHECKING:
     import pandas
 
     from ray.data._internal.sort import SortKeyT
+    from ray.data.expressions import Expr
 
 
 T = TypeVar("T")
@@ -329,6 +331,60 @@ class ArrowBlockAccessor(TableBlockAccessor):
             )
         return self._table.select(columns)
 
+    def eval_expr(self, expr: "Expr") -> "pyarrow.ChunkedArray":
+        """Evaluate the expression on the rows of this block.
+
+        The expression is compiled to ``pyarrow.compute`` calls on the columns of the
+        block, so no Python code runs per row.
+        """
+        import pyarrow as pa
+
+        result = self._eval_expr(expr)
+        if isinstance(result, pa.Scalar):
+            # The expression doesn't depend on any column.
+            result = pa.chunked_array(
+                [pa.repeat(result, self._table.num_rows)], type=result.type
+            )
+        return result
+
+    def _eval_expr(
+        self, expr: "Expr"
+    ) -> Union["pyarrow.ChunkedArray", "pyarrow.Scalar"]:
+        import pyarrow as pa
+        import pyarrow.compute as pac
+
+        from ray.data.expressions import _CallExpr, _ColumnExpr, _LiteralExpr
+
+        if isinstance(expr, _ColumnExpr):
+            if expr.name not in self._table.column_names:
+                raise ValueError(
+                    f"Column {expr.name!r} of the expression {expr} doesn't exist. "
+                    f"The available columns are {self._table.column_names}."
+                )
+            return self._table[expr.name]
+        elif isinstance(expr, _LiteralExpr):
+            return pa.scalar(expr.value)
+        elif isinstance(expr, _CallExpr):
+            args = [self._eval_expr(arg) for arg in expr.args]
+            return pac.call_function(expr.function, args, expr.function_options())
+        else:
+            raise ValueError(f"Unsupported expression: {expr!r}")
+
+    def with_column(self, name: str, expr: "Expr") -> "pyarrow.Table":
+        """Return this block with the column set to the values of the expression.
+
+        The column is appended if it doesn't exist yet.
+        """
+        column = self.eval_expr(expr)
+        if name in self._table.column_names:
+            i = self._table.column_names.index(name)
+            return self._table.set_column(i, name, column)
+        return self._table.append_column(name, column)
+
+    def filter(self, expr: "Expr") -> "pyarrow.Table":
+        """Return the rows of this block for which the expression is true."""
+        return self._table.filter(self.eval_expr(expr))
+
     def _sample(self, n_samples: int, key: "SortKeyT") -> "pyarrow.Table":
         indices = random.sample(range(self._table.num_rows), n_samples)
         table = self._table.select([k[0] for k in key])
@@ -649,6 +705,240 @@ class ArrowBlockAccessor(TableBlockAccessor):
         ret = builder.build()
         return ret, ArrowBlockAccessor(ret).get_metadata(None, exec_stats=stats.build())
 
+    @staticmethod
+    def supports_hash_aggregate(
+        key: Optional[str],
+        aggs: Tuple[AggregateFn],
+        schema: Optional[Union[type, "pyarrow.lib.Schema"]],
+    ) -> bool:
+        """Return whether `hash_combine` can compute the grouped aggregations.
+
+        This requires Arrow 7.0.0+, a primitive key column, and only count, sum,
+        min, max and mean aggregations on numeric columns.
+        """
+        from pkg_resources._vendor.packaging.version import parse as parse_version
+
+        if pyarrow is None:
+            return False
+        pyarrow_version = _get_pyarrow_version()
+        if pyarrow_version is not None and parse_version(
+            pyarrow_version
+        ) < parse_version("7.0.0"):
+            return False
+        if not isinstance(key, str) or not isinstance(schema, pyarrow.Schema):
+            return False
+        if key not in schema.names:
+            return False
+        key_type = schema.field(key).type
+        if (
+            pyarrow.types.is_nested(key_type)
+            or pyarrow.types.is_null(key_type)
+            or isinstance(key_type, pyarrow.ExtensionType)
+        ):
+            return False
+        for agg in aggs:
+            if type(agg) is Count:
+                continue
+            if type(agg) not in (Sum, Min, Max, Mean):
+                return False
+            on = agg._key_fn
+            if not isinstance(on, str) or on not in schema.names:
+                return False
+            on_type = schema.field(on).type
+            if not (
+                pyarrow.types.is_integer(on_type) or pyarrow.types.is_floating(on_type)
+            ):
+                return False
+        return True
+
+    def hash_combine(self, key: str, aggs: Tuple[AggregateFn]) -> "pyarrow.Table":
+        """Partially aggregate rows with the same key with Arrow's hash aggregation.
+
+        Unlike `combine`, this doesn't require the block to be sorted, and the
+        partial results are plain columns that can be merged by
+        `aggregate_hash_combined_blocks`.
+
+        Args:
+            key: The column name of key.
+            aggs: The aggregations to do, see `supports_hash_aggregate`.
+
+        Returns:
+            An unsorted block of [k, p_1, ..., p_m] columns where k is the groupby
+            key and p_j are the partial results of the aggregations.
+        """
+        if self._table.num_rows == 0:
+            return self._empty_table()
+        parts = _hash_aggregate_parts(aggs)
+        columns = {key: self._table[key]}
+        for part in parts:
+            columns[part.name] = self._table[part.on if part.on is not None else key]
+        combined = (
+            pyarrow.table(columns)
+            .group_by(key)
+            .aggregate([(p.name, p.map_fn, p.map_options) for p in parts])
+        )
+        columns = {key: combined[key]}
+        for part in parts:
+            columns[part.name] = combined[f"{part.name}_{part.map_fn}"]
+        return pyarrow.table(columns)
+
+    def hash_partition(self, key: str, num_partitions: int) -> List["pyarrow.Table"]:
+        """Partition the rows by the hash of their key.
+
+        Rows with the same key go to the same partition, regardless of the block
+        they come from.
+        """
+        if self._table.num_rows == 0:
+            return [self._empty_table() for _ in range(num_partitions)]
+        if num_partitions == 1:
+            return [self._table]
+        partition_ids = (
+            _hash_key_column(self._table[key]) % np.uint64(num_partitions)
+        ).astype(np.int64)
+        table = self._table.take(np.argsort(partition_ids, kind="stable"))
+        offsets = np.concatenate(
+            [[0], np.cumsum(np.bincount(partition_ids, minlength=num_partitions))]
+        )
+        return [
+            table.slice(offsets[i], offsets[i + 1] - offsets[i])
+            for i in range(num_partitions)
+        ]
+
+    @staticmethod
+    def aggregate_hash_combined_blocks(
+        blocks: List[Block],
+        key: str,
+        aggs: Tuple[AggregateFn],
+        finalize: bool,
+    ) -> Tuple[Block, BlockMetadata]:
+        """Aggregate blocks combined by `hash_combine` with the same key partition.
+
+        Args:
+            blocks: A list of partially combined blocks, in any order.
+            key: The column name of key.
+            aggs: The aggregations to do.
+            finalize: Whether to finalize the aggregation. If False, the result is
+                partially combined like the input blocks.
+
+        Returns:
+            An unsorted block of [k, v_1, ..., v_n] columns and its metadata where k
+            is the groupby key and v_i is the corresponding aggregation result for
+            the ith given aggregation.
+        """
+        import pyarrow.compute as pac
+
+        stats = BlockExecStats.builder()
+        blocks = [b for b in blocks if b.num_rows > 0]
+        if len(blocks) == 0:
+            ret = ArrowBlockAccessor._empty_table()
+            return ret, ArrowBlockAccessor(ret).get_metadata(
+                None, exec_stats=stats.build()
+            )
+
+        parts = _hash_aggregate_parts(aggs)
+        merged = (
+            transform_pyarrow.concat(blocks)
+            .group_by(key)
+            .aggregate([(p.name, p.merge_fn, p.merge_options) for p in parts])
+        )
+        merged_parts = {p.name: merged[f"{p.name}_{p.merge_fn}"] for p in parts}
+        if not finalize:
+            ret = pyarrow.table({key: merged[key], **merged_parts})
+            return ret, ArrowBlockAccessor(ret).get_metadata(
+                None, exec_stats=stats.build()
+            )
+
+        columns = {key: merged[key]}
+        count = collections.defaultdict(int)
+        for i, agg in enumerate(aggs):
+            name = agg.name
+            # Check for conflicts with existing aggregation name.
+            if count[name] > 0:
+                name = ArrowBlockAccessor._munge_conflict(name, count[name])
+            count[name] += 1
+            if type(agg) is Mean:
+                columns[name] = pac.divide(
+                    pac.cast(merged_parts[f"{i}_sum"], pyarrow.float64()),
+                    pac.cast(merged_parts[f"{i}_count"], pyarrow.float64()),
+                )
+            else:
+                columns[name] = merged_parts[f"{i}"]
+        ret = pyarrow.table(columns)
+        return ret, ArrowBlockAccessor(ret).get_metadata(None, exec_stats=stats.build())
+
+
+class _HashAggregatePart(NamedTuple):
+    """A partial result computed by hash aggregation."""
+
+    # The name of the partial result column.
+    name: str
+    # The column to aggregate, or None to count the rows of each group.
+    on: Optional[str]
+    # The Arrow hash aggregation that computes the partial result of a block.
+    map_fn: str
+    map_options: Any
+    # The Arrow hash aggregation that merges partial results.
+    merge_fn: str
+    merge_options: Any
+
+
+def _hash_aggregate_parts(aggs: Tuple[AggregateFn]) -> List[_HashAggregatePart]:
+    """Return the partial results that hash aggregation computes for the aggs."""
+    import pyarrow.compute as pac
+
+    # Counts are merged by summing them up.
+    sum_counts = pac.ScalarAggregateOptions()
+    parts = []
+    for i, agg in enumerate(aggs):
+        if type(agg) is Count:
+            count_all = pac.CountOptions(mode="all")
+            parts.append(
+                _HashAggregatePart(f"{i}", None, "count", count_all, "sum", sum_counts)
+            )
+            continue
+        # A null partial result means that all values were null, or, if nulls
+        # aren't ignored, that some were. Merging with the same null handling
+        # preserves both.
+        options = pac.ScalarAggregateOptions(skip_nulls=agg._ignore_nulls)
+        if type(agg) is Mean:
+            count_valid = pac.CountOptions(mode="only_valid")
+            parts.append(
+                _HashAggregatePart(
+                    f"{i}_sum", agg._key_fn, "sum", options, "sum", options
+                )
+            )
+            parts.append(
+                _HashAggregatePart(
+                    f"{i}_count", agg._key_fn, "count", count_valid, "sum", sum_counts
+                )
+            )
+        else:
+            fn = {Sum: "sum", Min: "min", Max: "max"}[type(agg)]
+            parts.append(
+                _HashAggregatePart(f"{i}", agg._key_fn, fn, options, fn, options)
+            )
+    return parts
+
+
+def _hash_key_column(column: "pyarrow.ChunkedArray") -> np.ndarray:
+    """Hash the key column consistently across blocks and processes."""
+    import pandas as pd
+
+    # Equal keys must get equal hashes in every block, so convert them the same way
+    # regardless of nulls. Collisions only unbalance the partitions.
+    if pyarrow.types.is_integer(column.type) or pyarrow.types.is_floating(column.type):
+        values = column.cast(pyarrow.float64(), safe=False).to_numpy()
+    else:
+        if not (
+            pyarrow.types.is_string(column.type)
+            or pyarrow.types.is_large_string(column.type)
+            or pyarrow.types.is_binary(column.type)
+            or pyarrow.types.is_large_binary(column.type)
+        ):
+            column = column.cast(pyarrow.string())
+        values = column.to_numpy(zero_copy_only=False)
+    return pd.util.hash_array(values)
+
 
 def _copy_table(table: "pyarrow.Table") -> "pyarrow.Table":
     """Copy the provided Arrow table."""
@@ -1,5 +1,7 @@
 from typing import TYPE_CHECKING, List, Union
 
+import numpy as np
+
 try:
     import pyarrow
 except ImportError:
@@ -284,3 +286,114 @@ def combine_chunks(table: "pyarrow.Table") -> "pyarrow.Table":
             arr = col.combine_chunks()
         new_cols.append(arr)
     return pyarrow.Table.from_arrays(new_cols, schema=table.schema)
+
+
+def hash_partition(
+    table: "pyarrow.Table", keys: List[str], num_partitions: int
+) -> List["pyarrow.Table"]:
+    """Partition the rows of the table by the hash of the given key columns.
+
+    The hash of a key only depends on its value (and not on the block it lives in),
+    so rows with equal keys from different tables always land in the same partition
+    index. This is what makes the partitions of two datasets co-partitioned, e.g. for
+    a hash join.
+
+    Args:
+        table: The table to partition.
+        keys: The key columns to hash.
+        num_partitions: The number of partitions to produce.
+
+    Returns:
+        A list of ``num_partitions`` tables, some of which may be empty.
+    """
+    if num_partitions == 1 or table.num_rows == 0:
+        return [table] + [table.slice(0, 0) for _ in range(num_partitions - 1)]
+
+    hashes = None
+    for key in keys:
+        key_hash = _hash_column(table[key])
+        if hashes is None:
+            hashes = key_hash
+        else:
+            # Combine the per-column hashes, relying on uint64 wraparound.
+            hashes = hashes * np.uint64(1000003) ^ key_hash
+    partition_ids = hashes % np.uint64(num_partitions)
+    indices = np.argsort(partition_ids, kind="stable")
+    counts = np.bincount(partition_ids.astype(np.int64), minlength=num_partitions)
+    table = take_table(table, indices)
+
+    partitions = []
+    offset = 0
+    for count in counts:
+        partitions.append(table.slice(offset, count))
+        offset += count
+    return partitions
+
+
+def _hash_column(column: "pyarrow.ChunkedArray") -> np.ndarray:
+    """Hash the values of the column into a uint64 ndarray.
+
+    Integer-like and floating point columns are normalized to 64-bit types first, so
+    that the same key value hashes identically whether or not its column contains
+    nulls, or is e.g. int32 in one block and int64 in another.
+    """
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.compute as pac
+
+    if pa.types.is_integer(column.type) or pa.types.is_boolean(column.type):
+        # Null keys never match in a join, so any hash value works for them.
+        column = pac.fill_null(column.cast(pa.int64()), 0)
+    elif pa.types.is_floating(column.type):
+        column = column.cast(pa.float64())
+    if column.num_chunks == 0:
+        column = pa.array([], type=column.type)
+    else:
+        column = column.combine_chunks()
+    return pd.util.hash_array(column.to_numpy(zero_copy_only=False))
+
+
+# Mapping from the user-facing join type to the pyarrow join type.
+_JOIN_TYPES = {
+    "inner": "inner",
+    "left": "left outer",
+    "right": "right outer",
+    "outer": "full outer",
+}
+
+
+def join(
+    left: "pyarrow.Table",
+    right: "pyarrow.Table",
+    keys: List[str],
+    how: str,
+    right_suffix: str,
+) -> "pyarrow.Table":
+    """Join two tables on the given key columns with pyarrow compute.
+
+    Args:
+        left: The left table.
+        right: The right table.
+        keys: The key columns, which must exist in both tables.
+        how: One of "inner", "left", "right" or "outer".
+        right_suffix: The suffix appended to non-key columns of the right table
+            whose names collide with columns of the left table.
+
+    Returns:
+        The joined table, with the columns of the left table followed by the non-key
+        columns of the right table.
+    """
+    result = left.join(
+        right,
+        keys=keys,
+        join_type=_JOIN_TYPES[how],
+        right_suffix=right_suffix,
+        coalesce_keys=True,
+    )
+    # Arrow moves the key columns behind the other left columns for right joins,
+    # so restore a column order that doesn't depend on the join type.
+    left_columns = set(left.column_names)
+    columns = left.column_names + [
+        c for c in result.column_names if c not in left_columns
+    ]
+    return result.select(columns)
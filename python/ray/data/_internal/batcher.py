@@ -1,6 +1,7 @@
-import random
 from typing import List, Optional
 
+import numpy as np
+
 from ray.data._internal.arrow_block import ArrowBlockAccessor
 from ray.data._internal.arrow_ops import transform_pyarrow
 from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
@@ -14,6 +15,10 @@ from ray.data.block import Block, BlockAccessor
 # https://github.com/apache/arrow/issues/35126 is resolved.
 MIN_NUM_CHUNKS_TO_TRIGGER_COMBINE_CHUNKS = 2
 
+# Gathering a shuffled batch takes rows from each block in the shuffle buffer
+# separately, so the blocks are merged once the buffer holds more than this many.
+SHUFFLE_BUFFER_MAX_NUM_BLOCKS = 32
+
 
 class BatcherInterface:
     def add(self, block: Block):
@@ -173,30 +178,22 @@ class ShufflingBatcher(BatcherInterface):
 
     # Implementation Note:
     #
-    # This shuffling batcher lazily builds a shuffle buffer from added blocks, and once
-    # a batch is requested via .next_batch(), it concatenates the blocks into a concrete
-    # shuffle buffer, generates random shuffle indices, and starts returning shuffled
-    # batches.
-    #
-    # Adding of more blocks can be intermixed with retrieving batches, but it should be
-    # noted that we can end up performing two expensive operations on each retrieval:
-    #  1. Build added blocks into a concrete shuffle buffer.
-    #  2. Generate random shuffle indices.
-    # Note that (1) and (2) only happen when new blocks are added, upon the next
-    # retrieval. I.e., if no new blocks have been added since the last batch retrieval,
-    # and there are still batches in the existing concrete shuffle buffer to be yielded,
-    # then each batch retrieval will only involve slicing the batch out of the concrete
+    # This shuffling batcher keeps the added blocks as they are, and tracks the rows
+    # that haven't been yielded yet as (block index, row index) pairs. Once a batch is
+    # requested via .next_batch(), it draws random pairs from them, and gathers the
+    # rows of the batch with one vectorized take per source block. Neither adding
+    # blocks nor retrieving batches concatenates or reshuffles the row data of the
     # shuffle buffer.
     #
-    # Similarly, adding blocks is very cheap. Each added block will be appended to a
-    # list, with concatenation of the underlying data delayed until the next batch
-    # retrieval.
+    # Yielded rows stay referenced by their source blocks, so the shuffle buffer is
+    # compacted lazily: once the yielded rows outnumber the unyielded ones, or once
+    # the buffer holds more than SHUFFLE_BUFFER_MAX_NUM_BLOCKS blocks, the unyielded
+    # rows are merged into a single block. Each compaction copies at most the
+    # unyielded rows, which bounds both the memory held by yielded rows and the
+    # number of takes needed per batch.
     #
-    # Since (1) runs of block additions are cheap, and (2) runs of batch retrievals are
-    # cheap, callers of ShufflingBatcher are encouraged to add as many blocks as
-    # possible (up to the shuffle buffer capacity), followed by retrieving as many
-    # batches as possible (down to the shuffle buffer minimum size), in such contiguous
-    # runs.
+    # Adding blocks is very cheap, since each added block is only appended to a list,
+    # and indexed upon the next retrieval.
 
     def __init__(
         self,
@@ -229,14 +226,17 @@ class ShufflingBatcher(BatcherInterface):
             shuffle_buffer_min_size + batch_size,
         )
         self._buffer_min_size = shuffle_buffer_min_size
-        self._builder = DelegatingBlockBuilder()
-        self._shuffle_buffer: Block = None
-        self._shuffle_indices: List[int] = None
-        self._batch_head = 0
+        # Blocks added since the last batch retrieval, which aren't indexed yet.
+        self._pending_blocks: List[Block] = []
+        self._num_pending_rows = 0
+        # Indexed blocks, and their total number of rows, including yielded rows.
+        self._blocks: List[Block] = []
+        self._num_indexed_rows = 0
+        # (block index, row index) pairs of the unyielded indexed rows, in no
+        # particular order.
+        self._unyielded_indices = np.empty((0, 2), dtype=np.int64)
         self._done_adding = False
-
-        if shuffle_seed is not None:
-            random.seed(shuffle_seed)
+        self._rng = np.random.default_rng(shuffle_seed)
 
     def add(self, block: Block):
         """Add a block to the shuffle buffer.
@@ -246,9 +246,11 @@ class ShufflingBatcher(BatcherInterface):
         Args:
             block: Block to add to the shuffle buffer.
         """
-        if BlockAccessor.for_block(block).num_rows() > 0:
+        num_rows = BlockAccessor.for_block(block).num_rows()
+        if num_rows > 0:
             assert self.can_add(block)
-            self._builder.add_block(block)
+            self._pending_blocks.append(block)
+            self._num_pending_rows += num_rows
 
     def can_add(self, block: Block) -> bool:
         """Whether the block can be added to the shuffle buffer.
@@ -283,16 +285,7 @@ class ShufflingBatcher(BatcherInterface):
 
     def _buffer_size(self) -> int:
         """Return shuffle buffer size."""
-        buffer_size = self._builder.num_rows()
-        if self._shuffle_buffer is not None:
-            # Include the size of the concrete (materialized) shuffle buffer, adjusting
-            # for the batch head position, which also serves as a counter of the number
-            # of already-yielded rows from the current concrete shuffle buffer.
-            buffer_size += (
-                BlockAccessor.for_block(self._shuffle_buffer).num_rows()
-                - self._batch_head
-            )
-        return buffer_size
+        return self._num_pending_rows + len(self._unyielded_indices)
 
     def next_batch(self) -> Block:
         """Get the next shuffled batch from the shuffle buffer.
@@ -301,51 +294,104 @@ class ShufflingBatcher(BatcherInterface):
             A batch represented as a Block.
         """
         assert self.has_batch() or (self._done_adding and self.has_any())
-        # Add rows in the builder to the shuffle buffer.
-        if self._builder.num_rows() > 0:
-            if self._shuffle_buffer is not None:
-                if self._batch_head > 0:
-                    # Compact the materialized shuffle buffer.
-                    # TODO(Clark): If alternating between adding blocks and fetching
-                    # shuffled batches, this aggressive compaction could be inefficient.
-                    self._shuffle_buffer = BlockAccessor.for_block(
-                        self._shuffle_buffer
-                    ).take(self._shuffle_indices[self._batch_head :])
-                # Add the unyielded rows from the existing shuffle buffer.
-                self._builder.add_block(self._shuffle_buffer)
-            # Build the new shuffle buffer.
-            self._shuffle_buffer = self._builder.build()
-            if (
-                isinstance(
-                    BlockAccessor.for_block(self._shuffle_buffer), ArrowBlockAccessor
-                )
-                and self._shuffle_buffer.num_columns > 0
-                and self._shuffle_buffer.column(0).num_chunks
-                >= MIN_NUM_CHUNKS_TO_TRIGGER_COMBINE_CHUNKS
-            ):
-                self._shuffle_buffer = transform_pyarrow.combine_chunks(
-                    self._shuffle_buffer
-                )
-            # Reset the builder.
-            self._builder = DelegatingBlockBuilder()
-            # Invalidate the shuffle indices.
-            self._shuffle_indices = None
-            self._batch_head = 0
-
-        assert self._shuffle_buffer is not None
-        buffer_size = BlockAccessor.for_block(self._shuffle_buffer).num_rows()
+        if self._pending_blocks:
+            self._index_pending_blocks()
+
+        buffer_size = len(self._unyielded_indices)
         # Truncate the batch to the buffer size, if necessary.
         batch_size = min(self._batch_size, buffer_size)
-
-        if self._shuffle_indices is None:
-            # Need to generate new shuffle indices.
-            self._shuffle_indices = list(range(buffer_size))
-            random.shuffle(self._shuffle_indices)
-
-        # Get the shuffle indices for this batch.
-        batch_indices = self._shuffle_indices[
-            self._batch_head : self._batch_head + batch_size
+        # Draw the rows of this batch, and move the undrawn rows at the tail of the
+        # unyielded indices into the holes left by the drawn ones.
+        drawn = self._rng.choice(buffer_size, size=batch_size, replace=False)
+        batch_indices = self._unyielded_indices[drawn]
+        new_size = buffer_size - batch_size
+        undrawn_tail = np.ones(batch_size, dtype=bool)
+        undrawn_tail[drawn[drawn >= new_size] - new_size] = False
+        self._unyielded_indices[drawn[drawn < new_size]] = self._unyielded_indices[
+            new_size + np.flatnonzero(undrawn_tail)
         ]
-        self._batch_head += batch_size
+        self._unyielded_indices = self._unyielded_indices[:new_size]
+
+        batch = self._take(batch_indices)
+        if (
+            self._num_indexed_rows > 2 * new_size
+            or len(self._blocks) > SHUFFLE_BUFFER_MAX_NUM_BLOCKS
+        ):
+            self._compact()
         # Yield the shuffled batch.
-        return BlockAccessor.for_block(self._shuffle_buffer).take(batch_indices)
+        return batch
+
+    def _index_pending_blocks(self) -> None:
+        """Add the pending blocks to the unyielded indices."""
+        new_indices = [self._unyielded_indices]
+        for block in self._pending_blocks:
+            block = self._maybe_combine_chunks(block)
+            num_rows = BlockAccessor.for_block(block).num_rows()
+            indices = np.empty((num_rows, 2), dtype=np.int64)
+            indices[:, 0] = len(self._blocks)
+            indices[:, 1] = np.arange(num_rows)
+            new_indices.append(indices)
+            self._blocks.append(block)
+            self._num_indexed_rows += num_rows
+        self._pending_blocks = []
+        self._num_pending_rows = 0
+        self._unyielded_indices = np.concatenate(new_indices)
+
+    def _take(self, indices: np.ndarray) -> Block:
+        """Gather the rows at the given (block index, row index) pairs, in order."""
+        # Group the rows by their source block, so that each block is only taken
+        # from once.
+        order = np.argsort(indices[:, 0], kind="stable")
+        grouped = indices[order]
+        groups = np.split(grouped, np.flatnonzero(np.diff(grouped[:, 0])) + 1)
+        if len(groups) == 1:
+            block = self._blocks[groups[0][0, 0]]
+            return BlockAccessor.for_block(block).take(groups[0][:, 1])
+        builder = DelegatingBlockBuilder()
+        for group in groups:
+            block = self._blocks[group[0, 0]]
+            builder.add_block(BlockAccessor.for_block(block).take(group[:, 1]))
+        batch = builder.build()
+        # Restore the drawn order across the groups.
+        inverse_order = np.empty_like(order)
+        inverse_order[order] = np.arange(len(order))
+        return BlockAccessor.for_block(batch).take(inverse_order)
+
+    def _compact(self) -> None:
+        """Merge the unyielded rows into a single block, releasing the yielded rows."""
+        num_rows = len(self._unyielded_indices)
+        if num_rows == 0:
+            self._blocks = []
+            self._num_indexed_rows = 0
+            return
+        # Sort the unyielded rows by source block, and renumber them by their position
+        # in the merged block.
+        order = np.lexsort(
+            (self._unyielded_indices[:, 1], self._unyielded_indices[:, 0])
+        )
+        grouped = self._unyielded_indices[order]
+        builder = DelegatingBlockBuilder()
+        for group in np.split(grouped, np.flatnonzero(np.diff(grouped[:, 0])) + 1):
+            block = self._blocks[group[0, 0]]
+            accessor = BlockAccessor.for_block(block)
+            if len(group) < accessor.num_rows():
+                block = accessor.take(group[:, 1])
+            builder.add_block(block)
+        self._blocks = [self._maybe_combine_chunks(builder.build())]
+        self._num_indexed_rows = num_rows
+        self._unyielded_indices[order, 0] = 0
+        self._unyielded_indices[order, 1] = np.arange(num_rows)
+
+    @staticmethod
+    def _maybe_combine_chunks(block: Block) -> Block:
+        """Combine the chunks of an Arrow block, so that taking rows from it is fast.
+
+        pyarrow.Table.take concatenates all chunks of the table internally.
+        """
+        if (
+            isinstance(BlockAccessor.for_block(block), ArrowBlockAccessor)
+            and block.num_columns > 0
+            and block.column(0).num_chunks >= MIN_NUM_CHUNKS_TO_TRIGGER_COMBINE_CHUNKS
+        ):
+            block = transform_pyarrow.combine_chunks(block)
+        return block
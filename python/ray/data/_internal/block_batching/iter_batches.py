@@ -16,6 +16,7 @@ from ray.data._internal.block_batching.util import (
 )
 from ray.data._internal.memory_tracing import trace_deallocation
 from ray.data._internal.stats import DatasetStats
+from ray.data._internal.tracer import get_tracer
 from ray.data.block import Block, BlockMetadata, DataBatch
 from ray.data.context import DataContext
 from ray.types import ObjectRef
@@ -161,14 +162,25 @@ def iter_batches(
     # for streaming results.
     async_batch_iter = make_async_gen(block_refs, fn=_async_iter_batches, num_workers=1)
 
+    # Trace the time spent waiting for batches and in the user code between them, if
+    # tracing is enabled.
+    tracer = get_tracer()
+    if tracer is not None:
+        track = tracer.new_track("iter_batches")
+
     while True:
         with stats.iter_total_blocked_s.timer() if stats else nullcontext():
-            try:
-                next_batch = next(async_batch_iter)
-            except StopIteration:
-                break
+            with tracer.timer("wait", track) if tracer else nullcontext():
+                try:
+                    next_batch = next(async_batch_iter)
+                except StopIteration:
+                    break
         with stats.iter_user_s.timer() if stats else nullcontext():
-            yield next_batch
+            with tracer.timer("user", track) if tracer else nullcontext():
+                yield next_batch
+
+    if tracer is not None:
+        tracer.flush()
 
 
 def _format_in_threadpool(
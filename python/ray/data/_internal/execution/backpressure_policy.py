@@ -0,0 +1,157 @@
+import time
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from ray.data._internal.execution.interfaces import PhysicalOperator
+from ray.data.context import DataContext
+
+if TYPE_CHECKING:
+    from ray.data._internal.execution.streaming_executor_state import OpState, Topology
+
+# Min number of seconds between two samples of the downstream throughput.
+THROUGHPUT_SAMPLE_INTERVAL_S = 1.0
+
+# Weight of the newest sample in the moving average of the downstream throughput.
+THROUGHPUT_SMOOTHING_FACTOR = 0.5
+
+# How many seconds of downstream consumption an operator may buffer in its outqueue.
+OUTQUEUE_BUFFER_SECONDS = 5.0
+
+# An operator may always buffer at least this many output bundles, so that slow
+# consumers never starve.
+MIN_OUTQUEUE_BUNDLES = 2
+
+
+class BackpressurePolicy(ABC):
+    """Interface for policies that throttle operators in the streaming executor.
+
+    Policies are consulted in addition to the global resource limits: an operator
+    is only dispatched new inputs if every enabled policy allows it.
+    """
+
+    def __init__(self, topology: "Topology"):
+        """Create the policy for the given topology.
+
+        Args:
+            topology: The execution state of the streaming topology.
+        """
+        ...
+
+    @abstractmethod
+    def can_add_input(self, op: PhysicalOperator) -> bool:
+        """Return whether the given operator may be dispatched a new input."""
+        ...
+
+    def get_metrics(self, op: PhysicalOperator) -> Dict[str, int]:
+        """Return the policy's metrics for the given operator, reported in stats."""
+        return {}
+
+
+class DownstreamThroughputBackpressurePolicy(BackpressurePolicy):
+    """Bound each operator's output queue by the throughput of its consumer.
+
+    The consumer's throughput is the rate (in bytes/s) at which it takes bundles
+    from the queue, sampled while it has queued inputs. An operator is throttled
+    once its outqueue plus the estimated output of its running tasks holds more than
+    `OUTQUEUE_BUFFER_SECONDS` worth of that throughput (and at least
+    `MIN_OUTQUEUE_BUNDLES` bundles). Since a throttled consumer takes inputs more
+    slowly, the bound of a slow operator propagates to all operators upstream of it.
+
+    The output operator of the topology is not bounded by this policy, since it is
+    consumed by the user.
+    """
+
+    def __init__(self, topology: "Topology"):
+        self._topology = topology
+        # Maps each operator to the state of its consumer and the index of the
+        # consumer's inqueue that it feeds.
+        self._consumers: Dict[PhysicalOperator, Tuple["OpState", int]] = {}
+        for op, state in topology.items():
+            for i, dep in enumerate(op.input_dependencies):
+                self._consumers[dep] = (state, i)
+        # Smoothed throughput in bytes/s of the consumer of each operator.
+        self._throughput: Dict[PhysicalOperator, float] = {}
+        self._consumed_bytes: Dict[PhysicalOperator, int] = {
+            op: 0 for op in self._consumers
+        }
+        self._last_sample_ts = time.perf_counter()
+
+    def can_add_input(self, op: PhysicalOperator) -> bool:
+        limit = self._outqueue_limit(op)
+        if limit is None:
+            return True
+        return self._pending_output_bytes(op) < limit
+
+    def get_metrics(self, op: PhysicalOperator) -> Dict[str, int]:
+        if op not in self._consumers:
+            return {}
+        metrics = {
+            "downstream_throughput_bytes_per_s": round(self._throughput.get(op, 0))
+        }
+        limit = self._outqueue_limit(op)
+        if limit is not None:
+            metrics["outqueue_limit_bytes"] = round(limit)
+        return metrics
+
+    def _outqueue_limit(self, op: PhysicalOperator) -> Optional[float]:
+        """Return the max bytes the op may buffer, or None if it's unbounded."""
+        self._maybe_sample_throughput()
+        throughput = self._throughput.get(op)
+        if throughput is None:
+            # Nothing is known about the consumer yet.
+            return None
+        state = self._topology[op]
+        avg_bundle_bytes = state.output_bytes_produced / max(
+            1, state.num_completed_tasks
+        )
+        return max(
+            throughput * OUTQUEUE_BUFFER_SECONDS,
+            avg_bundle_bytes * MIN_OUTQUEUE_BUNDLES,
+        )
+
+    def _pending_output_bytes(self, op: PhysicalOperator) -> float:
+        """Estimate the bytes in the op's outqueue and its running tasks' outputs."""
+        state = self._topology[op]
+        avg_output_bytes_per_input = state.output_bytes_produced / max(
+            1, state.num_inputs_dispatched
+        )
+        return (
+            state.outqueue_memory_usage()
+            + state.num_processing() * avg_output_bytes_per_input
+        )
+
+    def _maybe_sample_throughput(self) -> None:
+        now = time.perf_counter()
+        elapsed = now - self._last_sample_ts
+        if elapsed < THROUGHPUT_SAMPLE_INTERVAL_S:
+            return
+        self._last_sample_ts = now
+        for op, (consumer_state, index) in self._consumers.items():
+            consumed = consumer_state.inqueue_bytes_consumed[index]
+            delta = consumed - self._consumed_bytes[op]
+            self._consumed_bytes[op] = consumed
+            if delta == 0 and not consumer_state.inqueues[index]:
+                # The consumer was starved rather than slow, so this sample says
+                # nothing about its throughput.
+                continue
+            rate = delta / elapsed
+            prev = self._throughput.get(op)
+            if prev is None:
+                self._throughput[op] = rate
+            else:
+                self._throughput[op] = (
+                    THROUGHPUT_SMOOTHING_FACTOR * rate
+                    + (1 - THROUGHPUT_SMOOTHING_FACTOR) * prev
+                )
+
+
+# The policies enabled when `DataContext.backpressure_policies` is None.
+BUILTIN_BACKPRESSURE_POLICIES = [DownstreamThroughputBackpressurePolicy]
+
+
+def get_backpressure_policies(topology: "Topology") -> List[BackpressurePolicy]:
+    """Instantiate the backpressure policies enabled in the current DataContext."""
+    policies = DataContext.get_current().backpressure_policies
+    if policies is None:
+        policies = BUILTIN_BACKPRESSURE_POLICIES
+    return [policy(topology) for policy in policies]
@@ -48,6 +48,10 @@ class RefBundle:
     # Cached location, used for get_cached_location().
     _cached_location: Optional[NodeIdStr] = None
 
+    # Whether the data was spilled at the cached location, used for
+    # get_cached_location_spilled().
+    _cached_location_spilled: bool = False
+
     def __post_init__(self):
         for b in self.blocks:
             assert isinstance(b, tuple), b
@@ -73,6 +77,13 @@ class RefBundle:
         """Size of the blocks of this bundle in bytes."""
         return sum(b[1].size_bytes for b in self.blocks)
 
+    def object_store_bytes(self) -> int:
+        """Size in bytes of the blocks of this bundle that are in the object store.
+
+        Memory-mapped blocks are stored on local disk, so they're excluded.
+        """
+        return sum(b[1].size_bytes for b in self.blocks if not b[1].mmapped)
+
     def destroy_if_owned(self) -> int:
         """Clears the object store memory for these blocks if owned.
 
@@ -82,7 +93,7 @@ class RefBundle:
         should_free = self.owns_blocks and DataContext.get_current().eager_free
         for b in self.blocks:
             trace_deallocation(b[0], "RefBundle.destroy_if_owned", free=should_free)
-        return self.size_bytes() if should_free else 0
+        return self.object_store_bytes() if should_free else 0
 
     def get_cached_location(self) -> Optional[NodeIdStr]:
         """Return a location for this bundle's data, if possible.
@@ -101,11 +112,21 @@ class RefBundle:
                 self._cached_location = nodes[0]
             else:
                 self._cached_location = ""
+            self._cached_location_spilled = locs[ref].get("did_spill", False)
         if self._cached_location:
             return self._cached_location
         else:
             return None  # Return None if cached location is "".
 
+    def get_cached_location_spilled(self) -> bool:
+        """Return whether this bundle's data was spilled at its cached location.
+
+        Restoring spilled data is only cheap on the node that spilled it, so spilled
+        bundles benefit the most from being consumed at their location.
+        """
+        self.get_cached_location()
+        return self._cached_location_spilled
+
     def __eq__(self, other) -> bool:
         return self is other
 
@@ -250,6 +271,10 @@ class TaskContext:
     # This should be set if upstream_map_transform_fn is set.
     upstream_map_ray_remote_args: Dict[str, Any] = None
 
+    # The max size in bytes of the blocks output by this task, if chosen adaptively
+    # by the executor. If None, `DataContext.target_max_block_size` is used.
+    target_max_block_size: Optional[int] = None
+
 
 # Block transform function applied by task and actor pools in MapOperator.
 MapTransformFn = Callable[[Iterable[Block], TaskContext], Iterable[Block]]
@@ -259,6 +284,12 @@ AllToAllTransformFn = Callable[
     [List[RefBundle], TaskContext], Tuple[List[RefBundle], StatsDict]
 ]
 
+# Block transform function applied in JoinOperator. The inputs are the bundles of the
+# left and right side.
+JoinTransformFn = Callable[
+    [List[RefBundle], List[RefBundle], TaskContext], Tuple[List[RefBundle], StatsDict]
+]
+
 
 class PhysicalOperator(Operator):
     """Abstract class for physical operators.
@@ -529,6 +560,17 @@ class OutputIterator(Iterator[RefBundle]):
             raise NotImplementedError()
         return next(self._it)
 
+    def has_next(self, output_split_idx: Optional[int] = None) -> bool:
+        """Whether get_next() for the given output split would return immediately.
+
+        This is used by `Dataset.streaming_split()` to hand out several outputs at a
+        time, without blocking on outputs that aren't produced yet.
+
+        Args:
+            output_split_idx: The output split index to check for.
+        """
+        raise NotImplementedError()
+
     def __next__(self) -> RefBundle:
         return self.get_next()
 
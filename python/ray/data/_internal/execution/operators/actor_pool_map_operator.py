@@ -166,7 +166,10 @@ class ActorPoolMapOperator(MapOperator):
             # Submit the map task.
             bundle = self._bundle_queue.popleft()
             input_blocks = [block for block, _ in bundle.blocks]
-            ctx = TaskContext(task_idx=self._next_task_idx)
+            ctx = TaskContext(
+                task_idx=self._next_task_idx,
+                target_max_block_size=self._target_output_block_size(),
+            )
             ref = actor.submit.options(num_returns="dynamic", name=self.name).remote(
                 self._transform_fn_ref, ctx, *input_blocks
             )
@@ -0,0 +1,48 @@
+from collections import deque
+from typing import Deque, List, Optional
+
+from ray.data._internal.execution.interfaces import PhysicalOperator, RefBundle
+from ray.data._internal.stats import StatsDict
+from ray.data.block import BlockMetadata
+
+
+class CacheOperator(PhysicalOperator):
+    """Physical operator that passes its inputs through and keeps a reference to them.
+
+    Holding the references keeps the blocks in the object store (from which Ray spills
+    them to disk under memory pressure), so that later executions can read them from
+    an InputDataBuffer instead of recomputing them.
+    """
+
+    def __init__(self, input_op: PhysicalOperator):
+        self._cached_bundles: List[RefBundle] = []
+        self._buffer: Deque[RefBundle] = deque()
+        self._output_metadata: List[BlockMetadata] = []
+        super().__init__("Cache", [input_op])
+
+    def add_input(self, refs: RefBundle, input_index: int) -> None:
+        assert not self.completed()
+        assert input_index == 0, input_index
+        # The downstream operators mustn't free the blocks, since they're cached.
+        bundle = RefBundle(refs.blocks, owns_blocks=False)
+        self._cached_bundles.append(bundle)
+        self._buffer.append(bundle)
+        self._output_metadata.extend(meta for _, meta in bundle.blocks)
+
+    def has_next(self) -> bool:
+        return len(self._buffer) > 0
+
+    def get_next(self) -> RefBundle:
+        return self._buffer.popleft()
+
+    def get_stats(self) -> StatsDict:
+        return {self._name: self._output_metadata}
+
+    def num_outputs_total(self) -> Optional[int]:
+        return self.input_dependencies[0].num_outputs_total()
+
+    def get_cached_bundles(self) -> Optional[List[RefBundle]]:
+        """Return the cached bundles, or None if the input wasn't fully consumed."""
+        if not self._inputs_complete or self._dependents_complete:
+            return None
+        return self._cached_bundles
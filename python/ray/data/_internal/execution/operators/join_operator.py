@@ -0,0 +1,113 @@
+from typing import List, Optional
+
+from ray.data._internal.execution.interfaces import (
+    JoinTransformFn,
+    PhysicalOperator,
+    RefBundle,
+    TaskContext,
+)
+from ray.data._internal.progress_bar import ProgressBar
+from ray.data._internal.stats import StatsDict
+
+
+class JoinOperator(PhysicalOperator):
+    """A blocking operator that joins its two inputs once they are complete.
+
+    The join itself is done by `join_fn`, which launches the exchange tasks (see
+    `ray.data._internal.planner.join`). Like AllToAllOperator, this operator reports
+    the progress of the exchange through sub progress bars.
+    """
+
+    def __init__(
+        self,
+        join_fn: JoinTransformFn,
+        left_input_op: PhysicalOperator,
+        right_input_op: PhysicalOperator,
+        sub_progress_bar_names: Optional[List[str]] = None,
+        name: str = "Join",
+    ):
+        """Create a JoinOperator.
+
+        Args:
+            join_fn: The blocking join function to run. The inputs are the lists of
+                input ref bundles of both sides, and the outputs are the output ref
+                bundles and a stats dict.
+            left_input_op: The input operator at left hand side.
+            right_input_op: The input operator at right hand side.
+            sub_progress_bar_names: The names of internal sub progress bars.
+            name: The name of this operator.
+        """
+        self._join_fn = join_fn
+        self._sub_progress_bar_names = sub_progress_bar_names
+        self._sub_progress_bar_dict = None
+        self._left_buffer: List[RefBundle] = []
+        self._right_buffer: List[RefBundle] = []
+        self._output_buffer: List[RefBundle] = []
+        self._stats: StatsDict = {}
+        super().__init__(name, [left_input_op, right_input_op])
+
+    def num_outputs_total(self) -> Optional[int]:
+        left_num_outputs = self.input_dependencies[0].num_outputs_total()
+        right_num_outputs = self.input_dependencies[1].num_outputs_total()
+        if left_num_outputs is not None and right_num_outputs is not None:
+            return max(left_num_outputs, right_num_outputs)
+        elif left_num_outputs is not None:
+            return left_num_outputs
+        else:
+            return right_num_outputs
+
+    def add_input(self, refs: RefBundle, input_index: int) -> None:
+        assert not self.completed()
+        assert input_index == 0 or input_index == 1, input_index
+        if input_index == 0:
+            self._left_buffer.append(refs)
+        else:
+            self._right_buffer.append(refs)
+
+    def inputs_done(self) -> None:
+        ctx = TaskContext(
+            task_idx=0,
+            sub_progress_bar_dict=self._sub_progress_bar_dict,
+        )
+        self._output_buffer, self._stats = self._join_fn(
+            self._left_buffer, self._right_buffer, ctx
+        )
+        self._left_buffer.clear()
+        self._right_buffer.clear()
+        super().inputs_done()
+
+    def has_next(self) -> bool:
+        return len(self._output_buffer) > 0
+
+    def get_next(self) -> RefBundle:
+        return self._output_buffer.pop(0)
+
+    def get_stats(self) -> StatsDict:
+        return self._stats
+
+    def get_transformation_fn(self) -> JoinTransformFn:
+        return self._join_fn
+
+    def progress_str(self) -> str:
+        return f"{len(self._output_buffer)} output"
+
+    def initialize_sub_progress_bars(self, position: int) -> int:
+        """Initialize all internal sub progress bars, and return the number of bars."""
+        if self._sub_progress_bar_names is not None:
+            self._sub_progress_bar_dict = {}
+            for name in self._sub_progress_bar_names:
+                bar = ProgressBar(name, self.num_outputs_total() or 1, position)
+                # NOTE: call `set_description` to trigger the initial print of progress
+                # bar on console.
+                bar.set_description(f"  *- {name}")
+                self._sub_progress_bar_dict[name] = bar
+                position += 1
+            return len(self._sub_progress_bar_dict)
+        else:
+            return 0
+
+    def close_sub_progress_bars(self):
+        """Close all internal sub progress bars."""
+        if self._sub_progress_bar_dict is not None:
+            for sub_bar in self._sub_progress_bar_dict.values():
+                sub_bar.close()
@@ -56,6 +56,8 @@ class LimitOperator(PhysicalOperator):
                     metadata = copy.deepcopy(metadata)
                     metadata.num_rows = num_rows
                     metadata.size_bytes = BlockAccessor.for_block(block).size_bytes()
+                    # The sliced copy of a memory-mapped block is in the object store.
+                    metadata.mmapped = False
                     return block, metadata
 
                 block, metadata_ref = cached_remote_fn(slice_fn, num_returns=2).remote(
@@ -21,10 +21,20 @@ from ray.data._internal.execution.interfaces import (
 )
 from ray.data._internal.memory_tracing import trace_allocation
 from ray.data._internal.stats import StatsDict
+from ray.data._internal.tracer import Tracer, get_tracer
 from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
+from ray.data.context import DataContext
 from ray.types import ObjectRef
 from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
 
+# Weight of the newest task in the moving average of the throughput of adaptively
+# sized map operators.
+_TASK_SIZER_SMOOTHING_FACTOR = 0.3
+
+# Task durations are floored to this, so that trivial tasks don't imply an unbounded
+# throughput.
+_MIN_OBSERVED_TASK_DURATION_S = 0.01
+
 
 class MapOperator(PhysicalOperator, ABC):
     """A streaming operator that maps input bundles 1:1 to output bundles.
@@ -51,8 +61,16 @@ class MapOperator(PhysicalOperator, ABC):
 
         # Bundles block references up to the min_rows_per_bundle target.
         self._block_ref_bundler = _BlockRefBundler(min_rows_per_bundle)
+        # Fixed bytes target of the bundler, set by set_min_bytes_per_bundle().
+        self._min_bytes_per_bundle: Optional[int] = None
         # Object store allocation stats.
         self._metrics = _ObjectStoreMetrics(alloc=0, freed=0, cur=0, peak=0)
+        # Sizes tasks from the stats of completed tasks, if adaptive block sizing is
+        # enabled (this is set by start()).
+        self._task_sizer: Optional[_AdaptiveTaskSizer] = None
+        # Records the timeline of the tasks, if tracing is enabled (this is set by
+        # start()).
+        self._tracer: Optional[Tracer] = None
 
         # Queue for task outputs, either ordered or unordered (this is set by start()).
         self._output_queue: _OutputQueue = None
@@ -169,16 +187,38 @@ class MapOperator(PhysicalOperator, ABC):
 
             self._ray_remote_args_factory = RoundRobinAssign(locs)
 
+        ctx = DataContext.get_current()
+        if ctx.adaptive_block_sizing_enabled and self._min_bytes_per_bundle is None:
+            self._task_sizer = _AdaptiveTaskSizer(
+                ctx.target_task_duration_s,
+                ctx.target_min_block_size,
+                ctx.target_max_block_size,
+            )
+        self._tracer = get_tracer()
+
         # Put the function def in the object store to avoid repeated serialization
         # in case it's large (i.e., closure captures large objects).
         self._transform_fn_ref = ray.put(self._transform_fn)
 
+    def set_min_bytes_per_bundle(self, min_bytes_per_bundle: int):
+        """Bundle inputs up to the given number of bytes per task.
+
+        This overrides adaptive block sizing, and only has an effect if there's no
+        target number of rows per bundle. It must be called before start().
+        """
+        self._min_bytes_per_bundle = min_bytes_per_bundle
+        self._block_ref_bundler.set_min_bytes_per_bundle(min_bytes_per_bundle)
+
     def add_input(self, refs: RefBundle, input_index: int):
         assert input_index == 0, input_index
         # Add ref bundle allocation to operator's object store metrics.
-        self._metrics.cur += refs.size_bytes()
+        self._metrics.cur += refs.object_store_bytes()
         if self._metrics.cur > self._metrics.peak:
             self._metrics.peak = self._metrics.cur
+        if self._task_sizer is not None:
+            self._block_ref_bundler.set_min_bytes_per_bundle(
+                self._task_sizer.target_bundle_bytes()
+            )
         # Add RefBundle to the bundler.
         self._block_ref_bundler.add_bundle(refs)
         if self._block_ref_bundler.has_bundle():
@@ -187,6 +227,20 @@ class MapOperator(PhysicalOperator, ABC):
             bundle = self._block_ref_bundler.get_next_bundle()
             self._add_bundled_input(bundle)
 
+    def _target_output_block_size(self) -> Optional[int]:
+        """Return the max size of the blocks output by the next task.
+
+        With adaptive block sizing, output blocks are capped to the bundle size
+        targeted by the downstream map operator, so that its task sizes aren't
+        dictated by oversized blocks. Returns None to use the configured default.
+        """
+        for dep in self.output_dependencies:
+            if isinstance(dep, MapOperator) and dep._task_sizer is not None:
+                target = dep._task_sizer.target_bundle_bytes()
+                if target is not None:
+                    return target
+        return None
+
     def _get_runtime_ray_remote_args(self) -> Dict[str, Any]:
         if self._ray_remote_args_factory:
             return self._ray_remote_args_factory(self._ray_remote_args)
@@ -218,6 +272,8 @@ class MapOperator(PhysicalOperator, ABC):
         """
         # Notify output queue that this task is pending.
         self._output_queue.notify_pending_task(task)
+        if self._tracer is not None:
+            self._tracer.task_submitted(task, self.name)
 
     @abstractmethod
     def notify_work_completed(
@@ -246,14 +302,30 @@ class MapOperator(PhysicalOperator, ABC):
         self._output_queue.notify_task_completed(task)
         task.inputs.destroy_if_owned()
         # Update object store metrics.
-        allocated = task.output.size_bytes()
+        allocated = task.output.object_store_bytes()
         self._metrics.alloc += allocated
         self._metrics.cur += allocated
-        freed = task.inputs.size_bytes()
+        freed = task.inputs.object_store_bytes()
         self._metrics.freed += freed
         self._metrics.cur -= freed
         if self._metrics.cur > self._metrics.peak:
             self._metrics.peak = self._metrics.cur
+        if self._task_sizer is not None:
+            self._task_sizer.observe(task)
+        if self._tracer is not None:
+            exec_stats = [
+                meta.exec_stats
+                for _, meta in task.output.blocks
+                if meta.exec_stats and meta.exec_stats.start_time_s is not None
+            ]
+            self._tracer.task_finished(
+                task,
+                start_s=min((s.start_time_s for s in exec_stats), default=None),
+                end_s=max((s.end_time_s for s in exec_stats), default=None),
+                num_blocks=len(task.output.blocks),
+                num_rows=task.output.num_rows(),
+                size_bytes=task.output.size_bytes(),
+            )
 
     def inputs_done(self):
         self._block_ref_bundler.done_adding_bundles()
@@ -270,7 +342,7 @@ class MapOperator(PhysicalOperator, ABC):
     def get_next(self) -> RefBundle:
         assert self._started
         bundle = self._output_queue.get_next()
-        self._metrics.cur -= bundle.size_bytes()
+        self._metrics.cur -= bundle.object_store_bytes()
         for _, meta in bundle.blocks:
             self._output_metadata.append(meta)
         return bundle
@@ -290,7 +362,12 @@ class MapOperator(PhysicalOperator, ABC):
         raise NotImplementedError
 
     def get_metrics(self) -> Dict[str, int]:
-        return self._metrics.to_metrics_dict()
+        metrics = self._metrics.to_metrics_dict()
+        if self._task_sizer is not None:
+            target = self._task_sizer.target_bundle_bytes()
+            if target is not None:
+                metrics["target_bundle_bytes"] = target
+        return metrics
 
     def get_stats(self) -> StatsDict:
         return {self._name: self._output_metadata}
@@ -392,7 +469,11 @@ def _map_task(
 
 
 class _BlockRefBundler:
-    """Rebundles RefBundles to get them close to a particular number of rows."""
+    """Rebundles RefBundles to get them close to a particular number of rows.
+
+    If no row target is given, bundles can instead be rebundled up to a number of
+    bytes, which is set with `set_min_bytes_per_bundle()`.
+    """
 
     def __init__(self, min_rows_per_bundle: Optional[int]):
         """Creates a BlockRefBundler.
@@ -403,10 +484,21 @@ class _BlockRefBundler:
                 result in an empty bundle.
         """
         self._min_rows_per_bundle = min_rows_per_bundle
+        self._min_bytes_per_bundle: Optional[int] = None
         self._bundle_buffer: List[RefBundle] = []
         self._bundle_buffer_size = 0
         self._finalized = False
 
+    def set_min_bytes_per_bundle(self, min_bytes_per_bundle: Optional[int]):
+        """Set the target number of bytes per bundle.
+
+        This only has an effect if there's no target number of rows per bundle.
+        """
+        self._min_bytes_per_bundle = min_bytes_per_bundle
+        self._bundle_buffer_size = sum(
+            self._get_bundle_size(bundle) for bundle in self._bundle_buffer
+        )
+
     def add_bundle(self, bundle: RefBundle):
         """Add a bundle to the bundler."""
         self._bundle_buffer.append(bundle)
@@ -414,16 +506,18 @@ class _BlockRefBundler:
 
     def has_bundle(self) -> bool:
         """Returns whether the bundler has a bundle."""
+        target = self._get_bundle_target()
         return self._bundle_buffer and (
-            self._min_rows_per_bundle is None
-            or self._bundle_buffer_size >= self._min_rows_per_bundle
+            target is None
+            or self._bundle_buffer_size >= target
             or (self._finalized and self._bundle_buffer_size > 0)
         )
 
     def get_next_bundle(self) -> RefBundle:
         """Gets the next bundle."""
         assert self.has_bundle()
-        if self._min_rows_per_bundle is None:
+        target = self._get_bundle_target()
+        if target is None:
             # Short-circuit if no bundle row target was defined.
             assert len(self._bundle_buffer) == 1
             bundle = self._bundle_buffer[0]
@@ -439,10 +533,7 @@ class _BlockRefBundler:
             if buffer_filled:
                 # Buffer has been filled, save it in the leftovers.
                 leftover.append(bundle)
-            elif (
-                output_buffer_size + bundle_size <= self._min_rows_per_bundle
-                or output_buffer_size == 0
-            ):
+            elif output_buffer_size + bundle_size <= target or output_buffer_size == 0:
                 # Bundle fits in buffer, or bundle doesn't fit but the buffer still
                 # needs a non-empty bundle.
                 output_buffer.append(bundle)
@@ -463,11 +554,63 @@ class _BlockRefBundler:
         """Indicate that no more RefBundles will be added to this bundler."""
         self._finalized = True
 
-    @staticmethod
-    def _get_bundle_size(bundle: RefBundle):
+    def _get_bundle_target(self) -> Optional[int]:
+        if self._min_rows_per_bundle is not None:
+            return self._min_rows_per_bundle
+        return self._min_bytes_per_bundle
+
+    def _get_bundle_size(self, bundle: RefBundle):
+        if self._min_rows_per_bundle is None and self._min_bytes_per_bundle is not None:
+            return bundle.size_bytes()
         return bundle.num_rows() if bundle.num_rows() is not None else float("inf")
 
 
+class _AdaptiveTaskSizer:
+    """Chooses the input bundle size of a map operator's tasks from completed tasks.
+
+    This tracks the throughput of the operator (input bytes per second of task wall
+    time) as a moving average, and targets bundles that take `target_task_duration_s`
+    to process at that throughput, within the configured block size bounds.
+    """
+
+    def __init__(
+        self,
+        target_task_duration_s: float,
+        min_bundle_bytes: int,
+        max_bundle_bytes: int,
+    ):
+        self._target_task_duration_s = target_task_duration_s
+        self._min_bundle_bytes = min_bundle_bytes
+        self._max_bundle_bytes = max_bundle_bytes
+        self._throughput: Optional[float] = None
+
+    def observe(self, task: _TaskState):
+        """Update the throughput estimate with the stats of a completed task."""
+        wall_times = [
+            meta.exec_stats.wall_time_s if meta.exec_stats else None
+            for _, meta in task.output.blocks
+        ]
+        if not wall_times or None in wall_times:
+            # The duration of the task is unknown.
+            return
+        duration = max(sum(wall_times), _MIN_OBSERVED_TASK_DURATION_S)
+        throughput = task.inputs.size_bytes() / duration
+        if self._throughput is None:
+            self._throughput = throughput
+        else:
+            self._throughput = (
+                _TASK_SIZER_SMOOTHING_FACTOR * throughput
+                + (1 - _TASK_SIZER_SMOOTHING_FACTOR) * self._throughput
+            )
+
+    def target_bundle_bytes(self) -> Optional[int]:
+        """Return the target input bytes per task, or None if not known yet."""
+        if self._throughput is None:
+            return None
+        target = self._throughput * self._target_task_duration_s
+        return int(min(max(target, self._min_bundle_bytes), self._max_bundle_bytes))
+
+
 def _merge_ref_bundles(*bundles: RefBundle) -> RefBundle:
     """Merge N ref bundles into a single bundle of multiple blocks."""
     # Check that at least one bundle is non-null.
@@ -8,7 +8,7 @@ from ray.data._internal.execution.interfaces import (
     PhysicalOperator,
     RefBundle,
 )
-from ray.data._internal.execution.util import locality_string
+from ray.data._internal.execution.util import locality_rank, locality_string
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data._internal.stats import StatsDict
 from ray.data.block import Block, BlockAccessor, BlockMetadata
@@ -136,8 +136,8 @@ class OutputSplitter(PhysicalOperator):
 
     def current_resource_usage(self) -> ExecutionResources:
         return ExecutionResources(
-            object_store_memory=sum(b.size_bytes() for b in self._buffer)
-            + sum(b.size_bytes() for b in self._output_queue)
+            object_store_memory=sum(b.object_store_bytes() for b in self._buffer)
+            + sum(b.object_store_bytes() for b in self._output_queue)
         )
 
     def progress_str(self) -> str:
@@ -177,10 +177,18 @@ class OutputSplitter(PhysicalOperator):
     def _pop_bundle_to_dispatch(self, target_index: int) -> RefBundle:
         if self._locality_hints:
             preferred_loc = self._locality_hints[target_index]
+            best_bundle, best_rank = None, None
             for bundle in self._buffer:
-                if self._get_location(bundle) == preferred_loc:
-                    self._buffer.remove(bundle)
-                    return bundle
+                rank = locality_rank(
+                    self._get_location(bundle) == preferred_loc,
+                    self._is_spilled(bundle),
+                )
+                if best_rank is None or rank < best_rank:
+                    best_bundle, best_rank = bundle, rank
+                    if rank == 0:
+                        break
+            self._buffer.remove(best_bundle)
+            return best_bundle
         return self._buffer.pop(0)
 
     def _can_safely_dispatch(self, target_index: int, nrow: int) -> bool:
@@ -227,6 +235,13 @@ class OutputSplitter(PhysicalOperator):
         """
         return bundle.get_cached_location()
 
+    def _is_spilled(self, bundle: RefBundle) -> bool:
+        """Return whether the bundle's data was spilled to external storage.
+
+        This method may be overriden for testing.
+        """
+        return bundle.get_cached_location_spilled()
+
 
 def _split(bundle: RefBundle, left_size: int) -> (RefBundle, RefBundle):
     left_blocks, left_meta = [], []
@@ -51,7 +51,10 @@ class TaskPoolMapOperator(MapOperator):
         # Submit the task as a normal Ray task.
         map_task = cached_remote_fn(_map_task, num_returns="dynamic")
         input_blocks = [block for block, _ in bundle.blocks]
-        ctx = TaskContext(task_idx=self._next_task_idx)
+        ctx = TaskContext(
+            task_idx=self._next_task_idx,
+            target_max_block_size=self._target_output_block_size(),
+        )
         ref = map_task.options(
             **self._get_runtime_ray_remote_args(), name=self.name
         ).remote(self._transform_fn_ref, ctx, *input_blocks)
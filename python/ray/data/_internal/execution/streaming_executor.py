@@ -2,13 +2,18 @@ import os
 import threading
 import time
 import uuid
-from typing import Iterator, Optional
+from contextlib import nullcontext
+from typing import Iterator, List, Optional
 
 import ray
 from ray.data._internal.dataset_logger import DatasetLogger
 from ray.data._internal.execution.autoscaling_requester import (
     get_or_create_autoscaling_requester_actor,
 )
+from ray.data._internal.execution.backpressure_policy import (
+    BackpressurePolicy,
+    get_backpressure_policies,
+)
 from ray.data._internal.execution.interfaces import (
     ExecutionOptions,
     ExecutionResources,
@@ -30,6 +35,7 @@ from ray.data._internal.execution.streaming_executor_state import (
 )
 from ray.data._internal.progress_bar import ProgressBar
 from ray.data._internal.stats import DatasetStats
+from ray.data._internal.tracer import get_tracer
 from ray.data.context import DataContext
 
 logger = DatasetLogger(__name__)
@@ -71,6 +77,11 @@ class StreamingExecutor(Executor, threading.Thread):
         # generator `yield`s.
         self._topology: Optional[Topology] = None
         self._output_node: Optional[OpState] = None
+        self._backpressure_policies: List[BackpressurePolicy] = []
+
+        # Records the timeline of the execution, if tracing is enabled.
+        self._tracer = get_tracer()
+        self._consumer_track: Optional[str] = None
 
         Executor.__init__(self, options)
         threading.Thread.__init__(self, daemon=True)
@@ -100,12 +111,15 @@ class StreamingExecutor(Executor, threading.Thread):
         # Setup the streaming DAG topology and start the runner thread.
         _validate_dag(dag, self._get_or_refresh_resource_limits())
         self._topology, _ = build_streaming_topology(dag, self._options)
+        self._backpressure_policies = get_backpressure_policies(self._topology)
 
         if not isinstance(dag, InputDataBuffer):
             # Note: DAG must be initialized in order to query num_outputs_total.
             self._global_info = ProgressBar("Running", dag.num_outputs_total() or 1)
 
         self._output_node: OpState = self._topology[dag]
+        if self._tracer is not None:
+            self._consumer_track = self._tracer.new_track(f"{dag.name} consumer")
         self.start()
 
         class StreamIterator(OutputIterator):
@@ -114,9 +128,15 @@ class StreamingExecutor(Executor, threading.Thread):
 
             def get_next(self, output_split_idx: Optional[int] = None) -> RefBundle:
                 try:
-                    item = self._outer._output_node.get_output_blocking(
-                        output_split_idx
-                    )
+                    tracer = self._outer._tracer
+                    if tracer is not None:
+                        track = self._outer._consumer_track
+                        if output_split_idx is not None:
+                            track += f" (split {output_split_idx})"
+                    with tracer.timer("wait", track) if tracer else nullcontext():
+                        item = self._outer._output_node.get_output_blocking(
+                            output_split_idx
+                        )
                     # Translate the special sentinel values for MaybeRefBundle into
                     # exceptions.
                     if item is None:
@@ -137,6 +157,9 @@ class StreamingExecutor(Executor, threading.Thread):
                     self._outer.shutdown()
                     raise
 
+            def has_next(self, output_split_idx: Optional[int] = None) -> bool:
+                return self._outer._output_node.has_output(output_split_idx)
+
         return StreamIterator(self)
 
     def shutdown(self):
@@ -166,6 +189,8 @@ class StreamingExecutor(Executor, threading.Thread):
             for op, state in self._topology.items():
                 op.shutdown()
                 state.close_progress_bars()
+            if self._tracer is not None:
+                self._tracer.flush()
             # Make request for zero resources to autoscaler for this execution.
             actor = get_or_create_autoscaling_requester_actor()
             actor.request_resources.remote({}, self._execution_id)
@@ -204,7 +229,12 @@ class StreamingExecutor(Executor, threading.Thread):
                 continue
             builder = stats.child_builder(op.name, override_start_time=self._start_time)
             stats = builder.build_multistage(op.get_stats())
-            stats.extra_metrics = op.get_metrics()
+            stats.extra_metrics = {
+                **op.get_metrics(),
+                **self._topology[op].get_metrics(),
+            }
+            for policy in self._backpressure_policies:
+                stats.extra_metrics.update(policy.get_metrics(op))
         return stats
 
     def _scheduling_loop_step(self, topology: Topology) -> bool:
@@ -231,6 +261,8 @@ class StreamingExecutor(Executor, threading.Thread):
         limits = self._get_or_refresh_resource_limits()
         cur_usage = TopologyResourceUsage.of(topology)
         self._report_current_usage(cur_usage, limits)
+        for op_state in topology.values():
+            op_state.update_peak_outqueue_memory_usage()
         op = select_operator_to_run(
             topology,
             cur_usage,
@@ -238,6 +270,7 @@ class StreamingExecutor(Executor, threading.Thread):
             ensure_at_least_one_running=self._consumer_idling(),
             execution_id=self._execution_id,
             autoscaling_state=self._autoscaling_state,
+            backpressure_policies=self._backpressure_policies,
         )
         i = 0
         while op is not None:
@@ -255,12 +288,23 @@ class StreamingExecutor(Executor, threading.Thread):
                 ensure_at_least_one_running=self._consumer_idling(),
                 execution_id=self._execution_id,
                 autoscaling_state=self._autoscaling_state,
+                backpressure_policies=self._backpressure_policies,
             )
 
         # Update the progress bar to reflect scheduling decisions.
         for op_state in topology.values():
             op_state.refresh_progress_bar()
 
+        if self._tracer is not None:
+            # Trace the queues, which show where the pipeline is backpressured.
+            for op, op_state in topology.items():
+                self._tracer.counter(
+                    op.name,
+                    queued=op_state.num_queued() + op.internal_queue_size(),
+                    active=op.num_active_work_refs(),
+                    outputs=len(op_state.outqueue),
+                )
+
         # Keep going until all operators run to completion.
         return not all(op.completed() for op in topology)
 
@@ -7,7 +7,7 @@ import math
 import time
 from collections import deque
 from dataclasses import dataclass
-from typing import Deque, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional, Tuple, Union
 
 import ray
 from ray.data._internal.execution.autoscaling_requester import (
@@ -21,8 +21,13 @@ from ray.data._internal.execution.interfaces import (
 )
 from ray.data._internal.execution.operators.all_to_all_operator import AllToAllOperator
 from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
+from ray.data._internal.execution.operators.join_operator import JoinOperator
 from ray.data._internal.execution.util import memory_string
 from ray.data._internal.progress_bar import ProgressBar
+from ray.data._internal.tracer import get_tracer
+
+if TYPE_CHECKING:
+    from ray.data._internal.execution.backpressure_policy import BackpressurePolicy
 
 # Holds the full execution state of the streaming topology. It's a dict mapping each
 # operator to tracked streaming exec state.
@@ -121,14 +126,23 @@ class OpState:
         self.num_completed_tasks = 0
         self.inputs_done_called = False
         self.dependents_completed_called = False
+        # Queue and throttling stats, used by backpressure policies and reported in
+        # the execution stats.
+        self.num_inputs_dispatched = 0
+        self.inqueue_bytes_consumed = [0] * len(inqueues)
+        self.output_bytes_produced = 0
+        self.peak_outqueue_memory_usage = 0
+        self.num_backpressured = 0
+        # Records the outputs of the operator, if tracing is enabled.
+        self.tracer = get_tracer()
 
     def initialize_progress_bars(self, index: int, verbose_progress: bool) -> int:
         """Create progress bars at the given index (line offset in console).
 
-        For AllToAllOperator, zero or more sub progress bar would be created.
-        Return the number of progress bars created for this operator.
+        For AllToAllOperator and JoinOperator, zero or more sub progress bar would be
+        created. Return the number of progress bars created for this operator.
         """
-        is_all_to_all = isinstance(self.op, AllToAllOperator)
+        is_all_to_all = isinstance(self.op, (AllToAllOperator, JoinOperator))
         # Only show 1:1 ops when in verbose progress mode.
         enabled = verbose_progress or is_all_to_all
         self.progress_bar = ProgressBar(
@@ -149,7 +163,7 @@ class OpState:
         """Close all progress bars for this operator."""
         if self.progress_bar:
             self.progress_bar.close()
-            if isinstance(self.op, AllToAllOperator):
+            if isinstance(self.op, (AllToAllOperator, JoinOperator)):
                 self.op.close_sub_progress_bars()
 
     def num_queued(self) -> int:
@@ -164,8 +178,17 @@ class OpState:
         """Move a bundle produced by the operator to its outqueue."""
         self.outqueue.append(ref)
         self.num_completed_tasks += 1
+        self.output_bytes_produced += ref.size_bytes()
         if self.progress_bar:
             self.progress_bar.update(1)
+        if self.tracer is not None:
+            self.tracer.instant(
+                "output",
+                self.op.name,
+                num_blocks=len(ref.blocks),
+                num_rows=ref.num_rows(),
+                size_bytes=ref.size_bytes(),
+            )
 
     def refresh_progress_bar(self) -> None:
         """Update the console with the latest operator progress."""
@@ -190,7 +213,11 @@ class OpState:
         """Move a bundle from the operator inqueue to the operator itself."""
         for i, inqueue in enumerate(self.inqueues):
             if inqueue:
-                self.op.add_input(inqueue.popleft(), input_index=i)
+                ref = inqueue.popleft()
+                self.num_inputs_dispatched += 1
+                if isinstance(ref, RefBundle):
+                    self.inqueue_bytes_consumed[i] += ref.size_bytes()
+                self.op.add_input(ref, input_index=i)
                 return
         assert False, "Nothing to dispatch"
 
@@ -224,6 +251,24 @@ class OpState:
                 pass
             time.sleep(0.01)
 
+    def has_output(self, output_split_idx: Optional[int]) -> bool:
+        """Whether get_output_blocking() would return without blocking."""
+        try:
+            if output_split_idx is None:
+                return len(self.outqueue) > 0
+            for i in range(len(self.outqueue)):
+                bundle = self.outqueue[i]
+                if (
+                    bundle is None
+                    or isinstance(bundle, Exception)
+                    or bundle.output_split_idx == output_split_idx
+                ):
+                    return True
+        except IndexError:
+            # The queue shrank while we were scanning it.
+            pass
+        return False
+
     def inqueue_memory_usage(self) -> int:
         """Return the object store memory of this operator's inqueue."""
         total = 0
@@ -237,6 +282,20 @@ class OpState:
         """Return the object store memory of this operator's outqueue."""
         return self._queue_memory_usage(self.outqueue)
 
+    def update_peak_outqueue_memory_usage(self) -> None:
+        """Record the current outqueue memory usage if it's the highest so far."""
+        self.peak_outqueue_memory_usage = max(
+            self.peak_outqueue_memory_usage, self.outqueue_memory_usage()
+        )
+
+    def get_metrics(self) -> Dict[str, int]:
+        """Return the queue and backpressure metrics of this operator."""
+        return {
+            "obj_store_mem_outqueue": self.outqueue_memory_usage(),
+            "obj_store_mem_outqueue_peak": self.peak_outqueue_memory_usage,
+            "num_backpressured": self.num_backpressured,
+        }
+
     def _queue_memory_usage(self, queue: Deque[RefBundle]) -> int:
         """Sum the object store memory usage in this queue.
 
@@ -249,7 +308,7 @@ class OpState:
         for i in range(len(queue)):
             try:
                 bundle = queue[i]
-                object_store_memory += bundle.size_bytes()
+                object_store_memory += bundle.object_store_bytes()
             except IndexError:
                 break  # Concurrent pop from the outqueue by the consumer thread.
         return object_store_memory
@@ -367,6 +426,7 @@ def select_operator_to_run(
     ensure_at_least_one_running: bool,
     execution_id: str,
     autoscaling_state: AutoscalingState,
+    backpressure_policies: Optional[List["BackpressurePolicy"]] = None,
 ) -> Optional[PhysicalOperator]:
     """Select an operator to run, if possible.
 
@@ -375,7 +435,8 @@ def select_operator_to_run(
 
     This is currently implemented by applying backpressure on operators that are
     producing outputs faster than they are consuming them `len(outqueue)`, as well as
-    operators with a large number of running tasks `num_processing()`.
+    operators with a large number of running tasks `num_processing()`. In addition,
+    operators are only run if all of the given `backpressure_policies` allow it.
 
     Note that memory limits also apply to the outqueue of the output operator. This
     provides backpressure if the consumer is slow. However, once a bundle is returned
@@ -383,6 +444,8 @@ def select_operator_to_run(
     """
     assert isinstance(cur_usage, TopologyResourceUsage), cur_usage
 
+    backpressure_policies = backpressure_policies or []
+
     # Filter to ops that are eligible for execution.
     ops = []
     for op, state in topology.items():
@@ -393,7 +456,14 @@ def select_operator_to_run(
             and op.should_add_input()
             and under_resource_limits
         ):
-            ops.append(op)
+            if op.throttling_disabled() or all(
+                policy.can_add_input(op) for policy in backpressure_policies
+            ):
+                ops.append(op)
+            else:
+                # Don't scale up the operator while its outputs are backpressured.
+                state.num_backpressured += 1
+                under_resource_limits = False
         # Update the op in all cases to enable internal autoscaling, etc.
         op.notify_resource_usage(state.num_queued(), under_resource_limits)
 
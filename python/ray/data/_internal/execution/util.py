@@ -50,6 +50,18 @@ def locality_string(locality_hits: int, locality_misses) -> str:
     return f"[{locality_hits}/{locality_hits + locality_misses} objects local]"
 
 
+def locality_rank(local: bool, spilled: bool) -> int:
+    """Rank how cheap it is to consume an object at a node, lower is cheaper.
+
+    Local objects are preferred, and in-memory ones over spilled ones. Remote spilled
+    objects rank last, since they would have to be restored before being transferred,
+    and are best left to a consumer on their own node.
+    """
+    if local:
+        return 1 if spilled else 0
+    return 3 if spilled else 2
+
+
 def make_callable_class_concurrent(callable_cls: CallableClass) -> CallableClass:
     """Returns a thread-safe CallableClass with the same logic as the provided
     `callable_cls`.
@@ -1,16 +1,26 @@
 import copy
 import logging
+import random
 import threading
 import time
-from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple, Union
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import ray
-from ray.data._internal.execution.interfaces import NodeIdStr, RefBundle
+from ray.data._internal.execution.interfaces import (
+    NodeIdStr,
+    PhysicalOperator,
+    RefBundle,
+)
 from ray.data._internal.execution.legacy_compat import execute_to_legacy_bundle_iterator
+from ray.data._internal.execution.operators.cache_operator import CacheOperator
+from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
 from ray.data._internal.execution.operators.output_splitter import OutputSplitter
 from ray.data._internal.execution.streaming_executor import StreamingExecutor
+from ray.data._internal.execution.util import locality_rank
 from ray.data._internal.stats import DatasetStats
 from ray.data.block import Block, BlockMetadata
+from ray.data.context import DataContext
 from ray.data.iterator import DataIterator
 from ray.types import ObjectRef
 from ray.util.debug import log_once
@@ -26,6 +36,11 @@ logger = logging.getLogger(__name__)
 
 BLOCKED_CLIENT_WARN_TIMEOUT = 30
 
+# The operators whose output is randomized in each epoch, so that neither they nor
+# the operators after them are cached by `streaming_split(cache_first_epoch=True)`.
+# Fused operators are named after all of the fused operators.
+RANDOM_OPERATOR_NAMES = ("RandomShuffle", "RandomizeBlockOrder")
+
 
 class StreamSplitDataIterator(DataIterator):
     """Implements a collection of iterators over a shared data stream."""
@@ -36,18 +51,21 @@ class StreamSplitDataIterator(DataIterator):
         n: int,
         equal: bool,
         locality_hints: Optional[List[NodeIdStr]],
+        cache_first_epoch: bool = False,
     ) -> List["StreamSplitDataIterator"]:
         """Create a split iterator from the given base Dataset and options.
 
         See also: `Dataset.streaming_split`.
         """
         # To avoid deadlock, the concurrency on this actor must be set to at least `n`.
+        # Each client may also call the actor while its prefetched lease is blocked,
+        # so leave room for one more call per client.
         coord_actor = SplitCoordinator.options(
-            max_concurrency=n,
+            max_concurrency=2 * n,
             scheduling_strategy=NodeAffinitySchedulingStrategy(
                 ray.get_runtime_context().get_node_id(), soft=False
             ),
-        ).remote(base_dataset, n, equal, locality_hints)
+        ).remote(base_dataset, n, equal, locality_hints, cache_first_epoch)
 
         return [
             StreamSplitDataIterator(base_dataset, coord_actor, i, n) for i in range(n)
@@ -64,6 +82,8 @@ class StreamSplitDataIterator(DataIterator):
         self._coord_actor = coord_actor
         self._output_split_idx = output_split_idx
         self._world_size = world_size
+        # Total time this iterator has been blocked waiting on leases.
+        self._lease_wait_time_s = 0.0
 
     def _to_block_iterator(
         self,
@@ -72,30 +92,58 @@ class StreamSplitDataIterator(DataIterator):
         Optional[DatasetStats],
         bool,
     ]:
+        lease_size = self._base_dataset.context.streaming_split_lease_size
+
         def gen_blocks() -> Iterator[Tuple[ObjectRef[Block], BlockMetadata]]:
             cur_epoch = ray.get(
                 self._coord_actor.start_epoch.remote(self._output_split_idx)
             )
-            future: ObjectRef[
-                Optional[ObjectRef[Block]]
-            ] = self._coord_actor.get.remote(cur_epoch, self._output_split_idx)
-            while True:
-                block_ref: Optional[Tuple[ObjectRef[Block], BlockMetadata]] = ray.get(
-                    future
-                )
-                if not block_ref:
-                    break
-                else:
-                    future = self._coord_actor.get.remote(
-                        cur_epoch, self._output_split_idx
+            leased: List[Tuple[ObjectRef[Block], BlockMetadata]] = []
+            num_leases_received = 0
+            future: Optional[
+                ObjectRef[List[Tuple[ObjectRef[Block], BlockMetadata]]]
+            ] = self._coord_actor.lease.remote(
+                cur_epoch, self._output_split_idx, lease_size
+            )
+            try:
+                while True:
+                    start_time = time.perf_counter()
+                    leased = ray.get(future)
+                    self._lease_wait_time_s += time.perf_counter() - start_time
+                    future = None
+                    if not leased:
+                        break
+                    num_leases_received += 1
+                    # Prefetch the next lease while this one is being consumed.
+                    future = self._coord_actor.lease.remote(
+                        cur_epoch, self._output_split_idx, lease_size
+                    )
+                    while leased:
+                        yield leased.pop(0)
+            finally:
+                if future is not None:
+                    # The consumer stopped before the end of the epoch. Give the
+                    # unconsumed blocks back, including those of the pending lease.
+                    self._coord_actor.release.remote(
+                        cur_epoch, self._output_split_idx, leased, num_leases_received
                     )
-                    yield block_ref
 
         return gen_blocks(), None, False
 
     def stats(self) -> str:
         """Implements DataIterator."""
-        return self._base_dataset.stats()
+        lease_stats = ray.get(
+            self._coord_actor.get_lease_stats.remote(self._output_split_idx)
+        )
+        return (
+            f"{self._base_dataset.stats()}\n"
+            f"Streaming split {self._output_split_idx} of {self._world_size}:\n"
+            f"* Leased {lease_stats['num_blocks_leased']} blocks in "
+            f"{lease_stats['num_leases']} requests\n"
+            f"* Waited {self._lease_wait_time_s:.3f}s for leases in total, "
+            f"{lease_stats['lease_queue_time_s']:.3f}s of which queued in the "
+            "coordinator"
+        )
 
     def schema(self) -> Union[type, "pyarrow.lib.Schema"]:
         """Implements DataIterator."""
@@ -111,7 +159,7 @@ class SplitCoordinator:
     """Coordinator actor for routing blocks to output splits.
 
     This actor runs a streaming executor locally on its main thread. Clients can
-    retrieve results via actor calls running on other threads.
+    lease batches of blocks via actor calls running on other threads.
     """
 
     def __init__(
@@ -120,11 +168,17 @@ class SplitCoordinator:
         n: int,
         equal: bool,
         locality_hints: Optional[List[NodeIdStr]],
+        cache_first_epoch: bool = False,
     ):
         # Automatically set locality with output to the specified location hints.
         if locality_hints:
             dataset.context.execution_options.locality_with_output = locality_hints
             logger.info(f"Auto configuring locality_with_output={locality_hints}")
+        if cache_first_epoch:
+            # Don't fuse the operators before a shuffle into it, since their output
+            # couldn't be cached otherwise.
+            dataset.context.optimize_fuse_shuffle_stages = False
+            DataContext._set_current(dataset.context)
 
         self._base_dataset = dataset
         self._n = n
@@ -133,17 +187,66 @@ class SplitCoordinator:
         self._lock = threading.RLock()
 
         # Guarded by self._lock.
-        self._next_bundle: Dict[int, RefBundle] = {}
         self._unfinished_clients_in_epoch = n
         self._cur_epoch = -1
+        # Blocks routed to each output split that haven't been leased yet.
+        self._pending_blocks: Dict[
+            int, List[Tuple[ObjectRef[Block], BlockMetadata]]
+        ] = defaultdict(list)
+        # Blocks given back by splits that stopped early, which other splits may
+        # lease, as (block, metadata, location, spilled) tuples.
+        self._returned_blocks: List[
+            Tuple[ObjectRef[Block], BlockMetadata, Optional[NodeIdStr], bool]
+        ] = []
+        # Splits that stopped consuming in this epoch.
+        self._released_splits: Set[int] = set()
+        # The number of leases handed out to each split in this epoch, and the blocks
+        # of the last one.
+        self._num_leases_in_epoch: Dict[int, int] = defaultdict(int)
+        self._last_lease: Dict[int, List[Tuple[ObjectRef[Block], BlockMetadata]]] = {}
+        # Lease stats of each split, across epochs.
+        self._num_leases = [0] * n
+        self._num_blocks_leased = [0] * n
+        self._lease_queue_time_s = [0.0] * n
 
         def gen_epochs():
+            # The operator caching the output of the first epoch, and the cached
+            # bundles once it completed.
+            cache_op: Optional[CacheOperator] = None
+            cached_bundles: Optional[List[RefBundle]] = None
             while True:
                 executor = StreamingExecutor(
                     copy.deepcopy(dataset.context.execution_options)
                 )
+                if cache_op is not None and cached_bundles is None:
+                    # The previous epoch was stopped early if this is None, in which
+                    # case the output is cached in this epoch instead.
+                    cached_bundles = cache_op.get_cached_bundles()
+                    cache_op = None
 
                 def add_split_op(dag):
+                    nonlocal cache_op
+                    cache_point = _find_cache_point(dag) if cache_first_epoch else None
+                    if cache_first_epoch and cache_point is None:
+                        if log_once("stream_split_no_cache_point"):
+                            logger.warning(
+                                "streaming_split(cache_first_epoch=True) found no "
+                                "operator output to cache, so each epoch recomputes "
+                                "the Dataset. Only the operators before the first "
+                                "random_shuffle() or randomize_block_order() that "
+                                "aren't fused into it are cached."
+                            )
+                    if cache_point is not None:
+                        if cached_bundles is not None:
+                            # Read the cached bundles in a random order instead of
+                            # recomputing them.
+                            bundles = random.sample(cached_bundles, len(cached_bundles))
+                            dag = _replace_operator(
+                                dag, cache_point, InputDataBuffer(bundles)
+                            )
+                        else:
+                            cache_op = CacheOperator(cache_point)
+                            dag = _replace_operator(dag, cache_point, cache_op)
                     return OutputSplitter(dag, n, equal, locality_hints)
 
                 output_iterator = execute_to_legacy_bundle_iterator(
@@ -162,7 +265,7 @@ class SplitCoordinator:
         """Called to start an epoch.
 
         Returns:
-            UUID for the epoch, which must be used when accessing results via get().
+            UUID for the epoch, which must be used when accessing results via lease().
         """
 
         # Wait for all clients to arrive at the barrier before starting a new epoch.
@@ -172,40 +275,154 @@ class SplitCoordinator:
     def get(
         self, epoch_id: int, output_split_idx: int
     ) -> Optional[Tuple[ObjectRef[Block], BlockMetadata]]:
-        """Blocking get operation.
+        """Blocking get operation for a single block.
 
         This is intended to be called concurrently from multiple clients.
         """
+        blocks = self.lease(epoch_id, output_split_idx, 1)
+        return blocks[0] if blocks else None
+
+    def lease(
+        self, epoch_id: int, output_split_idx: int, max_blocks: int
+    ) -> List[Tuple[ObjectRef[Block], BlockMetadata]]:
+        """Blocking lease of up to `max_blocks` blocks for the given output split.
 
+        This blocks until at least one block is available for the split, and then
+        also leases the further blocks that are available without blocking. This is
+        intended to be called concurrently from multiple clients.
+
+        Returns:
+            The leased blocks, or an empty list at the end of the epoch.
+        """
+        self._check_epoch(epoch_id)
+        start_time = time.perf_counter()
+
+        with self._lock:
+            blocks = self._take_pending_blocks(output_split_idx, max_blocks)
+        try:
+            while len(blocks) < max_blocks and (
+                not blocks or self._output_iterator.has_next(output_split_idx)
+            ):
+                # This is a BLOCKING call if there are no blocks yet, so do it outside
+                # the lock.
+                bundle = self._output_iterator.get_next(output_split_idx)
+                blocks.extend(bundle.blocks)
+        except StopIteration:
+            pass
+
+        with self._lock:
+            if not blocks:
+                # Blocks may have been returned while we were waiting.
+                blocks = self._take_pending_blocks(output_split_idx, max_blocks)
+            if output_split_idx in self._released_splits:
+                # The client stopped consuming while this lease was pending.
+                self._return_blocks(blocks)
+                return []
+            # Keep any excess blocks for the next lease.
+            self._pending_blocks[output_split_idx][:0] = blocks[max_blocks:]
+            blocks = blocks[:max_blocks]
+            if blocks:
+                self._num_leases_in_epoch[output_split_idx] += 1
+                self._last_lease[output_split_idx] = blocks
+            self._num_leases[output_split_idx] += 1
+            self._num_blocks_leased[output_split_idx] += len(blocks)
+            self._lease_queue_time_s[output_split_idx] += (
+                time.perf_counter() - start_time
+            )
+        return blocks
+
+    def release(
+        self,
+        epoch_id: int,
+        output_split_idx: int,
+        unconsumed_blocks: List[Tuple[ObjectRef[Block], BlockMetadata]],
+        num_leases_received: int,
+    ) -> None:
+        """Called when a client stops consuming its split before the epoch ends.
+
+        Args:
+            epoch_id: The epoch the client was consuming.
+            output_split_idx: The output split of the client.
+            unconsumed_blocks: The leased blocks the client didn't consume.
+            num_leases_received: The number of leases the client received in the
+                epoch. If a lease was handed out but not received, its blocks weren't
+                consumed either.
+        """
+        with self._lock:
+            if epoch_id != self._cur_epoch:
+                return
+            self._released_splits.add(output_split_idx)
+            blocks = list(unconsumed_blocks)
+            if self._num_leases_in_epoch[output_split_idx] > num_leases_received:
+                blocks.extend(self._last_lease[output_split_idx])
+            blocks.extend(self._pending_blocks.pop(output_split_idx, []))
+            self._return_blocks(blocks)
+
+    def get_lease_stats(self, output_split_idx: int) -> Dict[str, Union[int, float]]:
+        """Return the lease stats of the given output split, across epochs."""
+        with self._lock:
+            return {
+                "num_leases": self._num_leases[output_split_idx],
+                "num_blocks_leased": self._num_blocks_leased[output_split_idx],
+                "lease_queue_time_s": self._lease_queue_time_s[output_split_idx],
+            }
+
+    def _check_epoch(self, epoch_id: int) -> None:
         if epoch_id != self._cur_epoch:
             raise ValueError(
                 "Invalid iterator: the dataset has moved on to another epoch."
             )
 
-        try:
-            # Ensure there is at least one bundle.
-            with self._lock:
-                if output_split_idx in self._next_bundle:
-                    next_bundle = self._next_bundle[output_split_idx]
-                else:
-                    next_bundle = None
-
-            # Fetch next bundle if needed.
-            while next_bundle is None or not next_bundle.blocks:
-                # This is a BLOCKING call, so do it outside the lock.
-                next_bundle = self._output_iterator.get_next(output_split_idx)
-
-            bundle = next_bundle.blocks.pop()
-
-            # Accumulate any remaining blocks in next_bundle map as needed.
-            with self._lock:
-                self._next_bundle[output_split_idx] = next_bundle
-                if not next_bundle.blocks:
-                    del self._next_bundle[output_split_idx]
-
-            return bundle
-        except StopIteration:
-            return None
+    def _take_pending_blocks(
+        self, output_split_idx: int, max_blocks: int
+    ) -> List[Tuple[ObjectRef[Block], BlockMetadata]]:
+        """Take up to `max_blocks` blocks that don't need to wait on execution.
+
+        The split's own pending blocks are taken first, then blocks returned by other
+        splits, preferring the ones that are local to the split.
+
+        Must be called with the lock held.
+        """
+        pending = self._pending_blocks[output_split_idx]
+        blocks = pending[:max_blocks]
+        del pending[:max_blocks]
+        if len(blocks) < max_blocks and self._returned_blocks:
+            preferred_loc = (
+                self._locality_hints[output_split_idx] if self._locality_hints else None
+            )
+            self._returned_blocks.sort(
+                key=lambda b: locality_rank(
+                    preferred_loc is not None and b[2] == preferred_loc, b[3]
+                )
+            )
+            num_taken = max_blocks - len(blocks)
+            blocks.extend((b, m) for b, m, _, _ in self._returned_blocks[:num_taken])
+            del self._returned_blocks[:num_taken]
+        return blocks
+
+    def _return_blocks(
+        self, blocks: List[Tuple[ObjectRef[Block], BlockMetadata]]
+    ) -> None:
+        """Make the given unconsumed blocks available to other splits.
+
+        Must be called with the lock held.
+        """
+        if self._equal or not blocks:
+            # Handing the blocks to other splits would break the equal split, so
+            # they are dropped, like the rest of the stopped split.
+            return
+        locations = ray.experimental.get_object_locations([b for b, _ in blocks])
+        for b, m in blocks:
+            location = locations.get(b, {})
+            node_ids = location.get("node_ids")
+            self._returned_blocks.append(
+                (
+                    b,
+                    m,
+                    node_ids[0] if node_ids else None,
+                    location.get("did_spill", False),
+                )
+            )
 
     def _barrier(self, split_idx: int) -> int:
         """Arrive and block until the start of the given epoch."""
@@ -237,6 +454,53 @@ class SplitCoordinator:
                 self._cur_epoch += 1
                 self._unfinished_clients_in_epoch = self._n
                 self._output_iterator = next(self._next_epoch)
+                self._pending_blocks.clear()
+                self._returned_blocks = []
+                self._released_splits = set()
+                self._num_leases_in_epoch.clear()
+                self._last_lease = {}
 
         assert self._output_iterator is not None
         return starting_epoch + 1
+
+
+def _find_cache_point(dag: PhysicalOperator) -> Optional[PhysicalOperator]:
+    """Return the last operator of the DAG whose output is the same in each epoch.
+
+    That's the last operator that isn't randomized and doesn't depend on randomized
+    operators. Returns None if there's nothing worth caching.
+    """
+
+    def is_random(op: PhysicalOperator) -> bool:
+        return op.name.split("->")[-1] in RANDOM_OPERATOR_NAMES or any(
+            is_random(dep) for dep in op.input_dependencies
+        )
+
+    op = dag
+    while is_random(op):
+        if len(op.input_dependencies) != 1:
+            return None
+        op = op.input_dependencies[0]
+    if isinstance(op, InputDataBuffer):
+        # The input is already materialized.
+        return None
+    return op
+
+
+def _replace_operator(
+    dag: PhysicalOperator, old_op: PhysicalOperator, new_op: PhysicalOperator
+) -> PhysicalOperator:
+    """Make the consumers of `old_op` in the DAG consume `new_op` instead.
+
+    `new_op` may take `old_op` as its input. Returns the new output operator.
+    """
+    if dag is old_op:
+        return new_op
+    for consumer in list(old_op.output_dependencies):
+        if consumer is new_op:
+            continue
+        index = consumer.input_dependencies.index(old_op)
+        consumer.input_dependencies[index] = new_op
+        old_op.output_dependencies.remove(consumer)
+        new_op.output_dependencies.append(consumer)
+    return dag
@@ -110,6 +110,7 @@ class Sort(AbstractAllToAll):
         input_op: LogicalOperator,
         key: Optional[str],
         descending: bool,
+        skew_aware: bool = False,
     ):
         super().__init__(
             "Sort",
@@ -122,6 +123,7 @@ class Sort(AbstractAllToAll):
         )
         self._key = key
         self._descending = descending
+        self._skew_aware = skew_aware
 
 
 class Aggregate(AbstractAllToAll):
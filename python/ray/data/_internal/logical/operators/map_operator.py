@@ -1,5 +1,5 @@
 import inspect
-from typing import Any, Dict, Iterable, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
 
 from ray.data._internal.compute import ComputeStrategy, TaskPoolStrategy
 from ray.data._internal.dataset_logger import DatasetLogger
@@ -7,6 +7,11 @@ from ray.data._internal.logical.interfaces import LogicalOperator
 from ray.data.block import UserDefinedFunction
 from ray.data.context import DEFAULT_BATCH_SIZE
 
+if TYPE_CHECKING:
+    import pyarrow
+
+    from ray.data.expressions import Expr
+
 logger = DatasetLogger(__name__)
 
 
@@ -153,23 +158,86 @@ class MapRows(AbstractUDFMap):
         )
 
 
-class Filter(AbstractUDFMap):
-    """Logical operator for filter."""
+class Project(MapBatches):
+    """Logical operator for select_columns.
+
+    This is planned like any other MapBatches, but it keeps the selected columns, so
+    that the optimizer can push the projection down into the read.
+    """
 
     def __init__(
         self,
         input_op: LogicalOperator,
         fn: UserDefinedFunction,
+        cols: List[str],
         compute: Optional[Union[str, ComputeStrategy]] = None,
         ray_remote_args: Optional[Dict[str, Any]] = None,
     ):
         super().__init__(
-            "Filter",
             input_op,
             fn,
+            batch_size=None,
+            batch_format="pandas",
+            zero_copy_batch=True,
+            compute=compute,
+            ray_remote_args=ray_remote_args,
+        )
+        self._cols = cols
+
+
+class Filter(AbstractUDFMap):
+    """Logical operator for filter.
+
+    The predicate is either a UDF applied to each row, or an Arrow expression or
+    `ray.data.expressions.Expr` (``filter_expr``) evaluated on whole blocks. In the
+    latter case, the expression is passed to the transform function in place of the
+    UDF.
+    """
+
+    def __init__(
+        self,
+        input_op: LogicalOperator,
+        fn: Optional[UserDefinedFunction] = None,
+        compute: Optional[Union[str, ComputeStrategy]] = None,
+        ray_remote_args: Optional[Dict[str, Any]] = None,
+        filter_expr: Optional[Union["pyarrow.dataset.Expression", "Expr"]] = None,
+    ):
+        assert (fn is None) != (filter_expr is None)
+        super().__init__(
+            "Filter",
+            input_op,
+            fn if fn is not None else filter_expr,
             compute=compute,
             ray_remote_args=ray_remote_args,
         )
+        if filter_expr is not None:
+            # Name the operator after the expression rather than its class.
+            self._name = f"Filter({filter_expr})"
+        self._filter_expr = filter_expr
+
+
+class WithColumn(AbstractUDFMap):
+    """Logical operator for with_column.
+
+    The expression is passed to the transform function in place of the UDF.
+    """
+
+    def __init__(
+        self,
+        input_op: LogicalOperator,
+        col: str,
+        expr: "Expr",
+        ray_remote_args: Optional[Dict[str, Any]] = None,
+    ):
+        super().__init__(
+            "WithColumn",
+            input_op,
+            expr,
+            ray_remote_args=ray_remote_args,
+        )
+        # Name the operator after the column rather than the expression's class.
+        self._name = f"WithColumn({col})"
+        self._col = col
 
 
 class FlatMap(AbstractUDFMap):
@@ -1,4 +1,7 @@
+from typing import List
+
 from ray.data._internal.logical.interfaces import LogicalOperator
+from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
 
 
 class Zip(LogicalOperator):
@@ -15,3 +18,32 @@ class Zip(LogicalOperator):
             right_input_op: The input operator at right hand side.
         """
         super().__init__("Zip", [left_input_op, right_input_op])
+
+
+class Join(LogicalOperator):
+    """Logical operator for join."""
+
+    def __init__(
+        self,
+        left_input_op: LogicalOperator,
+        right_input_op: LogicalOperator,
+        keys: List[str],
+        how: str,
+        right_suffix: str,
+    ):
+        """
+        Args:
+            left_input_op: The input operator at left hand side.
+            right_input_op: The input operator at right hand side.
+            keys: The key columns to join on.
+            how: The type of join, one of "inner", "left", "right" or "outer".
+            right_suffix: The suffix for colliding non-key columns of the right side.
+        """
+        super().__init__("Join", [left_input_op, right_input_op])
+        self._keys = keys
+        self._how = how
+        self._right_suffix = right_suffix
+        self._sub_progress_bar_names = [
+            ExchangeTaskSpec.MAP_SUB_PROGRESS_BAR_NAME,
+            ExchangeTaskSpec.REDUCE_SUB_PROGRESS_BAR_NAME,
+        ]
@@ -27,3 +27,8 @@ class Write(AbstractMap):
         self._compute = TaskPoolStrategy()
         # Take the input blocks unchanged while writing.
         self._target_block_size = float("inf")
+        # Give each write task enough input to fill its files, if the datasource
+        # rolls files at a target size.
+        self._min_bytes_per_bundle: Optional[int] = write_args.get(
+            "target_file_size_bytes"
+        )
@@ -8,6 +8,8 @@ from ray.data._internal.logical.interfaces import (
 )
 from ray.data._internal.logical.rules import (
     OperatorFusionRule,
+    PredicatePushdownRule,
+    ProjectionPushdownRule,
     ReorderRandomizeBlocksRule,
 )
 from ray.data._internal.planner.planner import Planner
@@ -18,7 +20,13 @@ class LogicalOptimizer(Optimizer):
 
     @property
     def rules(self) -> List[Rule]:
-        return [ReorderRandomizeBlocksRule()]
+        # NOTE: predicates are pushed down first, so that they can be moved across
+        # the projections that are pushed down next.
+        return [
+            ReorderRandomizeBlocksRule(),
+            PredicatePushdownRule(),
+            ProjectionPushdownRule(),
+        ]
 
 
 class PhysicalOptimizer(Optimizer):
@@ -1,4 +1,13 @@
 from ray.data._internal.logical.rules.operator_fusion import OperatorFusionRule
+from ray.data._internal.logical.rules.pushdown import (
+    PredicatePushdownRule,
+    ProjectionPushdownRule,
+)
 from ray.data._internal.logical.rules.randomize_blocks import ReorderRandomizeBlocksRule
 
-__all__ = ["ReorderRandomizeBlocksRule", "OperatorFusionRule"]
+__all__ = [
+    "ReorderRandomizeBlocksRule",
+    "OperatorFusionRule",
+    "PredicatePushdownRule",
+    "ProjectionPushdownRule",
+]
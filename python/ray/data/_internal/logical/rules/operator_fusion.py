@@ -22,8 +22,10 @@ from ray.data._internal.logical.operators.all_to_all_operator import (
     Repartition,
 )
 from ray.data._internal.logical.operators.map_operator import AbstractUDFMap
+from ray.data._internal.logical.operators.write_operator import Write
 from ray.data._internal.stats import StatsDict
 from ray.data.block import Block
+from ray.data.context import DataContext
 
 # Scheduling strategy can be inherited from upstream operator if not specified.
 INHERITABLE_REMOTE_ARGS = ["scheduling_strategy"]
@@ -144,6 +146,14 @@ class OperatorFusionRule(Rule):
         ) or not isinstance(up_logical_op, AbstractMap):
             return False
 
+        # Do not fuse into AllToAllOperator if shuffle stage fusion is disabled, e.g.
+        # to cache the upstream output in `streaming_split(cache_first_epoch=True)`.
+        if (
+            isinstance(down_op, AllToAllOperator)
+            and not DataContext.get_current().optimize_fuse_shuffle_stages
+        ):
+            return False
+
         # Do not fuse Repartition operator if shuffle is disabled
         # (i.e. using split shuffle).
         if isinstance(down_logical_op, Repartition) and not down_logical_op._shuffle:
@@ -261,6 +271,10 @@ class OperatorFusionRule(Rule):
             min_rows_per_bundle=target_block_size,
             ray_remote_args=ray_remote_args,
         )
+        if isinstance(down_logical_op, Write) and (
+            down_logical_op._min_bytes_per_bundle is not None
+        ):
+            op.set_min_bytes_per_bundle(down_logical_op._min_bytes_per_bundle)
 
         # Build a map logical operator to be used as a reference for further fusion.
         # TODO(Scott): This is hacky, remove this once we push fusion to be purely based
@@ -0,0 +1,132 @@
+import copy
+from typing import Callable, List, Optional
+
+from ray.data._internal.compute import is_task_compute
+from ray.data._internal.logical.interfaces import LogicalOperator, LogicalPlan, Rule
+from ray.data._internal.logical.operators.map_operator import Filter, Project
+from ray.data._internal.logical.operators.read_operator import Read
+from ray.data.datasource.datasource import ReadTask
+from ray.data.datasource.parquet_datasource import _ParquetReadTask
+from ray.data.expressions import Expr
+
+
+class PredicatePushdownRule(Rule):
+    """Rule for pushing filter expressions down into Parquet reads.
+
+    A Filter operator with an Arrow expression or `ray.data.expressions.Expr` (see
+    `Dataset.filter(expr=...)`) is removed from the DAG, and the expression is
+    passed to the Parquet scan of the Read operator below it instead. The read tasks
+    then skip the row groups whose statistics don't match, and never materialize the
+    filtered out rows.
+
+    The filter is also moved across Project operators between it and the Read, since
+    it can only refer to columns that are selected by them anyway.
+    """
+
+    def apply(self, plan: LogicalPlan) -> LogicalPlan:
+        return LogicalPlan(dag=_transform_up(plan.dag, self._push_down))
+
+    def _push_down(self, op: LogicalOperator) -> Optional[LogicalOperator]:
+        if not isinstance(op, Filter) or op._filter_expr is None:
+            return None
+        if not _is_simple_map(op):
+            return None
+
+        # Find the Read operator, looking through Project operators.
+        projects = []
+        input_op = op.input_dependencies[0]
+        while isinstance(input_op, Project):
+            projects.append(input_op)
+            input_op = input_op.input_dependencies[0]
+        if not _can_push_into(input_op):
+            return None
+
+        filter_expr = op._filter_expr
+        if isinstance(filter_expr, Expr):
+            filter_expr = filter_expr.to_pyarrow()
+        read_tasks = [t.with_filter(filter_expr) for t in input_op._read_tasks]
+        # Drop the tasks whose row groups were all skipped based on their statistics,
+        # but keep one so that the Read still produces a schema.
+        non_empty_tasks = [t for t in read_tasks if not t.is_empty()]
+        new_op = _with_read_tasks(input_op, non_empty_tasks or read_tasks[:1])
+        # Re-apply the projections on top of the filtered read.
+        for project in reversed(projects):
+            new_op = _with_input(project, new_op)
+        return new_op
+
+
+class ProjectionPushdownRule(Rule):
+    """Rule for pushing column selections down into Parquet reads.
+
+    A Project operator (see `Dataset.select_columns()`) right after a Read operator
+    is removed from the DAG, and the Read only reads the selected columns instead.
+    For wide tables, this saves most of the I/O and decoding work of the read.
+    """
+
+    def apply(self, plan: LogicalPlan) -> LogicalPlan:
+        return LogicalPlan(dag=_transform_up(plan.dag, self._push_down))
+
+    def _push_down(self, op: LogicalOperator) -> Optional[LogicalOperator]:
+        if not isinstance(op, Project) or not _is_simple_map(op):
+            return None
+        if not op._cols or len(set(op._cols)) != len(op._cols):
+            # The Parquet scan can't produce empty or duplicate column selections.
+            return None
+        input_op = op.input_dependencies[0]
+        if not _can_push_into(input_op):
+            return None
+        # Leave missing columns to the Project operator, so that it raises the
+        # same error as without the optimization.
+        for read_task in input_op._read_tasks:
+            schema = read_task.get_metadata().schema
+            if schema is None or not set(op._cols).issubset(schema.names):
+                return None
+        return _with_read_tasks(
+            input_op, [t.with_columns(op._cols) for t in input_op._read_tasks]
+        )
+
+
+def _transform_up(
+    op: LogicalOperator,
+    fn: Callable[[LogicalOperator], Optional[LogicalOperator]],
+) -> LogicalOperator:
+    """Apply `fn` to every operator of the DAG in post-order.
+
+    `fn` returns the operator to replace the given one with, or None to keep it.
+    Operators are never modified in place, because they may be shared by multiple
+    Datasets; the operators whose inputs changed are copied instead.
+    """
+    inputs = [_transform_up(input_op, fn) for input_op in op.input_dependencies]
+    if any(new is not old for new, old in zip(inputs, op.input_dependencies)):
+        op = copy.copy(op)
+        op._input_dependencies = inputs
+    return fn(op) or op
+
+
+def _is_simple_map(op: LogicalOperator) -> bool:
+    # Pushing the operator into the read task would drop its compute strategy and
+    # resource requirements.
+    return is_task_compute(op._compute) and not op._ray_remote_args
+
+
+def _can_push_into(op: LogicalOperator) -> bool:
+    return (
+        isinstance(op, Read)
+        and len(op._read_tasks) > 0
+        and all(
+            isinstance(t, _ParquetReadTask) and t.supports_pushdown()
+            for t in op._read_tasks
+        )
+    )
+
+
+def _with_read_tasks(op: Read, read_tasks: List[ReadTask]) -> Read:
+    op = copy.copy(op)
+    op._read_tasks = read_tasks
+    return op
+
+
+def _with_input(op: LogicalOperator, input_op: LogicalOperator) -> LogicalOperator:
+    op = copy.copy(op)
+    op._input_dependencies = [input_op]
+    return op
@@ -50,6 +50,7 @@ _op_name_white_list = [
     "MapBatches",
     "Filter",
     "FlatMap",
+    "WithColumn",
     # All-to-all
     "RandomizeBlockOrder",
     "RandomShuffle",
@@ -58,6 +59,7 @@ _op_name_white_list = [
     "Aggregate",
     # N-ary
     "Zip",
+    "Join",
     "Union",
 ]
 
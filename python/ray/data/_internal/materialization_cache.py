@@ -0,0 +1,308 @@
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import posixpath
+import time
+import types
+import uuid
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import numpy as np
+
+import ray
+import ray.cloudpickle as pickle
+from ray.actor import ActorHandle
+from ray.data._internal.logical.interfaces import LogicalOperator
+from ray.data.context import DataContext
+from ray.data.datasource.datasource import ReadTask
+
+if TYPE_CHECKING:
+    import pyarrow
+
+    from ray.data.dataset import Dataset
+
+
+logger = logging.getLogger(__name__)
+
+# Bump this to invalidate all existing cache entries, e.g. when the fingerprint
+# encoding or the cache layout changes.
+_FINGERPRINT_VERSION = 1
+
+# Attributes of logical operators that don't affect the data they output.
+_IGNORED_OPERATOR_ATTRS = {
+    "_input_dependencies",
+    "_output_dependencies",
+    "_ray_remote_args",
+    "_compute",
+    "_sub_progress_bar_names",
+}
+
+
+class _UnfingerprintableError(Exception):
+    """Raised for values that can't be fingerprinted deterministically."""
+
+    pass
+
+
+def fingerprint_logical_plan(dag: LogicalOperator) -> str:
+    """Return a fingerprint of the data output by the given logical plan.
+
+    The fingerprint covers the operators of the plan and their arguments, including
+    the code of user-defined functions (and of the functions and classes of their
+    module that they reference), their closures and the files and metadata of read
+    tasks. It's stable across processes and jobs, so it can be used as the key of
+    persistent caches. Functions and classes imported from other modules are only
+    covered by their names, so changing their code doesn't change the fingerprint.
+
+    Raises:
+        ValueError: If the plan can't be fingerprinted, e.g. because it reads
+            in-memory data or shuffles without a seed.
+    """
+    fingerprinter = _Fingerprinter()
+    fingerprinter.add(("version", _FINGERPRINT_VERSION, ray.__version__))
+    fingerprinter.add_operator(dag)
+    return fingerprinter.hexdigest()
+
+
+class _Fingerprinter:
+    """Accumulates a SHA-256 hash of logical operators and the values they hold."""
+
+    def __init__(self):
+        self._hash = hashlib.sha256()
+        # Maps the ids of the objects added so far to their order, so that shared
+        # and recursive references are encoded as back-references.
+        self._seen: Dict[int, int] = {}
+        # Keeps the seen objects alive so that their ids aren't reused.
+        self._seen_objects: List[Any] = []
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+    def add_operator(self, op: LogicalOperator):
+        for dep in op.input_dependencies:
+            self.add_operator(dep)
+        self._update("op", type(op).__qualname__, op.name)
+        if getattr(op, "_seed", 0) is None:
+            raise ValueError(
+                f"The {op.name} operator of the dataset isn't deterministic, so it "
+                "can't be cached. Pass a seed to it to make it deterministic."
+            )
+        attrs = {
+            name: value
+            for name, value in vars(op).items()
+            if name not in _IGNORED_OPERATOR_ATTRS
+        }
+        try:
+            self.add(attrs)
+        except _UnfingerprintableError as e:
+            raise ValueError(
+                f"The {op.name} operator of the dataset can't be cached, since {e}. "
+                "Only datasets read from datasources or created from Python items "
+                "can be cached."
+            ) from None
+
+    def add(self, value: Any):
+        if value is None or isinstance(value, (bool, int, float, str, bytes)):
+            self._update(type(value).__name__, repr(value))
+            return
+        if id(value) in self._seen:
+            self._update("ref", self._seen[id(value)])
+            return
+        self._seen[id(value)] = len(self._seen)
+        self._seen_objects.append(value)
+
+        if isinstance(value, (list, tuple)):
+            self._update(type(value).__name__, len(value))
+            for item in value:
+                self.add(item)
+        elif isinstance(value, (set, frozenset)):
+            self._update("set", sorted(repr(item) for item in value))
+        elif isinstance(value, dict):
+            self._update("dict", len(value))
+            for key in sorted(value, key=repr):
+                self.add(key)
+                self.add(value[key])
+        elif isinstance(value, np.ndarray):
+            self._update("ndarray", value.dtype.str, value.shape)
+            if value.dtype == object:
+                self.add(value.tolist())
+            else:
+                self._hash.update(np.ascontiguousarray(value).tobytes())
+        elif isinstance(value, DataContext):
+            # Read tasks capture the context, but its settings only affect how the
+            # data is executed and not the data itself.
+            self._update("context")
+        elif isinstance(value, ray.ObjectRef):
+            raise _UnfingerprintableError("it holds in-memory data")
+        elif isinstance(value, ActorHandle):
+            # Functions may capture actors, which are identified by their ids.
+            self._update("actor", value._actor_id.hex())
+        elif isinstance(value, ReadTask):
+            meta = value.get_metadata()
+            self._update("read", meta.num_rows, meta.size_bytes, meta.input_files)
+            self.add(value._read_fn)
+        elif isinstance(value, types.FunctionType):
+            self._add_function(value)
+        elif isinstance(value, types.MethodType):
+            self._update("method")
+            self.add(value.__func__)
+            self.add(value.__self__)
+        elif isinstance(value, functools.partial):
+            self._update("partial")
+            self.add((value.func, value.args, value.keywords))
+        elif isinstance(value, types.CodeType):
+            self._update("code", value.co_code, value.co_names, value.co_varnames)
+            self.add(value.co_consts)
+        elif isinstance(value, types.ModuleType):
+            self._update("module", value.__name__)
+        elif inspect.isclass(value):
+            self._add_class(value)
+        elif hasattr(value, "__dict__"):
+            self._update("object", type(value).__module__, type(value).__qualname__)
+            self._add_class(type(value))
+            self.add(vars(value))
+        else:
+            try:
+                self._hash.update(pickle.dumps(value))
+            except Exception:
+                raise _UnfingerprintableError(
+                    f"it holds the value {value!r} that can't be serialized"
+                )
+
+    def _add_function(self, fn: types.FunctionType):
+        self._update("function", fn.__module__, fn.__qualname__)
+        self.add(fn.__code__)
+        self.add(fn.__defaults__)
+        self.add(fn.__kwdefaults__)
+        if fn.__closure__:
+            for cell in fn.__closure__:
+                try:
+                    contents = cell.cell_contents
+                except ValueError:
+                    # The cell is empty.
+                    contents = None
+                self.add(contents)
+        # Include the values of the globals the function references. Imported
+        # modules, and functions, classes and objects defined in other modules, are
+        # only included by name, since hashing them would hash the code of every
+        # library the function uses. Changes to their code don't change the
+        # fingerprint.
+        for name in _referenced_names(fn.__code__):
+            if name not in fn.__globals__:
+                continue
+            value = fn.__globals__[name]
+            if isinstance(value, types.ModuleType):
+                continue
+            module = getattr(value, "__module__", fn.__module__)
+            if module != fn.__module__:
+                qualname = getattr(value, "__qualname__", type(value).__qualname__)
+                self._update("imported global", name, module, qualname)
+                continue
+            self._update("global", name)
+            self.add(value)
+
+    def _add_class(self, cls: type):
+        self._update("class", cls.__module__, cls.__qualname__)
+        if cls.__module__ == "builtins":
+            return
+        for name in sorted(vars(cls)):
+            attr = vars(cls)[name]
+            if isinstance(attr, (staticmethod, classmethod)):
+                attr = attr.__func__
+            if isinstance(attr, types.FunctionType):
+                self._update("attr", name)
+                self.add(attr)
+
+    def _update(self, *parts: Any):
+        self._hash.update(repr(parts).encode())
+
+
+def _referenced_names(code: types.CodeType) -> List[str]:
+    """Return the global names referenced by the code and its nested code."""
+    names = list(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names.extend(_referenced_names(const))
+    return names
+
+
+class MaterializationCache:
+    """A persistent cache of materialized datasets in a local or shared directory.
+
+    Each entry is stored in a subdirectory named by the fingerprint of the dataset's
+    logical plan (see `fingerprint_logical_plan()`), holding the blocks of the
+    dataset as Arrow IPC files and a manifest listing them in order. The manifest is
+    written last, so entries of failed or unfinished writes are never read.
+    """
+
+    MANIFEST_FILE_NAME = "_MANIFEST.json"
+
+    def __init__(self, path: str, filesystem: Optional["pyarrow.fs.FileSystem"] = None):
+        from ray.data.datasource.file_based_datasource import (
+            _resolve_paths_and_filesystem,
+        )
+
+        paths, self._filesystem = _resolve_paths_and_filesystem(path, filesystem)
+        self._path = paths[0]
+
+    @property
+    def filesystem(self) -> "pyarrow.fs.FileSystem":
+        return self._filesystem
+
+    def get(self, fingerprint: str) -> Optional[List[str]]:
+        """Return the paths of the cached files of the entry, or None on a miss."""
+        entry_path = posixpath.join(self._path, fingerprint)
+        manifest_path = posixpath.join(entry_path, self.MANIFEST_FILE_NAME)
+        try:
+            with self._filesystem.open_input_stream(manifest_path) as f:
+                manifest = json.loads(f.read().decode())
+        except (OSError, ValueError):
+            # Either the entry doesn't exist, or it's still being written.
+            return None
+        return [posixpath.join(entry_path, name) for name in manifest["files"]]
+
+    def put(self, fingerprint: str, ds: "Dataset") -> List[str]:
+        """Execute the dataset and write it to the entry.
+
+        Every write goes to its own subdirectory of the entry, so concurrent writes
+        of the same entry don't overwrite each other's files. The entry is published
+        by atomically moving its manifest into place, and the files of the earlier
+        writes are left in place, since their readers may still be reading them.
+
+        Returns:
+            The paths of the cached files of the entry.
+        """
+        from pyarrow.fs import FileSelector
+
+        from ray.data.datasource.arrow_ipc_datasource import ArrowIPCDatasource
+
+        entry_path = posixpath.join(self._path, fingerprint)
+        write_id = uuid.uuid4().hex
+        write_path = posixpath.join(entry_path, write_id)
+        self._filesystem.create_dir(write_path, recursive=True)
+
+        start_time = time.perf_counter()
+        ds.write_datasource(
+            ArrowIPCDatasource(),
+            path=write_path,
+            dataset_uuid="block",
+            filesystem=self._filesystem,
+        )
+        file_infos = self._filesystem.get_file_info(FileSelector(write_path))
+        names = sorted(
+            posixpath.join(write_id, posixpath.basename(info.path))
+            for info in file_infos
+            if info.path.endswith(f".{ArrowIPCDatasource._FILE_EXTENSION}")
+        )
+        manifest_path = posixpath.join(entry_path, self.MANIFEST_FILE_NAME)
+        tmp_manifest_path = f"{manifest_path}.{write_id}"
+        with self._filesystem.open_output_stream(tmp_manifest_path) as f:
+            f.write(json.dumps({"files": names}).encode())
+        self._filesystem.move(tmp_manifest_path, manifest_path)
+        logger.info(
+            f"Cached {len(names)} files of the dataset to {write_path} in "
+            f"{time.perf_counter() - start_time:.2f}s."
+        )
+        return [posixpath.join(entry_path, name) for name in names]
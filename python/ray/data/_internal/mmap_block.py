@@ -0,0 +1,133 @@
+import atexit
+import logging
+import os
+import shutil
+import uuid
+from typing import List, Optional, Set, Tuple
+
+import ray
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
+from ray.data.context import DataContext
+from ray.types import ObjectRef
+from ray.util.debug import log_once
+
+logger = logging.getLogger(__name__)
+
+# The directories of memory-mapped blocks that are removed when the driver exits.
+_registered_dirs: Set[str] = set()
+
+
+class _MmapBlock:
+    """A placeholder for a block stored in a memory-mapped Arrow IPC file.
+
+    The placeholder is what's stored in the object store, but it's pickled as a call
+    that opens the file, so getting it from the object store returns a zero-copy
+    `pyarrow.Table` view of the file instead. Consumers of the block therefore never
+    see the placeholder.
+
+    Blocks that were pandas DataFrames are converted back to DataFrames when they're
+    opened, which copies them out of the file.
+    """
+
+    def __init__(self, path: str, to_pandas: bool = False):
+        self._path = path
+        self._to_pandas = to_pandas
+
+    def __reduce__(self):
+        return _open_mmap_block, (self._path, self._to_pandas)
+
+
+def _open_mmap_block(path: str, to_pandas: bool = False) -> Block:
+    import pyarrow as pa
+
+    table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+    if to_pandas:
+        return table.to_pandas()
+    return table
+
+
+def get_mmap_blocks_dir() -> Optional[str]:
+    """Return the directory to store memory-mapped blocks of this job in.
+
+    Returns None if memory-mapped blocks are disabled, or if the cluster has more
+    than one node, since the files are only readable on the node they're on.
+    """
+    ctx = DataContext.get_current()
+    if ctx.mmap_blocks_dir is None:
+        return None
+    if sum(node["Alive"] for node in ray.nodes()) > 1:
+        if log_once("mmap_blocks_multi_node"):
+            logger.warning(
+                "Memory-mapped blocks are only supported on single-node clusters, "
+                "so blocks are stored in the object store instead."
+            )
+        return None
+    job_dir = os.path.join(
+        os.path.expanduser(ctx.mmap_blocks_dir),
+        f"ray_data_{ray.get_runtime_context().get_job_id()}",
+    )
+    if job_dir not in _registered_dirs:
+        _registered_dirs.add(job_dir)
+        atexit.register(shutil.rmtree, job_dir, ignore_errors=True)
+    return job_dir
+
+
+def write_mmap_block(block: Block, mmap_dir: str) -> Tuple[_MmapBlock, BlockMetadata]:
+    """Write the block to an Arrow IPC file in the directory.
+
+    Returns:
+        The placeholder of the block to store in the object store, and its metadata.
+    """
+    import pandas as pd
+    import pyarrow as pa
+
+    stats = BlockExecStats.builder()
+    to_pandas = isinstance(block, pd.DataFrame)
+    table = BlockAccessor.for_block(block).to_arrow()
+    os.makedirs(mmap_dir, exist_ok=True)
+    path = os.path.join(mmap_dir, f"{uuid.uuid4().hex}.arrow")
+    with pa.OSFile(path, "wb") as f, pa.ipc.new_file(f, table.schema) as writer:
+        writer.write_table(table)
+    # The metadata is of the block as it's returned when opened.
+    metadata = BlockAccessor.for_block(block if to_pandas else table).get_metadata(
+        input_files=None, exec_stats=stats.build()
+    )
+    metadata.mmapped = True
+    return _MmapBlock(path, to_pandas), metadata
+
+
+def put_mmap_blocks(
+    blocks: List[Block], mmap_dir: str
+) -> Tuple[List[ObjectRef[Block]], List[BlockMetadata]]:
+    """Store the given local blocks as memory-mapped blocks."""
+    refs, metadata = [], []
+    for block in blocks:
+        placeholder, block_metadata = write_mmap_block(block, mmap_dir)
+        refs.append(ray.put(placeholder))
+        metadata.append(block_metadata)
+    return refs, metadata
+
+
+def spill_to_mmap_blocks(
+    blocks_with_metadata: List[Tuple[ObjectRef[Block], BlockMetadata]],
+    mmap_dir: str,
+) -> Tuple[List[ObjectRef[Block]], List[BlockMetadata]]:
+    """Move the given blocks from the object store to memory-mapped blocks.
+
+    Blocks that are already memory-mapped are returned as is.
+    """
+    spill = cached_remote_fn(write_mmap_block, num_returns=2)
+    refs, metadata = [], []
+    for block_ref, block_metadata in blocks_with_metadata:
+        if block_metadata.mmapped:
+            refs.append(block_ref)
+            metadata.append(block_metadata)
+        else:
+            placeholder_ref, metadata_ref = spill.remote(block_ref, mmap_dir)
+            refs.append(placeholder_ref)
+            metadata.append(metadata_ref)
+    pending = [i for i, m in enumerate(metadata) if not isinstance(m, BlockMetadata)]
+    for i, block_metadata in zip(pending, ray.get([metadata[i] for i in pending])):
+        metadata[i] = block_metadata
+    return refs, metadata
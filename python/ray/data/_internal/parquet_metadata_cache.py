@@ -0,0 +1,147 @@
+import hashlib
+import json
+import logging
+import os
+import posixpath
+import uuid
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    import pyarrow
+    import pyarrow.parquet
+
+
+logger = logging.getLogger(__name__)
+
+
+class ParquetMetadataCache:
+    """A persistent cache of Parquet file metadata in a local directory.
+
+    The footers of Parquet files (including the row group statistics) and their
+    estimated encoding ratios are cached across reads and processes, so that reading
+    the same files again doesn't need to fetch their footers or sample them.
+
+    Entries are keyed by the path, modification time and size of the files, so
+    rewritten files are never served stale metadata. Files whose modification time
+    is unknown (e.g. on HTTP filesystems) are not cached.
+
+    All errors from accessing the cache directory are logged and ignored, so that the
+    cache never fails a read.
+    """
+
+    def __init__(self, cache_dir: str):
+        self._cache_dir = os.path.expanduser(cache_dir)
+
+    def get_keys(
+        self, paths: List[str], filesystem: "pyarrow.fs.FileSystem"
+    ) -> List[Optional[str]]:
+        """Return the cache keys of the given files, or None for uncacheable ones.
+
+        Files that share a directory with other given files are looked up by listing
+        the directory, which is much cheaper than a request per file on cloud
+        storage.
+        """
+        from pyarrow.fs import FileSelector, FileType
+
+        paths_by_dir = defaultdict(list)
+        for path in paths:
+            paths_by_dir[posixpath.dirname(path)].append(path)
+        file_infos = {}
+        try:
+            for dir_path, dir_paths in paths_by_dir.items():
+                if len(dir_paths) > 1:
+                    infos = filesystem.get_file_info(FileSelector(dir_path))
+                    dir_paths = set(dir_paths)
+                    infos = [info for info in infos if info.path in dir_paths]
+                else:
+                    infos = filesystem.get_file_info(dir_paths)
+                for info in infos:
+                    file_infos[info.path] = info
+        except OSError:
+            logger.debug("Failed to get Parquet file infos.", exc_info=True)
+            return [None] * len(paths)
+
+        keys = []
+        for path in paths:
+            info = file_infos.get(path)
+            if info is None or info.type != FileType.File or info.mtime_ns is None:
+                keys.append(None)
+                continue
+            key = f"{filesystem.type_name}://{path}:{info.mtime_ns}:{info.size}"
+            keys.append(hashlib.sha1(key.encode()).hexdigest())
+        return keys
+
+    def get_metadata(self, key: str) -> Optional["pyarrow.parquet.FileMetaData"]:
+        """Return the cached footer of a file, or None on a cache miss."""
+        import pyarrow.parquet as pq
+
+        path = self._entry_path(key, "footer")
+        if not os.path.exists(path):
+            return None
+        try:
+            return pq.read_metadata(path)
+        except Exception:
+            logger.debug(f"Failed to read cached Parquet footer {path}.", exc_info=True)
+            return None
+
+    def put_metadata(self, key: str, metadata: "pyarrow.parquet.FileMetaData"):
+        """Cache the footer of a file."""
+        self._write(key, "footer", metadata.write_metadata_file)
+
+    def get_encoding_ratio(
+        self, key: str, columns: Optional[List[str]]
+    ) -> Optional[float]:
+        """Return the cached encoding ratio of a file when reading the given columns,
+        or None on a cache miss."""
+        ratios = self._read_encoding_ratios(key)
+        return ratios.get(_columns_key(columns))
+
+    def put_encoding_ratio(self, key: str, columns: Optional[List[str]], ratio: float):
+        """Cache the encoding ratio of a file when reading the given columns."""
+        ratios = self._read_encoding_ratios(key)
+        ratios[_columns_key(columns)] = ratio
+
+        def write(path: str):
+            with open(path, "w") as f:
+                json.dump(ratios, f)
+
+        self._write(key, "ratios", write)
+
+    def _read_encoding_ratios(self, key: str) -> Dict[str, float]:
+        path = self._entry_path(key, "ratios")
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except Exception:
+            logger.debug(
+                f"Failed to read cached encoding ratios {path}.", exc_info=True
+            )
+            return {}
+
+    def _entry_path(self, key: str, kind: str) -> str:
+        # Shard the entries into subdirectories, to keep directories small for
+        # datasets with many files.
+        return os.path.join(self._cache_dir, key[:2], f"{key}.{kind}")
+
+    def _write(self, key: str, kind: str, write_fn):
+        path = self._entry_path(key, kind)
+        # Write to a temporary file first, so that concurrent readers never see a
+        # partially written entry.
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            write_fn(tmp_path)
+            os.replace(tmp_path, path)
+        except Exception:
+            logger.debug(
+                f"Failed to write Parquet metadata cache {path}.", exc_info=True
+            )
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+def _columns_key(columns: Optional[List[str]]) -> str:
+    return json.dumps(sorted(columns) if columns else None)
@@ -1,11 +1,13 @@
 from typing import List, Optional, Tuple
 
+from ray.data._internal.arrow_block import ArrowBlockAccessor
 from ray.data._internal.execution.interfaces import (
     AllToAllTransformFn,
     RefBundle,
     TaskContext,
 )
 from ray.data._internal.planner.exchange.aggregate_task_spec import (
+    HashAggregateTaskSpec,
     SortAggregateTaskSpec,
 )
 from ray.data._internal.planner.exchange.pull_based_shuffle_task_scheduler import (
@@ -15,6 +17,7 @@ from ray.data._internal.planner.exchange.push_based_shuffle_task_scheduler impor
     PushBasedShuffleTaskScheduler,
 )
 from ray.data._internal.planner.exchange.sort_task_spec import SortTaskSpec
+from ray.data._internal.sort import heavy_key_runs, merge_heavy_key_partitions
 from ray.data._internal.stats import StatsDict
 from ray.data._internal.util import unify_block_metadata_schema
 from ray.data.aggregate import AggregateFn
@@ -48,6 +51,20 @@ def generate_aggregate_fn(
             agg_fn._validate(unified_schema)
 
         num_mappers = len(blocks)
+        context = DataContext.get_current()
+
+        if (
+            key is not None
+            and context.use_hash_based_aggregate
+            and ArrowBlockAccessor.supports_hash_aggregate(key, aggs, unified_schema)
+        ):
+            # Hash partitioning needs no boundaries, so skip the sampling.
+            agg_spec = HashAggregateTaskSpec(key=key, aggs=aggs)
+            if context.use_push_based_shuffle:
+                scheduler = PushBasedShuffleTaskScheduler(agg_spec)
+            else:
+                scheduler = PullBasedShuffleTaskScheduler(agg_spec)
+            return scheduler.execute(refs, num_mappers, ctx)
 
         if key is None:
             num_outputs = 1
@@ -62,16 +79,39 @@ def generate_aggregate_fn(
                 num_outputs,
             )
 
+        runs = []
+        if context.skew_aware_groupby_enabled and isinstance(key, str):
+            runs = heavy_key_runs(boundaries, descending=False)
+
         agg_spec = SortAggregateTaskSpec(
             boundaries=boundaries,
             key=key,
             aggs=aggs,
+            skew_aware=len(runs) > 0,
         )
-        if DataContext.get_current().use_push_based_shuffle:
+        if context.use_push_based_shuffle:
             scheduler = PushBasedShuffleTaskScheduler(agg_spec)
         else:
             scheduler = PullBasedShuffleTaskScheduler(agg_spec)
 
-        return scheduler.execute(refs, num_outputs, ctx)
+        output, stats = scheduler.execute(refs, num_outputs, ctx)
+        if not runs:
+            return output, stats
+
+        # The rows of the heavy keys were spread across several reducers, so merge
+        # their partial aggregates in a final stage.
+        new_blocks, new_metadata = merge_heavy_key_partitions(
+            [block for bundle in output for block, _ in bundle.blocks],
+            runs,
+            key,
+            aggs,
+        )
+        owns_blocks = all(bundle.owns_blocks for bundle in output)
+        output = [
+            RefBundle([(block, meta)], owns_blocks=owns_blocks)
+            for block, meta in zip(new_blocks, new_metadata)
+        ]
+        stats["aggregate_merge"] = new_metadata
+        return output, stats
 
     return fn
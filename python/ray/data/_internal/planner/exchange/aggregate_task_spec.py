@@ -1,6 +1,8 @@
 from typing import List, Optional, Tuple, Union
 
+from ray.data._internal.arrow_block import ArrowBlockAccessor
 from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
+from ray.data._internal.sort import split_heavy_keys
 from ray.data._internal.table_block import TableBlockAccessor
 from ray.data.aggregate import AggregateFn, Count, _AggregateOnKeyBase
 from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata, KeyType
@@ -20,6 +22,10 @@ class SortAggregateTaskSpec(ExchangeTaskSpec):
     Final aggregate (`reduce`): each task would receive a block from every worker that
     consists of items in a certain range. It then merges the sorted blocks and
     aggregates on-the-fly.
+
+    In skew-aware mode, the rows of a heavy key are spread across several reducers,
+    so the reducers only partially aggregate and the caller finalizes the output
+    with `ray.data._internal.sort.merge_heavy_key_partitions`.
     """
 
     def __init__(
@@ -27,10 +33,11 @@ class SortAggregateTaskSpec(ExchangeTaskSpec):
         boundaries: List[KeyType],
         key: Optional[str],
         aggs: List[AggregateFn],
+        skew_aware: bool = False,
     ):
         super().__init__(
-            map_args=[boundaries, key, aggs],
-            reduce_args=[key, aggs],
+            map_args=[boundaries, key, aggs, skew_aware],
+            reduce_args=[key, aggs, skew_aware],
         )
 
     @staticmethod
@@ -41,6 +48,7 @@ class SortAggregateTaskSpec(ExchangeTaskSpec):
         boundaries: List[KeyType],
         key: Optional[str],
         aggs: List[AggregateFn],
+        skew_aware: bool,
     ) -> List[Union[BlockMetadata, Block]]:
         stats = BlockExecStats.builder()
 
@@ -49,11 +57,14 @@ class SortAggregateTaskSpec(ExchangeTaskSpec):
         if key is None:
             partitions = [block]
         else:
+            sort_key = [(key, "ascending")] if isinstance(key, str) else key
             partitions = BlockAccessor.for_block(block).sort_and_partition(
-                boundaries,
-                [(key, "ascending")] if isinstance(key, str) else key,
-                descending=False,
+                boundaries, sort_key, descending=False
             )
+            if skew_aware:
+                partitions = split_heavy_keys(
+                    partitions, boundaries, sort_key, descending=False
+                )
         parts = [BlockAccessor.for_block(p).combine(key, aggs) for p in partitions]
         meta = BlockAccessor.for_block(block).get_metadata(
             input_files=None, exec_stats=stats.build()
@@ -64,11 +75,15 @@ class SortAggregateTaskSpec(ExchangeTaskSpec):
     def reduce(
         key: Optional[str],
         aggs: List[AggregateFn],
+        skew_aware: bool,
         *mapper_outputs: List[Block],
         partial_reduce: bool = False,
     ) -> Tuple[Block, BlockMetadata]:
         return BlockAccessor.for_block(mapper_outputs[0]).aggregate_combined_blocks(
-            list(mapper_outputs), key, aggs, finalize=not partial_reduce
+            list(mapper_outputs),
+            key,
+            aggs,
+            finalize=not partial_reduce and not skew_aware,
         )
 
     @staticmethod
@@ -102,3 +117,61 @@ class SortAggregateTaskSpec(ExchangeTaskSpec):
             return block_accessor.select(list(columns))
         else:
             return block
+
+
+class HashAggregateTaskSpec(ExchangeTaskSpec):
+    """
+    The implementation for hash-based aggregate tasks.
+
+    Unlike `SortAggregateTaskSpec`, this needs neither sampled boundaries nor sorted
+    blocks, but the output isn't sorted by key. It only supports the aggregations
+    that Arrow can compute, see `ArrowBlockAccessor.supports_hash_aggregate`.
+
+    Partial aggregate (`map`): each block is partially aggregated with Arrow's hash
+    aggregation, then partitioned by the hash of the key.
+
+    Final aggregate (`reduce`): each task would receive a block from every worker that
+    consists of the partial aggregates of a hash partition. It then merges them with
+    Arrow's hash aggregation.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        aggs: List[AggregateFn],
+    ):
+        super().__init__(
+            map_args=[key, aggs],
+            reduce_args=[key, aggs],
+        )
+
+    @staticmethod
+    def map(
+        idx: int,
+        block: Block,
+        output_num_blocks: int,
+        key: str,
+        aggs: List[AggregateFn],
+    ) -> List[Union[BlockMetadata, Block]]:
+        stats = BlockExecStats.builder()
+
+        block = SortAggregateTaskSpec._prune_unused_columns(block, key, aggs)
+        combined = ArrowBlockAccessor(
+            BlockAccessor.for_block(block).to_arrow()
+        ).hash_combine(key, aggs)
+        parts = ArrowBlockAccessor(combined).hash_partition(key, output_num_blocks)
+        meta = BlockAccessor.for_block(block).get_metadata(
+            input_files=None, exec_stats=stats.build()
+        )
+        return parts + [meta]
+
+    @staticmethod
+    def reduce(
+        key: str,
+        aggs: List[AggregateFn],
+        *mapper_outputs: List[Block],
+        partial_reduce: bool = False,
+    ) -> Tuple[Block, BlockMetadata]:
+        return ArrowBlockAccessor.aggregate_hash_combined_blocks(
+            list(mapper_outputs), key, aggs, finalize=not partial_reduce
+        )
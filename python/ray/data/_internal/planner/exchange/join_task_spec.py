@@ -0,0 +1,105 @@
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+
+from ray.data._internal.arrow_block import ArrowBlockAccessor
+from ray.data._internal.arrow_ops import transform_pyarrow
+from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
+from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
+
+if TYPE_CHECKING:
+    import pyarrow
+
+
+class HashJoinTaskSpec(ExchangeTaskSpec):
+    """
+    The implementation for distributed hash join tasks.
+
+    The blocks of both sides are fed through a single exchange, left side first.
+    Hash join is done in 2 steps: hash partitioning of individual blocks, and
+    joining co-partitioned blocks.
+
+    Partitioning (`map`): each block (from either side) is partitioned by the hash
+    of its key columns. Rows with equal keys always land in the same partition index,
+    no matter which side or block they come from.
+
+    Joining (`reduce`): each task receives one partition from every map task, i.e.
+    all rows of both sides whose keys hash to this partition. It concatenates the
+    partitions of each side and joins them with Arrow compute.
+
+    NOTE: the reduce task tells the two sides apart by the position of the map
+    outputs, so this spec must be scheduled with the pull-based scheduler, which
+    passes map outputs to the reducers in map task order.
+    """
+
+    def __init__(
+        self,
+        keys: List[str],
+        how: str,
+        num_left_blocks: int,
+        right_suffix: str,
+    ):
+        super().__init__(
+            map_args=[keys],
+            reduce_args=[keys, how, num_left_blocks, right_suffix],
+        )
+
+    @staticmethod
+    def map(
+        idx: int,
+        block: Block,
+        output_num_blocks: int,
+        keys: List[str],
+    ) -> List[Union[BlockMetadata, Block]]:
+        stats = BlockExecStats.builder()
+        block = BlockAccessor.for_block(block)
+        partitions = transform_pyarrow.hash_partition(
+            block.to_arrow(), keys, output_num_blocks
+        )
+        meta = block.get_metadata(input_files=None, exec_stats=stats.build())
+        return partitions + [meta]
+
+    @staticmethod
+    def reduce(
+        keys: List[str],
+        how: str,
+        num_left_blocks: int,
+        right_suffix: str,
+        *mapper_outputs: List[Block],
+        partial_reduce: bool = False,
+    ) -> Tuple[Block, BlockMetadata]:
+        assert not partial_reduce, "Hash join doesn't support partial reduce."
+        stats = BlockExecStats.builder()
+        left = _concat_non_empty(mapper_outputs[:num_left_blocks])
+        right = _concat_non_empty(mapper_outputs[num_left_blocks:])
+        result = join_tables(left, right, keys, how, right_suffix)
+        return result, ArrowBlockAccessor(result).get_metadata(
+            input_files=None, exec_stats=stats.build()
+        )
+
+
+def join_tables(
+    left: Optional["pyarrow.Table"],
+    right: Optional["pyarrow.Table"],
+    keys: List[str],
+    how: str,
+    right_suffix: str,
+) -> "pyarrow.Table":
+    """Join two tables, where either side may be missing (None) because it had no
+    schema-bearing input blocks.
+    """
+    if left is not None and right is not None:
+        return transform_pyarrow.join(left, right, keys, how, right_suffix)
+    # Without a schema for one side, there is nothing to join against, so only the
+    # rows that the join type keeps unconditionally can be returned.
+    if left is not None and how in ("left", "outer"):
+        return left
+    if right is not None and how in ("right", "outer"):
+        return right
+    return ArrowBlockAccessor._empty_table()
+
+
+def _concat_non_empty(blocks: List[Block]) -> Optional["pyarrow.Table"]:
+    """Concatenate the blocks that have a schema, or return None if there are none."""
+    tables = [b for b in blocks if b.num_columns > 0]
+    if not tables:
+        return None
+    return transform_pyarrow.concat(tables)
@@ -6,6 +6,7 @@ from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
 from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
 from ray.data._internal.progress_bar import ProgressBar
 from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data._internal.sort import split_heavy_keys
 from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
 from ray.types import ObjectRef
 
@@ -26,6 +27,10 @@ class SortTaskSpec(ExchangeTaskSpec):
     Sorting is done in 3 steps: sampling, sorting individual blocks, and
     merging sorted blocks.
 
+    In skew-aware mode, the rows of a heavy key are spread across all the reducers
+    whose boundaries equal the key, instead of all going to one of them (see
+    `ray.data._internal.sort.split_heavy_keys`).
+
     Sampling (`sample_boundaries`): we get a number of sample items from each block,
     sort them, and use them to compute boundaries that would partition all items into
     approximately equal ranges.
@@ -46,9 +51,10 @@ class SortTaskSpec(ExchangeTaskSpec):
         boundaries: List[T],
         key: SortKeyT,
         descending: bool,
+        skew_aware: bool = False,
     ):
         super().__init__(
-            map_args=[boundaries, key, descending],
+            map_args=[boundaries, key, descending, skew_aware],
             reduce_args=[key, descending],
         )
 
@@ -60,11 +66,14 @@ class SortTaskSpec(ExchangeTaskSpec):
         boundaries: List[T],
         key: SortKeyT,
         descending: bool,
+        skew_aware: bool,
     ) -> List[Union[BlockMetadata, Block]]:
         stats = BlockExecStats.builder()
         out = BlockAccessor.for_block(block).sort_and_partition(
             boundaries, key, descending
         )
+        if skew_aware:
+            out = split_heavy_keys(out, boundaries, key, descending)
         meta = BlockAccessor.for_block(block).get_metadata(
             input_files=None, exec_stats=stats.build()
         )
@@ -88,6 +97,9 @@ class SortTaskSpec(ExchangeTaskSpec):
         """
         Return (num_reducers - 1) items in ascending order from the blocks that
         partition the domain into ranges with approximately equally many elements.
+
+        A key that makes up a fraction f of the samples appears about
+        f * num_reducers times in a row in the result.
         """
         # TODO(Clark): Support multiple boundary sampling keys.
         if isinstance(key, list) and len(key) > 1:
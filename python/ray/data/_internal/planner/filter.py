@@ -1,9 +1,15 @@
-from typing import Callable, Iterator
+from typing import TYPE_CHECKING, Callable, Iterator, Union
 
+from ray.data._internal.arrow_block import ArrowBlockAccessor
 from ray.data._internal.execution.interfaces import TaskContext
 from ray.data.block import Block, BlockAccessor, UserDefinedFunction
 from ray.data.context import DataContext
 
+if TYPE_CHECKING:
+    import pyarrow
+
+    from ray.data.expressions import Expr
+
 
 def generate_filter_fn() -> Callable[
     [Iterator[Block], TaskContext, UserDefinedFunction], Iterator[Block]
@@ -30,3 +36,37 @@ def generate_filter_fn() -> Callable[
             yield builder.build()
 
     return fn
+
+
+def generate_filter_expr_fn() -> Callable[
+    [Iterator[Block], TaskContext, Union["pyarrow.dataset.Expression", "Expr"]],
+    Iterator[Block],
+]:
+    """Generate function to filter out records of blocks that do not satisfy the
+    given Arrow expression or `ray.data.expressions.Expr`.
+
+    Unlike `generate_filter_fn`, the predicate is evaluated on whole blocks with Arrow
+    compute, without calling back into Python for each record.
+    """
+    import pyarrow.dataset as pds
+
+    from ray.data.expressions import Expr
+
+    context = DataContext.get_current()
+
+    def fn(
+        blocks: Iterator[Block],
+        ctx: TaskContext,
+        filter_expr: Union["pyarrow.dataset.Expression", Expr],
+    ) -> Iterator[Block]:
+        DataContext._set_current(context)
+        for block in blocks:
+            table = BlockAccessor.for_block(block).to_arrow()
+            if table.num_rows > 0:
+                if isinstance(filter_expr, Expr):
+                    table = ArrowBlockAccessor(table).filter(filter_expr)
+                else:
+                    table = pds.dataset(table).to_table(filter=filter_expr)
+            yield table
+
+    return fn
@@ -0,0 +1,212 @@
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from ray.data._internal.arrow_ops import transform_pyarrow
+from ray.data._internal.execution.interfaces import (
+    JoinTransformFn,
+    RefBundle,
+    TaskContext,
+)
+from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
+from ray.data._internal.planner.exchange.join_task_spec import (
+    HashJoinTaskSpec,
+    join_tables,
+)
+from ray.data._internal.planner.exchange.pull_based_shuffle_task_scheduler import (
+    PullBasedShuffleTaskScheduler,
+)
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data._internal.stats import StatsDict
+from ray.data._internal.util import unify_block_metadata_schema
+from ray.data.block import (
+    Block,
+    BlockAccessor,
+    BlockExecStats,
+    BlockMetadata,
+    _validate_key_fn,
+)
+from ray.data.context import DataContext
+
+if TYPE_CHECKING:
+    import pyarrow
+
+# The supported join types.
+JOIN_TYPES = ("inner", "left", "right", "outer")
+
+
+def generate_join_fn(
+    keys: List[str],
+    how: str,
+    right_suffix: str,
+) -> JoinTransformFn:
+    """Generate function to join the blocks of two datasets on the key columns.
+
+    If one side is smaller than `DataContext.broadcast_join_threshold_bytes` and the
+    join type allows it, the small side is concatenated into a single block and
+    broadcast to one join task per block of the large side. Otherwise, both sides are
+    hash partitioned by key in a single exchange, and co-partitioned blocks are joined
+    by the reduce tasks.
+    """
+    if how not in JOIN_TYPES:
+        raise ValueError(f"`how` must be one of {JOIN_TYPES}, got: {how!r}")
+
+    def fn(
+        left_refs: List[RefBundle],
+        right_refs: List[RefBundle],
+        ctx: TaskContext,
+    ) -> Tuple[List[RefBundle], StatsDict]:
+        left_metadata = [meta for b in left_refs for _, meta in b.blocks]
+        right_metadata = [meta for b in right_refs for _, meta in b.blocks]
+        for metadata in (left_metadata, right_metadata):
+            schema = unify_block_metadata_schema(metadata)
+            for key in keys:
+                _validate_key_fn(schema, key)
+
+        if not left_metadata or not right_metadata:
+            # One side has no blocks to take a schema from.
+            return _join_with_empty_side(left_refs, right_refs, how)
+
+        broadcast_side = _choose_broadcast_side(left_metadata, right_metadata, how)
+        if broadcast_side is not None:
+            output, stats = _broadcast_join(
+                left_refs, right_refs, keys, how, right_suffix, broadcast_side, ctx
+            )
+        else:
+            spec = HashJoinTaskSpec(
+                keys=keys,
+                how=how,
+                num_left_blocks=len(left_metadata),
+                right_suffix=right_suffix,
+            )
+            # NOTE: the push-based scheduler merges map outputs, which loses the
+            # side each of them came from, so always use the pull-based one.
+            scheduler = PullBasedShuffleTaskScheduler(spec)
+            num_outputs = max(len(left_metadata), len(right_metadata))
+            output, stats = scheduler.execute(left_refs + right_refs, num_outputs, ctx)
+
+        # Clean up inputs.
+        for ref in left_refs:
+            ref.destroy_if_owned()
+        for ref in right_refs:
+            ref.destroy_if_owned()
+        return output, stats
+
+    return fn
+
+
+def _choose_broadcast_side(
+    left_metadata: List[BlockMetadata],
+    right_metadata: List[BlockMetadata],
+    how: str,
+) -> Optional[str]:
+    """Return the side ("left" or "right") to broadcast, or None to shuffle.
+
+    Only a side whose unmatched rows are dropped by the join can be broadcast, since
+    each join task only sees a subset of the other side's rows.
+    """
+    threshold = DataContext.get_current().broadcast_join_threshold_bytes
+    if threshold is None or threshold <= 0:
+        return None
+    left_bytes = sum(m.size_bytes for m in left_metadata)
+    right_bytes = sum(m.size_bytes for m in right_metadata)
+    candidates = []
+    if how in ("inner", "left") and right_bytes <= threshold:
+        candidates.append((right_bytes, "right"))
+    if how in ("inner", "right") and left_bytes <= threshold:
+        candidates.append((left_bytes, "left"))
+    if not candidates:
+        return None
+    return min(candidates)[1]
+
+
+def _broadcast_join(
+    left_refs: List[RefBundle],
+    right_refs: List[RefBundle],
+    keys: List[str],
+    how: str,
+    right_suffix: str,
+    broadcast_side: str,
+    ctx: TaskContext,
+) -> Tuple[List[RefBundle], StatsDict]:
+    """Join by shipping the small side once to every join task of the large side."""
+    if broadcast_side == "left":
+        small_refs, large_refs = left_refs, right_refs
+    else:
+        small_refs, large_refs = right_refs, left_refs
+
+    concat_blocks = cached_remote_fn(_concat_blocks)
+    small_block = concat_blocks.remote(
+        *[block for bundle in small_refs for block, _ in bundle.blocks]
+    )
+
+    join_block = cached_remote_fn(_broadcast_join_block, num_returns=2)
+    output_blocks = []
+    output_metadata = []
+    for bundle in large_refs:
+        for block, _ in bundle.blocks:
+            res, meta = join_block.remote(
+                block, small_block, keys, how, right_suffix, broadcast_side
+            )
+            output_blocks.append(res)
+            output_metadata.append(meta)
+    del small_block
+
+    sub_progress_bar_dict = ctx.sub_progress_bar_dict
+    bar_name = ExchangeTaskSpec.REDUCE_SUB_PROGRESS_BAR_NAME
+    assert bar_name in sub_progress_bar_dict, sub_progress_bar_dict
+    output_metadata = sub_progress_bar_dict[bar_name].fetch_until_complete(
+        output_metadata
+    )
+
+    input_owned = all(b.owns_blocks for b in left_refs + right_refs)
+    output = [
+        RefBundle([(block, meta)], owns_blocks=input_owned)
+        for block, meta in zip(output_blocks, output_metadata)
+    ]
+    return output, {"broadcast_join": output_metadata}
+
+
+def _join_with_empty_side(
+    left_refs: List[RefBundle],
+    right_refs: List[RefBundle],
+    how: str,
+) -> Tuple[List[RefBundle], StatsDict]:
+    """Join where at least one side has no blocks at all.
+
+    The blocks of the kept side (if any) are passed through as is.
+    """
+    if left_refs and how in ("left", "outer"):
+        return left_refs, {}
+    if right_refs and how in ("right", "outer"):
+        return right_refs, {}
+    for ref in left_refs + right_refs:
+        ref.destroy_if_owned()
+    return [], {}
+
+
+def _concat_blocks(*blocks: Block) -> "pyarrow.Table":
+    tables = [BlockAccessor.for_block(b).to_arrow() for b in blocks]
+    tables = [t for t in tables if t.num_columns > 0]
+    if not tables:
+        return BlockAccessor.for_block(blocks[0]).to_arrow()
+    return transform_pyarrow.concat(tables)
+
+
+def _broadcast_join_block(
+    block: Block,
+    small_block: "pyarrow.Table",
+    keys: List[str],
+    how: str,
+    right_suffix: str,
+    broadcast_side: str,
+) -> Tuple[Block, BlockMetadata]:
+    stats = BlockExecStats.builder()
+    table = BlockAccessor.for_block(block).to_arrow()
+    table = table if table.num_columns > 0 else None
+    small_table = small_block if small_block.num_columns > 0 else None
+    if broadcast_side == "left":
+        result = join_tables(small_table, table, keys, how, right_suffix)
+    else:
+        result = join_tables(table, small_table, keys, how, right_suffix)
+    return result, BlockAccessor.for_block(result).get_metadata(
+        input_files=None, exec_stats=stats.build()
+    )
@@ -31,7 +31,9 @@ def generate_map_batches_fn(
         **fn_kwargs,
     ) -> Iterator[Block]:
         DataContext._set_current(context)
-        output_buffer = BlockOutputBuffer(None, context.target_max_block_size)
+        output_buffer = BlockOutputBuffer(
+            None, task_context.target_max_block_size or context.target_max_block_size
+        )
 
         def validate_batch(batch: Block) -> None:
             if not isinstance(
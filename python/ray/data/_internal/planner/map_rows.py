@@ -19,7 +19,9 @@ def generate_map_rows_fn() -> (
         blocks: Iterator[Block], ctx: TaskContext, row_fn: UserDefinedFunction
     ) -> Iterator[Block]:
         DataContext._set_current(context)
-        output_buffer = BlockOutputBuffer(None, context.target_max_block_size)
+        output_buffer = BlockOutputBuffer(
+            None, ctx.target_max_block_size or context.target_max_block_size
+        )
         for block in blocks:
             block = BlockAccessor.for_block(block)
             for row in block.iter_rows(public_row_format=True):
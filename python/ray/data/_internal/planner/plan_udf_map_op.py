@@ -11,11 +11,16 @@ from ray.data._internal.logical.operators.map_operator import (
     FlatMap,
     MapBatches,
     MapRows,
+    WithColumn,
+)
+from ray.data._internal.planner.filter import (
+    generate_filter_expr_fn,
+    generate_filter_fn,
 )
-from ray.data._internal.planner.filter import generate_filter_fn
 from ray.data._internal.planner.flat_map import generate_flat_map_fn
 from ray.data._internal.planner.map_batches import generate_map_batches_fn
 from ray.data._internal.planner.map_rows import generate_map_rows_fn
+from ray.data._internal.planner.with_column import generate_with_column_fn
 from ray.data._internal.util import validate_compute
 from ray.data.block import Block, CallableClass
 
@@ -39,7 +44,12 @@ def _plan_udf_map_op(
     elif isinstance(op, FlatMap):
         transform_fn = generate_flat_map_fn()
     elif isinstance(op, Filter):
-        transform_fn = generate_filter_fn()
+        if op._filter_expr is not None:
+            transform_fn = generate_filter_expr_fn()
+        else:
+            transform_fn = generate_filter_fn()
+    elif isinstance(op, WithColumn):
+        transform_fn = generate_with_column_fn(op._col)
     else:
         raise ValueError(f"Found unknown logical operator during planning: {op}")
 
@@ -13,9 +13,12 @@ def _plan_write_op(op: Write, input_physical_dag: PhysicalOperator) -> PhysicalO
     def do_write(blocks: Iterator[Block], ctx: TaskContext) -> Iterator[Block]:
         yield from transform_fn(blocks, ctx)
 
-    return MapOperator.create(
+    physical_op = MapOperator.create(
         do_write,
         input_physical_dag,
         name="Write",
         ray_remote_args=op._ray_remote_args,
     )
+    if op._min_bytes_per_bundle is not None:
+        physical_op.set_min_bytes_per_bundle(op._min_bytes_per_bundle)
+    return physical_op
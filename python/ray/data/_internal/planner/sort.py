@@ -22,6 +22,7 @@ from ray.data.context import DataContext
 def generate_sort_fn(
     key: SortKeyT,
     descending: bool,
+    skew_aware: bool = False,
 ) -> AllToAllTransformFn:
     """Generate function to sort blocks by the specified key column or key function."""
 
@@ -55,7 +56,12 @@ def generate_sort_fn(
         boundaries = SortTaskSpec.sample_boundaries(blocks, key, num_outputs)
         if descending:
             boundaries.reverse()
-        sort_spec = SortTaskSpec(boundaries=boundaries, key=key, descending=descending)
+        sort_spec = SortTaskSpec(
+            boundaries=boundaries,
+            key=key,
+            descending=descending,
+            skew_aware=skew_aware,
+        )
 
         if DataContext.get_current().use_push_based_shuffle:
             scheduler = PushBasedShuffleTaskScheduler(sort_spec)
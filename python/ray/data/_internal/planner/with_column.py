@@ -0,0 +1,33 @@
+from typing import TYPE_CHECKING, Callable, Iterator
+
+from ray.data._internal.arrow_block import ArrowBlockAccessor
+from ray.data._internal.execution.interfaces import TaskContext
+from ray.data.block import Block, BlockAccessor
+from ray.data.context import DataContext
+
+if TYPE_CHECKING:
+    from ray.data.expressions import Expr
+
+
+def generate_with_column_fn(
+    col: str,
+) -> Callable[[Iterator[Block], TaskContext, "Expr"], Iterator[Block]]:
+    """Generate function to set the column of blocks to the values of the given
+    expression.
+
+    The expression is evaluated on whole blocks with Arrow compute, without
+    converting them to another batch format or calling back into Python for each
+    batch.
+    """
+
+    context = DataContext.get_current()
+
+    def fn(blocks: Iterator[Block], ctx: TaskContext, expr: "Expr") -> Iterator[Block]:
+        DataContext._set_current(context)
+        for block in blocks:
+            table = BlockAccessor.for_block(block).to_arrow()
+            if table.num_rows > 0:
+                table = ArrowBlockAccessor(table).with_column(col, expr)
+            yield table
+
+    return fn
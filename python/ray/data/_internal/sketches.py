@@ -0,0 +1,245 @@
+import math
+import pickle
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# This module contains mergeable sketches backing the approximate aggregations of
+# ray.data.aggregate. Each sketch is updated with whole arrays of (non-null) values,
+# merged with sketches of other blocks, and serialized to bytes so that it can be
+# stored as the accumulator of a partially aggregated block.
+
+
+def hash_values(values: np.ndarray) -> np.ndarray:
+    """Hash the values to uint64s consistently across blocks and processes."""
+    import pandas as pd
+
+    # Equal numbers must get equal hashes regardless of their dtype, which differs
+    # e.g. for integer columns with and without nulls.
+    if values.dtype.kind in "biuf":
+        values = values.astype(np.float64)
+    return pd.util.hash_array(values)
+
+
+class HyperLogLog:
+    """HyperLogLog sketch for estimating the number of distinct values.
+
+    The relative standard error of the estimate is about 1.04 / sqrt(2**precision).
+    See https://algo.inria.fr/flajolet/Publications/FlFuGaMe07.pdf.
+    """
+
+    def __init__(self, precision: int = 12, registers: Optional[np.ndarray] = None):
+        if not 4 <= precision <= 18:
+            raise ValueError(f"precision must be between 4 and 18, got {precision}.")
+        self._precision = precision
+        if registers is None:
+            registers = np.zeros(1 << precision, dtype=np.uint8)
+        self._registers = registers
+
+    def update(self, values: np.ndarray):
+        if len(values) == 0:
+            return
+        hashes = hash_values(values)
+        p = np.uint64(self._precision)
+        # The first `precision` bits of the hash select the register, and the
+        # position of the first 1 bit in the rest is the rank of the value.
+        indices = (hashes >> (np.uint64(64) - p)).astype(np.int64)
+        rest = hashes & ((np.uint64(1) << (np.uint64(64) - p)) - np.uint64(1))
+        ranks = (64 - self._precision) - _bit_length(rest) + 1
+        np.maximum.at(self._registers, indices, ranks.astype(np.uint8))
+
+    def merge(self, other: "HyperLogLog"):
+        assert self._precision == other._precision
+        self._registers = np.maximum(self._registers, other._registers)
+
+    def estimate(self) -> int:
+        m = len(self._registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.exp2(-self._registers.astype(np.float64)))
+        num_zeros = int(np.count_nonzero(self._registers == 0))
+        if estimate <= 2.5 * m and num_zeros > 0:
+            # Use linear counting for small cardinalities.
+            estimate = m * math.log(m / num_zeros)
+        return int(round(estimate))
+
+    def to_bytes(self) -> bytes:
+        return self._registers.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "HyperLogLog":
+        registers = np.frombuffer(data, dtype=np.uint8).copy()
+        return cls(int(math.log2(len(registers))), registers)
+
+
+def _bit_length(x: np.ndarray) -> np.ndarray:
+    """Return the number of bits needed to represent each of the uint64s."""
+    x = x.copy()
+    length = np.zeros(len(x), dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        mask = x >= (np.uint64(1) << np.uint64(shift))
+        length[mask] += shift
+        x[mask] >>= np.uint64(shift)
+    return length + (x > 0)
+
+
+class KLLSketch:
+    """KLL sketch for estimating quantiles of numeric values.
+
+    Items are kept in levels of compactors, where the items at level h stand for
+    2**h input values each. When a level exceeds its capacity, it's sorted and every
+    other item (starting at a random offset) is promoted to the next level. The
+    capacities shrink geometrically towards the lower levels, so the sketch keeps
+    O(k) items, and the rank error of the quantiles is about 1.65 / k.
+    See https://arxiv.org/abs/1603.05346.
+    """
+
+    def __init__(self, k: int = 200, levels: Optional[List[np.ndarray]] = None):
+        if k < 8:
+            raise ValueError(f"k must be at least 8, got {k}.")
+        self._k = k
+        self._levels = levels or [np.empty(0)]
+        self._rng = np.random.default_rng()
+
+    def update(self, values: np.ndarray):
+        if len(values) == 0:
+            return
+        self._levels[0] = np.concatenate(
+            [self._levels[0], np.asarray(values, dtype=np.float64)]
+        )
+        self._compress()
+
+    def merge(self, other: "KLLSketch"):
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+        for i, items in enumerate(other._levels):
+            self._levels[i] = np.concatenate([self._levels[i], items])
+        self._compress()
+
+    def quantiles(self, qs: List[float]) -> List[Optional[float]]:
+        items = np.concatenate(self._levels)
+        if len(items) == 0:
+            return [None] * len(qs)
+        weights = np.concatenate(
+            [np.full(len(level), 2**h) for h, level in enumerate(self._levels)]
+        )
+        order = np.argsort(items, kind="stable")
+        items = items[order]
+        cum_weights = np.cumsum(weights[order])
+        indices = np.searchsorted(cum_weights, np.asarray(qs) * cum_weights[-1])
+        return items[np.minimum(indices, len(items) - 1)].tolist()
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - level - 1
+        return max(2, int(math.ceil(self._k * (2 / 3) ** depth)))
+
+    def _compress(self):
+        level = 0
+        while level < len(self._levels):
+            items = self._levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self._levels):
+                    self._levels.append(np.empty(0))
+                items = np.sort(items)
+                # Keep the odd item out at this level.
+                num_kept = len(items) % 2
+                offset = int(self._rng.integers(2))
+                promoted = items[num_kept + offset :: 2]
+                self._levels[level] = items[:num_kept]
+                self._levels[level + 1] = np.concatenate(
+                    [self._levels[level + 1], promoted]
+                )
+            level += 1
+
+    def to_bytes(self) -> bytes:
+        header = np.array(
+            [self._k, len(self._levels)] + [len(level) for level in self._levels],
+            dtype=np.int64,
+        )
+        return header.tobytes() + np.concatenate(self._levels).tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "KLLSketch":
+        k, num_levels = np.frombuffer(data, dtype=np.int64, count=2)
+        sizes = np.frombuffer(data, dtype=np.int64, count=num_levels, offset=16)
+        items = np.frombuffer(data, dtype=np.float64, offset=8 * (2 + num_levels))
+        levels = np.split(items, np.cumsum(sizes)[:-1])
+        return cls(int(k), levels)
+
+
+class SpaceSaving:
+    """Space-saving sketch for finding the most frequent values.
+
+    The sketch keeps estimated counts of at most `capacity` values. Estimates never
+    undercount, and overcount by at most `errors[value]`. Sketches are merged as in
+    https://arxiv.org/abs/1202.5224: values missing from a sketch are assumed to
+    have the largest count that the sketch could have dropped.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        import pandas as pd
+
+        self._capacity = capacity
+        self._counts = pd.Series([], dtype=np.int64)
+        self._errors = pd.Series([], dtype=np.int64)
+        # An upper bound on the count of the values that aren't in the sketch.
+        self._bound = 0
+
+    def update(self, values: np.ndarray):
+        import pandas as pd
+
+        if len(values) == 0:
+            return
+        counts = pd.Series(values).value_counts()
+        other = SpaceSaving(self._capacity)
+        other._counts = counts.astype(np.int64)
+        other._errors = pd.Series(0, index=counts.index, dtype=np.int64)
+        other._truncate()
+        self.merge(other)
+
+    def merge(self, other: "SpaceSaving"):
+        index = self._counts.index.union(other._counts.index)
+        self._counts = self._counts.reindex(
+            index, fill_value=self._bound
+        ) + other._counts.reindex(index, fill_value=other._bound)
+        self._errors = self._errors.reindex(
+            index, fill_value=self._bound
+        ) + other._errors.reindex(index, fill_value=other._bound)
+        self._bound += other._bound
+        self._truncate()
+
+    def top_k(self, k: int) -> List[Dict[str, Any]]:
+        top = self._counts.sort_values(ascending=False, kind="stable").head(k)
+        return [
+            {"value": value, "count": int(count)}
+            for value, count in zip(top.index.tolist(), top.tolist())
+        ]
+
+    def _truncate(self):
+        if len(self._counts) <= self._capacity:
+            return
+        counts = self._counts.sort_values(ascending=False, kind="stable")
+        self._bound = max(self._bound, int(counts.iloc[self._capacity]))
+        self._counts = counts.iloc[: self._capacity]
+        self._errors = self._errors.reindex(self._counts.index)
+
+    def to_bytes(self) -> bytes:
+        return pickle.dumps(
+            (
+                self._capacity,
+                self._counts.index.tolist(),
+                self._counts.to_numpy(),
+                self._errors.to_numpy(),
+                self._bound,
+            )
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SpaceSaving":
+        import pandas as pd
+
+        capacity, values, counts, errors, bound = pickle.loads(data)
+        sketch = cls(capacity)
+        sketch._bound = bound
+        sketch._counts = pd.Series(counts, index=values, dtype=np.int64)
+        sketch._errors = pd.Series(errors, index=values, dtype=np.int64)
+        return sketch
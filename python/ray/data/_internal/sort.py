@@ -15,8 +15,14 @@ This is an all-to-all shuffle.
 Merging: a merge task would receive a block from every worker that consists
 of items in a certain range. It then merges the sorted blocks into one sorted
 block and becomes part of the new, sorted dataset.
+
+Heavy keys: a key that makes up a large share of the dataset shows up as a run of
+equal boundaries. In skew-aware mode, the rows of such a key are spread evenly
+across the run's reducers instead of all landing in one of them (see
+`split_heavy_keys`). The sort order is preserved, but a key may then span several
+output blocks.
 """
-from typing import Any, Callable, List, Optional, Tuple, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple, TypeVar, Union
 
 import numpy as np
 
@@ -31,6 +37,9 @@ from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
 from ray.data.context import DataContext
 from ray.types import ObjectRef
 
+if TYPE_CHECKING:
+    from ray.data.aggregate import AggregateFn
+
 T = TypeVar("T")
 
 # Data can be sorted by value (None), a list of columns and
@@ -48,11 +57,14 @@ class _SortOp(ShuffleOp):
         boundaries: List[T],
         key: SortKeyT,
         descending: bool,
+        skew_aware: bool,
     ) -> List[Union[BlockMetadata, Block]]:
         stats = BlockExecStats.builder()
         out = BlockAccessor.for_block(block).sort_and_partition(
             boundaries, key, descending
         )
+        if skew_aware:
+            out = split_heavy_keys(out, boundaries, key, descending)
         meta = BlockAccessor.for_block(block).get_metadata(
             input_files=None, exec_stats=stats.build()
         )
@@ -87,6 +99,9 @@ def sample_boundaries(
     """
     Return (num_reducers - 1) items in ascending order from the blocks that
     partition the domain into ranges with approximately equally many elements.
+
+    A key that makes up a fraction f of the samples appears about
+    f * num_reducers times in a row in the result.
     """
     # TODO(Clark): Support multiple boundary sampling keys.
     if isinstance(key, list) and len(key) > 1:
@@ -131,13 +146,14 @@ def sample_boundaries(
 
 
 # Note: currently the map_groups() API relies on this implementation
-# to partition the same key into the same block.
+# to partition the same key into the same block, unless `skew_aware` is set.
 def sort_impl(
     blocks: BlockList,
     clear_input_blocks: bool,
     key: SortKeyT,
     descending: bool = False,
     ctx: Optional[TaskContext] = None,
+    skew_aware: bool = False,
 ) -> Tuple[BlockList, dict]:
     stage_info = {}
     blocks_list = blocks.get_blocks()
@@ -164,7 +180,8 @@ def sort_impl(
     else:
         sort_op_cls = SimpleSortOp
     sort_op = sort_op_cls(
-        map_args=[boundaries, key, descending], reduce_args=[key, descending]
+        map_args=[boundaries, key, descending, skew_aware],
+        reduce_args=[key, descending],
     )
     return sort_op.execute(
         blocks,
@@ -173,5 +190,116 @@ def sort_impl(
     )
 
 
+def heavy_key_runs(boundaries: List[T], descending: bool) -> List[Tuple[T, int, int]]:
+    """Return the heavy keys of the boundaries and the output partitions they span.
+
+    A key that appears m > 1 times in a row in the boundaries spans the m output
+    partitions in [start, end). After `sort_and_partition`, m - 1 of them are empty,
+    and the rows of the key are at the head (ascending) or at the tail (descending)
+    of the remaining one.
+
+    Returns:
+        A list of (key, start, end) tuples in partition order.
+    """
+    runs = []
+    i = 0
+    while i < len(boundaries):
+        j = i + 1
+        while j < len(boundaries) and boundaries[j] == boundaries[i]:
+            j += 1
+        # Boundaries of an empty dataset are all None.
+        if j - i > 1 and boundaries[i] is not None:
+            offset = 0 if descending else 1
+            runs.append((boundaries[i], i + offset, j + offset))
+        i = j
+    return runs
+
+
+def split_heavy_keys(
+    partitions: List[Block], boundaries: List[T], key: SortKeyT, descending: bool
+) -> List[Block]:
+    """Spread the rows of each heavy key evenly across the partitions it spans.
+
+    Args:
+        partitions: The output of `sort_and_partition` for the boundaries.
+        boundaries: The boundaries the block was partitioned by.
+        key: The sort key. Only single-column keys are split.
+        descending: Whether the partitions are sorted in descending order.
+
+    Returns:
+        The partitions, still in sort order.
+    """
+    if not isinstance(key, list):
+        return partitions
+    col, _ = key[0]
+    partitions = list(partitions)
+    for value, start, end in heavy_key_runs(boundaries, descending):
+        num_splits = end - start
+        # The other partitions of the run are empty.
+        src = start if descending else end - 1
+        accessor = BlockAccessor.for_block(partitions[src])
+        num_rows = accessor.num_rows()
+        keys = accessor.to_numpy(col)
+        if descending:
+            keys = keys[::-1]
+        num_key_rows = int(np.searchsorted(keys, value, side="right"))
+        offset = num_rows - num_key_rows if descending else 0
+        edges = [offset + num_key_rows * i // num_splits for i in range(num_splits)]
+        # The first and the last split keep the rows of the neighbouring keys.
+        edges[0] = 0
+        edges.append(num_rows)
+        for i in range(num_splits):
+            partitions[start + i] = accessor.slice(edges[i], edges[i + 1], copy=False)
+    return partitions
+
+
+def merge_heavy_key_partitions(
+    blocks: List[ObjectRef[Block]],
+    runs: List[Tuple[T, int, int]],
+    key: str,
+    aggs: Tuple["AggregateFn"],
+) -> Tuple[List[ObjectRef[Block]], List[BlockMetadata]]:
+    """Finalize the partially aggregated output partitions of a groupby.
+
+    The partitions spanned by a heavy key each hold a partial aggregate of it, so
+    they are merged into a single block. All other partitions are finalized on
+    their own.
+
+    Args:
+        blocks: The partially aggregated partitions, sorted in ascending order.
+        runs: The heavy keys, as returned by `heavy_key_runs`.
+        key: The groupby key.
+        aggs: The aggregations to finalize.
+
+    Returns:
+        The finalized blocks and their metadata.
+    """
+    groups = []
+    i = 0
+    for _, start, end in runs:
+        groups.extend([j] for j in range(i, start))
+        groups.append(list(range(start, end)))
+        i = end
+    groups.extend([j] for j in range(i, len(blocks)))
+
+    merge = cached_remote_fn(_merge_combined_blocks, num_returns=2)
+    merge_out = [
+        merge.remote(key, aggs, *[blocks[j] for j in group]) for group in groups
+    ]
+    new_blocks, new_metadata = zip(*merge_out)
+    merge_bar = ProgressBar("Aggregate Merge", len(merge_out))
+    new_metadata = merge_bar.fetch_until_complete(list(new_metadata))
+    merge_bar.close()
+    return list(new_blocks), new_metadata
+
+
 def _sample_block(block: Block, n_samples: int, key: SortKeyT) -> Block:
     return BlockAccessor.for_block(block).sample(n_samples, key)
+
+
+def _merge_combined_blocks(
+    key: str, aggs: Tuple["AggregateFn"], *blocks: Block
+) -> Tuple[Block, BlockMetadata]:
+    return BlockAccessor.for_block(blocks[0]).aggregate_combined_blocks(
+        list(blocks), key, aggs, finalize=True
+    )
@@ -4,9 +4,11 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 import ray
 from ray.data._internal.block_list import BlockList
 from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
-from ray.data._internal.execution.interfaces import TaskContext
+from ray.data._internal.execution.interfaces import RefBundle, TaskContext
 from ray.data._internal.fast_repartition import fast_repartition
 from ray.data._internal.plan import AllToAllStage
+from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
+from ray.data._internal.planner.join import generate_join_fn
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data._internal.shuffle_and_partition import (
     PushBasedShufflePartitionOp,
@@ -309,10 +311,60 @@ def _do_zip(
     return result, br.get_metadata(input_files=[], exec_stats=stats.build())
 
 
+class JoinStage(AllToAllStage):
+    """Implementation of `Dataset.join()`."""
+
+    def __init__(self, other: "Dataset", keys: List[str], how: str, right_suffix: str):
+        join_fn = generate_join_fn(keys, how, right_suffix)
+
+        def do_join(
+            block_list: BlockList,
+            ctx: TaskContext,
+            clear_input_blocks: bool,
+            *_,
+        ):
+            other_block_list = other._plan.execute()
+            left_refs = _block_list_to_bundles(block_list, clear_input_blocks)
+            right_refs = _block_list_to_bundles(other_block_list, clear_input_blocks)
+            if clear_input_blocks:
+                block_list.clear()
+                other_block_list.clear()
+            output, stats = join_fn(left_refs, right_refs, ctx)
+            blocks = BlockList(
+                [b for bundle in output for b, _ in bundle.blocks],
+                [m for bundle in output for _, m in bundle.blocks],
+                owned_by_consumer=block_list._owned_by_consumer,
+            )
+            return blocks, stats
+
+        super().__init__(
+            "Join",
+            None,
+            do_join,
+            sub_stage_names=[
+                ExchangeTaskSpec.MAP_SUB_PROGRESS_BAR_NAME,
+                ExchangeTaskSpec.REDUCE_SUB_PROGRESS_BAR_NAME,
+            ],
+        )
+
+
+def _block_list_to_bundles(block_list: BlockList, owns_blocks: bool) -> List[RefBundle]:
+    return [
+        RefBundle([(block, metadata)], owns_blocks=owns_blocks)
+        for block, metadata in block_list.get_blocks_with_metadata()
+    ]
+
+
 class SortStage(AllToAllStage):
     """Implementation of `Dataset.sort()`."""
 
-    def __init__(self, ds: "Dataset", key: Optional[str], descending: bool):
+    def __init__(
+        self,
+        ds: "Dataset",
+        key: Optional[str],
+        descending: bool,
+        skew_aware: bool = False,
+    ):
         def do_sort(
             block_list,
             ctx: TaskContext,
@@ -335,7 +387,9 @@ class SortStage(AllToAllStage):
                     _validate_key_fn(schema, subkey)
             else:
                 _validate_key_fn(schema, key)
-            return sort_impl(blocks, clear_input_blocks, key, descending, ctx)
+            return sort_impl(
+                blocks, clear_input_blocks, key, descending, ctx, skew_aware
+            )
 
         super().__init__(
             "Sort",
@@ -0,0 +1,238 @@
+import atexit
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ray.data.context import DataContext
+
+# This module records a timeline of the dataset executions and iterations of the
+# driver, if `DataContext.trace_dir` is set. The timeline is written in the Chrome
+# trace format, like the one of `ray.timeline()`, and can be viewed with
+# chrome://tracing or https://ui.perfetto.dev to find the bubbles of the pipeline.
+
+# The process tracer, which is created on first use.
+_tracer: Optional["Tracer"] = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Optional["Tracer"]:
+    """Return the tracer of this process, or None if tracing is disabled."""
+    global _tracer
+
+    trace_dir = DataContext.get_current().trace_dir
+    if trace_dir is None:
+        return None
+    trace_dir = os.path.abspath(os.path.expanduser(trace_dir))
+    with _tracer_lock:
+        if _tracer is None or os.path.dirname(_tracer.path) != trace_dir:
+            timestamp = time.strftime("%Y%m%d-%H%M%S")
+            _tracer = Tracer(
+                os.path.join(trace_dir, f"ray_data_{timestamp}_{os.getpid()}.json")
+            )
+            atexit.register(_tracer.flush)
+        return _tracer
+
+
+class Tracer:
+    """Records events on named tracks, and writes them as a Chrome trace.
+
+    Tracks are e.g. the operators of an execution and the consumers of datasets.
+    The tasks of an operator are drawn on separate tracks of their own (one per
+    concurrently running task), so that idle task slots show up as gaps.
+
+    This is thread-safe, since events are recorded both by the scheduling loop of the
+    streaming executor and by the consumer threads.
+
+    The events are buffered until the next flush(), which appends them to the trace
+    file, so that long running jobs don't keep all of their events in memory.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._events: List[Dict[str, Any]] = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": os.getpid(),
+                "args": {"name": "Ray Data"},
+            }
+        ]
+        # The offset of the closing bracket of the JSON array in the trace file, or
+        # None if the file hasn't been written yet.
+        self._end_offset: Optional[int] = None
+        self._tids: Dict[str, int] = {}
+        self._track_counters: Dict[str, Iterator[int]] = {}
+        # The task tracks of each operator track that are in use.
+        self._busy_task_tracks: Dict[str, List[bool]] = {}
+        # The operator track, task track index and submission time of the pending
+        # tasks.
+        self._pending_tasks: Dict[int, Tuple[str, int, float]] = {}
+        self._last_counters: Dict[str, Dict[str, float]] = {}
+
+    def new_track(self, prefix: str) -> str:
+        """Return a unique track name, for e.g. each iterator over a dataset."""
+        with self._lock:
+            counter = self._track_counters.setdefault(prefix, itertools.count())
+            return f"{prefix} {next(counter)}"
+
+    def span(self, name: str, track: str, start_s: float, end_s: float, **args) -> None:
+        """Record an event from start_s to end_s (in seconds since the epoch)."""
+        with self._lock:
+            self._events.append(
+                {
+                    "name": name,
+                    "cat": "ray.data",
+                    "ph": "X",
+                    "ts": start_s * 1e6,
+                    "dur": max(end_s - start_s, 0) * 1e6,
+                    "pid": os.getpid(),
+                    "tid": self._tid(track),
+                    "args": args,
+                }
+            )
+
+    def instant(self, name: str, track: str, **args) -> None:
+        """Record an event happening now."""
+        with self._lock:
+            self._events.append(
+                {
+                    "name": name,
+                    "cat": "ray.data",
+                    "ph": "i",
+                    "s": "t",
+                    "ts": time.time() * 1e6,
+                    "pid": os.getpid(),
+                    "tid": self._tid(track),
+                    "args": args,
+                }
+            )
+
+    def counter(self, name: str, **values: float) -> None:
+        """Record the current values of a counter, if they changed."""
+        with self._lock:
+            if self._last_counters.get(name) == values:
+                return
+            self._last_counters[name] = values
+            self._events.append(
+                {
+                    "name": name,
+                    "cat": "ray.data",
+                    "ph": "C",
+                    "ts": time.time() * 1e6,
+                    "pid": os.getpid(),
+                    "args": values,
+                }
+            )
+
+    @contextmanager
+    def timer(self, name: str, track: str, **args):
+        """Record the duration of the with block."""
+        start_s = time.time()
+        try:
+            yield
+        finally:
+            self.span(name, track, start_s, time.time(), **args)
+
+    def task_submitted(self, task: Any, track: str) -> None:
+        """Record the submission of a task of the operator with the given track."""
+        now = time.time()
+        with self._lock:
+            busy = self._busy_task_tracks.setdefault(track, [])
+            if False in busy:
+                index = busy.index(False)
+                busy[index] = True
+            else:
+                index = len(busy)
+                busy.append(True)
+                # Create the tracks in order, so that they're sorted by index.
+                self._tid(track)
+                self._tid(_task_track(track, index))
+            self._pending_tasks[id(task)] = (track, index, now)
+
+    def task_finished(
+        self,
+        task: Any,
+        start_s: Optional[float] = None,
+        end_s: Optional[float] = None,
+        **args,
+    ) -> None:
+        """Record the completion of a task.
+
+        Args:
+            task: The task, which must have been passed to task_submitted().
+            start_s: When the task started running on its worker, if known.
+            end_s: When the task finished running on its worker, if known.
+            args: Details of the task to show with its event.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._pending_tasks.pop(id(task), None)
+            if entry is None:
+                return
+            track, index, submit_s = entry
+            self._busy_task_tracks[track][index] = False
+        task_track = _task_track(track, index)
+        # The span of the task is from its submission to its completion as seen by
+        # the driver, and the span of its execution on the worker is nested within
+        # it. Clamp the latter, since the clocks of the nodes can differ a bit.
+        self.span("task", task_track, submit_s, now, **args)
+        if start_s is not None and end_s is not None:
+            start_s = min(max(start_s, submit_s), now)
+            end_s = min(max(end_s, start_s), now)
+            self.span("run", task_track, start_s, end_s)
+
+    def flush(self) -> None:
+        """Append the events recorded since the last flush to the trace file."""
+        with self._lock:
+            if not self._events:
+                return
+            data = ",\n".join(json.dumps(event) for event in self._events).encode()
+            self._events = []
+            # Overwrite the closing bracket of the array, so that the file stays valid
+            # JSON without rewriting the events of the earlier flushes.
+            if self._end_offset is None:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                with open(self.path, "wb") as f:
+                    f.write(b"[\n" + data)
+                    self._end_offset = f.tell()
+                    f.write(b"\n]\n")
+            else:
+                with open(self.path, "r+b") as f:
+                    f.seek(self._end_offset)
+                    f.write(b",\n" + data)
+                    self._end_offset = f.tell()
+                    f.write(b"\n]\n")
+
+    def _tid(self, track: str) -> int:
+        if track not in self._tids:
+            tid = len(self._tids)
+            self._tids[track] = tid
+            pid = os.getpid()
+            self._events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": track},
+                }
+            )
+            self._events.append(
+                {
+                    "name": "thread_sort_index",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"sort_index": tid},
+                }
+            )
+        return self._tids[track]
+
+
+def _task_track(track: str, index: int) -> str:
+    return f"{track} (task {index})"
@@ -1,6 +1,8 @@
 import math
 from typing import TYPE_CHECKING, Callable, List, Optional, Union
 
+import numpy as np
+
 from ray.data._internal.null_aggregate import (
     _null_wrap_accumulate_block,
     _null_wrap_accumulate_row,
@@ -119,6 +121,7 @@ class Sum(_AggregateOnKeyBase):
         alias_name: Optional[str] = None,
     ):
         self._set_key_fn(on)
+        self._ignore_nulls = ignore_nulls
         if alias_name:
             self._rs_name = alias_name
         else:
@@ -150,6 +153,7 @@ class Min(_AggregateOnKeyBase):
         alias_name: Optional[str] = None,
     ):
         self._set_key_fn(on)
+        self._ignore_nulls = ignore_nulls
         if alias_name:
             self._rs_name = alias_name
         else:
@@ -181,6 +185,7 @@ class Max(_AggregateOnKeyBase):
         alias_name: Optional[str] = None,
     ):
         self._set_key_fn(on)
+        self._ignore_nulls = ignore_nulls
         if alias_name:
             self._rs_name = alias_name
         else:
@@ -212,6 +217,7 @@ class Mean(_AggregateOnKeyBase):
         alias_name: Optional[str] = None,
     ):
         self._set_key_fn(on)
+        self._ignore_nulls = ignore_nulls
         if alias_name:
             self._rs_name = alias_name
         else:
@@ -436,3 +442,194 @@ class Quantile(_AggregateOnKeyBase):
             finalize=_null_wrap_finalize(percentile),
             name=(self._rs_name),
         )
+
+
+def _non_null_values(block: Block, on: str) -> np.ndarray:
+    """Return the non-null values of the column of the block."""
+    import pandas as pd
+
+    block_acc = BlockAccessor.for_block(block)
+    if block_acc.num_rows() == 0:
+        return np.empty(0)
+    values = block_acc.to_numpy(on)
+    return values[~pd.isnull(values)]
+
+
+@PublicAPI(stability="alpha")
+class ApproximateQuantile(_AggregateOnKeyBase):
+    """Defines approximate quantiles aggregation.
+
+    The quantiles are estimated in a single pass with a KLL sketch, which keeps
+    O(k) values per group instead of all of them. The rank of each estimated
+    quantile is within about 1.65 / k of the requested one. Null values are
+    ignored.
+
+    Examples:
+        >>> import ray
+        >>> from ray.data.aggregate import ApproximateQuantile
+        >>> ds = ray.data.range(1000)
+        >>> ds.aggregate(ApproximateQuantile("id", [0.5]))  # doctest: +SKIP
+        {'approx_quantile(id)': [499.0]}
+
+    Args:
+        on: The numeric column to compute the quantiles of.
+        quantiles: The quantiles to compute, between 0 and 1.
+        k: The size of the sketch. Larger values are more accurate but use more
+            memory.
+        alias_name: The name of the output column.
+    """
+
+    def __init__(
+        self,
+        on: str,
+        quantiles: List[float],
+        k: int = 200,
+        alias_name: Optional[str] = None,
+    ):
+        from ray.data._internal.sketches import KLLSketch
+
+        if any(not 0 <= q <= 1 for q in quantiles):
+            raise ValueError(f"Quantiles must be between 0 and 1, got {quantiles}.")
+        self._set_key_fn(on)
+        if alias_name:
+            self._rs_name = alias_name
+        else:
+            self._rs_name = f"approx_quantile({str(on)})"
+
+        def accumulate_block(a: bytes, block: Block) -> bytes:
+            sketch = KLLSketch.from_bytes(a)
+            sketch.update(_non_null_values(block, on))
+            return sketch.to_bytes()
+
+        def merge(a1: bytes, a2: bytes) -> bytes:
+            sketch = KLLSketch.from_bytes(a1)
+            sketch.merge(KLLSketch.from_bytes(a2))
+            return sketch.to_bytes()
+
+        super().__init__(
+            init=lambda k_: KLLSketch(k).to_bytes(),
+            merge=merge,
+            accumulate_block=accumulate_block,
+            finalize=lambda a: KLLSketch.from_bytes(a).quantiles(quantiles),
+            name=(self._rs_name),
+        )
+
+
+@PublicAPI(stability="alpha")
+class ApproximateCountDistinct(_AggregateOnKeyBase):
+    """Defines approximate distinct count aggregation.
+
+    The number of distinct values is estimated in a single pass with a HyperLogLog
+    sketch of 2**precision bytes per group, with a relative standard error of about
+    1.04 / sqrt(2**precision). Null values are ignored.
+
+    Examples:
+        >>> import ray
+        >>> from ray.data.aggregate import ApproximateCountDistinct
+        >>> ds = ray.data.range(1000)
+        >>> ds.aggregate(ApproximateCountDistinct("id"))  # doctest: +SKIP
+        {'approx_count_distinct(id)': 1005}
+
+    Args:
+        on: The column to count the distinct values of.
+        precision: The number of bits of the hashes used to select the registers of
+            the sketch, between 4 and 18.
+        alias_name: The name of the output column.
+    """
+
+    def __init__(
+        self,
+        on: str,
+        precision: int = 12,
+        alias_name: Optional[str] = None,
+    ):
+        from ray.data._internal.sketches import HyperLogLog
+
+        # Validate the precision eagerly.
+        HyperLogLog(precision)
+        self._set_key_fn(on)
+        if alias_name:
+            self._rs_name = alias_name
+        else:
+            self._rs_name = f"approx_count_distinct({str(on)})"
+
+        def accumulate_block(a: bytes, block: Block) -> bytes:
+            sketch = HyperLogLog.from_bytes(a)
+            sketch.update(_non_null_values(block, on))
+            return sketch.to_bytes()
+
+        def merge(a1: bytes, a2: bytes) -> bytes:
+            sketch = HyperLogLog.from_bytes(a1)
+            sketch.merge(HyperLogLog.from_bytes(a2))
+            return sketch.to_bytes()
+
+        super().__init__(
+            init=lambda k: HyperLogLog(precision).to_bytes(),
+            merge=merge,
+            accumulate_block=accumulate_block,
+            finalize=lambda a: HyperLogLog.from_bytes(a).estimate(),
+            name=(self._rs_name),
+        )
+
+
+@PublicAPI(stability="alpha")
+class TopK(_AggregateOnKeyBase):
+    """Defines approximate most frequent values aggregation.
+
+    The most frequent values are found in a single pass with a space-saving sketch,
+    which keeps the counts of at most ``capacity`` values per group. The result is
+    a list of ``{"value": value, "count": count}`` dicts in descending order of
+    count. The counts are exact if a group has at most ``capacity`` distinct
+    values, and overestimated otherwise. Null values are ignored.
+
+    Examples:
+        >>> import ray
+        >>> from ray.data.aggregate import TopK
+        >>> ds = ray.data.from_items([{"a": x} for x in "abbccc"])
+        >>> ds.aggregate(TopK("a", 2))  # doctest: +SKIP
+        {'top_k(a)': [{'value': 'c', 'count': 3}, {'value': 'b', 'count': 2}]}
+
+    Args:
+        on: The column to find the most frequent values of.
+        k: The number of values to return.
+        capacity: The number of values to keep the counts of. Larger values are
+            more accurate but use more memory. Defaults to ``max(1000, 10 * k)``.
+        alias_name: The name of the output column.
+    """
+
+    def __init__(
+        self,
+        on: str,
+        k: int,
+        capacity: Optional[int] = None,
+        alias_name: Optional[str] = None,
+    ):
+        from ray.data._internal.sketches import SpaceSaving
+
+        if capacity is None:
+            capacity = max(1000, 10 * k)
+        if capacity < k:
+            raise ValueError(f"capacity must be at least k, got {capacity} < {k}.")
+        self._set_key_fn(on)
+        if alias_name:
+            self._rs_name = alias_name
+        else:
+            self._rs_name = f"top_k({str(on)})"
+
+        def accumulate_block(a: bytes, block: Block) -> bytes:
+            sketch = SpaceSaving.from_bytes(a)
+            sketch.update(_non_null_values(block, on))
+            return sketch.to_bytes()
+
+        def merge(a1: bytes, a2: bytes) -> bytes:
+            sketch = SpaceSaving.from_bytes(a1)
+            sketch.merge(SpaceSaving.from_bytes(a2))
+            return sketch.to_bytes()
+
+        super().__init__(
+            init=lambda k_: SpaceSaving(capacity).to_bytes(),
+            merge=merge,
+            accumulate_block=accumulate_block,
+            finalize=lambda a: SpaceSaving.from_bytes(a).top_k(k),
+            name=(self._rs_name),
+        )
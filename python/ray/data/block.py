@@ -197,12 +197,18 @@ class BlockExecStats:
     Attributes:
         wall_time_s: The wall-clock time it took to compute this block.
         cpu_time_s: The CPU time it took to compute this block.
+        start_time_s: When the computation of this block started, in seconds since
+            the epoch.
+        end_time_s: When the computation of this block ended, in seconds since the
+            epoch.
         node_id: A unique id for the node that computed this block.
     """
 
     def __init__(self):
         self.wall_time_s: Optional[float] = None
         self.cpu_time_s: Optional[float] = None
+        self.start_time_s: Optional[float] = None
+        self.end_time_s: Optional[float] = None
         self.node_id = ray.runtime_context.get_runtime_context().get_node_id()
         # Max memory usage. May be an overestimate since we do not
         # differentiate from previous tasks on the same worker.
@@ -232,11 +238,14 @@ class _BlockExecStatsBuilder:
     def __init__(self):
         self.start_time = time.perf_counter()
         self.start_cpu = time.process_time()
+        self.start_time_s = time.time()
 
     def build(self) -> "BlockExecStats":
         stats = BlockExecStats()
         stats.wall_time_s = time.perf_counter() - self.start_time
         stats.cpu_time_s = time.process_time() - self.start_cpu
+        stats.start_time_s = self.start_time_s
+        stats.end_time_s = time.time()
         if resource is None:
             # NOTE(swang): resource package is not supported on Windows. This
             # is only the memory usage at the end of the task, not the peak
@@ -266,6 +275,9 @@ class BlockMetadata:
     input_files: Optional[List[str]]
     #: Execution stats for this block.
     exec_stats: Optional[BlockExecStats]
+    #: Whether the block is stored in a memory-mapped file on local disk rather
+    #: than in the object store.
+    mmapped: bool = False
 
     def __post_init__(self):
         if self.input_files is None:
@@ -1,12 +1,13 @@
 import os
 import threading
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List, Optional, Type
 
 from ray._private.ray_constants import env_integer
 from ray.util.annotations import DeveloperAPI
 from ray.util.scheduling_strategies import SchedulingStrategyT
 
 if TYPE_CHECKING:
+    from ray.data._internal.execution.backpressure_policy import BackpressurePolicy
     from ray.data._internal.execution.interfaces import ExecutionOptions
 
 # The context singleton on this process.
@@ -129,6 +130,61 @@ DEFAULT_ENABLE_PROGRESS_BARS = not bool(
     env_integer("RAY_DATA_DISABLE_PROGRESS_BARS", 0)
 )
 
+# The size threshold of the smaller side of a join, under which it is broadcast to
+# the join tasks of the other side instead of shuffling both sides.
+DEFAULT_BROADCAST_JOIN_THRESHOLD_BYTES = 10 * 1024 * 1024
+
+# A local directory to cache the footers of read Parquet files in, across reads
+# and processes. Caching is disabled if this is None.
+DEFAULT_PARQUET_METADATA_CACHE_DIR = os.environ.get(
+    "RAY_DATA_PARQUET_METADATA_CACHE_DIR", None
+)
+
+# The backpressure policy classes used by the streaming executor. None selects the
+# built-in policies, which bound each operator's output queue by the throughput of
+# its consumer. An empty list disables them.
+DEFAULT_BACKPRESSURE_POLICIES = None
+
+# Whether map operators adapt the size of their input bundles and output blocks to the
+# observed task durations and block sizes (streaming executor only).
+DEFAULT_ADAPTIVE_BLOCK_SIZING_ENABLED = bool(
+    env_integer("RAY_DATA_ADAPTIVE_BLOCK_SIZING", 0)
+)
+
+# The wall-clock duration in seconds that adaptively sized map tasks aim for.
+DEFAULT_TARGET_TASK_DURATION_S = 10.0
+
+# The max number of blocks that each `Dataset.streaming_split()` iterator leases from
+# the split coordinator per request.
+DEFAULT_STREAMING_SPLIT_LEASE_SIZE = env_integer(
+    "RAY_DATA_STREAMING_SPLIT_LEASE_SIZE", 8
+)
+
+# Whether groupby may spread the rows of a heavy key across several reducers. The
+# partial aggregates of such a key are merged in a final stage.
+DEFAULT_SKEW_AWARE_GROUPBY_ENABLED = bool(env_integer("RAY_DATA_SKEW_AWARE_GROUPBY", 0))
+
+# Whether groupby aggregations that Arrow can compute are hash partitioned instead of
+# range partitioned. This skips the sampling and sorting, but the output of the
+# aggregation isn't sorted by key.
+DEFAULT_USE_HASH_BASED_AGGREGATE = bool(
+    env_integer("RAY_DATA_USE_HASH_BASED_AGGREGATE", 0)
+)
+
+# A local directory to store the blocks of `from_arrow()`, `from_pandas()` and
+# `materialize()` in as memory-mapped Arrow IPC files, instead of in the object store.
+# This is only used on single-node clusters, and disabled if this is None.
+DEFAULT_MMAP_BLOCKS_DIR = os.environ.get("RAY_DATA_MMAP_BLOCKS_DIR", None)
+
+# Newline-delimited files (CSV and JSON) larger than this are split into byte ranges
+# that are read by separate read tasks. Splitting is disabled if this is None.
+DEFAULT_TARGET_SPLIT_SIZE_BYTES = 256 * 1024 * 1024
+
+# A local directory to write a Chrome trace of the dataset executions and iterations
+# of the driver to, which can be viewed with chrome://tracing or Perfetto. Tracing is
+# disabled if this is None.
+DEFAULT_TRACE_DIR = os.environ.get("RAY_DATA_TRACE_DIR", None)
+
 
 @DeveloperAPI
 class DataContext:
@@ -168,6 +224,17 @@ class DataContext:
         use_legacy_iter_batches: bool,
         strict_mode: bool,
         enable_progress_bars: bool,
+        broadcast_join_threshold_bytes: int,
+        parquet_metadata_cache_dir: Optional[str],
+        backpressure_policies: Optional[List[Type["BackpressurePolicy"]]],
+        adaptive_block_sizing_enabled: bool,
+        target_task_duration_s: float,
+        streaming_split_lease_size: int,
+        skew_aware_groupby_enabled: bool,
+        use_hash_based_aggregate: bool,
+        mmap_blocks_dir: Optional[str],
+        target_split_size_bytes: Optional[int],
+        trace_dir: Optional[str],
     ):
         """Private constructor (use get_current() instead)."""
         self.block_splitting_enabled = block_splitting_enabled
@@ -201,6 +268,17 @@ class DataContext:
         self.use_legacy_iter_batches = use_legacy_iter_batches
         self.strict_mode = strict_mode
         self.enable_progress_bars = enable_progress_bars
+        self.broadcast_join_threshold_bytes = broadcast_join_threshold_bytes
+        self.parquet_metadata_cache_dir = parquet_metadata_cache_dir
+        self.backpressure_policies = backpressure_policies
+        self.adaptive_block_sizing_enabled = adaptive_block_sizing_enabled
+        self.target_task_duration_s = target_task_duration_s
+        self.streaming_split_lease_size = streaming_split_lease_size
+        self.skew_aware_groupby_enabled = skew_aware_groupby_enabled
+        self.use_hash_based_aggregate = use_hash_based_aggregate
+        self.mmap_blocks_dir = mmap_blocks_dir
+        self.target_split_size_bytes = target_split_size_bytes
+        self.trace_dir = trace_dir
 
     @staticmethod
     def get_current() -> "DataContext":
@@ -250,6 +328,21 @@ class DataContext:
                     use_legacy_iter_batches=DEFAULT_USE_LEGACY_ITER_BATCHES,
                     strict_mode=DEFAULT_STRICT_MODE,
                     enable_progress_bars=DEFAULT_ENABLE_PROGRESS_BARS,
+                    broadcast_join_threshold_bytes=(
+                        DEFAULT_BROADCAST_JOIN_THRESHOLD_BYTES
+                    ),
+                    parquet_metadata_cache_dir=DEFAULT_PARQUET_METADATA_CACHE_DIR,
+                    backpressure_policies=DEFAULT_BACKPRESSURE_POLICIES,
+                    adaptive_block_sizing_enabled=(
+                        DEFAULT_ADAPTIVE_BLOCK_SIZING_ENABLED
+                    ),
+                    target_task_duration_s=DEFAULT_TARGET_TASK_DURATION_S,
+                    streaming_split_lease_size=DEFAULT_STREAMING_SPLIT_LEASE_SIZE,
+                    skew_aware_groupby_enabled=DEFAULT_SKEW_AWARE_GROUPBY_ENABLED,
+                    use_hash_based_aggregate=DEFAULT_USE_HASH_BASED_AGGREGATE,
+                    mmap_blocks_dir=DEFAULT_MMAP_BLOCKS_DIR,
+                    target_split_size_bytes=DEFAULT_TARGET_SPLIT_SIZE_BYTES,
+                    trace_dir=DEFAULT_TRACE_DIR,
                 )
 
             return _default_context
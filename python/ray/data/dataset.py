@@ -56,21 +56,29 @@ from ray.data._internal.logical.operators.map_operator import (
     FlatMap,
     MapBatches,
     MapRows,
+    Project,
+    WithColumn,
 )
-from ray.data._internal.logical.operators.n_ary_operator import Zip
+from ray.data._internal.logical.operators.n_ary_operator import Join, Zip
 from ray.data._internal.logical.operators.write_operator import Write
 from ray.data._internal.logical.optimizers import LogicalPlan
 from ray.data._internal.pandas_block import PandasBlockSchema
 from ray.data._internal.plan import ExecutionPlan, OneToOneStage
-from ray.data._internal.planner.filter import generate_filter_fn
+from ray.data._internal.planner.filter import (
+    generate_filter_expr_fn,
+    generate_filter_fn,
+)
 from ray.data._internal.planner.flat_map import generate_flat_map_fn
+from ray.data._internal.planner.join import JOIN_TYPES
 from ray.data._internal.planner.map_batches import generate_map_batches_fn
 from ray.data._internal.planner.map_rows import generate_map_rows_fn
+from ray.data._internal.planner.with_column import generate_with_column_fn
 from ray.data._internal.planner.write import generate_write_fn
 from ray.data._internal.progress_bar import ProgressBar
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data._internal.split import _get_num_rows, _split_at_indices
 from ray.data._internal.stage_impl import (
+    JoinStage,
     LimitStage,
     RandomizeBlocksStage,
     RandomShuffleStage,
@@ -124,6 +132,7 @@ from ray.data.datasource.file_based_datasource import (
     _unwrap_arrow_serialization_workaround,
     _wrap_arrow_serialization_workaround,
 )
+from ray.data.expressions import Expr
 from ray.data.iterator import DataIterator
 from ray.data.random_access_dataset import RandomAccessDataset
 from ray.types import ObjectRef
@@ -696,6 +705,59 @@ class Dataset:
             **ray_remote_args,
         )
 
+    def with_column(self, col: str, expr: Expr, **ray_remote_args) -> "Dataset":
+        """Add a column to the dataset, computed from an expression of its columns.
+
+        Unlike ``.add_column()``, the expression is evaluated on whole blocks with
+        Arrow compute, without converting them to pandas or calling back into
+        Python, and it's fused with the adjacent map operators.
+
+        Examples:
+            >>> import ray
+            >>> from ray.data.expressions import col
+            >>> ds = ray.data.range(100)
+            >>> # Add a new column equal to value * 2.
+            >>> ds = ds.with_column("new_col", col("id") * 2)
+            >>> # Overwrite the existing "id" column with its values as strings.
+            >>> import pyarrow as pa
+            >>> ds = ds.with_column("id", col("id").cast(pa.string()))
+
+        Time complexity: O(dataset size / parallelism)
+
+        Args:
+            col: Name of the column to add. If the name already exists, the
+                column will be overwritten.
+            expr: The expression generating the column values, built with
+                ``ray.data.expressions.col()`` and ``ray.data.expressions.lit()``.
+            ray_remote_args: Additional resource requirements to request from
+                ray (e.g., num_cpus=2 to request CPUs for the map tasks).
+        """
+        if not isinstance(expr, Expr):
+            raise ValueError(
+                "`expr` must be a `ray.data.expressions.Expr`, got {}".format(expr)
+            )
+
+        plan = self._plan.with_stage(
+            OneToOneStage(
+                "WithColumn",
+                generate_with_column_fn(col),
+                None,
+                ray_remote_args,
+                fn=expr,
+            )
+        )
+
+        logical_plan = self._logical_plan
+        if logical_plan is not None:
+            op = WithColumn(
+                input_op=logical_plan.dag,
+                col=col,
+                expr=expr,
+                ray_remote_args=ray_remote_args,
+            )
+            logical_plan = LogicalPlan(op)
+        return Dataset(plan, self._epoch, self._lazy, logical_plan)
+
     def drop_columns(
         self,
         cols: List[str],
@@ -754,7 +816,7 @@ class Dataset:
             >>> # Select only "col1" and "col2" columns.
             >>> ds = ds.select_columns(cols=["col1", "col2"])
             >>> ds
-            MapBatches(<lambda>)
+            MapBatches(select_columns)
             +- Dataset(
                   num_blocks=10,
                   num_rows=10,
@@ -762,6 +824,10 @@ class Dataset:
                )
 
 
+        .. note::
+            If the dataset is read from Parquet files, the selection is pushed down
+            into the read, so that only the selected columns are read.
+
         Time complexity: O(dataset size / parallelism)
 
         Args:
@@ -774,14 +840,41 @@ class Dataset:
             ray_remote_args: Additional resource requirements to request from
                 ray (e.g., num_gpus=1 to request GPUs for the map tasks).
         """  # noqa: E501
-        return self.map_batches(
-            lambda batch: BlockAccessor.for_block(batch).select(columns=cols),
+
+        def select_columns(batch: DataBatch) -> DataBatch:
+            return BlockAccessor.for_block(batch).select(columns=cols)
+
+        validate_compute(select_columns, compute)
+
+        transform_fn = generate_map_batches_fn(
+            batch_size=None,
             batch_format="pandas",
             zero_copy_batch=True,
-            compute=compute,
-            **ray_remote_args,
         )
 
+        plan = self._plan.with_stage(
+            OneToOneStage(
+                "MapBatches(select_columns)",
+                transform_fn,
+                compute,
+                ray_remote_args,
+                fn=select_columns,
+            )
+        )
+
+        logical_plan = self._logical_plan
+        if logical_plan is not None:
+            op = Project(
+                logical_plan.dag,
+                select_columns,
+                cols,
+                compute=compute,
+                ray_remote_args=ray_remote_args,
+            )
+            logical_plan = LogicalPlan(op)
+
+        return Dataset(plan, self._epoch, self._lazy, logical_plan)
+
     def flat_map(
         self,
         fn: UserDefinedFunction[Dict[str, Any], List[Dict[str, Any]]],
@@ -860,15 +953,17 @@ class Dataset:
 
     def filter(
         self,
-        fn: UserDefinedFunction[Dict[str, Any], bool],
+        fn: Optional[UserDefinedFunction[Dict[str, Any], bool]] = None,
         *,
+        expr: Optional[Union["pyarrow.dataset.Expression", Expr]] = None,
         compute: Union[str, ComputeStrategy] = None,
         **ray_remote_args,
     ) -> "Dataset":
         """Filter out records that do not satisfy the given predicate.
 
-        Consider using ``.map_batches()`` for better performance (you can implement
-        filter by dropping records).
+        The predicate is either a function applied to each record, or an
+        expression evaluated on whole blocks. Consider using an expression (or
+        ``.map_batches()``) for better performance.
 
         Examples:
             >>> import ray
@@ -876,6 +971,17 @@ class Dataset:
             >>> ds.filter(lambda x: x["id"] % 2 == 0)
             Filter
             +- Dataset(num_blocks=..., num_rows=100, schema={id: int64})
+            >>> import pyarrow.dataset as pds
+            >>> ds.filter(expr=pds.field("id") < 10).count()
+            10
+            >>> from ray.data.expressions import col
+            >>> ds.filter(expr=(col("id") >= 10) & (col("id") < 15)).count()
+            5
+
+        .. note::
+            If the dataset is read from Parquet files, a filter expression is pushed
+            down into the read, so that the row groups that do not match it are
+            skipped.
 
         Time complexity: O(dataset size / parallelism)
 
@@ -883,6 +989,9 @@ class Dataset:
             fn: The predicate to apply to each record, or a class type
                 that can be instantiated to create such a callable. Callable classes are
                 only supported for the actor compute strategy.
+            expr: The predicate as a ``pyarrow.dataset.Expression`` or a
+                ``ray.data.expressions.Expr``. Exactly one of ``fn`` and ``expr``
+                must be provided.
             compute: The compute strategy, either "tasks" (default) to use Ray
                 tasks, ``ray.data.ActorPoolStrategy(size=n)`` to use a fixed-size actor
                 pool, or ``ray.data.ActorPoolStrategy(min_size=m, max_size=n)`` for an
@@ -890,13 +999,23 @@ class Dataset:
             ray_remote_args: Additional resource requirements to request from
                 ray (e.g., num_gpus=1 to request GPUs for the map tasks).
         """
-        validate_compute(fn, compute)
-        self._warn_slow()
+        if (fn is None) == (expr is None):
+            raise ValueError("Exactly one of `fn` and `expr` must be provided.")
 
-        transform_fn = generate_filter_fn()
+        if expr is not None:
+            # The expression is passed to the transform function in place of the UDF.
+            transform_fn = generate_filter_expr_fn()
+            fn_or_expr = expr
+        else:
+            validate_compute(fn, compute)
+            self._warn_slow()
+            transform_fn = generate_filter_fn()
+            fn_or_expr = fn
 
         plan = self._plan.with_stage(
-            OneToOneStage("Filter", transform_fn, compute, ray_remote_args, fn=fn)
+            OneToOneStage(
+                "Filter", transform_fn, compute, ray_remote_args, fn=fn_or_expr
+            )
         )
 
         logical_plan = self._logical_plan
@@ -906,6 +1025,7 @@ class Dataset:
                 fn=fn,
                 compute=compute,
                 ray_remote_args=ray_remote_args,
+                filter_expr=expr,
             )
             logical_plan = LogicalPlan(op)
 
@@ -1092,6 +1212,7 @@ class Dataset:
         *,
         equal: bool = False,
         locality_hints: Optional[List["NodeIdStr"]] = None,
+        cache_first_epoch: bool = False,
     ) -> List[DataIterator]:
         """Returns ``n`` :class:`DataIterators <ray.data.DataIterator>` that can
         be used to read disjoint subsets of the dataset in parallel.
@@ -1147,12 +1268,22 @@ class Dataset:
                 iterator output locations. This list must have length ``n``. You can
                 get the current node id of a task or actor by calling
                 ``ray.get_runtime_context().get_node_id()``.
+            cache_first_epoch: If True, the output of the Dataset is kept in the
+                object store (spilling to disk if needed) in the first epoch, and
+                later epochs read the cached blocks in a new random order instead of
+                recomputing them. Only the operators before the first
+                ``random_shuffle()`` or ``randomize_block_order()`` are cached, and
+                they must be deterministic. Combine this with
+                ``local_shuffle_buffer_size`` in ``iter_batches()`` to also shuffle
+                the rows within blocks.
 
         Returns:
             The output iterator splits. These iterators are Ray-serializable and can
             be freely passed to any Ray task or actor.
         """
-        return StreamSplitDataIterator.create(self, n, equal, locality_hints)
+        return StreamSplitDataIterator.create(
+            self, n, equal, locality_hints, cache_first_epoch
+        )
 
     @ConsumptionAPI
     def split(
@@ -1988,6 +2119,71 @@ class Dataset:
             logical_plan = LogicalPlan(op)
         return Dataset(plan, self._epoch, self._lazy, logical_plan)
 
+    @PublicAPI(stability="alpha")
+    def join(
+        self,
+        other: "Dataset",
+        on: Union[str, List[str]],
+        how: str = "inner",
+        *,
+        right_suffix: str = "_1",
+    ) -> "Dataset":
+        """Join this dataset with another dataset on one or more key columns.
+
+        Rows of both datasets are matched by equality of the ``on`` columns, which
+        must exist in both datasets. The order of the output rows is not defined.
+
+        .. note::
+            If one side is smaller than ``DataContext.broadcast_join_threshold_bytes``
+            and the join type allows it, the small side is broadcast to one join task
+            per block of the other side. Otherwise, both sides are hash partitioned
+            by the key columns in a single shuffle.
+
+        Examples:
+            >>> import ray
+            >>> ds1 = ray.data.from_items([{"id": 1, "x": "a"}, {"id": 2, "x": "b"}])
+            >>> ds2 = ray.data.from_items([{"id": 1, "y": 10}, {"id": 1, "y": 20}])
+            >>> ds1.join(ds2, on="id").sort("y").take_all()
+            [{'id': 1, 'x': 'a', 'y': 10}, {'id': 1, 'x': 'a', 'y': 20}]
+
+        Time complexity: O(dataset size / parallelism)
+
+        Args:
+            other: The dataset to join with on the right hand side.
+            on: The name of the key column, or a list of key column names.
+            how: The type of join, one of "inner", "left", "right" or "outer".
+                Unmatched rows of the kept side(s) are padded with nulls.
+            right_suffix: The suffix appended to the non-key columns of ``other``
+                whose names collide with columns of this dataset.
+
+        Returns:
+            A ``Dataset`` containing the columns of this dataset followed by the
+            non-key columns of the other dataset.
+        """
+        if isinstance(on, str):
+            on = [on]
+        if not on:
+            raise ValueError("`on` must be a column name or a non-empty list of them.")
+        if how not in JOIN_TYPES:
+            raise ValueError(f"`how` must be one of {JOIN_TYPES}, got: {how!r}")
+
+        plan = self._plan.with_stage(JoinStage(other, on, how, right_suffix))
+
+        logical_plan = self._logical_plan
+        other_logical_plan = other._logical_plan
+        if logical_plan is not None and other_logical_plan is not None:
+            op = Join(
+                logical_plan.dag,
+                other_logical_plan.dag,
+                keys=on,
+                how=how,
+                right_suffix=right_suffix,
+            )
+            logical_plan = LogicalPlan(op)
+        else:
+            logical_plan = None
+        return Dataset(plan, self._epoch, self._lazy, logical_plan)
+
     @ConsumptionAPI
     def limit(self, limit: int) -> "Dataset":
         """Materialize and truncate the dataset to the first ``limit`` records.
@@ -2275,21 +2471,34 @@ class Dataset:
         block_path_provider: BlockWritePathProvider = DefaultBlockWritePathProvider(),
         arrow_parquet_args_fn: Callable[[], Dict[str, Any]] = lambda: {},
         ray_remote_args: Dict[str, Any] = None,
+        target_file_size_bytes: Optional[int] = None,
+        max_rows_per_file: Optional[int] = None,
+        partition_cols: Optional[List[str]] = None,
         **arrow_parquet_args,
     ) -> None:
         """Write the dataset to parquet.
 
         This is only supported for datasets convertible to Arrow records.
-        To control the number of files, use ``.repartition()``.
+        To control the number of files, use ``.repartition()``, or set
+        ``target_file_size_bytes`` or ``max_rows_per_file``. With these set, each
+        write task is given blocks up to the target file size, and streams them to
+        files that are rolled over once they reach the target size or row count.
+        Use ``row_group_size`` to control the size of the row groups in each file.
 
         Unless a custom block path provider is given, the format of the output
         files will be {uuid}_{block_idx}.parquet, where ``uuid`` is an unique
-        id for the dataset.
+        id for the dataset. Rolled files have the file index inserted before the
+        extension, i.e. {uuid}_{block_idx}_{file_idx}.parquet.
 
         Examples:
             >>> import ray
             >>> ds = ray.data.range(100) # doctest: +SKIP
             >>> ds.write_parquet("s3://bucket/path") # doctest: +SKIP
+            >>> ds.write_parquet( # doctest: +SKIP
+            ...     "s3://bucket/path",
+            ...     target_file_size_bytes=128 * 1024 * 1024,
+            ...     partition_cols=["year"],
+            ... )
 
         Time complexity: O(dataset size / parallelism)
 
@@ -2310,6 +2519,13 @@ class Dataset:
                 cannot be pickled, or if you'd like to lazily resolve the write
                 arguments for each dataset block.
             ray_remote_args: Kwargs passed to ray.remote in the write tasks.
+            target_file_size_bytes: The size in bytes at which to start a new
+                output file. Files may exceed this by about one row group.
+            max_rows_per_file: The max number of rows to write to each output file.
+            partition_cols: Columns to partition the output by. The rows of each
+                partition are written to a Hive-style ``{col}={value}``
+                subdirectory of ``path``, without the partition columns. No
+                repartitioning of the dataset is needed beforehand.
             arrow_parquet_args: Options to pass to
                 pyarrow.parquet.write_table(), which is used to write out each
                 block to a file.
@@ -2324,6 +2540,9 @@ class Dataset:
             open_stream_args=arrow_open_stream_args,
             block_path_provider=block_path_provider,
             write_args_fn=arrow_parquet_args_fn,
+            target_file_size_bytes=target_file_size_bytes,
+            max_rows_per_file=max_rows_per_file,
+            partition_cols=partition_cols,
             **arrow_parquet_args,
         )
 
@@ -2946,6 +3165,7 @@ class Dataset:
         drop_last: bool = False,
         local_shuffle_buffer_size: Optional[int] = None,
         local_shuffle_seed: Optional[int] = None,
+        pin_memory: bool = False,
         # Deprecated
         prefetch_blocks: int = 0,
     ) -> Iterator["TorchTensorBatchType"]:
@@ -3001,6 +3221,9 @@ class Dataset:
                 therefore ``batch_size`` must also be specified when using local
                 shuffling.
             local_shuffle_seed: The seed to use for the local random shuffle.
+            pin_memory: Whether to stage the tensors in pinned memory before copying
+                them to ``device``, which makes the copy asynchronous. This is ignored
+                if CUDA is not available or if ``collate_fn`` is given.
 
         Returns:
             An iterator over Torch Tensor batches.
@@ -3015,6 +3238,7 @@ class Dataset:
             drop_last=drop_last,
             local_shuffle_buffer_size=local_shuffle_buffer_size,
             local_shuffle_seed=local_shuffle_seed,
+            pin_memory=pin_memory,
         )
 
     @ConsumptionAPI
@@ -3968,14 +4192,31 @@ class Dataset:
         Note that this does not mutate the original Dataset. Only the blocks of the
         returned MaterializedDataset class are pinned in memory.
 
+        On single-node clusters, the blocks can be stored on local disk instead, as
+        memory-mapped Arrow IPC files, by setting
+        ``DataContext.mmap_blocks_dir``. Reading them is zero-copy, and they don't
+        count against the object store memory limits.
+
         Returns:
             A MaterializedDataset holding the materialized data blocks.
         """
+        from ray.data._internal.mmap_block import (
+            get_mmap_blocks_dir,
+            spill_to_mmap_blocks,
+        )
+
         copy = Dataset.copy(self, _deep_copy=True, _as=MaterializedDataset)
         copy._plan.execute(force_read=True)
 
         blocks = copy._plan._snapshot_blocks
         blocks_with_metadata = blocks.get_blocks_with_metadata() if blocks else []
+        mmap_dir = get_mmap_blocks_dir()
+        if mmap_dir is not None and blocks_with_metadata:
+            refs, metadata = spill_to_mmap_blocks(blocks_with_metadata, mmap_dir)
+            copy._plan._snapshot_blocks = BlockList(
+                refs, metadata, owned_by_consumer=False
+            )
+            blocks_with_metadata = list(zip(refs, metadata))
         # TODO(hchen): Here we generate the same number of blocks as
         # the original Dataset. Because the old code path does this, and
         # some unit tests implicily depend on this behavior.
@@ -3995,6 +4236,76 @@ class Dataset:
 
         return copy
 
+    @ConsumptionAPI
+    def cache(
+        self,
+        path: str,
+        *,
+        filesystem: Optional["pyarrow.fs.FileSystem"] = None,
+    ) -> "Dataset":
+        """Cache this dataset persistently in the given directory, across jobs.
+
+        The dataset is keyed by a fingerprint of its plan, which covers the
+        datasources and files it reads, its operations and the code of the
+        functions passed to them. If the directory already holds the dataset for
+        the same fingerprint (e.g. written by an earlier run of the same job), it's
+        read back from there instead of being recomputed. Otherwise, the dataset is
+        executed and written there as Arrow IPC files.
+
+        Note that the cached data is only valid if the operations of the dataset
+        are deterministic, and if the files it reads are only ever replaced by files
+        of a different size. Functions and classes that the functions import from
+        other modules are only fingerprinted by name, so changing their code doesn't
+        invalidate the cache. Delete the directory to invalidate the cache.
+
+        Examples:
+            >>> import ray
+            >>> ds = ray.data.read_parquet("s3://bucket/raw") # doctest: +SKIP
+            >>> ds = ds.map_batches(preprocess) # doctest: +SKIP
+            >>> # Only the first run of this job reads and preprocesses the files.
+            >>> ds = ds.cache("s3://bucket/cache") # doctest: +SKIP
+
+        Time complexity: O(dataset size / parallelism)
+
+        Args:
+            path: The local or shared directory to cache datasets in.
+            filesystem: The filesystem implementation of the directory.
+
+        Returns:
+            A dataset reading the cached data.
+
+        Raises:
+            ValueError: If the dataset can't be fingerprinted, e.g. because it's
+                created from in-memory data or randomly shuffled without a seed.
+        """
+        from ray.data._internal.materialization_cache import (
+            MaterializationCache,
+            fingerprint_logical_plan,
+        )
+        from ray.data.datasource import ArrowIPCDatasource
+        from ray.data.read_api import from_items, read_datasource
+
+        if self._logical_plan is None:
+            raise ValueError(
+                "Dataset.cache() requires the new execution optimizer, which "
+                "can be enabled with `DataContext.optimizer_enabled = True`."
+            )
+        fingerprint = fingerprint_logical_plan(self._logical_plan.dag)
+        cache = MaterializationCache(path, filesystem)
+        paths = cache.get(fingerprint)
+        if paths is None:
+            paths = cache.put(fingerprint, self)
+        else:
+            logger.info(f"Reading the dataset from the cache entry {fingerprint}.")
+        if not paths:
+            return from_items([])
+        return read_datasource(
+            ArrowIPCDatasource(),
+            parallelism=len(paths),
+            paths=paths,
+            filesystem=cache.filesystem,
+        )
+
     @ConsumptionAPI(pattern="timing information.", insert_after=True)
     def stats(self) -> str:
         """Returns a string containing execution timing information.
@@ -1,3 +1,4 @@
+from ray.data.datasource.arrow_ipc_datasource import ArrowIPCDatasource
 from ray.data.datasource.binary_datasource import BinaryDatasource
 from ray.data.datasource.csv_datasource import CSVDatasource
 from ray.data.datasource.datasource import (
@@ -43,6 +44,7 @@ from ray.data.datasource.tfrecords_datasource import TFRecordDatasource
 from ray.data.datasource.webdataset_datasource import WebDatasetDatasource
 
 __all__ = [
+    "ArrowIPCDatasource",
     "BaseFileMetadataProvider",
     "BinaryDatasource",
     "BlockWritePathProvider",
@@ -0,0 +1,92 @@
+import logging
+from typing import TYPE_CHECKING, Any, Callable, Dict
+
+from ray.data.block import BlockAccessor
+from ray.data.datasource.file_based_datasource import (
+    FileBasedDatasource,
+    _BlockWriter,
+    _resolve_kwargs,
+)
+from ray.util.annotations import PublicAPI
+
+if TYPE_CHECKING:
+    import pyarrow
+
+
+logger = logging.getLogger(__name__)
+
+
+@PublicAPI(stability="alpha")
+class ArrowIPCDatasource(FileBasedDatasource):
+    """Arrow IPC datasource, for reading and writing Arrow IPC (Feather V2) files.
+
+    Examples:
+        >>> import ray
+        >>> from ray.data.datasource import ArrowIPCDatasource
+        >>> source = ArrowIPCDatasource() # doctest: +SKIP
+        >>> ray.data.read_datasource( # doctest: +SKIP
+        ...     source, paths="/path/to/dir").take()
+        [{"a": 1, "b": "foo"}, ...]
+    """
+
+    _FILE_EXTENSION = "arrow"
+
+    def _read_file(self, f: "pyarrow.NativeFile", path: str, **reader_args):
+        import pyarrow as pa
+
+        return pa.ipc.open_file(f, **reader_args).read_all()
+
+    def _open_input_source(
+        self,
+        filesystem: "pyarrow.fs.FileSystem",
+        path: str,
+        **open_args,
+    ) -> "pyarrow.NativeFile":
+        # The IPC file format requires random access reads of its footer.
+        return filesystem.open_input_file(path, **open_args)
+
+    def _write_block(
+        self,
+        f: "pyarrow.NativeFile",
+        block: BlockAccessor,
+        writer_args_fn: Callable[[], Dict[str, Any]] = lambda: {},
+        **writer_args,
+    ):
+        import pyarrow as pa
+
+        writer_args = _resolve_kwargs(writer_args_fn, **writer_args)
+        table = block.to_arrow()
+        with pa.ipc.new_file(f, table.schema, **writer_args) as writer:
+            writer.write_table(table)
+
+    def _open_block_writer(
+        self,
+        f: "pyarrow.NativeFile",
+        block: BlockAccessor,
+        writer_args_fn: Callable[[], Dict[str, Any]] = lambda: {},
+        **writer_args,
+    ) -> "_ArrowIPCBlockWriter":
+        writer_args = _resolve_kwargs(writer_args_fn, **writer_args)
+        return _ArrowIPCBlockWriter(f, block.to_arrow().schema, **writer_args)
+
+
+class _ArrowIPCBlockWriter(_BlockWriter):
+    """Appends blocks with the same schema to an Arrow IPC file."""
+
+    def __init__(
+        self, f: "pyarrow.NativeFile", schema: "pyarrow.Schema", **writer_args
+    ):
+        import pyarrow as pa
+
+        self._schema = schema
+        self._writer = pa.ipc.new_file(f, schema, **writer_args)
+
+    def append(self, block: BlockAccessor) -> bool:
+        table = block.to_arrow()
+        if not table.schema.equals(self._schema):
+            return False
+        self._writer.write_table(table)
+        return True
+
+    def close(self):
+        self._writer.close()
@@ -1,8 +1,11 @@
+import copy
 from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator
 
 from ray.data.block import Block, BlockAccessor
 from ray.data.datasource.file_based_datasource import (
     FileBasedDatasource,
+    _find_line_end,
+    _NewlineAlignedRange,
     _resolve_kwargs,
 )
 from ray.util.annotations import PublicAPI
@@ -62,6 +65,74 @@ class CSVDatasource(FileBasedDatasource):
                 "more details."
             ) from e
 
+    def _supports_byte_range_splits(self, **reader_args) -> bool:
+        from pyarrow import csv
+
+        read_options = reader_args.get("read_options", csv.ReadOptions())
+        parse_options = reader_args.get("parse_options", csv.ParseOptions())
+        return (
+            not parse_options.newlines_in_values
+            and read_options.skip_rows_after_names == 0
+        )
+
+    def _read_byte_range(
+        self,
+        f: "pyarrow.NativeFile",
+        path: str,
+        start: int,
+        end: int,
+        **reader_args,
+    ) -> Iterator[Block]:
+        import pyarrow as pa
+        from pyarrow import csv
+
+        read_options = reader_args.get(
+            "read_options", csv.ReadOptions(use_threads=False)
+        )
+        parse_options = reader_args.get("parse_options", csv.ParseOptions())
+        convert_options = reader_args.get("convert_options", csv.ConvertOptions())
+        num_header_lines = read_options.skip_rows
+        if not read_options.column_names and not read_options.autogenerate_column_names:
+            num_header_lines += 1
+        header_size = _get_header_size(f, num_header_lines)
+        # Skip the range if none of the records start in it.
+        range_start = max(start, header_size)
+        line_start = _find_line_end(f, range_start - 1) if range_start > 0 else 0
+        if line_start is None or line_start >= end:
+            return
+
+        # Reading the whole file would infer the column types from its first block,
+        # so infer them from the same block and use them for every range.
+        first_block = f.read_at(max(header_size, read_options.block_size), 0)
+        if b"\n" in first_block[header_size:]:
+            first_block = first_block[: first_block.rindex(b"\n") + 1]
+        try:
+            schema = csv.open_csv(
+                pa.BufferReader(first_block),
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=convert_options,
+            ).schema
+        except pa.lib.ArrowInvalid as e:
+            raise ValueError(
+                f"Failed to read CSV file: {path}. "
+                "Please check the CSV file has correct format, or filter out non-CSV "
+                "file with 'partition_filter' field. See read_csv() documentation for "
+                "more details."
+            ) from e
+        convert_options = copy.copy(convert_options)
+        convert_options.column_types = schema
+        reader_args["convert_options"] = convert_options
+
+        # Only the first range contains the header, so prepend it to the others.
+        if start == 0:
+            stream = _NewlineAlignedRange(f, 0, end)
+        else:
+            stream = _NewlineAlignedRange(
+                f, range_start, end, prefix=first_block[:header_size]
+            )
+        yield from self._read_stream(stream, path, **reader_args)
+
     def _write_block(
         self,
         f: "pyarrow.NativeFile",
@@ -74,3 +145,13 @@ class CSVDatasource(FileBasedDatasource):
         writer_args = _resolve_kwargs(writer_args_fn, **writer_args)
         write_options = writer_args.pop("write_options", None)
         csv.write_csv(block.to_arrow(), f, write_options, **writer_args)
+
+
+def _get_header_size(f: "pyarrow.NativeFile", num_lines: int) -> int:
+    """Returns the number of bytes of the first lines of the file."""
+    size = 0
+    for _ in range(num_lines):
+        size = _find_line_end(f, size)
+        if size is None:
+            return f.size()
+    return size
@@ -1,3 +1,4 @@
+import io
 import itertools
 import logging
 import pathlib
@@ -37,6 +38,7 @@ from ray.data.datasource.file_meta_provider import (
 )
 from ray.data.datasource.partitioning import (
     Partitioning,
+    PathPartitionEncoder,
     PathPartitionFilter,
     PathPartitionParser,
 )
@@ -57,6 +59,10 @@ FILE_SIZE_FETCH_PARALLELIZATION_THRESHOLD = 16
 # 16 file size fetches from S3 takes ~1.5 seconds with Arrow's S3FileSystem.
 PATHS_PER_FILE_SIZE_FETCH_TASK = 16
 
+# The partition directory value used for null partition column values, matching the
+# default of Hive and Arrow.
+HIVE_NULL_PARTITION_VALUE = "__HIVE_DEFAULT_PARTITION__"
+
 
 @DeveloperAPI
 class BlockWritePathProvider:
@@ -250,6 +256,35 @@ class FileBasedDatasource(Datasource):
             "Subclasses of FileBasedDatasource must implement _read_file()."
         )
 
+    def _supports_byte_range_splits(self, **reader_args) -> bool:
+        """Returns whether large files can be read in byte ranges by separate tasks.
+
+        This is only possible for newline-delimited formats whose records can't
+        contain newlines, since the records of a byte range are found by skipping to
+        the next newline. Subclasses that return True must implement
+        _read_byte_range().
+        """
+        return False
+
+    def _read_byte_range(
+        self,
+        f: "pyarrow.NativeFile",
+        path: str,
+        start: int,
+        end: int,
+        **reader_args,
+    ) -> Iterator[Block]:
+        """Streaming read the records of a file that start in the byte range
+        [start, end), passing all kwargs to the reader.
+
+        The file is opened for random access. Use _NewlineAlignedRange to read the
+        records of the range.
+        """
+        raise NotImplementedError(
+            "Subclasses of FileBasedDatasource that support byte range splits must "
+            "implement _read_byte_range()."
+        )
+
     def _convert_block_to_tabular_block(
         self, block: Block, column_name: Optional[str] = None
     ) -> Union["pyarrow.Table", "pd.DataFrame"]:
@@ -281,10 +316,21 @@ class FileBasedDatasource(Datasource):
         open_stream_args: Optional[Dict[str, Any]] = None,
         block_path_provider: BlockWritePathProvider = DefaultBlockWritePathProvider(),
         write_args_fn: Callable[[], Dict[str, Any]] = lambda: {},
+        target_file_size_bytes: Optional[int] = None,
+        max_rows_per_file: Optional[int] = None,
+        partition_cols: Optional[List[str]] = None,
         _block_udf: Optional[Callable[[Block], Block]] = None,
         **write_args,
     ) -> WriteResult:
-        """Write blocks for a file-based datasource."""
+        """Write blocks for a file-based datasource.
+
+        By default, all blocks of a write task are concatenated into a single file.
+        If any of `target_file_size_bytes`, `max_rows_per_file` or `partition_cols`
+        is given, blocks are instead streamed to the files as they arrive, starting a
+        new file whenever the current one reaches the target size or row count, and
+        writing the rows of each partition to their own Hive-style partition
+        directory. This requires the datasource to implement `_open_block_writer()`.
+        """
         path, filesystem = _resolve_paths_and_filesystem(path, filesystem)
         path = path[0]
         if try_create_dir:
@@ -320,13 +366,37 @@ class FileBasedDatasource(Datasource):
         if isinstance(file_format, list):
             file_format = file_format[0]
 
+        if not block_path_provider:
+            block_path_provider = DefaultBlockWritePathProvider()
+
+        if (
+            target_file_size_bytes is not None
+            or max_rows_per_file is not None
+            or partition_cols
+        ):
+            return self._write_rolling_files(
+                blocks,
+                ctx,
+                path,
+                dataset_uuid,
+                filesystem,
+                try_create_dir,
+                open_stream_args,
+                block_path_provider,
+                file_format,
+                write_args_fn,
+                target_file_size_bytes,
+                max_rows_per_file,
+                partition_cols,
+                _block_udf,
+                **write_args,
+            )
+
         builder = DelegatingBlockBuilder()
         for block in blocks:
             builder.add_block(block)
         block = builder.build()
 
-        if not block_path_provider:
-            block_path_provider = DefaultBlockWritePathProvider()
         write_path = block_path_provider(
             path,
             filesystem=filesystem,
@@ -352,6 +422,100 @@ class FileBasedDatasource(Datasource):
             "Subclasses of FileBasedDatasource must implement _write_files()."
         )
 
+    def _open_block_writer(
+        self,
+        f: "pyarrow.NativeFile",
+        block: BlockAccessor,
+        writer_args_fn: Callable[[], Dict[str, Any]] = lambda: {},
+        **writer_args,
+    ) -> "_BlockWriter":
+        """Opens a writer that appends blocks like the given one to a single file.
+
+        Subclasses must implement this to support rolling file writes (i.e. the
+        `target_file_size_bytes`, `max_rows_per_file` and `partition_cols` write
+        args).
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} doesn't support rolling file writes."
+        )
+
+    def _write_rolling_files(
+        self,
+        blocks: Iterable[Block],
+        ctx: TaskContext,
+        path: str,
+        dataset_uuid: str,
+        filesystem: "pyarrow.fs.FileSystem",
+        try_create_dir: bool,
+        open_stream_args: Dict[str, Any],
+        block_path_provider: BlockWritePathProvider,
+        file_format: str,
+        write_args_fn: Callable[[], Dict[str, Any]],
+        target_file_size_bytes: Optional[int],
+        max_rows_per_file: Optional[int],
+        partition_cols: Optional[List[str]],
+        _block_udf: Optional[Callable[[Block], Block]],
+        **write_args,
+    ) -> WriteResult:
+        """Stream blocks to rolling files, with one set of files per partition."""
+        if target_file_size_bytes is not None and target_file_size_bytes < 1:
+            raise ValueError(
+                "target_file_size_bytes must be positive, got "
+                f"{target_file_size_bytes}."
+            )
+        if max_rows_per_file is not None and max_rows_per_file < 1:
+            raise ValueError(
+                f"max_rows_per_file must be positive, got {max_rows_per_file}."
+            )
+        fs = _unwrap_s3_serialization_workaround(filesystem)
+        encoder = None
+        if partition_cols:
+            encoder = PathPartitionEncoder.of(
+                base_dir=path, field_names=partition_cols, filesystem=fs
+            )
+
+        def open_block_writer(f: "pyarrow.NativeFile", block: BlockAccessor):
+            return self._open_block_writer(
+                f, block, writer_args_fn=write_args_fn, **write_args
+            )
+
+        # Maps partition values to the rolling writer of the partition.
+        writers: Dict[Tuple[str, ...], _RollingFileWriter] = {}
+        try:
+            for block in blocks:
+                if _block_udf is not None:
+                    block = _block_udf(block)
+                for values, part in _split_block_by_partition(block, partition_cols):
+                    writer = writers.get(values)
+                    if writer is None:
+                        base_path = path
+                        if encoder is not None:
+                            base_path = encoder(list(values))
+                            if try_create_dir:
+                                fs.create_dir(base_path, recursive=True)
+                        write_path = block_path_provider(
+                            base_path,
+                            filesystem=filesystem,
+                            dataset_uuid=dataset_uuid,
+                            block=part,
+                            block_index=ctx.task_idx,
+                            file_format=file_format,
+                        )
+                        writer = _RollingFileWriter(
+                            fs,
+                            write_path,
+                            open_stream_args,
+                            open_block_writer,
+                            target_file_size_bytes,
+                            max_rows_per_file,
+                        )
+                        writers[values] = writer
+                    writer.write(part)
+        finally:
+            for writer in writers.values():
+                writer.close()
+        return "ok"
+
     @classmethod
     def file_extension_filter(cls) -> Optional[PathPartitionFilter]:
         if cls._FILE_EXTENSION is None:
@@ -359,6 +523,161 @@ class FileBasedDatasource(Datasource):
         return FileExtensionFilter(cls._FILE_EXTENSION)
 
 
+class _BlockWriter:
+    """Appends blocks to a single open file.
+
+    Writers are opened with `FileBasedDatasource._open_block_writer()`.
+    """
+
+    def append(self, block: BlockAccessor) -> bool:
+        """Appends the block to the file.
+
+        Returns False without writing anything if the block can't be appended to
+        this file (e.g. because its schema differs), in which case it's written to
+        a new file instead.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """Finishes the file. The underlying stream is closed by the caller."""
+        pass
+
+
+class _RollingFileWriter:
+    """Streams blocks to a sequence of files, rolling over to a new file whenever
+    the current one reaches the target size in bytes or rows.
+
+    The k-th file is written to `{write_path}` with `_{k:06}` inserted before its
+    extension.
+    """
+
+    def __init__(
+        self,
+        filesystem: "pyarrow.fs.FileSystem",
+        write_path: str,
+        open_stream_args: Dict[str, Any],
+        open_block_writer: Callable[
+            ["pyarrow.NativeFile", BlockAccessor], _BlockWriter
+        ],
+        target_file_size_bytes: Optional[int],
+        max_rows_per_file: Optional[int],
+    ):
+        self._filesystem = filesystem
+        self._path_root, self._path_ext = posixpath.splitext(write_path)
+        self._open_stream_args = open_stream_args
+        self._open_block_writer = open_block_writer
+        self._target_file_size_bytes = target_file_size_bytes
+        self._max_rows_per_file = max_rows_per_file
+        self._num_files = 0
+        self._file: Optional["pyarrow.NativeFile"] = None
+        self._writer: Optional[_BlockWriter] = None
+        self._file_num_rows = 0
+
+    def write(self, block: Block):
+        """Writes the block, slicing it across files if it exceeds the targets."""
+        accessor = BlockAccessor.for_block(block)
+        num_rows = accessor.num_rows()
+        # Write blocks that are bigger than the target file size in slices, so that
+        # the files can be rolled in between.
+        max_rows_per_slice = num_rows
+        if self._target_file_size_bytes is not None and num_rows > 0:
+            bytes_per_row = accessor.size_bytes() / num_rows
+            max_rows_per_slice = max(
+                1, int(self._target_file_size_bytes / max(bytes_per_row, 1))
+            )
+        offset = 0
+        while offset < num_rows:
+            if self._writer is not None and self._is_full():
+                self._close_file()
+            end = min(num_rows, offset + max_rows_per_slice)
+            if self._max_rows_per_file is not None:
+                end = min(end, offset + self._max_rows_per_file - self._file_num_rows)
+            piece = BlockAccessor.for_block(accessor.slice(offset, end, copy=False))
+            if self._writer is not None and not self._writer.append(piece):
+                self._close_file()
+            if self._writer is None:
+                self._open_file(piece)
+                # A new file always accepts its first piece.
+                appended = self._writer.append(piece)
+                assert appended
+            self._file_num_rows += end - offset
+            offset = end
+
+    def close(self):
+        """Finishes the current file, if any."""
+        if self._writer is not None:
+            self._close_file()
+
+    def _is_full(self) -> bool:
+        if (
+            self._max_rows_per_file is not None
+            and self._file_num_rows >= self._max_rows_per_file
+        ):
+            return True
+        return (
+            self._target_file_size_bytes is not None
+            and self._file.tell() >= self._target_file_size_bytes
+        )
+
+    def _open_file(self, block: BlockAccessor):
+        write_path = f"{self._path_root}_{self._num_files:06}{self._path_ext}"
+        logger.debug(f"Writing {write_path} file.")
+        self._num_files += 1
+        self._file = self._filesystem.open_output_stream(
+            write_path, **self._open_stream_args
+        )
+        self._writer = self._open_block_writer(self._file, block)
+
+    def _close_file(self):
+        try:
+            self._writer.close()
+        finally:
+            self._file.close()
+            self._file = None
+            self._writer = None
+            self._file_num_rows = 0
+
+
+def _split_block_by_partition(
+    block: Block, partition_cols: Optional[List[str]]
+) -> Iterator[Tuple[Tuple[str, ...], Block]]:
+    """Splits the block into the rows of each partition, dropping the partition
+    columns.
+
+    Yields:
+        Tuples of the partition value strings and the rows of the partition.
+    """
+    if not partition_cols:
+        yield (), block
+        return
+    import pandas as pd
+    import pyarrow as pa
+
+    table = BlockAccessor.for_block(block).to_arrow()
+    if table.num_rows == 0:
+        return
+    missing = [col for col in partition_cols if col not in table.column_names]
+    if missing:
+        raise ValueError(
+            f"The partition columns {missing} aren't in the dataset columns "
+            f"{table.column_names}."
+        )
+    data_cols = [col for col in table.column_names if col not in partition_cols]
+    # Format the partition values with Arrow, since pandas would turn integer
+    # columns with nulls into floats.
+    keys = pd.DataFrame(
+        {col: table.column(col).cast(pa.string()).to_pandas() for col in partition_cols}
+    )
+    groups = keys.groupby(partition_cols, sort=False, dropna=False).indices
+    for values, indices in groups.items():
+        if not isinstance(values, tuple):
+            values = (values,)
+        values = tuple(
+            HIVE_NULL_PARTITION_VALUE if pd.isna(value) else value for value in values
+        )
+        yield values, table.select(data_cols).take(indices)
+
+
 class _FileBasedDatasourceReader(Reader):
     def __init__(
         self,
@@ -373,6 +692,7 @@ class _FileBasedDatasourceReader(Reader):
         # TODO(ekl) deprecate this once read fusion is available.
         _block_udf: Optional[Callable[[Block], Block]] = None,
         ignore_missing_paths: bool = False,
+        target_split_size_bytes: Optional[int] = None,
         **reader_args,
     ):
         _check_pyarrow_version()
@@ -384,6 +704,7 @@ class _FileBasedDatasourceReader(Reader):
         self._partitioning = partitioning
         self._block_udf = _block_udf
         self._ignore_missing_paths = ignore_missing_paths
+        self._target_split_size_bytes = target_split_size_bytes
         self._reader_args = reader_args
         paths, self._filesystem = _resolve_paths_and_filesystem(paths, filesystem)
         self._paths, self._file_sizes = map(
@@ -431,7 +752,6 @@ class _FileBasedDatasourceReader(Reader):
         partitioning = self._partitioning
         _block_udf = self._block_udf
 
-        paths, file_sizes = self._paths, self._file_sizes
         read_stream = self._delegate._read_stream
         convert_block_to_tabular_block = self._delegate._convert_block_to_tabular_block
         column_name = reader_args.get("column_name", None)
@@ -441,9 +761,11 @@ class _FileBasedDatasourceReader(Reader):
             open_stream_args = {}
 
         open_input_source = self._delegate._open_input_source
+        read_byte_range = self._delegate._read_byte_range
 
         def read_files(
             read_paths: List[str],
+            byte_ranges: List[Optional[Tuple[int, int]]],
             fs: Union["pyarrow.fs.FileSystem", _S3FileSystemWrapper],
         ) -> Iterable[Block]:
             DataContext._set_current(ctx)
@@ -452,7 +774,7 @@ class _FileBasedDatasourceReader(Reader):
             output_buffer = BlockOutputBuffer(
                 block_udf=_block_udf, target_max_block_size=ctx.target_max_block_size
             )
-            for read_path in read_paths:
+            for read_path, byte_range in zip(read_paths, byte_ranges):
                 compression = open_stream_args.pop("compression", None)
                 if compression is None:
                     import pyarrow as pa
@@ -487,8 +809,19 @@ class _FileBasedDatasourceReader(Reader):
                     parse = PathPartitionParser(partitioning)
                     partitions = parse(read_path)
 
-                with open_input_source(fs, read_path, **open_stream_args) as f:
-                    for data in read_stream(f, read_path, **reader_args):
+                if byte_range is None:
+                    source = open_input_source(fs, read_path, **open_stream_args)
+                else:
+                    source = fs.open_input_file(read_path)
+                with source as f:
+                    if byte_range is None:
+                        blocks = read_stream(f, read_path, **reader_args)
+                    else:
+                        start, end = byte_range
+                        blocks = read_byte_range(
+                            f, read_path, start, end, **reader_args
+                        )
+                    for data in blocks:
                         if partitions:
                             data = convert_block_to_tabular_block(data, column_name)
                             data = _add_partitions(data, partitions)
@@ -500,29 +833,154 @@ class _FileBasedDatasourceReader(Reader):
             if output_buffer.has_next():
                 yield output_buffer.next()
 
+        paths, byte_ranges, file_sizes = self._split_files(ctx)
+
         # fix https://github.com/ray-project/ray/issues/24296
         parallelism = min(parallelism, len(paths))
 
         read_tasks = []
-        for read_paths, file_sizes in zip(
-            np.array_split(paths, parallelism), np.array_split(file_sizes, parallelism)
-        ):
-            if len(read_paths) <= 0:
+        for indices in np.array_split(np.arange(len(paths)), parallelism):
+            if len(indices) <= 0:
                 continue
+            read_paths = [paths[i] for i in indices]
+            read_byte_ranges = [byte_ranges[i] for i in indices]
 
             meta = self._meta_provider(
                 read_paths,
                 self._schema,
                 rows_per_file=self._delegate._rows_per_file(),
-                file_sizes=file_sizes,
+                file_sizes=[file_sizes[i] for i in indices],
             )
             read_task = ReadTask(
-                lambda read_paths=read_paths: read_files(read_paths, filesystem), meta
+                lambda read_paths=read_paths, byte_ranges=read_byte_ranges: read_files(
+                    read_paths, byte_ranges, filesystem
+                ),
+                meta,
             )
             read_tasks.append(read_task)
 
         return read_tasks
 
+    def _split_files(
+        self, ctx: DataContext
+    ) -> Tuple[List[str], List[Optional[Tuple[int, int]]], List[Optional[int]]]:
+        """Split the files that are larger than the target split size into byte
+        ranges, if the datasource supports it.
+
+        Returns:
+            The path, byte range (or None for the whole file) and size of each part.
+        """
+        split_size = self._target_split_size_bytes
+        if split_size is None:
+            split_size = ctx.target_split_size_bytes
+        if (
+            split_size is None
+            or "compression" in (self._open_stream_args or {})
+            or not self._delegate._supports_byte_range_splits(**self._reader_args)
+        ):
+            return self._paths, [None] * len(self._paths), self._file_sizes
+
+        paths, byte_ranges, file_sizes = [], [], []
+        for path, file_size in zip(self._paths, self._file_sizes):
+            if file_size is None or file_size <= split_size or _is_compressed(path):
+                paths.append(path)
+                byte_ranges.append(None)
+                file_sizes.append(file_size)
+                continue
+            for start in range(0, file_size, split_size):
+                end = min(start + split_size, file_size)
+                paths.append(path)
+                byte_ranges.append((start, end))
+                file_sizes.append(end - start)
+        return paths, byte_ranges, file_sizes
+
+
+class _NewlineAlignedRange(io.RawIOBase):
+    """A stream of the lines of a file that start in the byte range [start, end).
+
+    The first line of the range is found by skipping to the byte after the first
+    newline at or after start - 1, and the last line ends at the first newline at or
+    after end - 1. This way, every line of the file is in exactly one of the ranges
+    that the file is split into, without knowing where the other ranges start.
+    """
+
+    def __init__(
+        self, f: "pyarrow.NativeFile", start: int, end: int, prefix: bytes = b""
+    ):
+        self._f = f
+        self._end = end
+        # Bytes to return before the range, e.g. the header of a CSV file.
+        self._buffer = prefix
+        self._done = False
+        if start > 0:
+            start = _find_line_end(f, start - 1)
+            if start is None or start >= end:
+                self._done = True
+        if not self._done:
+            f.seek(start)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        # Arrow treats reads that return fewer bytes than requested as the end of
+        # the stream, so fill the whole buffer unless the range ends first.
+        n = 0
+        while n < len(b):
+            if not self._buffer:
+                if self._done:
+                    break
+                self._buffer = self._read_next(len(b) - n)
+            size = min(len(b) - n, len(self._buffer))
+            b[n : n + size] = self._buffer[:size]
+            self._buffer = self._buffer[size:]
+            n += size
+        return n
+
+    def _read_next(self, size: int) -> bytes:
+        position = self._f.tell()
+        if position < self._end - 1:
+            # Read up to the byte before the last one of the range, which can't
+            # contain the end of the last line.
+            return self._f.read(min(size, self._end - 1 - position))
+        # Read until the end of the last line.
+        chunk = self._f.read(size)
+        index = chunk.find(b"\n")
+        if index >= 0 or not chunk:
+            self._done = True
+            chunk = chunk[: index + 1] if index >= 0 else chunk
+        return chunk
+
+
+# The number of bytes to read at a time when searching for the end of a line.
+_NEWLINE_SEARCH_CHUNK_SIZE = 64 * 1024
+
+
+def _find_line_end(f: "pyarrow.NativeFile", offset: int) -> Optional[int]:
+    """Returns the offset after the first newline at or after the offset, or None if
+    there's no newline after it."""
+    f.seek(offset)
+    while True:
+        chunk = f.read(_NEWLINE_SEARCH_CHUNK_SIZE)
+        if not chunk:
+            return None
+        index = chunk.find(b"\n")
+        if index >= 0:
+            return offset + index + 1
+        offset += len(chunk)
+
+
+def _is_compressed(path: str) -> bool:
+    """Returns whether the compression codec of the file can be detected from its
+    path, in which case it can't be read in byte ranges."""
+    import pyarrow as pa
+
+    try:
+        pa.Codec.detect(path)
+        return True
+    except (ValueError, TypeError):
+        return pathlib.Path(path).suffix == ".snappy"
+
 
 def _add_partitions(
     data: Union["pyarrow.Table", "pd.DataFrame"], partitions: Dict[str, Any]
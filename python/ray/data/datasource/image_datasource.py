@@ -1,15 +1,16 @@
 import io
 import logging
 import time
-from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 
-from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
 from ray.data._internal.util import _check_import
-from ray.data.block import Block, BlockMetadata
+from ray.data.block import Block, BlockAccessor, BlockMetadata
+from ray.data.context import DataContext
 from ray.data.datasource.binary_datasource import BinaryDatasource
-from ray.data.datasource.datasource import Reader
+from ray.data.datasource.datasource import Reader, ReadTask
 from ray.data.datasource.file_based_datasource import (
     FileBasedDatasource,
     _FileBasedDatasourceReader,
@@ -37,6 +38,10 @@ IMAGE_ENCODING_RATIO_ESTIMATE_DEFAULT = 1
 # The lower bound value to estimate image encoding ratio.
 IMAGE_ENCODING_RATIO_ESTIMATE_LOWER_BOUND = 0.5
 
+# The number of threads that each read task decodes images with. Pillow releases the
+# GIL while decoding and resizing images, so the threads decode in parallel.
+IMAGE_DECODE_NUM_THREADS = 4
+
 
 @DeveloperAPI
 class ImageDatasource(BinaryDatasource):
@@ -49,6 +54,7 @@ class ImageDatasource(BinaryDatasource):
         size: Optional[Tuple[int, int]] = None,
         mode: Optional[str] = None,
         include_paths: bool = False,
+        jpeg_draft_decode: bool = False,
         **reader_args,
     ) -> "Reader[T]":
         if size is not None and len(size) != 2:
@@ -64,7 +70,12 @@ class ImageDatasource(BinaryDatasource):
         _check_import(self, module="PIL", package="Pillow")
 
         return _ImageDatasourceReader(
-            self, size=size, mode=mode, include_paths=include_paths, **reader_args
+            self,
+            size=size,
+            mode=mode,
+            include_paths=include_paths,
+            jpeg_draft_decode=jpeg_draft_decode,
+            **reader_args,
         )
 
     def _convert_block_to_tabular_block(
@@ -80,34 +91,21 @@ class ImageDatasource(BinaryDatasource):
         self,
         f: "pyarrow.NativeFile",
         path: str,
-        size: Optional[Tuple[int, int]],
-        mode: Optional[str],
         include_paths: bool,
         **reader_args,
     ) -> "pyarrow.Table":
-        from PIL import Image
+        import pyarrow as pa
 
         records = super()._read_file(f, path, include_paths=True, **reader_args)
         assert len(records) == 1
         path, data = records[0]
 
-        image = Image.open(io.BytesIO(data))
-        if size is not None:
-            height, width = size
-            image = image.resize((width, height))
-        if mode is not None:
-            image = image.convert(mode)
-
-        builder = DelegatingBlockBuilder()
-        array = np.array(image)
+        # The encoded image is decoded together with the other images of the read
+        # task by _decode_images().
+        columns = {"image": pa.array([data], type=pa.binary())}
         if include_paths:
-            item = {"image": array, "path": path}
-        else:
-            item = {"image": array}
-        builder.add(item)
-        block = builder.build()
-
-        return block
+            columns["path"] = pa.array([path])
+        return pa.table(columns)
 
 
 class _ImageFileMetadataProvider(DefaultFileMetadataProvider):
@@ -140,8 +138,14 @@ class _ImageDatasourceReader(_FileBasedDatasourceReader):
         partition_filter: PathPartitionFilter,
         partitioning: Partitioning,
         meta_provider: BaseFileMetadataProvider,
+        size: Optional[Tuple[int, int]] = None,
+        mode: Optional[str] = None,
+        jpeg_draft_decode: bool = False,
         **reader_args,
     ):
+        self._size = size
+        self._mode = mode
+        self._jpeg_draft_decode = jpeg_draft_decode
         super().__init__(
             delegate=delegate,
             paths=paths,
@@ -158,6 +162,24 @@ class _ImageDatasourceReader(_FileBasedDatasourceReader):
         else:
             self._encoding_ratio = IMAGE_ENCODING_RATIO_ESTIMATE_DEFAULT
 
+    def get_read_tasks(self, parallelism: int) -> List[ReadTask]:
+        ctx = DataContext.get_current()
+        size, mode = self._size, self._mode
+        jpeg_draft_decode = self._jpeg_draft_decode
+        target_max_block_size = ctx.target_max_block_size
+
+        # The files are read as encoded images, which the read tasks then decode in
+        # batches.
+        return [
+            ReadTask(
+                lambda read_task=read_task: _decode_images(
+                    read_task(), size, mode, jpeg_draft_decode, target_max_block_size
+                ),
+                read_task.get_metadata(),
+            )
+            for read_task in super().get_read_tasks(parallelism)
+        ]
+
     def estimate_inmemory_data_size(self) -> Optional[int]:
         total_size = 0
         for file_size in self._file_sizes:
@@ -182,8 +204,8 @@ class _ImageDatasourceReader(_FileBasedDatasourceReader):
             )
             return IMAGE_ENCODING_RATIO_ESTIMATE_DEFAULT
 
-        size = self._reader_args.get("size")
-        mode = self._reader_args.get("mode")
+        size = self._size
+        mode = self._mode
         if size is not None and mode is not None:
             # Use image size and mode to calculate data size for all images,
             # because all images are homogeneous with same size after resizing.
@@ -215,3 +237,97 @@ class _ImageDatasourceReader(_FileBasedDatasourceReader):
             )
         logger.debug(f"Estimated image encoding ratio from sampling is {ratio}.")
         return max(ratio, IMAGE_ENCODING_RATIO_ESTIMATE_LOWER_BOUND)
+
+
+def _decode_images(
+    blocks: Iterable[Block],
+    size: Optional[Tuple[int, int]],
+    mode: Optional[str],
+    jpeg_draft_decode: bool,
+    target_max_block_size: int,
+) -> Iterator[Block]:
+    """Decode the encoded images in the "image" column of the blocks.
+
+    The images are decoded by a pool of threads, in batches of about the target max
+    block size. If the size and mode of the images are given, all images have the
+    same shape, so the images of a batch are written directly into a preallocated
+    ndarray, which becomes the buffer of the tensor column without another copy.
+    """
+    from PIL import Image
+
+    from ray.data.extensions import ArrowTensorArray
+
+    max_bytes = target_max_block_size
+
+    def decode(data: bytes) -> "Image.Image":
+        image = Image.open(io.BytesIO(data))
+        if size is not None:
+            height, width = size
+            if jpeg_draft_decode:
+                # Let the JPEG decoder scale the image down by a power of two, to no
+                # less than the requested size. This is much faster than decoding the
+                # full image, and does nothing for other formats.
+                image.draft(mode, (width, height))
+            image = image.resize((width, height))
+        if mode is not None:
+            image = image.convert(mode)
+        return image
+
+    if size is not None and mode is not None:
+        # Pillow determines the dtype and number of channels of the mode.
+        sample = np.asarray(Image.new(mode, (1, 1)))
+        shape = tuple(size) + sample.shape[2:]
+        rows_per_batch = max(1, max_bytes // (int(np.prod(shape)) * sample.itemsize))
+
+        def decode_batch(encoded: List[bytes]) -> Tuple["pyarrow.Array", int]:
+            encoded = encoded[:rows_per_batch]
+            images = np.empty((len(encoded),) + shape, dtype=sample.dtype)
+
+            def decode_into(i: int):
+                images[i] = np.asarray(decode(encoded[i]))
+
+            list(pool.map(decode_into, range(len(encoded))))
+            return ArrowTensorArray.from_numpy(images), len(encoded)
+
+    else:
+
+        def decode_batch(encoded: List[bytes]) -> Tuple["pyarrow.Array", int]:
+            # The size of the decoded images isn't known in advance, so decode a few
+            # images at a time until the batch is large enough.
+            images, batch_size_bytes = [], 0
+            chunk_size = 2 * IMAGE_DECODE_NUM_THREADS
+            while len(images) < len(encoded) and batch_size_bytes < max_bytes:
+                chunk = encoded[len(images) : len(images) + chunk_size]
+                for image in pool.map(decode, chunk):
+                    images.append(np.asarray(image))
+                    batch_size_bytes += images[-1].nbytes
+            return _to_tensor_array(images), len(images)
+
+    with ThreadPoolExecutor(max_workers=IMAGE_DECODE_NUM_THREADS) as pool:
+        for block in blocks:
+            block = BlockAccessor.for_block(block).to_arrow()
+            column_index = block.schema.get_field_index("image")
+            encoded = block.column(column_index).to_pylist()
+            start = 0
+            while start < len(encoded):
+                column, num_rows = decode_batch(encoded[start:])
+                yield block.slice(start, num_rows).set_column(
+                    column_index, "image", column
+                )
+                start += num_rows
+
+
+def _to_tensor_array(arrays: List[np.ndarray]) -> "pyarrow.Array":
+    from ray.data.extensions import ArrowTensorArray
+
+    if all(
+        array.shape == arrays[0].shape and array.dtype == arrays[0].dtype
+        for array in arrays
+    ):
+        return ArrowTensorArray.from_numpy(np.stack(arrays))
+    # Build the ragged ndarray element by element, since NumPy would try to
+    # broadcast the arrays against each other otherwise.
+    ragged = np.empty(len(arrays), dtype=object)
+    for i, array in enumerate(arrays):
+        ragged[i] = array
+    return ArrowTensorArray.from_numpy(ragged)
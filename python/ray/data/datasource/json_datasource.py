@@ -1,8 +1,9 @@
-from typing import TYPE_CHECKING, Any, Callable, Dict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator
 
-from ray.data.block import BlockAccessor
+from ray.data.block import Block, BlockAccessor
 from ray.data.datasource.file_based_datasource import (
     FileBasedDatasource,
+    _NewlineAlignedRange,
     _resolve_kwargs,
 )
 from ray.util.annotations import PublicAPI
@@ -35,6 +36,47 @@ class JSONDatasource(FileBasedDatasource):
         )
         return json.read_json(f, read_options=read_options, **reader_args)
 
+    def _supports_byte_range_splits(self, **reader_args) -> bool:
+        from pyarrow import json
+
+        parse_options = reader_args.get("parse_options", json.ParseOptions())
+        return not parse_options.newlines_in_values
+
+    def _read_byte_range(
+        self,
+        f: "pyarrow.NativeFile",
+        path: str,
+        start: int,
+        end: int,
+        **reader_args,
+    ) -> Iterator[Block]:
+        import pyarrow as pa
+        from pyarrow import json
+
+        read_options = reader_args.get(
+            "read_options", json.ReadOptions(use_threads=False)
+        )
+        parse_options = reader_args.get("parse_options", json.ParseOptions())
+
+        # Each range would otherwise infer its own column types, e.g. int64 for a
+        # range of integers and double for the next one, which can't be
+        # concatenated. Infer them from the first block of the file instead, and use
+        # them for every range.
+        first_block = f.read_at(read_options.block_size, 0)
+        if b"\n" in first_block:
+            first_block = first_block[: first_block.rindex(b"\n") + 1]
+        schema = json.read_json(
+            pa.BufferReader(first_block),
+            read_options=read_options,
+            parse_options=parse_options,
+        ).schema
+        reader_args["parse_options"] = json.ParseOptions(
+            explicit_schema=schema,
+            newlines_in_values=parse_options.newlines_in_values,
+            unexpected_field_behavior=parse_options.unexpected_field_behavior,
+        )
+        yield self._read_file(_NewlineAlignedRange(f, start, end), path, **reader_args)
+
     def _write_block(
         self,
         f: "pyarrow.NativeFile",
@@ -1,9 +1,10 @@
 import logging
-from typing import TYPE_CHECKING, Any, Callable, Dict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
 
 from ray.data.block import BlockAccessor
 from ray.data.datasource.file_based_datasource import (
     FileBasedDatasource,
+    _BlockWriter,
     _resolve_kwargs,
 )
 from ray.util.annotations import PublicAPI
@@ -54,3 +55,42 @@ class ParquetBaseDatasource(FileBasedDatasource):
 
         writer_args = _resolve_kwargs(writer_args_fn, **writer_args)
         pq.write_table(block.to_arrow(), f, **writer_args)
+
+    def _open_block_writer(
+        self,
+        f: "pyarrow.NativeFile",
+        block: BlockAccessor,
+        writer_args_fn: Callable[[], Dict[str, Any]] = lambda: {},
+        **writer_args,
+    ) -> "_ParquetBlockWriter":
+        writer_args = _resolve_kwargs(writer_args_fn, **writer_args)
+        return _ParquetBlockWriter(f, block.to_arrow().schema, **writer_args)
+
+
+class _ParquetBlockWriter(_BlockWriter):
+    """Appends blocks with the same schema to a Parquet file as row groups."""
+
+    def __init__(
+        self,
+        f: "pyarrow.NativeFile",
+        schema: "pyarrow.Schema",
+        row_group_size: Optional[int] = None,
+        **writer_args,
+    ):
+        import pyarrow.parquet as pq
+
+        self._schema = schema
+        # Unlike the other `pq.write_table()` args, the row group size is passed per
+        # written table rather than to the writer.
+        self._row_group_size = row_group_size
+        self._writer = pq.ParquetWriter(f, schema, **writer_args)
+
+    def append(self, block: BlockAccessor) -> bool:
+        table = block.to_arrow()
+        if not table.schema.equals(self._schema):
+            return False
+        self._writer.write_table(table, row_group_size=self._row_group_size)
+        return True
+
+    def close(self):
+        self._writer.close()
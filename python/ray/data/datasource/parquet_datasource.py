@@ -1,14 +1,16 @@
+import copy
 import logging
-from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Union
 
 import numpy as np
 
 import ray.cloudpickle as cloudpickle
 from ray.data._internal.output_buffer import BlockOutputBuffer
+from ray.data._internal.parquet_metadata_cache import ParquetMetadataCache
 from ray.data._internal.progress_bar import ProgressBar
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data._internal.util import _check_pyarrow_version
-from ray.data.block import Block
+from ray.data.block import Block, BlockMetadata
 from ray.data.context import DataContext
 from ray.data.datasource.datasource import Reader, ReadTask
 from ray.data.datasource.file_based_datasource import _resolve_paths_and_filesystem
@@ -72,6 +74,14 @@ class _SerializedPiece:
         self._data = cloudpickle.dumps(
             (frag.format, frag.path, frag.filesystem, frag.partition_expression)
         )
+        # The row groups of the file to read, or None to read all of them.
+        self._row_groups = None
+
+    def with_row_groups(self, row_groups: List[int]) -> "_SerializedPiece":
+        """Return a copy of this piece that only reads the given row groups."""
+        piece = copy.copy(self)
+        piece._row_groups = row_groups
+        return piece
 
     def deserialize(self) -> "ParquetFileFragment":
         # Implicitly trigger S3 subsystem initialization by importing
@@ -81,7 +91,9 @@ class _SerializedPiece:
         (file_format, path, filesystem, partition_expression) = cloudpickle.loads(
             self._data
         )
-        return file_format.make_fragment(path, filesystem, partition_expression)
+        return file_format.make_fragment(
+            path, filesystem, partition_expression, row_groups=self._row_groups
+        )
 
 
 # Visible for test mocking.
@@ -183,7 +195,6 @@ class _ParquetDatasourceReader(Reader):
         **reader_args,
     ):
         _check_pyarrow_version()
-        import pyarrow as pa
         import pyarrow.parquet as pq
 
         paths, filesystem = _resolve_paths_and_filesystem(paths, filesystem)
@@ -211,14 +222,13 @@ class _ParquetDatasourceReader(Reader):
             _handle_read_os_error(e, paths)
         if schema is None:
             schema = pq_ds.schema
-        if columns:
-            schema = pa.schema(
-                [schema.field(column) for column in columns], schema.metadata
-            )
+        # NOTE: the full schema is kept for scanning, so that filters can refer to
+        # columns that are not read.
+        output_schema = _project_schema(schema, columns)
 
         if _block_udf is not None:
             # Try to infer dataset schema by passing dummy table through UDF.
-            dummy_table = schema.empty_table()
+            dummy_table = output_schema.empty_table()
             try:
                 inferred_schema = _block_udf(dummy_table).schema
                 inferred_schema = inferred_schema.with_metadata(schema.metadata)
@@ -228,19 +238,25 @@ class _ParquetDatasourceReader(Reader):
                     "through UDF due to the following exception:",
                     exc_info=True,
                 )
-                inferred_schema = schema
+                inferred_schema = output_schema
         else:
-            inferred_schema = schema
+            inferred_schema = output_schema
+
+        self._metadata_cache = None
+        self._cache_keys = [None] * len(pq_ds.pieces)
+        cache_dir = DataContext.get_current().parquet_metadata_cache_dir
+        if cache_dir is not None:
+            self._metadata_cache = ParquetMetadataCache(cache_dir)
+            self._cache_keys = self._metadata_cache.get_keys(
+                [p.path for p in pq_ds.pieces], pq_ds.filesystem
+            )
 
         try:
             prefetch_remote_args = {}
             if self._local_scheduling:
                 prefetch_remote_args["scheduling_strategy"] = self._local_scheduling
-            self._metadata = (
-                meta_provider.prefetch_file_metadata(
-                    pq_ds.pieces, **prefetch_remote_args
-                )
-                or []
+            self._metadata = self._prefetch_file_metadata(
+                pq_ds.pieces, meta_provider, **prefetch_remote_args
             )
         except OSError as e:
             _handle_read_os_error(e, paths)
@@ -253,6 +269,44 @@ class _ParquetDatasourceReader(Reader):
         self._schema = schema
         self._encoding_ratio = self._estimate_files_encoding_ratio()
 
+    def _prefetch_file_metadata(
+        self,
+        pieces: List["pyarrow.dataset.ParquetFileFragment"],
+        meta_provider: ParquetMetadataProvider,
+        **ray_remote_args,
+    ) -> List[Any]:
+        if self._metadata_cache is None or not isinstance(
+            meta_provider, DefaultParquetMetadataProvider
+        ):
+            # The metadata of other providers can't be cached, since it may not be
+            # a Parquet footer.
+            return meta_provider.prefetch_file_metadata(pieces, **ray_remote_args) or []
+
+        # Only fetch the footers of the files that are not cached yet.
+        metadata = [
+            self._metadata_cache.get_metadata(key) if key is not None else None
+            for key in self._cache_keys
+        ]
+        missing = [
+            i for i, file_metadata in enumerate(metadata) if file_metadata is None
+        ]
+        if not missing:
+            return metadata
+        fetched = (
+            meta_provider.prefetch_file_metadata(
+                [pieces[i] for i in missing], **ray_remote_args
+            )
+            or []
+        )
+        if len(fetched) != len(missing):
+            # The footers aren't available for all files.
+            return fetched if len(missing) == len(pieces) else []
+        for i, file_metadata in zip(missing, fetched):
+            metadata[i] = file_metadata
+            if self._cache_keys[i] is not None:
+                self._metadata_cache.put_metadata(self._cache_keys[i], file_metadata)
+        return metadata
+
     def estimate_inmemory_data_size(self) -> Optional[int]:
         total_size = 0
         for file_metadata in self._metadata:
@@ -266,6 +320,8 @@ class _ParquetDatasourceReader(Reader):
         # method in order to leverage pyarrow's ParquetDataset abstraction,
         # which simplifies partitioning logic. We still use
         # FileBasedDatasource's write side (do_write), however.
+        reader_args = dict(self._reader_args)
+        filter_expr = reader_args.pop("filter", None)
         read_tasks = []
         for pieces, metadata in zip(
             np.array_split(self._pq_ds.pieces, parallelism),
@@ -281,31 +337,22 @@ class _ParquetDatasourceReader(Reader):
                 pieces=pieces,
                 prefetched_metadata=metadata,
             )
-            # If there is a filter operation, reset the calculated row count,
-            # since the resulting row count is unknown.
-            if self._reader_args.get("filter") is not None:
-                meta.num_rows = None
 
             if meta.size_bytes is not None:
                 meta.size_bytes = int(meta.size_bytes * self._encoding_ratio)
-            block_udf, reader_args, columns, schema = (
+            read_task = _ParquetReadTask(
                 self._block_udf,
-                self._reader_args,
+                reader_args,
                 self._columns,
                 self._schema,
+                serialized_pieces,
+                meta,
+                file_metadata=_as_file_metadata(metadata, len(pieces)),
             )
-            read_tasks.append(
-                ReadTask(
-                    lambda p=serialized_pieces: _read_pieces(
-                        block_udf,
-                        reader_args,
-                        columns,
-                        schema,
-                        p,
-                    ),
-                    meta,
-                )
-            )
+            if filter_expr is not None:
+                # Skip the row groups that can't match the filter.
+                read_task = read_task._with_filter(filter_expr)
+            read_tasks.append(read_task)
 
         return read_tasks
 
@@ -333,19 +380,30 @@ class _ParquetDatasourceReader(Reader):
 
         # Evenly distributed to choose which file to sample, to avoid biased prediction
         # if data is skewed.
-        file_samples = [
-            self._pq_ds.pieces[idx]
-            for idx in np.linspace(0, num_files - 1, num_samples).astype(int).tolist()
-        ]
+        sample_indices = np.linspace(0, num_files - 1, num_samples).astype(int).tolist()
+
+        # Reuse the cached ratios of the sampled files, if any.
+        sample_ratios = []
+        uncached_indices = []
+        for idx in sample_indices:
+            ratio = None
+            if self._metadata_cache is not None and self._cache_keys[idx] is not None:
+                ratio = self._metadata_cache.get_encoding_ratio(
+                    self._cache_keys[idx], self._columns
+                )
+            if ratio is None:
+                uncached_indices.append(idx)
+            else:
+                sample_ratios.append(ratio)
 
         sample_piece = cached_remote_fn(_sample_piece)
         futures = []
         scheduling = self._local_scheduling or "SPREAD"
-        for sample in file_samples:
+        for idx in uncached_indices:
             # Sample the first rows batch in i-th file.
             # Use SPREAD scheduling strategy to avoid packing many sampling tasks on
             # same machine to cause OOM issue, as sampling can be memory-intensive.
-            serialized_sample = _SerializedPiece(sample)
+            serialized_sample = _SerializedPiece(self._pq_ds.pieces[idx])
             futures.append(
                 sample_piece.options(scheduling_strategy=scheduling).remote(
                     self._reader_args,
@@ -354,14 +412,267 @@ class _ParquetDatasourceReader(Reader):
                     serialized_sample,
                 )
             )
-        sample_bar = ProgressBar("Parquet Files Sample", len(futures))
-        sample_ratios = sample_bar.fetch_until_complete(futures)
-        sample_bar.close()
+        if futures:
+            sample_bar = ProgressBar("Parquet Files Sample", len(futures))
+            new_ratios = sample_bar.fetch_until_complete(futures)
+            sample_bar.close()
+            for idx, ratio in zip(uncached_indices, new_ratios):
+                if self._metadata_cache is not None and self._cache_keys[idx]:
+                    self._metadata_cache.put_encoding_ratio(
+                        self._cache_keys[idx], self._columns, ratio
+                    )
+            sample_ratios.extend(new_ratios)
         ratio = np.mean(sample_ratios)
         logger.debug(f"Estimated Parquet encoding ratio from sampling is {ratio}.")
         return max(ratio, PARQUET_ENCODING_RATIO_ESTIMATE_LOWER_BOUND)
 
 
+class _ParquetReadTask(ReadTask):
+    """A read task over a list of Parquet file pieces.
+
+    Unlike a generic read task, it keeps its read arguments, so that the logical
+    optimizer can push a column projection or a filter expression down into the
+    Parquet scan (see `ray.data._internal.logical.rules.pushdown`). If the footers of
+    the files are known, the row groups whose statistics can't match a pushed down
+    filter are skipped without reading them.
+    """
+
+    def __init__(
+        self,
+        block_udf: Optional[Callable[[Block], Block]],
+        reader_args: Dict[str, Any],
+        columns: Optional[List[str]],
+        schema: "pyarrow.lib.Schema",
+        serialized_pieces: List[_SerializedPiece],
+        metadata: BlockMetadata,
+        file_metadata: Optional[List["pyarrow.parquet.FileMetaData"]] = None,
+    ):
+        self._block_udf = block_udf
+        self._reader_args = reader_args
+        self._columns = columns
+        self._schema = schema
+        self._serialized_pieces = serialized_pieces
+        # The footers of the pieces, used to prune row groups by their statistics.
+        self._file_metadata = file_metadata
+        super().__init__(
+            lambda: _read_pieces(
+                block_udf, reader_args, columns, schema, serialized_pieces
+            ),
+            metadata,
+        )
+
+    def supports_pushdown(self) -> bool:
+        """Whether a projection or filter can be pushed into this task.
+
+        The output of a block UDF can't be related to the columns of the files, so
+        nothing is pushed down if there is one.
+        """
+        return self._block_udf is None
+
+    def is_empty(self) -> bool:
+        """Whether all row groups of this task were skipped by a filter."""
+        return all(p._row_groups == [] for p in self._serialized_pieces)
+
+    def with_columns(self, columns: List[str]) -> "_ParquetReadTask":
+        """Return a copy of this task that only reads the given columns.
+
+        The columns must be a subset of the columns that this task currently reads.
+        """
+        assert self.supports_pushdown()
+        meta = copy.copy(self.get_metadata())
+        old_schema = _project_schema(self._schema, self._columns)
+        meta.schema = _project_schema(self._schema, columns)
+        if meta.size_bytes is not None and len(old_schema) > 0:
+            meta.size_bytes = int(meta.size_bytes * len(columns) / len(old_schema))
+        return _ParquetReadTask(
+            self._block_udf,
+            self._reader_args,
+            columns,
+            self._schema,
+            self._serialized_pieces,
+            meta,
+            self._file_metadata,
+        )
+
+    def with_filter(
+        self, filter_expr: "pyarrow.dataset.Expression"
+    ) -> "_ParquetReadTask":
+        """Return a copy of this task that only reads the rows matching the filter.
+
+        The filter is combined with the filter that this task already applies, if any.
+        """
+        assert self.supports_pushdown()
+        return self._with_filter(filter_expr)
+
+    def _with_filter(
+        self, filter_expr: "pyarrow.dataset.Expression"
+    ) -> "_ParquetReadTask":
+        reader_args = dict(self._reader_args)
+        if reader_args.get("filter") is not None:
+            filter_expr = reader_args["filter"] & filter_expr
+        reader_args["filter"] = filter_expr
+        meta = copy.copy(self.get_metadata())
+        # The resulting row count is unknown.
+        meta.num_rows = None
+
+        serialized_pieces = self._serialized_pieces
+        if self._file_metadata is not None:
+            serialized_pieces = _prune_row_groups(
+                serialized_pieces, self._file_metadata, self._schema, filter_expr
+            )
+            if meta.size_bytes is not None:
+                old_size = _row_groups_size(
+                    self._serialized_pieces, self._file_metadata
+                )
+                new_size = _row_groups_size(serialized_pieces, self._file_metadata)
+                if old_size > 0:
+                    meta.size_bytes = int(meta.size_bytes * new_size / old_size)
+        return _ParquetReadTask(
+            self._block_udf,
+            reader_args,
+            self._columns,
+            self._schema,
+            serialized_pieces,
+            meta,
+            self._file_metadata,
+        )
+
+
+def _as_file_metadata(
+    metadata: List[Any], num_pieces: int
+) -> Optional[List["pyarrow.parquet.FileMetaData"]]:
+    """Return the prefetched metadata of the pieces if it consists of their footers,
+    and None otherwise."""
+    import pyarrow.parquet as pq
+
+    if len(metadata) != num_pieces or not all(
+        isinstance(m, pq.FileMetaData) for m in metadata
+    ):
+        return None
+    return list(metadata)
+
+
+def _row_group_ids(
+    piece: _SerializedPiece, file_metadata: "pyarrow.parquet.FileMetaData"
+) -> List[int]:
+    if piece._row_groups is not None:
+        return piece._row_groups
+    return list(range(file_metadata.num_row_groups))
+
+
+def _row_groups_size(
+    pieces: List[_SerializedPiece],
+    file_metadata: List["pyarrow.parquet.FileMetaData"],
+) -> int:
+    return sum(
+        m.row_group(i).total_byte_size
+        for p, m in zip(pieces, file_metadata)
+        for i in _row_group_ids(p, m)
+    )
+
+
+def _prune_row_groups(
+    pieces: List[_SerializedPiece],
+    file_metadata: List["pyarrow.parquet.FileMetaData"],
+    schema: "pyarrow.lib.Schema",
+    filter_expr: "pyarrow.dataset.Expression",
+) -> List[_SerializedPiece]:
+    """Return the pieces restricted to the row groups that may match the filter.
+
+    The min/max statistics of each row group (and the partition expression of its
+    file) are turned into an expression that is guaranteed to hold for all of its
+    rows. Arrow then drops the row groups for which the filter simplifies to false
+    under that guarantee, without any I/O. Pieces without any matching row groups
+    are kept with an empty row group list, so that the number of pieces (and their
+    metadata) stays aligned.
+    """
+    import pyarrow.dataset as pds
+    import pyarrow.fs
+
+    row_groups = []
+    guarantees = []
+    for piece_idx, (piece, metadata) in enumerate(zip(pieces, file_metadata)):
+        partition_expression = piece.deserialize().partition_expression
+        for row_group_idx in _row_group_ids(piece, metadata):
+            row_groups.append((piece_idx, row_group_idx))
+            guarantees.append(
+                partition_expression
+                & _row_group_guarantee(metadata.row_group(row_group_idx), schema)
+            )
+
+    # Each row group is represented by a dummy file whose "partition" is its
+    # guarantee.
+    dataset = pds.FileSystemDataset.from_paths(
+        [str(i) for i in range(len(row_groups))],
+        schema=schema,
+        format=pds.ParquetFileFormat(),
+        filesystem=pyarrow.fs.LocalFileSystem(),
+        partitions=guarantees,
+    )
+    try:
+        matches = {int(f.path) for f in dataset.get_fragments(filter=filter_expr)}
+    except Exception:
+        # E.g. the filter refers to unknown columns. Leave it to the scan to raise.
+        logger.debug("Failed to prune Parquet row groups.", exc_info=True)
+        return pieces
+
+    matching_row_groups = [[] for _ in pieces]
+    for i, (piece_idx, row_group_idx) in enumerate(row_groups):
+        if i in matches:
+            matching_row_groups[piece_idx].append(row_group_idx)
+    return [
+        piece.with_row_groups(row_group_ids)
+        for piece, row_group_ids in zip(pieces, matching_row_groups)
+    ]
+
+
+def _row_group_guarantee(
+    row_group: "pyarrow.parquet.RowGroupMetaData", schema: "pyarrow.lib.Schema"
+) -> "pyarrow.dataset.Expression":
+    """Return an expression that holds for all rows of the row group, according to
+    its column statistics."""
+    import pyarrow as pa
+    import pyarrow.dataset as pds
+
+    guarantee = pds.scalar(True)
+    for i in range(row_group.num_columns):
+        column = row_group.column(i)
+        stats = column.statistics
+        # Nested columns have dotted paths, and are skipped here.
+        name = column.path_in_schema
+        if stats is None or name not in schema.names:
+            continue
+        field = pds.field(name)
+        if stats.has_min_max:
+            type_ = schema.field(name).type
+            try:
+                expr = (field >= pa.scalar(stats.min, type_)) & (
+                    field <= pa.scalar(stats.max, type_)
+                )
+            except (pa.ArrowException, TypeError, ValueError):
+                # The statistics can't be represented as the type of the column,
+                # e.g. for dictionary or extension types.
+                continue
+            if not stats.has_null_count or stats.null_count > 0:
+                expr = expr | field.is_null()
+        elif stats.has_null_count and stats.null_count == row_group.num_rows:
+            expr = field.is_null()
+        else:
+            continue
+        guarantee = guarantee & expr
+    return guarantee
+
+
+def _project_schema(
+    schema: "pyarrow.lib.Schema", columns: Optional[List[str]]
+) -> "pyarrow.lib.Schema":
+    import pyarrow as pa
+
+    if not columns:
+        return schema
+    return pa.schema([schema.field(column) for column in columns], schema.metadata)
+
+
 def _read_pieces(
     block_udf, reader_args, columns, schema, serialized_pieces: List[_SerializedPiece]
 ) -> Iterator["pyarrow.Table"]:
@@ -386,8 +697,10 @@ def _read_pieces(
     )
 
     logger.debug(f"Reading {len(pieces)} parquet pieces")
+    reader_args = dict(reader_args)
     use_threads = reader_args.pop("use_threads", False)
     batch_size = reader_args.pop("batch_size", PARQUET_READER_ROW_BATCH_SIZE)
+    output_schema = _project_schema(schema, columns)
     for piece in pieces:
         part = _get_partition_keys(piece.partition_expression)
         batches = piece.to_batches(
@@ -398,9 +711,11 @@ def _read_pieces(
             **reader_args,
         )
         for batch in batches:
-            table = pa.Table.from_batches([batch], schema=schema)
+            table = pa.Table.from_batches([batch], schema=output_schema)
             if part:
                 for col, value in part.items():
+                    if col not in output_schema.names:
+                        continue
                     table = table.set_column(
                         table.schema.get_field_index(col),
                         col,
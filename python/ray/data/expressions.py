@@ -0,0 +1,267 @@
+from typing import TYPE_CHECKING, Any, List, Optional
+
+from ray.util.annotations import PublicAPI
+
+if TYPE_CHECKING:
+    import pyarrow
+    import pyarrow.compute
+
+
+@PublicAPI(stability="alpha")
+class Expr:
+    """An expression over the columns of a dataset.
+
+    Expressions are built from column references (``col()``) and literals
+    (``lit()``) with Python operators and the methods below, and are evaluated on
+    whole blocks with ``pyarrow.compute``, without calling back into Python for each
+    batch or row. They're used with ``Dataset.with_column()`` and
+    ``Dataset.filter(expr=...)``.
+
+    Examples:
+        >>> import ray
+        >>> from ray.data.expressions import col
+        >>> ds = ray.data.range(5)
+        >>> ds.with_column("double", col("id") * 2).take(2)
+        [{'id': 0, 'double': 0}, {'id': 1, 'double': 2}]
+        >>> ds.filter(expr=(col("id") > 1) & (col("id") < 4)).count()
+        2
+
+    .. note::
+        Like in pandas, use ``&``, ``|`` and ``~`` to combine boolean expressions,
+        since ``and``, ``or`` and ``not`` can't be overloaded.
+    """
+
+    def __add__(self, other: Any) -> "Expr":
+        return _CallExpr("add", [self, other])
+
+    def __radd__(self, other: Any) -> "Expr":
+        return _CallExpr("add", [other, self])
+
+    def __sub__(self, other: Any) -> "Expr":
+        return _CallExpr("subtract", [self, other])
+
+    def __rsub__(self, other: Any) -> "Expr":
+        return _CallExpr("subtract", [other, self])
+
+    def __mul__(self, other: Any) -> "Expr":
+        return _CallExpr("multiply", [self, other])
+
+    def __rmul__(self, other: Any) -> "Expr":
+        return _CallExpr("multiply", [other, self])
+
+    def __truediv__(self, other: Any) -> "Expr":
+        return _true_divide(self, other)
+
+    def __rtruediv__(self, other: Any) -> "Expr":
+        return _true_divide(other, self)
+
+    def __neg__(self) -> "Expr":
+        return _CallExpr("negate", [self])
+
+    def __eq__(self, other: Any) -> "Expr":
+        return _CallExpr("equal", [self, other])
+
+    def __ne__(self, other: Any) -> "Expr":
+        return _CallExpr("not_equal", [self, other])
+
+    def __lt__(self, other: Any) -> "Expr":
+        return _CallExpr("less", [self, other])
+
+    def __le__(self, other: Any) -> "Expr":
+        return _CallExpr("less_equal", [self, other])
+
+    def __gt__(self, other: Any) -> "Expr":
+        return _CallExpr("greater", [self, other])
+
+    def __ge__(self, other: Any) -> "Expr":
+        return _CallExpr("greater_equal", [self, other])
+
+    def __and__(self, other: Any) -> "Expr":
+        return _CallExpr("and_kleene", [self, other])
+
+    def __rand__(self, other: Any) -> "Expr":
+        return _CallExpr("and_kleene", [other, self])
+
+    def __or__(self, other: Any) -> "Expr":
+        return _CallExpr("or_kleene", [self, other])
+
+    def __ror__(self, other: Any) -> "Expr":
+        return _CallExpr("or_kleene", [other, self])
+
+    def __invert__(self) -> "Expr":
+        return _CallExpr("invert", [self])
+
+    # Expressions override __eq__, so they can't be hashed.
+    __hash__ = None
+
+    def __bool__(self):
+        raise TypeError(
+            "The truth value of an expression is ambiguous. Use `&`, `|` and `~` "
+            "instead of `and`, `or` and `not` to combine expressions."
+        )
+
+    def cast(self, target_type: "pyarrow.DataType") -> "Expr":
+        """Cast the values to the given Arrow type."""
+        return _CallExpr("cast", [self], "CastOptions", target_type=target_type)
+
+    def is_null(self) -> "Expr":
+        """Return whether the values are null."""
+        return _CallExpr("is_null", [self])
+
+    def fill_null(self, value: Any) -> "Expr":
+        """Replace the null values with the given value."""
+        return _CallExpr("coalesce", [self, value])
+
+    def is_in(self, values: List[Any]) -> "Expr":
+        """Return whether the values are in the given list."""
+        import pyarrow as pa
+
+        return _CallExpr(
+            "is_in", [self], "SetLookupOptions", value_set=pa.array(values)
+        )
+
+    @property
+    def str(self) -> "_StringMethods":
+        """Methods for string values, named after their pandas equivalents."""
+        return _StringMethods(self)
+
+    def to_pyarrow(self) -> "pyarrow.compute.Expression":
+        """Convert this expression to an equivalent ``pyarrow.compute.Expression``."""
+        raise NotImplementedError
+
+
+class _ColumnExpr(Expr):
+    def __init__(self, name: str):
+        self.name = name
+
+    def to_pyarrow(self) -> "pyarrow.compute.Expression":
+        import pyarrow.compute as pc
+
+        return pc.field(self.name)
+
+    def __repr__(self) -> str:
+        return f"col({self.name!r})"
+
+
+class _LiteralExpr(Expr):
+    def __init__(self, value: Any):
+        self.value = value
+
+    def to_pyarrow(self) -> "pyarrow.compute.Expression":
+        import pyarrow.compute as pc
+
+        return pc.scalar(self.value)
+
+    def __repr__(self) -> str:
+        return f"lit({self.value!r})"
+
+
+class _CallExpr(Expr):
+    """A call of a ``pyarrow.compute`` function on the values of other expressions."""
+
+    def __init__(
+        self,
+        function: str,
+        args: List[Any],
+        options_type: Optional[str] = None,
+        **options,
+    ):
+        self.function = function
+        self.args = [_to_expr(arg) for arg in args]
+        # Function options can't be pickled, so they're kept as the name of their
+        # `pyarrow.compute` class and its arguments instead.
+        self.options_type = options_type
+        self.options = options
+
+    def function_options(self) -> Optional["pyarrow.compute.FunctionOptions"]:
+        import pyarrow.compute as pc
+
+        if self.options_type is None:
+            return None
+        return getattr(pc, self.options_type)(**self.options)
+
+    def to_pyarrow(self) -> "pyarrow.compute.Expression":
+        import pyarrow.compute as pc
+
+        return pc.Expression._call(
+            self.function,
+            [arg.to_pyarrow() for arg in self.args],
+            self.function_options(),
+        )
+
+    def __repr__(self) -> str:
+        args = ", ".join(repr(arg) for arg in self.args)
+        return f"{self.function}({args})"
+
+
+class _StringMethods:
+    """String methods of expressions (see `Expr.str`)."""
+
+    def __init__(self, expr: Expr):
+        self._expr = expr
+
+    def len(self) -> Expr:
+        """Return the number of characters of the strings."""
+        return _CallExpr("utf8_length", [self._expr])
+
+    def lower(self) -> Expr:
+        return _CallExpr("utf8_lower", [self._expr])
+
+    def upper(self) -> Expr:
+        return _CallExpr("utf8_upper", [self._expr])
+
+    def strip(self) -> Expr:
+        """Remove the leading and trailing whitespace of the strings."""
+        return _CallExpr("utf8_trim_whitespace", [self._expr])
+
+    def startswith(self, prefix: str) -> Expr:
+        return _CallExpr(
+            "starts_with", [self._expr], "MatchSubstringOptions", pattern=prefix
+        )
+
+    def endswith(self, suffix: str) -> Expr:
+        return _CallExpr(
+            "ends_with", [self._expr], "MatchSubstringOptions", pattern=suffix
+        )
+
+    def contains(self, pattern: str) -> Expr:
+        """Return whether the strings contain the given substring."""
+        return _CallExpr(
+            "match_substring", [self._expr], "MatchSubstringOptions", pattern=pattern
+        )
+
+    def replace(self, pattern: str, replacement: str) -> Expr:
+        """Replace the occurrences of the given substring."""
+        return _CallExpr(
+            "replace_substring",
+            [self._expr],
+            "ReplaceSubstringOptions",
+            pattern=pattern,
+            replacement=replacement,
+        )
+
+
+@PublicAPI(stability="alpha")
+def col(name: str) -> Expr:
+    """Return an expression referring to the column with the given name."""
+    return _ColumnExpr(name)
+
+
+@PublicAPI(stability="alpha")
+def lit(value: Any) -> Expr:
+    """Return an expression for the given constant value."""
+    return _LiteralExpr(value)
+
+
+def _to_expr(value: Any) -> Expr:
+    return value if isinstance(value, Expr) else _LiteralExpr(value)
+
+
+def _true_divide(lhs: Any, rhs: Any) -> Expr:
+    # Arrow divides integers with truncation, so cast the operands to floats to get
+    # the same result as Python's `/`.
+    import pyarrow as pa
+
+    return _CallExpr(
+        "divide", [_to_expr(lhs).cast(pa.float64()), _to_expr(rhs).cast(pa.float64())]
+    )
@@ -2,14 +2,18 @@ from typing import List, Optional, Tuple, Union
 
 from ._internal.table_block import TableBlockAccessor
 from ray.data._internal import sort
+from ray.data._internal.arrow_block import ArrowBlockAccessor
+from ray.data._internal.block_list import BlockList
 from ray.data._internal.compute import ComputeStrategy
 from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
 from ray.data._internal.execution.interfaces import TaskContext
 from ray.data._internal.logical.interfaces import LogicalPlan
-from ray.data._internal.logical.operators.all_to_all_operator import Aggregate
+from ray.data._internal.logical.operators.all_to_all_operator import Aggregate, Sort
 from ray.data._internal.plan import AllToAllStage
 from ray.data._internal.push_based_shuffle import PushBasedShufflePlan
 from ray.data._internal.shuffle import ShuffleOp, SimpleShufflePlan
+from ray.data._internal.stage_impl import SortStage
+from ray.data._internal.util import unify_block_metadata_schema
 from ray.data.aggregate import (
     AggregateFn,
     Count,
@@ -42,6 +46,7 @@ class _GroupbyOp(ShuffleOp):
         boundaries: List[KeyType],
         key: str,
         aggs: Tuple[AggregateFn],
+        skew_aware: bool,
     ) -> List[Union[BlockMetadata, Block]]:
         """Partition the block and combine rows with the same key."""
         stats = BlockExecStats.builder()
@@ -51,11 +56,14 @@ class _GroupbyOp(ShuffleOp):
         if key is None:
             partitions = [block]
         else:
+            sort_key = [(key, "ascending")] if isinstance(key, str) else key
             partitions = BlockAccessor.for_block(block).sort_and_partition(
-                boundaries,
-                [(key, "ascending")] if isinstance(key, str) else key,
-                descending=False,
+                boundaries, sort_key, descending=False
             )
+            if skew_aware:
+                partitions = sort.split_heavy_keys(
+                    partitions, boundaries, sort_key, descending=False
+                )
         parts = [BlockAccessor.for_block(p).combine(key, aggs) for p in partitions]
         meta = BlockAccessor.for_block(block).get_metadata(
             input_files=None, exec_stats=stats.build()
@@ -66,12 +74,20 @@ class _GroupbyOp(ShuffleOp):
     def reduce(
         key: str,
         aggs: Tuple[AggregateFn],
+        skew_aware: bool,
         *mapper_outputs: List[Block],
         partial_reduce: bool = False,
     ) -> (Block, BlockMetadata):
-        """Aggregate sorted and partially combined blocks."""
+        """Aggregate sorted and partially combined blocks.
+
+        In skew-aware mode, the result is left partial, to be finalized by
+        `sort.merge_heavy_key_partitions`.
+        """
         return BlockAccessor.for_block(mapper_outputs[0]).aggregate_combined_blocks(
-            list(mapper_outputs), key, aggs, finalize=not partial_reduce
+            list(mapper_outputs),
+            key,
+            aggs,
+            finalize=not partial_reduce and not skew_aware,
         )
 
     @staticmethod
@@ -115,6 +131,49 @@ class PushBasedGroupbyOp(_GroupbyOp, PushBasedShufflePlan):
     pass
 
 
+class _HashGroupbyOp(ShuffleOp):
+    @staticmethod
+    def map(
+        idx: int,
+        block: Block,
+        output_num_blocks: int,
+        key: str,
+        aggs: Tuple[AggregateFn],
+    ) -> List[Union[BlockMetadata, Block]]:
+        """Combine rows with the same key and partition them by key hash."""
+        stats = BlockExecStats.builder()
+
+        block = _GroupbyOp._prune_unused_columns(block, key, aggs)
+        combined = ArrowBlockAccessor(
+            BlockAccessor.for_block(block).to_arrow()
+        ).hash_combine(key, aggs)
+        parts = ArrowBlockAccessor(combined).hash_partition(key, output_num_blocks)
+        meta = BlockAccessor.for_block(block).get_metadata(
+            input_files=None, exec_stats=stats.build()
+        )
+        return parts + [meta]
+
+    @staticmethod
+    def reduce(
+        key: str,
+        aggs: Tuple[AggregateFn],
+        *mapper_outputs: List[Block],
+        partial_reduce: bool = False,
+    ) -> (Block, BlockMetadata):
+        """Aggregate partially combined blocks of the same hash partition."""
+        return ArrowBlockAccessor.aggregate_hash_combined_blocks(
+            list(mapper_outputs), key, aggs, finalize=not partial_reduce
+        )
+
+
+class SimpleShuffleHashGroupbyOp(_HashGroupbyOp, SimpleShufflePlan):
+    pass
+
+
+class PushBasedHashGroupbyOp(_HashGroupbyOp, PushBasedShufflePlan):
+    pass
+
+
 @PublicAPI
 class GroupedData:
     """Represents a grouped dataset created by calling ``Dataset.groupby()``.
@@ -139,6 +198,15 @@ class GroupedData:
     def aggregate(self, *aggs: AggregateFn) -> Dataset:
         """Implements an accumulator-based aggregation.
 
+        If ``DataContext.skew_aware_groupby_enabled`` is set, the rows of a key
+        that makes up a large share of the dataset are spread across several
+        reducers, and their partial aggregates are merged in a final stage.
+
+        If ``DataContext.use_hash_based_aggregate`` is set and all aggregations
+        are counts, sums, mins, maxes or means of numeric columns, the rows are
+        partitioned by the hash of their key rather than sorted, and the output
+        isn't sorted by key.
+
         Args:
             aggs: Aggregations to do.
 
@@ -162,6 +230,29 @@ class GroupedData:
 
             num_mappers = blocks.initial_num_blocks()
             num_reducers = num_mappers
+            ctx = DataContext.get_current()
+            if (
+                self._key is not None
+                and ctx.use_hash_based_aggregate
+                and ArrowBlockAccessor.supports_hash_aggregate(
+                    self._key, aggs, unify_block_metadata_schema(blocks.get_metadata())
+                )
+            ):
+                # Hash partitioning needs no boundaries, so skip the sampling.
+                if ctx.use_push_based_shuffle:
+                    shuffle_op_cls = PushBasedHashGroupbyOp
+                else:
+                    shuffle_op_cls = SimpleShuffleHashGroupbyOp
+                shuffle_op = shuffle_op_cls(
+                    map_args=[self._key, aggs], reduce_args=[self._key, aggs]
+                )
+                return shuffle_op.execute(
+                    blocks,
+                    num_reducers,
+                    clear_input_blocks,
+                    ctx=task_ctx,
+                )
+
             if self._key is None:
                 num_reducers = 1
                 boundaries = []
@@ -174,20 +265,41 @@ class GroupedData:
                     num_reducers,
                     task_ctx,
                 )
-            ctx = DataContext.get_current()
+            runs = []
+            if ctx.skew_aware_groupby_enabled and isinstance(self._key, str):
+                runs = sort.heavy_key_runs(boundaries, descending=False)
+            skew_aware = len(runs) > 0
             if ctx.use_push_based_shuffle:
                 shuffle_op_cls = PushBasedGroupbyOp
             else:
                 shuffle_op_cls = SimpleShuffleGroupbyOp
             shuffle_op = shuffle_op_cls(
-                map_args=[boundaries, self._key, aggs], reduce_args=[self._key, aggs]
+                map_args=[boundaries, self._key, aggs, skew_aware],
+                reduce_args=[self._key, aggs, skew_aware],
             )
-            return shuffle_op.execute(
+            blocks, stage_info = shuffle_op.execute(
                 blocks,
                 num_reducers,
                 clear_input_blocks,
                 ctx=task_ctx,
             )
+            if not skew_aware:
+                return blocks, stage_info
+
+            # The rows of the heavy keys were spread across several reducers, so
+            # merge their partial aggregates in a final stage.
+            new_blocks, new_metadata = sort.merge_heavy_key_partitions(
+                blocks.get_blocks(), runs, self._key, aggs
+            )
+            stage_info["aggregate_merge"] = new_metadata
+            return (
+                BlockList(
+                    new_blocks,
+                    new_metadata,
+                    owned_by_consumer=blocks._owned_by_consumer,
+                ),
+                stage_info,
+            )
 
         plan = self._dataset._plan.with_stage(
             AllToAllStage(
@@ -239,13 +351,15 @@ class GroupedData:
         *,
         compute: Union[str, ComputeStrategy] = None,
         batch_format: Optional[str] = "default",
+        batch_size: Optional[int] = None,
         **ray_remote_args,
     ) -> "Dataset":
         """Apply the given function to each group of records of this dataset.
 
         While map_groups() is very flexible, note that it comes with downsides:
             * It may be slower than using more specific methods such as min(), max().
-            * It requires that each group fits in memory on a single node.
+            * It requires that each group fits in memory on a single node, unless
+              ``batch_size`` is set.
 
         In general, prefer to use aggregate() instead of map_groups().
 
@@ -290,6 +404,12 @@ class GroupedData:
                 select ``pyarrow.Table``, or ``"numpy"`` to select
                 ``Dict[str, numpy.ndarray]``, or None to return the underlying block
                 exactly as is with no additional formatting.
+            batch_size: If set, the records of each group are passed to ``fn`` in
+                chunks of at most this many records, rather than all at once, so
+                ``fn`` must be able to process a group in parts. If
+                ``DataContext.skew_aware_groupby_enabled`` is also set, the records
+                of a large group may be spread across several blocks, so that no
+                single task has to hold the whole group.
             ray_remote_args: Additional resource requirements to request from
                 ray (e.g., num_gpus=1 to request GPUs for the map tasks).
 
@@ -297,10 +417,19 @@ class GroupedData:
             The return type is determined by the return type of ``fn``, and the return
             value is combined from results of all groups.
         """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be a positive integer or None.")
+
         # Globally sort records by key.
         # Note that sort() will ensure that records of the same key partitioned
-        # into the same block.
-        if self._key is not None:
+        # into the same block, unless it is skew-aware.
+        skew_aware = (
+            batch_size is not None
+            and DataContext.get_current().skew_aware_groupby_enabled
+        )
+        if self._key is not None and skew_aware:
+            sorted_ds = self._skew_aware_sort()
+        elif self._key is not None:
             sorted_ds = self._dataset.sort(self._key)
         else:
             sorted_ds = self._dataset.repartition(1)
@@ -331,14 +460,17 @@ class GroupedData:
             builder = DelegatingBlockBuilder()
             start = 0
             for end in boundaries:
-                group_block = block_accessor.slice(start, end)
-                group_block_accessor = BlockAccessor.for_block(group_block)
-                # Convert block of each group to batch format here, because the
-                # block format here can be different from batch format
-                # (e.g. block is Arrow format, and batch is NumPy format).
-                group_batch = group_block_accessor.to_batch_format(batch_format)
-                applied = fn(group_batch)
-                builder.add_batch(applied)
+                step = batch_size or end - start
+                for chunk_start in range(start, end, step):
+                    chunk_end = min(chunk_start + step, end)
+                    group_block = block_accessor.slice(chunk_start, chunk_end)
+                    group_block_accessor = BlockAccessor.for_block(group_block)
+                    # Convert block of each group to batch format here, because the
+                    # block format here can be different from batch format
+                    # (e.g. block is Arrow format, and batch is NumPy format).
+                    group_batch = group_block_accessor.to_batch_format(batch_format)
+                    applied = fn(group_batch)
+                    builder.add_batch(applied)
                 start = end
             rs = builder.build()
             return rs
@@ -353,6 +485,28 @@ class GroupedData:
             **ray_remote_args,
         )
 
+    def _skew_aware_sort(self) -> Dataset:
+        """Sort the dataset by key, spreading heavy keys across several blocks."""
+        plan = self._dataset._plan.with_stage(
+            SortStage(self._dataset, self._key, descending=False, skew_aware=True)
+        )
+
+        logical_plan = self._dataset._logical_plan
+        if logical_plan is not None:
+            op = Sort(
+                logical_plan.dag,
+                key=self._key,
+                descending=False,
+                skew_aware=True,
+            )
+            logical_plan = LogicalPlan(op)
+        return Dataset(
+            plan,
+            self._dataset._epoch,
+            self._dataset._lazy,
+            logical_plan,
+        )
+
     def count(self) -> Dataset:
         """Compute count aggregation.
 
@@ -244,6 +244,7 @@ class DataIterator(abc.ABC):
         drop_last: bool = False,
         local_shuffle_buffer_size: Optional[int] = None,
         local_shuffle_seed: Optional[int] = None,
+        pin_memory: bool = False,
         # Deprecated.
         prefetch_blocks: int = 0,
     ) -> Iterator["TorchTensorBatchType"]:
@@ -295,12 +296,18 @@ class DataIterator(abc.ABC):
                 therefore ``batch_size`` must also be specified when using local
                 shuffling.
             local_shuffle_seed: The seed to use for the local random shuffle.
+            pin_memory: Whether to stage the tensors in pinned memory before copying
+                them to ``device``, which makes the copy asynchronous. This is ignored
+                if CUDA is not available or if ``collate_fn`` is given.
 
         Returns:
             An iterator over Torch Tensor batches.
         """
 
+        import pyarrow
+
         from ray.air._internal.torch_utils import (
+            convert_arrow_batch_to_torch_tensor_batch,
             convert_ndarray_batch_to_torch_tensor_batch,
             get_device,
         )
@@ -320,16 +327,30 @@ class DataIterator(abc.ABC):
                 if default_device.type != "cpu":
                     device = default_device
 
-            def collate_fn(batch: Union[np.ndarray, Dict[str, np.ndarray]]):
+            # Convert the unformatted batches, so that Arrow batches can be converted
+            # to tensors directly from their buffers.
+            batch_format = None
+
+            def collate_fn(batch: Block):
+                if isinstance(batch, pyarrow.Table):
+                    return convert_arrow_batch_to_torch_tensor_batch(
+                        batch, dtypes=dtypes, device=device, pin_memory=pin_memory
+                    )
                 return convert_ndarray_batch_to_torch_tensor_batch(
-                    batch, dtypes=dtypes, device=device
+                    BlockAccessor.for_block(batch).to_numpy(),
+                    dtypes=dtypes,
+                    device=device,
+                    pin_memory=pin_memory,
                 )
 
+        else:
+            batch_format = "numpy"
+
         yield from self.iter_batches(
             prefetch_batches=prefetch_batches,
             prefetch_blocks=prefetch_blocks,
             batch_size=batch_size,
-            batch_format="numpy",
+            batch_format=batch_format,
             drop_last=drop_last,
             local_shuffle_buffer_size=local_shuffle_buffer_size,
             local_shuffle_seed=local_shuffle_seed,
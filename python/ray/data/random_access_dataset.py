@@ -3,11 +3,12 @@ import logging
 import random
 import time
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 
 import ray
+from ray.data._internal.arrow_ops import transform_pyarrow
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data.block import BlockAccessor
 from ray.data.context import DEFAULT_SCHEDULING_STRATEGY, DataContext
@@ -20,6 +21,8 @@ except ImportError:
     pa = None
 
 if TYPE_CHECKING:
+    import pyarrow
+
     from ray.data import Dataset
 
 logger = logging.getLogger(__name__)
@@ -64,6 +67,7 @@ class RandomAccessDataset:
                 if self._lower_bound is None:
                     self._lower_bound = b[0]
                 self._upper_bounds.append(b[1])
+        self._schema = schema
 
         logger.info("[setup] Creating {} random access workers.".format(num_workers))
         ctx = DataContext.get_current()
@@ -145,33 +149,68 @@ class RandomAccessDataset:
             return ray.put(None)
         return self._worker_for(block_index).get.remote(block_index, key)
 
-    def multiget(self, keys: List[Any]) -> List[Optional[Any]]:
+    def multiget(
+        self, keys: List[Any], batch_format: Optional[str] = None
+    ) -> Union[List[Optional[Any]], "pyarrow.Table"]:
         """Synchronously find the records for a list of keys.
 
+        The keys are grouped by the worker that holds their blocks, so that each
+        worker is sent a single request, and looks up all of its keys at once.
+
         Args:
             keys: List of keys to find the records for.
+            batch_format: If ``"pyarrow"``, return the records as a
+                ``pyarrow.Table`` with a row for each key, in the order of the keys.
+                The rows of missing keys are null, including their key column. If
+                None, return a list of records.
 
         Returns:
-            List of found records (in pydict form), or None for missing records.
+            List of found records (in pydict form), or None for missing records, or
+            a ``pyarrow.Table`` if ``batch_format="pyarrow"``.
         """
-        batches = defaultdict(list)
-        for k in keys:
-            batches[self._find_le(k)].append(k)
-        futures = {}
-        for index, keybatch in batches.items():
-            if index is None:
-                continue
-            fut = self._worker_for(index).multiget.remote(
-                [index] * len(keybatch), keybatch
+        if batch_format not in (None, "pyarrow"):
+            raise ValueError(
+                f"batch_format must be None or 'pyarrow', got {batch_format!r}."
+            )
+        block_indices = self._find_le_batch(keys)
+        keys = np.asarray(keys)
+        if batch_format == "pyarrow":
+            if len(keys) == 0 or not self._non_empty_blocks:
+                return pa.table(
+                    [pa.nulls(len(keys), field.type) for field in self._arrow_schema()],
+                    schema=self._arrow_schema(),
+                )
+            # Keys that are out of the range of all blocks aren't in the first block
+            # either, so looking them up there gives them null rows.
+            block_indices[block_indices < 0] = 0
+
+        futures, positions = [], []
+        worker_to_block_indices = defaultdict(list)
+        for block_index in np.unique(block_indices[block_indices >= 0]):
+            worker = self._worker_for(block_index)
+            worker_to_block_indices[worker].append(block_index)
+        for worker, worker_block_indices in worker_to_block_indices.items():
+            worker_positions = np.flatnonzero(
+                np.isin(block_indices, worker_block_indices)
+            )
+            if batch_format is None:
+                method = worker.multiget
+            else:
+                method = worker.multiget_arrow
+            futures.append(
+                method.remote(block_indices[worker_positions], keys[worker_positions])
             )
-            futures[index] = fut
-        results = {}
-        for i, fut in futures.items():
-            keybatch = batches[i]
-            values = ray.get(fut)
-            for k, v in zip(keybatch, values):
-                results[k] = v
-        return [results.get(k) for k in keys]
+            positions.append(worker_positions)
+        results = ray.get(futures)
+
+        if batch_format is None:
+            records = [None] * len(keys)
+            for worker_positions, worker_records in zip(positions, results):
+                for position, record in zip(worker_positions, worker_records):
+                    records[position] = record
+            return records
+        table = transform_pyarrow.concat(results)
+        return table.take(np.argsort(np.concatenate(positions), kind="stable"))
 
     def stats(self) -> str:
         """Returns a string containing access timing information."""
@@ -193,6 +232,12 @@ class RandomAccessDataset:
         )
         return msg
 
+    def _arrow_schema(self) -> "pyarrow.Schema":
+        if isinstance(self._schema.base_schema, pa.Schema):
+            return self._schema.base_schema
+        # The types of pandas blocks aren't known in Arrow until they're converted.
+        return pa.schema([(name, pa.null()) for name in self._schema.names])
+
     def _worker_for(self, block_index: int):
         return random.choice(self._block_to_workers_map[block_index])
 
@@ -202,17 +247,35 @@ class RandomAccessDataset:
             return None
         return i
 
+    def _find_le_batch(self, keys: List[Any]) -> np.ndarray:
+        """Vectorized version of _find_le(), which returns -1 instead of None."""
+        if not self._upper_bounds:
+            return np.full(len(keys), -1)
+        keys = np.asarray(keys)
+        indices = np.searchsorted(np.asarray(self._upper_bounds), keys)
+        indices[(indices >= len(self._upper_bounds)) | (keys < self._lower_bound)] = -1
+        return indices
+
 
 @ray.remote(num_cpus=0)
 class _RandomAccessWorker:
     def __init__(self, key_field):
         self.blocks = None
+        self.key_columns = None
         self.key_field = key_field
         self.num_accesses = 0
         self.total_time = 0
 
     def assign_blocks(self, block_ref_dict):
-        self.blocks = {k: ray.get(ref) for k, ref in block_ref_dict.items()}
+        self.blocks = {
+            k: BlockAccessor.for_block(ray.get(ref)).to_arrow()
+            for k, ref in block_ref_dict.items()
+        }
+        # The blocks are sorted by the key, so the key columns are the indexes of the
+        # blocks, which are searched with np.searchsorted().
+        self.key_columns = {
+            k: block[self.key_field].to_numpy() for k, block in self.blocks.items()
+        }
 
     def get(self, block_index, key):
         start = time.perf_counter()
@@ -223,20 +286,25 @@ class _RandomAccessWorker:
 
     def multiget(self, block_indices, keys):
         start = time.perf_counter()
-        block = self.blocks[block_indices[0]]
-        if len(set(block_indices)) == 1 and isinstance(
-            self.blocks[block_indices[0]], pa.Table
-        ):
-            # Fast path: use np.searchsorted for vectorized search on a single block.
-            # This is ~3x faster than the naive case.
-            block = self.blocks[block_indices[0]]
-            col = block[self.key_field]
-            indices = np.searchsorted(col, keys)
-            acc = BlockAccessor.for_block(block)
-            result = [acc._get_row(i) for i in indices]
-            # assert result == [self._get(i, k) for i, k in zip(block_indices, keys)]
-        else:
-            result = [self._get(i, k) for i, k in zip(block_indices, keys)]
+        result = [None] * len(keys)
+        for block_index, positions, rows in self._find_rows(block_indices, keys):
+            found = rows >= 0
+            records = self._to_records(self.blocks[block_index].take(rows[found]))
+            for position, record in zip(positions[found], records):
+                result[position] = record
+        self.total_time += time.perf_counter() - start
+        self.num_accesses += 1
+        return result
+
+    def multiget_arrow(self, block_indices, keys) -> "pyarrow.Table":
+        start = time.perf_counter()
+        tables, all_positions = [], []
+        for block_index, positions, rows in self._find_rows(block_indices, keys):
+            # Taking a null index gives a null row.
+            tables.append(self.blocks[block_index].take(pa.array(rows, mask=rows < 0)))
+            all_positions.append(positions)
+        table = transform_pyarrow.concat(tables)
+        result = table.take(np.argsort(np.concatenate(all_positions), kind="stable"))
         self.total_time += time.perf_counter() - start
         self.num_accesses += 1
         return result
@@ -254,33 +322,42 @@ class _RandomAccessWorker:
     def _get(self, block_index, key):
         if block_index is None:
             return None
-        block = self.blocks[block_index]
-        column = block[self.key_field]
-        if isinstance(block, pa.Table):
-            column = _ArrowListWrapper(column)
-        i = _binary_search_find(column, key)
-        if i is None:
+        (row,) = self._find(block_index, np.asarray([key]))
+        if row < 0:
             return None
-        acc = BlockAccessor.for_block(block)
-        return acc._get_row(i)
-
-
-def _binary_search_find(column, x):
-    i = bisect.bisect_left(column, x)
-    if i != len(column) and column[i] == x:
-        return i
-    return None
-
-
-class _ArrowListWrapper:
-    def __init__(self, arrow_col):
-        self.arrow_col = arrow_col
-
-    def __getitem__(self, i):
-        return self.arrow_col[i].as_py()
-
-    def __len__(self):
-        return len(self.arrow_col)
+        acc = BlockAccessor.for_block(self.blocks[block_index])
+        return acc._get_row(row)
+
+    def _find(self, block_index: int, keys: np.ndarray) -> np.ndarray:
+        """Return the row of each key in the block, or -1 if it's missing."""
+        column = self.key_columns[block_index]
+        rows = np.searchsorted(column, keys)
+        found = rows < len(column)
+        found[found] = column[rows[found]] == keys[found]
+        rows[~found] = -1
+        return rows
+
+    def _find_rows(
+        self, block_indices: np.ndarray, keys: np.ndarray
+    ) -> Iterator[Tuple[int, np.ndarray, np.ndarray]]:
+        """Look up the keys in their blocks, one block at a time.
+
+        Yields:
+            The index of each block, the positions of its keys in ``keys``, and the
+            rows of these keys in the block (or -1 if missing).
+        """
+        block_indices = np.asarray(block_indices)
+        keys = np.asarray(keys)
+        for block_index in np.unique(block_indices):
+            positions = np.flatnonzero(block_indices == block_index)
+            yield block_index, positions, self._find(block_index, keys[positions])
+
+    def _to_records(self, table: "pyarrow.Table") -> List[Any]:
+        if any(isinstance(field.type, pa.ExtensionType) for field in table.schema):
+            # Tensor columns need to be converted to ndarrays.
+            acc = BlockAccessor.for_block(table)
+            return [acc._get_row(i) for i in range(table.num_rows)]
+        return table.to_pylist()
 
 
 def _get_bounds(block, key):
@@ -20,6 +20,7 @@ from ray.air.util.tensor_extensions.utils import _create_possibly_ragged_ndarray
 from ray.data._internal.arrow_block import ArrowBlockBuilder
 from ray.data._internal.block_list import BlockList
 from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
+from ray.data._internal.execution.interfaces import RefBundle
 from ray.data._internal.lazy_block_list import LazyBlockList
 from ray.data._internal.logical.operators.from_arrow_operator import (
     FromArrowRefs,
@@ -33,8 +34,10 @@ from ray.data._internal.logical.operators.from_pandas_operator import (
     FromModin,
     FromPandasRefs,
 )
+from ray.data._internal.logical.operators.input_data_operator import InputData
 from ray.data._internal.logical.operators.read_operator import Read
 from ray.data._internal.logical.optimizers import LogicalPlan
+from ray.data._internal.mmap_block import get_mmap_blocks_dir, put_mmap_blocks
 from ray.data._internal.plan import ExecutionPlan
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data._internal.stats import DatasetStats
@@ -625,6 +628,7 @@ def read_images(
     mode: Optional[str] = None,
     include_paths: bool = False,
     ignore_missing_paths: bool = False,
+    jpeg_draft_decode: bool = False,
 ) -> Dataset:
     """Read images from the specified paths.
 
@@ -691,6 +695,10 @@ def read_images(
             stored in the ``'path'`` column.
         ignore_missing_paths: If True, ignores any file/directory paths in ``paths``
             that are not found. Defaults to False.
+        jpeg_draft_decode: If ``True`` and ``size`` is specified, JPEG images are
+            scaled down by a power of two while they're decoded, to no less than
+            ``size``, before they're resized. This makes decoding large images much
+            faster, but the result can differ slightly from resizing the full image.
 
     Returns:
         A :class:`~ray.data.Dataset` producing tensors that represent the images at
@@ -715,6 +723,7 @@ def read_images(
         mode=mode,
         include_paths=include_paths,
         ignore_missing_paths=ignore_missing_paths,
+        jpeg_draft_decode=jpeg_draft_decode,
     )
 
 
@@ -829,6 +838,7 @@ def read_json(
     ] = JSONDatasource.file_extension_filter(),
     partitioning: Partitioning = Partitioning("hive"),
     ignore_missing_paths: bool = False,
+    target_split_size_bytes: Optional[int] = None,
     **arrow_json_args,
 ) -> Dataset:
     """Create an Arrow dataset from json files.
@@ -875,6 +885,10 @@ def read_json(
             `Hive-style partitions <https://athena.guide/articles/hive-style-partitioning/>`_.
         ignore_missing_paths: If True, ignores any file paths in ``paths`` that are not
             found. Defaults to False.
+        target_split_size_bytes: Uncompressed files larger than this are split into
+            byte ranges of about this size, which are read in parallel. This
+            requires the records to be newline-delimited, without newlines within
+            records. Defaults to ``DataContext.target_split_size_bytes``.
 
     Returns:
         Dataset producing Arrow records read from the specified paths.
@@ -890,6 +904,7 @@ def read_json(
         partition_filter=partition_filter,
         partitioning=partitioning,
         ignore_missing_paths=ignore_missing_paths,
+        target_split_size_bytes=target_split_size_bytes,
         **arrow_json_args,
     )
 
@@ -906,6 +921,7 @@ def read_csv(
     partition_filter: Optional[PathPartitionFilter] = None,
     partitioning: Partitioning = Partitioning("hive"),
     ignore_missing_paths: bool = False,
+    target_split_size_bytes: Optional[int] = None,
     **arrow_csv_args,
 ) -> Dataset:
     r"""Create an Arrow dataset from csv files.
@@ -980,6 +996,10 @@ def read_csv(
         arrow_csv_args: Other csv read options to pass to pyarrow.
         ignore_missing_paths: If True, ignores any file paths in ``paths`` that are not
             found. Defaults to False.
+        target_split_size_bytes: Uncompressed files larger than this are split into
+            byte ranges of about this size, which are read in parallel. This
+            requires the records to be newline-delimited, without newlines within
+            records. Defaults to ``DataContext.target_split_size_bytes``.
 
     Returns:
         Dataset producing Arrow records read from the specified paths.
@@ -995,6 +1015,7 @@ def read_csv(
         partition_filter=partition_filter,
         partitioning=partitioning,
         ignore_missing_paths=ignore_missing_paths,
+        target_split_size_bytes=target_split_size_bytes,
         **arrow_csv_args,
     )
 
@@ -1541,6 +1562,11 @@ def from_pandas(
 ) -> MaterializedDataset:
     """Create a dataset from a list of Pandas dataframes.
 
+    If ``DataContext.mmap_blocks_dir`` is set on a single-node cluster, the
+    dataframes are stored as memory-mapped Arrow IPC files on local disk instead of
+    in the object store. They're still read as pandas dataframes, but unlike Arrow
+    tables, they're copied out of the files when read.
+
     Args:
         dfs: A Pandas dataframe or a list of Pandas dataframes.
 
@@ -1559,6 +1585,9 @@ def from_pandas(
     context = DataContext.get_current()
     if context.enable_tensor_extension_casting:
         dfs = [_cast_ndarray_columns_to_tensor_extension(df.copy()) for df in dfs]
+    mmap_dir = get_mmap_blocks_dir()
+    if mmap_dir is not None:
+        return _from_mmap_blocks(dfs, mmap_dir, "FromPandas")
     return from_pandas_refs([ray.put(df) for df in dfs])
 
 
@@ -1694,6 +1723,10 @@ def from_arrow(
 ) -> MaterializedDataset:
     """Create a dataset from a list of Arrow tables.
 
+    If ``DataContext.mmap_blocks_dir`` is set on a single-node cluster, the tables
+    are stored as memory-mapped Arrow IPC files on local disk instead of in the
+    object store.
+
     Args:
         tables: An Arrow table, or a list of Arrow tables,
                 or its streaming format in bytes.
@@ -1705,9 +1738,39 @@ def from_arrow(
 
     if isinstance(tables, (pa.Table, bytes)):
         tables = [tables]
+    mmap_dir = get_mmap_blocks_dir()
+    if mmap_dir is not None:
+        return _from_mmap_blocks(tables, mmap_dir, "FromArrow")
     return from_arrow_refs([ray.put(t) for t in tables])
 
 
+def _from_mmap_blocks(
+    blocks: List[Block], mmap_dir: str, stage_name: str
+) -> MaterializedDataset:
+    """Create a dataset from local blocks, stored as memory-mapped blocks."""
+    refs, metadata = put_mmap_blocks(blocks, mmap_dir)
+    # The logical plan takes the blocks with their metadata as is, since the metadata
+    # marks them as memory-mapped.
+    logical_plan = LogicalPlan(
+        InputData(
+            input_data=[
+                RefBundle([(ref, block_metadata)], owns_blocks=False)
+                for ref, block_metadata in zip(refs, metadata)
+            ]
+        )
+    )
+    return MaterializedDataset(
+        ExecutionPlan(
+            BlockList(refs, metadata, owned_by_consumer=False),
+            DatasetStats(stages={stage_name: metadata}, parent=None),
+            run_by_consumer=False,
+        ),
+        0,
+        True,
+        logical_plan,
+    )
+
+
 @DeveloperAPI
 def from_arrow_refs(
     tables: Union[
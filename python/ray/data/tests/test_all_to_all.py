@@ -2,6 +2,7 @@ import itertools
 import math
 import random
 import time
+from collections import defaultdict
 
 import numpy as np
 import pandas as pd
@@ -9,7 +10,19 @@ import pyarrow as pa
 import pytest
 
 import ray
-from ray.data.aggregate import AggregateFn, Count, Max, Mean, Min, Quantile, Std, Sum
+from ray.data.aggregate import (
+    AggregateFn,
+    ApproximateCountDistinct,
+    ApproximateQuantile,
+    Count,
+    Max,
+    Mean,
+    Min,
+    Quantile,
+    Std,
+    Sum,
+    TopK,
+)
 from ray.data.context import DataContext
 from ray.data.tests.conftest import *  # noqa
 from ray.data.tests.util import column_udf, named_values
@@ -1013,6 +1026,141 @@ def test_groupby_map_groups_with_different_types(ray_start_regular_shared):
     assert sorted([x["out"] for x in ds.take()]) == [1, 3]
 
 
+def test_groupby_skew_aware_aggregate(
+    ray_start_regular_shared, restore_data_context, use_push_based_shuffle
+):
+    DataContext.get_current().skew_aware_groupby_enabled = True
+    # Key 0 makes up 80% of the rows, so it spans several reducers.
+    xs = [0] * 800 + list(range(1, 201))
+    random.shuffle(xs)
+    ds = ray.data.from_items([{"A": x, "B": 1} for x in xs]).repartition(20)
+    agg_ds = ds.groupby("A").aggregate(Count(), Sum("B"))
+    assert agg_ds.count() == 201
+    assert list(agg_ds.sort("A").iter_rows()) == [
+        {"A": 0, "count()": 800, "sum(B)": 800}
+    ] + [{"A": x, "count()": 1, "sum(B)": 1} for x in range(1, 201)]
+
+
+@pytest.mark.parametrize("ds_format", ["arrow", "pandas"])
+def test_groupby_hash_aggregate(
+    ray_start_regular_shared, restore_data_context, ds_format, use_push_based_shuffle
+):
+    DataContext.get_current().use_hash_based_aggregate = True
+    xs = list(range(100))
+    random.shuffle(xs)
+    ds = ray.data.from_items(
+        [{"A": x % 3, "B": x, "C": None if x % 10 == 0 else float(x)} for x in xs]
+    ).repartition(10)
+    if ds_format == "pandas":
+        ds = ds.map_batches(lambda x: x, batch_size=None, batch_format="pandas")
+
+    agg_ds = ds.groupby("A").aggregate(
+        Count(), Sum("B"), Min("C"), Max("C"), Mean("C"), Sum("C", ignore_nulls=False)
+    )
+    assert agg_ds.count() == 3
+    expected = []
+    for a in range(3):
+        bs = [x for x in range(100) if x % 3 == a]
+        cs = [x for x in bs if x % 10 != 0]
+        expected.append(
+            {
+                "A": a,
+                "count()": len(bs),
+                "sum(B)": sum(bs),
+                "min(C)": min(cs),
+                "max(C)": max(cs),
+                "mean(C)": pytest.approx(sum(cs) / len(cs)),
+                "sum(C)": None,
+            }
+        )
+    assert sorted(agg_ds.take_all(), key=lambda r: r["A"]) == expected
+
+    # Aggregations that Arrow can't compute fall back to the sort-based path.
+    std_ds = ds.groupby("A").std("B")
+    assert [r["A"] for r in std_ds.take_all()] == [0, 1, 2]
+
+
+@pytest.mark.parametrize("num_parts", [1, 30])
+@pytest.mark.parametrize("ds_format", ["arrow", "pandas"])
+def test_approximate_aggregations(ray_start_regular_shared, ds_format, num_parts):
+    xs = list(range(3000))
+    random.shuffle(xs)
+    df = pd.DataFrame(
+        {
+            "A": [x % 3 for x in xs],
+            "B": [float(x) if x % 100 else None for x in xs],
+            "C": [f"v{int(math.sqrt(x))}" for x in xs],
+            "D": ["hot" if x % 5 == 0 else str(x) for x in xs],
+        }
+    )
+    ds = ray.data.from_pandas(df).repartition(num_parts)
+    if ds_format == "arrow":
+        ds = ds.map_batches(lambda x: x, batch_size=None, batch_format="pyarrow")
+    aggs = [
+        ApproximateQuantile("B", [0, 0.5, 1]),
+        ApproximateCountDistinct("C"),
+        TopK("C", 2),
+    ]
+
+    # Global aggregation.
+    result = ds.aggregate(*aggs)
+    # The ranks of the estimates are within 2% of the requested ones.
+    assert result["approx_quantile(B)"] == pytest.approx([1, 1500, 2999], abs=60)
+    # The sketch is exact for small cardinalities.
+    assert result["approx_count_distinct(C)"] == df["C"].nunique()
+    # The counts are exact if there are few distinct values.
+    assert result["top_k(C)"] == [
+        {"value": "v53", "count": 107},
+        {"value": "v52", "count": 105},
+    ]
+
+    # Grouped aggregation.
+    agg_ds = ds.groupby("A").aggregate(*aggs)
+    assert agg_ds.count() == 3
+    for row in agg_ds.take_all():
+        group = df[df["A"] == row["A"]]
+        quantiles = group["B"].quantile([0, 0.5, 1]).tolist()
+        assert row["approx_quantile(B)"] == pytest.approx(quantiles, abs=60)
+        assert row["approx_count_distinct(C)"] == group["C"].nunique()
+        top = group["C"].value_counts()
+        assert [r["count"] for r in row["top_k(C)"]] == top.iloc[:2].tolist()
+
+    # Counts are overestimated if there are more distinct values than the capacity,
+    # but the most frequent values are still found.
+    result = ds.aggregate(TopK("D", 1, capacity=10))
+    assert result["top_k(D)"][0]["value"] == "hot"
+    assert result["top_k(D)"][0]["count"] >= 600
+
+    with pytest.raises(ValueError):
+        ApproximateQuantile("B", [1.5])
+    with pytest.raises(ValueError):
+        ApproximateCountDistinct("C", precision=30)
+
+
+@pytest.mark.parametrize("skew_aware", [False, True])
+def test_groupby_map_groups_with_batch_size(
+    ray_start_regular_shared, restore_data_context, skew_aware
+):
+    DataContext.get_current().skew_aware_groupby_enabled = skew_aware
+    xs = [0] * 800 + list(range(1, 201))
+    random.shuffle(xs)
+    ds = ray.data.from_items([{"A": x} for x in xs]).repartition(20)
+
+    def fn(group):
+        assert len(np.unique(group["A"])) == 1
+        return {"A": group["A"][:1], "n": np.array([len(group["A"])])}
+
+    chunks = ds.groupby("A").map_groups(fn, batch_size=100).take_all()
+    assert all(chunk["n"] <= 100 for chunk in chunks)
+    counts = defaultdict(int)
+    for chunk in chunks:
+        counts[chunk["A"]] += chunk["n"]
+    assert counts == {0: 800, **{x: 1 for x in range(1, 201)}}
+
+    with pytest.raises(ValueError):
+        ds.groupby("A").map_groups(fn, batch_size=0)
+
+
 def test_random_block_order_schema(ray_start_regular_shared):
     df = pd.DataFrame({"a": np.random.rand(10), "b": np.random.rand(10)})
     ds = ray.data.from_pandas(df).randomize_block_order()
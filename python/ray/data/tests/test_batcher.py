@@ -6,10 +6,6 @@ import pytest
 from ray.data._internal.batcher import Batcher, ShufflingBatcher
 
 
-def gen_block(num_rows):
-    return pa.table({"foo": [1] * num_rows})
-
-
 def test_shuffling_batcher():
     batch_size = 5
     buffer_size = 20
@@ -26,21 +22,23 @@ def test_shuffling_batcher():
         batch_size=batch_size,
         shuffle_buffer_min_size=buffer_size,
     )
+    num_added = 0
+    yielded = []
 
     def add_and_check(num_rows, expect_has_batch=False, no_nexting_yet=True):
-        block = gen_block(num_rows)
+        nonlocal num_added
+        block = pa.table({"foo": list(range(num_added, num_added + num_rows))})
+        num_added += num_rows
         assert batcher.can_add(block)
         batcher.add(block)
         assert not expect_has_batch or batcher.has_batch()
 
         if no_nexting_yet:
-            # Check that no shuffle buffer has been materialized yet.
-            assert batcher._shuffle_buffer is None
-            assert batcher._shuffle_indices is None
-            assert batcher._batch_head == 0
+            # Check that no blocks have been indexed yet.
+            assert batcher._blocks == []
+            assert len(batcher._unyielded_indices) == 0
 
     def next_and_check(
-        current_cursor,
         should_batch_be_full=True,
         should_have_batch_after=True,
         new_data_added=False,
@@ -50,29 +48,20 @@ def test_shuffling_batcher():
         else:
             batcher.has_any()
         if new_data_added:
-            # If new data was added, the builder should be non-empty.
-            assert batcher._builder.num_rows() > 0
-        # Store the old shuffle indices for comparison in post.
-        old_shuffle_indices = batcher._shuffle_indices
-
+            # If new data was added, it should be pending.
+            assert batcher._num_pending_rows > 0
         batch = batcher.next_batch()
+        yielded.extend(batch["foo"].to_pylist())
 
         if should_batch_be_full:
             assert len(batch) == batch_size
 
-        # Check that shuffle buffer has been materialized and its state is as expected.
-        assert batcher._shuffle_buffer is not None
-        # Builder should always be empty after consuming a batch since the shuffle
-        # buffer should always be materialized.
-        assert batcher._builder.num_rows() == 0
-        assert len(
-            batcher._shuffle_indices
-        ) == batcher._buffer_size() + current_cursor + len(batch)
-        if new_data_added:
-            # If new data was added, confirm that the old shuffle indices were
-            # invalidated.
-            assert batcher._shuffle_indices != old_shuffle_indices
-        assert batcher._batch_head == current_cursor + len(batch)
+        # All pending blocks should have been indexed.
+        assert batcher._pending_blocks == []
+        assert batcher._num_pending_rows == 0
+        assert batcher._buffer_size() == num_added - len(yielded)
+        # Yielded rows are released once they outnumber the unyielded rows.
+        assert batcher._num_indexed_rows <= 2 * batcher._buffer_size()
 
         if should_have_batch_after:
             assert batcher.has_batch()
@@ -99,33 +88,61 @@ def test_shuffling_batcher():
     add_and_check(3, expect_has_batch=True)
 
     # Consume only available batch.
-    next_and_check(0, should_have_batch_after=False, new_data_added=True)
+    next_and_check(should_have_batch_after=False, new_data_added=True)
 
     # Add 4 batches-worth to the already-full buffer.
     add_and_check(20, no_nexting_yet=False)
 
     # Consume 4 batches from the buffer.
-    next_and_check(0, new_data_added=True)
-    next_and_check(batch_size)
-    next_and_check(2 * batch_size)
-    next_and_check(3 * batch_size, should_have_batch_after=False)
+    next_and_check(new_data_added=True)
+    next_and_check()
+    next_and_check()
+    next_and_check(should_have_batch_after=False)
 
     # Add a full batch + a partial batch to the buffer.
     add_and_check(8, no_nexting_yet=False)
-    next_and_check(0, should_have_batch_after=False, new_data_added=True)
+    next_and_check(should_have_batch_after=False, new_data_added=True)
 
     # Indicate to the batcher that we're done adding blocks.
     batcher.done_adding()
 
     # Consume 4 full batches and one partial batch.
-    next_and_check(batch_size)
-    next_and_check(2 * batch_size)
-    next_and_check(3 * batch_size)
+    next_and_check()
+    next_and_check()
+    next_and_check()
+    next_and_check(should_have_batch_after=False)
     next_and_check(
-        4 * batch_size,
         should_batch_be_full=False,
         should_have_batch_after=False,
     )
+    assert not batcher.has_any()
+
+    # Every added row should have been yielded exactly once.
+    assert sorted(yielded) == list(range(num_added))
+
+
+def test_shuffling_batcher_across_blocks():
+    def shuffle(seed):
+        batcher = ShufflingBatcher(
+            batch_size=10, shuffle_buffer_min_size=30, shuffle_seed=seed
+        )
+        batches = []
+        for i in range(0, 100, 4):
+            batcher.add(pa.table({"foo": list(range(i, i + 4))}))
+            while batcher.has_batch():
+                batches.append(batcher.next_batch()["foo"].to_pylist())
+        batcher.done_adding()
+        while batcher.has_any():
+            batches.append(batcher.next_batch()["foo"].to_pylist())
+        return batches
+
+    batches = shuffle(seed=42)
+    assert [len(batch) for batch in batches] == [10] * 10
+    # Batches mix rows from many source blocks, and all rows are yielded once.
+    assert any(len({row // 4 for row in batch}) > 1 for batch in batches)
+    assert sorted(sum(batches, [])) == list(range(100))
+    # The shuffle is deterministic for a given seed.
+    assert shuffle(seed=42) == batches
 
 
 def test_batching_pyarrow_table_with_many_chunks():
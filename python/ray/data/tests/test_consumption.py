@@ -205,6 +205,101 @@ def test_cache_dataset(ray_start_regular_shared):
     assert ray.get(c.inc.remote()) == 2
 
 
+def test_mmap_blocks(ray_start_regular_shared, tmp_path, restore_data_context):
+    DataContext.get_current().mmap_blocks_dir = str(tmp_path)
+
+    def check_mmapped(ds, block_type=pa.Table):
+        assert all(m.mmapped for m in ds._plan._snapshot_blocks.get_metadata())
+        for ref in ds.get_internal_block_refs():
+            assert isinstance(ray.get(ref), block_type)
+
+    ds = ray.data.from_arrow(pa.table({"id": list(range(100))}))
+    check_mmapped(ds)
+    assert len(os.listdir(tmp_path)) == 1
+    assert extract_values("id", ds.map_batches(lambda batch: batch).take_all()) == (
+        list(range(100))
+    )
+
+    # Pandas blocks are still pandas blocks when read.
+    ds = ray.data.from_pandas([pd.DataFrame({"id": [i]}) for i in range(4)])
+    check_mmapped(ds, pd.DataFrame)
+    assert sorted(extract_values("id", ds.take_all())) == list(range(4))
+
+    ds = ray.data.range(100, parallelism=4).map_batches(lambda batch: batch)
+    ds = ds.materialize()
+    check_mmapped(ds)
+    assert sorted(extract_values("id", ds.take_all())) == list(range(100))
+    # Memory-mapped blocks don't use object store memory.
+    for bundle in ds._logical_plan.dag.input_data:
+        assert bundle.object_store_bytes() == 0
+        assert bundle.size_bytes() > 0
+
+
+def test_cache_dataset_persistent(ray_start_regular_shared, tmp_path):
+    @ray.remote
+    class Counter:
+        def __init__(self):
+            self.i = 0
+
+        def inc(self):
+            self.i += 1
+            return self.i
+
+        def get(self):
+            return self.i
+
+    c = Counter.remote()
+
+    def inc(batch):
+        ray.get(c.inc.remote())
+        return batch
+
+    def build(offset):
+        ds = ray.data.range(100, parallelism=4)
+        ds = ds.map_batches(lambda batch: {"id": batch["id"] + offset})
+        return ds.map_batches(inc)
+
+    path = str(tmp_path)
+    ds = build(1).cache(path)
+    assert sorted(extract_values("id", ds.take_all())) == list(range(1, 101))
+    num_calls = ray.get(c.get.remote())
+    assert num_calls > 0
+
+    # The same plan is read back from the cache instead of recomputed.
+    ds = build(1).cache(path)
+    assert sorted(extract_values("id", ds.take_all())) == list(range(1, 101))
+    assert ray.get(c.get.remote()) == num_calls
+
+    # A plan whose functions capture different values is cached separately.
+    ds = build(2).cache(path)
+    assert sorted(extract_values("id", ds.take_all())) == list(range(2, 102))
+    assert ray.get(c.get.remote()) > num_calls
+    assert len(os.listdir(path)) == 2
+
+    # Plans that aren't deterministic or read in-memory data can't be cached.
+    with pytest.raises(ValueError, match="deterministic"):
+        ray.data.range(10).random_shuffle().cache(path)
+    ray.data.range(10).random_shuffle(seed=0).cache(path)
+    with pytest.raises(ValueError, match="in-memory data"):
+        ray.data.from_pandas(pd.DataFrame({"id": [1]})).cache(path)
+
+
+def test_cache_dataset_concurrent_writes(ray_start_regular_shared, tmp_path):
+    from ray.data._internal.materialization_cache import MaterializationCache
+
+    cache = MaterializationCache(str(tmp_path))
+    ds = ray.data.range(10, parallelism=2)
+    assert cache.get("entry") is None
+
+    # Every write of the entry has its own files, so the files of a write that's
+    # still being read aren't overwritten or deleted by a later write.
+    paths = cache.put("entry", ds)
+    other_paths = cache.put("entry", ds.map(lambda row: {"id": -row["id"]}))
+    assert set(paths).isdisjoint(other_paths)
+    assert all(os.path.exists(path) for path in paths + other_paths)
+    assert cache.get("entry") == other_paths
+
+
 def test_schema(ray_start_regular_shared):
     ds2 = ray.data.range(10, parallelism=10)
     ds3 = ds2.repartition(5)
@@ -913,6 +913,37 @@ def test_csv_invalid_file_handler(shutdown_only, tmp_path):
     )
 
 
+def test_csv_read_split_file(shutdown_only, tmp_path):
+    from pyarrow import csv
+
+    path = os.path.join(tmp_path, "test.csv")
+    df = pd.DataFrame({"one": range(1000), "two": [f"row{i}" for i in range(1000)]})
+    df.to_csv(path, index=False)
+
+    ds = ray.data.read_csv(path, parallelism=10, target_split_size_bytes=1000)
+    assert ds.num_blocks() == 10
+    assert ds.input_files() == [path]
+    assert ds.to_pandas().equals(df)
+
+    # The column names and types of every split are the same as the first one's.
+    ds = ray.data.read_csv(
+        path,
+        target_split_size_bytes=1000,
+        read_options=csv.ReadOptions(block_size=100),
+    )
+    assert ds.schema().types == [pa.int64(), pa.string()]
+    assert ds.to_pandas().equals(df)
+
+    # Records can't be found from an arbitrary offset if they may contain newlines.
+    ds = ray.data.read_csv(
+        path,
+        target_split_size_bytes=1000,
+        parse_options=csv.ParseOptions(newlines_in_values=True),
+    )
+    assert ds.num_blocks() == 1
+    assert ds.to_pandas().equals(df)
+
+
 if __name__ == "__main__":
     import sys
 
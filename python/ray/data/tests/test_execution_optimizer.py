@@ -1,13 +1,18 @@
 import itertools
+import os
 from typing import List, Optional
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as pds
+import pyarrow.parquet as pq
 import pytest
 
 import ray
 from ray.data._internal.execution.legacy_compat import _blocks_to_input_buffer
 from ray.data._internal.execution.operators.all_to_all_operator import AllToAllOperator
 from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
+from ray.data._internal.execution.operators.join_operator import JoinOperator
 from ray.data._internal.execution.operators.map_operator import MapOperator
 from ray.data._internal.execution.operators.zip_operator import ZipOperator
 from ray.data._internal.logical.interfaces import LogicalPlan
@@ -39,11 +44,13 @@ from ray.data._internal.logical.operators.map_operator import (
     FlatMap,
     MapBatches,
     MapRows,
+    Project,
+    WithColumn,
 )
-from ray.data._internal.logical.operators.n_ary_operator import Zip
+from ray.data._internal.logical.operators.n_ary_operator import Join, Zip
 from ray.data._internal.logical.operators.read_operator import Read
 from ray.data._internal.logical.operators.write_operator import Write
-from ray.data._internal.logical.optimizers import PhysicalOptimizer
+from ray.data._internal.logical.optimizers import LogicalOptimizer, PhysicalOptimizer
 from ray.data._internal.logical.util import (
     _op_name_white_list,
     _recorded_operators,
@@ -53,6 +60,7 @@ from ray.data._internal.planner.planner import Planner
 from ray.data._internal.stats import DatasetStats
 from ray.data.aggregate import Count
 from ray.data.datasource.parquet_datasource import ParquetDatasource
+from ray.data.expressions import col
 from ray.data.tests.conftest import *  # noqa
 from ray.data.tests.util import column_udf, extract_values, named_values
 from ray.tests.conftest import *  # noqa
@@ -221,6 +229,120 @@ def test_filter_e2e(ray_start_regular_shared, enable_optimizer):
     _check_usage_record(["ReadRange", "Filter"])
 
 
+def test_filter_expr_e2e(ray_start_regular_shared, enable_optimizer):
+    ds = ray.data.range(5)
+    ds = ds.filter(expr=pds.field("id") >= 2)
+    assert extract_values("id", ds.take_all()) == [2, 3, 4], ds
+    _check_usage_record(["ReadRange", "Filter"])
+
+
+def test_with_column_operator_fusion(ray_start_regular_shared, enable_optimizer):
+    planner = Planner()
+    read_op = Read(ParquetDatasource(), [])
+    op = WithColumn(read_op, "b", col("a") + 1)
+    op = Filter(op, filter_expr=col("b") > 1)
+    op = MapBatches(op, lambda x: x)
+    physical_plan = PhysicalOptimizer().optimize(planner.plan(LogicalPlan(op)))
+    physical_op = physical_plan.dag
+
+    assert physical_op.name == (
+        "ReadParquet->WithColumn(b)->Filter(greater(col('b'), lit(1)))->"
+        "MapBatches(<lambda>)"
+    )
+    assert isinstance(physical_op, MapOperator)
+    assert isinstance(physical_op.input_dependencies[0], InputDataBuffer)
+
+
+def test_with_column_e2e(ray_start_regular_shared, enable_optimizer):
+    ds = ray.data.range(5)
+    ds = ds.with_column("b", col("id") * 2).filter(expr=col("b") >= 4)
+    assert ds.take_all() == [{"id": 2, "b": 4}, {"id": 3, "b": 6}, {"id": 4, "b": 8}]
+    _check_usage_record(["ReadRange", "WithColumn", "Filter"])
+
+
+def _write_parquet_files(path, num_files=3, num_rows=100):
+    for i in range(num_files):
+        start = i * num_rows
+        table = pa.table(
+            {
+                "a": list(range(start, start + num_rows)),
+                "b": [str(x) for x in range(start, start + num_rows)],
+                "c": [float(x) for x in range(start, start + num_rows)],
+            }
+        )
+        pq.write_table(table, os.path.join(path, f"{i}.parquet"), row_group_size=10)
+
+
+def test_predicate_pushdown(ray_start_regular_shared, enable_optimizer, tmp_path):
+    _write_parquet_files(tmp_path)
+    ds = ray.data.read_parquet(str(tmp_path))
+    ds = ds.filter(expr=(pds.field("a") >= 95) & (pds.field("a") < 105))
+
+    dag = LogicalOptimizer().optimize(ds._logical_plan).dag
+    assert isinstance(dag, Read)
+    assert sorted(extract_values("a", ds.take_all())) == list(range(95, 105))
+    assert "Filter" not in ds.stats()
+
+    # Read tasks whose row groups can't match the filter are dropped.
+    ds = ray.data.read_parquet(str(tmp_path), parallelism=3)
+    ds = ds.filter(expr=(pds.field("a") >= 95) & (pds.field("a") < 105))
+    dag = LogicalOptimizer().optimize(ds._logical_plan).dag
+    assert len(dag._read_tasks) == 2
+    assert sorted(extract_values("a", ds.take_all())) == list(range(95, 105))
+    ds = ray.data.read_parquet(str(tmp_path), parallelism=3)
+    ds = ds.filter(expr=pds.field("a") > 1000)
+    dag = LogicalOptimizer().optimize(ds._logical_plan).dag
+    assert len(dag._read_tasks) == 1
+    assert ds.count() == 0
+
+    # Expressions are converted to Arrow expressions when pushed down.
+    ds = ray.data.read_parquet(str(tmp_path))
+    ds = ds.filter(expr=(col("a") >= 95) & (col("b").str.endswith("9")))
+    dag = LogicalOptimizer().optimize(ds._logical_plan).dag
+    assert isinstance(dag, Read)
+    assert sorted(extract_values("a", ds.take_all())) == list(range(99, 300, 10))
+
+    # Filters are pushed across column selections.
+    ds = ray.data.read_parquet(str(tmp_path), filter=pds.field("a") > 50)
+    ds = ds.select_columns(["a", "b"]).filter(expr=pds.field("a") < 55)
+    dag = LogicalOptimizer().optimize(ds._logical_plan).dag
+    assert isinstance(dag, Read)
+    assert sorted(extract_values("a", ds.take_all())) == list(range(51, 55))
+
+    # Filters with UDFs or with resource requirements are not pushed down.
+    ds = ray.data.read_parquet(str(tmp_path))
+    dag = LogicalOptimizer().optimize(ds.filter(lambda r: True)._logical_plan).dag
+    assert isinstance(dag, Filter)
+    ds = ds.filter(expr=pds.field("a") < 5, scheduling_strategy="SPREAD")
+    dag = LogicalOptimizer().optimize(ds._logical_plan).dag
+    assert isinstance(dag, Filter)
+    assert ds.count() == 5
+
+
+def test_projection_pushdown(ray_start_regular_shared, enable_optimizer, tmp_path):
+    _write_parquet_files(tmp_path)
+    ds = ray.data.read_parquet(str(tmp_path)).select_columns(["c", "a"])
+
+    dag = LogicalOptimizer().optimize(ds._logical_plan).dag
+    assert isinstance(dag, Read)
+    assert ds.schema().names == ["c", "a"]
+    assert sorted(extract_values("a", ds.take_all())) == list(range(300))
+    _check_usage_record(["ReadParquet", "MapBatches"])
+
+    # Missing columns are left to the projection, which raises the error.
+    ds = ray.data.read_parquet(str(tmp_path)).select_columns(["a", "d"])
+    dag = LogicalOptimizer().optimize(ds._logical_plan).dag
+    assert isinstance(dag, Project)
+    with pytest.raises(Exception):
+        ds.materialize()
+
+    # The input Read operator is not modified in place.
+    ds = ray.data.read_parquet(str(tmp_path))
+    assert ds.select_columns(["a"]).schema().names == ["a"]
+    assert ds.schema().names == ["a", "b", "c"]
+    assert ds.take(1) == [{"a": 0, "b": "0", "c": 0.0}]
+
+
 def test_flat_map(ray_start_regular_shared, enable_optimizer):
     planner = Planner()
     read_op = Read(ParquetDatasource(), [])
@@ -987,6 +1109,31 @@ def test_zip_e2e(ray_start_regular_shared, enable_optimizer, num_blocks1, num_bl
     _check_usage_record(["ReadRange", "Zip"])
 
 
+def test_join_operator(ray_start_regular_shared, enable_optimizer):
+    planner = Planner()
+    read_op1 = Read(ParquetDatasource(), [])
+    read_op2 = Read(ParquetDatasource(), [])
+    op = Join(read_op1, read_op2, keys=["id"], how="inner", right_suffix="_1")
+    plan = LogicalPlan(op)
+    physical_op = planner.plan(plan).dag
+
+    assert op.name == "Join"
+    assert isinstance(physical_op, JoinOperator)
+    assert len(physical_op.input_dependencies) == 2
+    assert isinstance(physical_op.input_dependencies[0], MapOperator)
+    assert isinstance(physical_op.input_dependencies[1], MapOperator)
+
+
+def test_join_e2e(ray_start_regular_shared, enable_optimizer):
+    ds1 = ray.data.range(10, parallelism=3)
+    ds2 = ray.data.range(10, parallelism=2).map(
+        lambda row: {"id": row["id"] * 2, "value": row["id"]}
+    )
+    ds = ds1.join(ds2, on="id")
+    assert sorted(extract_values("value", ds.take_all())) == list(range(5))
+    _check_usage_record(["ReadRange", "Join"])
+
+
 def test_from_dask_operator(ray_start_regular_shared, enable_optimizer):
     import dask.dataframe as dd
 
@@ -83,6 +83,19 @@ class TestReadImages:
         )
         assert all(record["image"].shape == (32, 32, 3) for record in ds.take())
 
+    def test_jpeg_draft_decode(self, ray_start_regular_shared):
+        ds = ray.data.read_images(
+            "example://image-datasets/simple",
+            size=(8, 8),
+            mode="L",
+            jpeg_draft_decode=True,
+            parallelism=1,
+        ).materialize()
+        # The images of a read task are decoded into one fixed-shape tensor column.
+        assert ds.num_blocks() == 1
+        assert ds.schema().types[0] == ArrowTensorType((8, 8), pa.uint8())
+        assert all(record["image"].shape == (8, 8) for record in ds.take())
+
     def test_different_sizes(self, ray_start_regular_shared):
         ds = ray.data.read_images("example://image-datasets/different-sizes")
         assert sorted(record["image"].shape for record in ds.take()) == [
@@ -249,6 +262,7 @@ class TestReadImages:
             "mode": "foo",
             "include_paths": True,
             "ignore_missing_paths": True,
+            "jpeg_draft_decode": True,
         }
         with patch("ray.data.read_api.read_datasource") as mock:
             ray.data.read_images(**kwargs)
@@ -0,0 +1,100 @@
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+import ray
+from ray.data._internal.arrow_ops import transform_pyarrow
+from ray.data.context import DataContext
+from ray.data.tests.conftest import *  # noqa
+from ray.tests.conftest import *  # noqa
+
+
+def _sorted_df(ds, columns):
+    df = ds.to_pandas()
+    return df[columns].sort_values(columns).reset_index(drop=True)
+
+
+def _expected_df(left, right, on, how, columns):
+    df = pd.merge(left, right, on=on, how=how, suffixes=("", "_1"))
+    return df[columns].sort_values(columns).reset_index(drop=True)
+
+
+def test_hash_partition():
+    table = pa.table({"a": [1, 2, 3, 1, 2, 3, None], "b": list("abcabca")})
+    partitions = transform_pyarrow.hash_partition(table, ["a", "b"], 4)
+    assert len(partitions) == 4
+    assert sum(p.num_rows for p in partitions) == table.num_rows
+    # Equal keys always land in the same partition.
+    for partition in partitions:
+        keys = set(zip(*partition.select(["a", "b"]).to_pydict().values()))
+        for other in partitions:
+            if other is not partition:
+                other_keys = zip(*other.select(["a", "b"]).to_pydict().values())
+                assert not keys.intersection(other_keys)
+    # Integer keys of different widths are partitioned the same way.
+    narrow = table.cast(pa.schema([("a", pa.int8()), ("b", pa.string())]))
+    for p1, p2 in zip(
+        partitions, transform_pyarrow.hash_partition(narrow, ["a", "b"], 4)
+    ):
+        assert p1.num_rows == p2.num_rows
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+@pytest.mark.parametrize("broadcast", [True, False])
+def test_join(ray_start_regular_shared, restore_data_context, how, broadcast):
+    DataContext.get_current().broadcast_join_threshold_bytes = (
+        100 * 1024 * 1024 if broadcast else 0
+    )
+    left = pd.DataFrame({"id": [i % 7 for i in range(30)], "x": list(range(30))})
+    right = pd.DataFrame({"id": list(range(3, 12)), "y": list(range(9))})
+    ds1 = ray.data.from_pandas(left).repartition(4)
+    ds2 = ray.data.from_pandas(right).repartition(3)
+
+    ds = ds1.join(ds2, on="id", how=how)
+    columns = ["id", "x", "y"]
+    assert ds.schema().names == columns
+    pd.testing.assert_frame_equal(
+        _sorted_df(ds, columns),
+        _expected_df(left, right, "id", how, columns),
+        check_dtype=False,
+    )
+
+
+def test_join_multiple_keys_and_suffix(ray_start_regular_shared):
+    left = pd.DataFrame(
+        {"a": [1, 1, 2, 2], "b": ["x", "y", "x", "y"], "v": [1, 2, 3, 4]}
+    )
+    right = pd.DataFrame({"a": [1, 2, 2], "b": ["y", "x", "z"], "v": [10, 20, 30]})
+    ds1 = ray.data.from_pandas(left)
+    ds2 = ray.data.from_pandas(right)
+
+    ds = ds1.join(ds2, on=["a", "b"], right_suffix="_right")
+    assert ds.schema().names == ["a", "b", "v", "v_right"]
+    assert sorted(ds.take_all(), key=lambda r: r["v"]) == [
+        {"a": 1, "b": "y", "v": 2, "v_right": 10},
+        {"a": 2, "b": "x", "v": 3, "v_right": 20},
+    ]
+
+
+def test_join_empty(ray_start_regular_shared):
+    ds1 = ray.data.range(10)
+    ds2 = ray.data.range(10).filter(lambda row: row["id"] > 100)
+    assert ds1.join(ds2, on="id").count() == 0
+    assert ds1.join(ds2, on="id", how="left").count() == 10
+    assert ds2.join(ds1, on="id", how="right").count() == 10
+
+
+def test_join_invalid_args(ray_start_regular_shared):
+    ds = ray.data.range(10)
+    with pytest.raises(ValueError):
+        ds.join(ds, on="id", how="cross")
+    with pytest.raises(ValueError):
+        ds.join(ds, on=[])
+    with pytest.raises(ValueError):
+        ds.join(ds, on="missing").materialize()
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", __file__]))
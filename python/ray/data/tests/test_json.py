@@ -604,6 +604,27 @@ def test_json_write_block_path_provider(
     assert df.equals(ds_df)
 
 
+def test_json_read_split_file(shutdown_only, tmp_path):
+    path = os.path.join(tmp_path, "test.json")
+    df = pd.DataFrame({"one": range(1000), "two": [f"row{i}" for i in range(1000)]})
+    df.to_json(path, orient="records", lines=True)
+
+    ds = ray.data.read_json(path, parallelism=10, target_split_size_bytes=2000)
+    assert ds.num_blocks() == 10
+    assert ds.input_files() == [path]
+    assert ds.to_pandas().equals(df)
+
+    # Every split uses the column types inferred from the first block of the file,
+    # even if its own values would be inferred as another type.
+    with open(path, "w") as f:
+        f.write('{"one": 1}\n' * 500 + '{"one": 1.5}\n' * 500)
+    ds = ray.data.read_json(path, target_split_size_bytes=1000)
+    df = pd.DataFrame({"one": [1.0] * 500 + [1.5] * 500})
+    assert ds.num_blocks() > 1
+    assert ds.schema().types == [pa.float64()]
+    assert ds.to_pandas().equals(df)
+
+
 if __name__ == "__main__":
     import sys
 
@@ -16,6 +16,7 @@ import ray
 from ray._private.test_utils import wait_for_condition
 from ray.data.block import BlockAccessor
 from ray.data.context import DataContext
+from ray.data.expressions import col, lit
 from ray.data.tests.conftest import *  # noqa
 from ray.data.tests.util import column_udf, extract_values
 from ray.tests.conftest import *  # noqa
@@ -242,6 +243,42 @@ def test_add_column(ray_start_regular_shared):
         ds = ray.data.range(5).add_column("id", 0)
 
 
+def test_with_column(ray_start_regular_shared):
+    ds = ray.data.from_items(
+        [{"a": i, "b": float(i), "s": f" Item{i} "} for i in range(5)]
+    )
+    ds = ds.with_column("c", col("a") * 2 + col("b"))
+    assert extract_values("c", ds.take_all()) == [0.0, 3.0, 6.0, 9.0, 12.0]
+
+    # True division and casts.
+    ds2 = ds.with_column("a", col("a") / 2).with_column("d", lit(1).cast(pa.int8()))
+    assert ds2.take(2) == [
+        {"a": 0.0, "b": 0.0, "s": " Item0 ", "c": 0.0, "d": 1},
+        {"a": 0.5, "b": 1.0, "s": " Item1 ", "c": 3.0, "d": 1},
+    ]
+    assert ds2.schema().base_schema.field("d").type == pa.int8()
+
+    # String methods.
+    ds2 = ds.with_column("s", col("s").str.strip().str.lower())
+    assert extract_values("s", ds2.take(2)) == ["item0", "item1"]
+
+    # Filters with expressions.
+    ds2 = ds.filter(expr=col("a").is_in([1, 3]) | col("s").str.contains("4"))
+    assert extract_values("a", ds2.take_all()) == [1, 3, 4]
+
+    # Pandas blocks.
+    ds2 = ray.data.from_pandas(pd.DataFrame({"a": [1, None, 3]}))
+    ds2 = ds2.with_column("a", col("a").fill_null(0))
+    assert extract_values("a", ds2.take_all()) == [1.0, 0.0, 3.0]
+
+    with pytest.raises(ValueError, match="doesn't exist"):
+        ds.with_column("c", col("x") + 1).materialize()
+    with pytest.raises(ValueError):
+        ds.with_column("c", lambda df: df["a"])
+    with pytest.raises(TypeError):
+        ds.filter(expr=col("a") > 1 and col("a") < 3)
+
+
 def test_drop_columns(ray_start_regular_shared, tmp_path):
     df = pd.DataFrame({"col1": [1, 2, 3], "col2": [2, 3, 4], "col3": [3, 4, 5]})
     ds1 = ray.data.from_pandas(df)
@@ -24,7 +24,9 @@ from ray.data._internal.execution.operators.input_data_buffer import InputDataBu
 from ray.data._internal.execution.operators.limit_operator import LimitOperator
 from ray.data._internal.execution.operators.map_operator import (
     MapOperator,
+    _AdaptiveTaskSizer,
     _BlockRefBundler,
+    _TaskState,
 )
 from ray.data._internal.execution.operators.output_splitter import OutputSplitter
 from ray.data._internal.execution.operators.task_pool_map_operator import (
@@ -325,6 +327,31 @@ def test_split_operator_locality_hints(ray_start_regular_shared):
     assert "all objects local" in op.progress_str()
 
 
+def test_split_operator_spill_aware_locality(ray_start_regular_shared):
+    bundles = make_ref_bundles([[i] for i in range(4)])
+    op = OutputSplitter(
+        InputDataBuffer(bundles), 2, equal=False, locality_hints=["node1", "node2"]
+    )
+    # The (location, spilled) of the bundle of each item.
+    fake_locs = {
+        0: ("node2", True),
+        1: ("node2", False),
+        2: ("node1", True),
+        3: ("node1", False),
+    }
+
+    def get_item(bundle):
+        return list(ray.get(bundle.blocks[0][0])["id"])[0]
+
+    op._get_location = lambda bundle: fake_locs[get_item(bundle)][0]
+    op._is_spilled = lambda bundle: fake_locs[get_item(bundle)][1]
+    op._buffer = list(bundles)
+
+    popped = [get_item(op._pop_bundle_to_dispatch(0)) for _ in range(4)]
+    # Local in-memory, local spilled, remote in-memory, then remote spilled.
+    assert popped == [3, 2, 1, 0]
+
+
 def test_map_operator_actor_locality_stats(ray_start_regular_shared):
     # Create with inputs.
     input_op = InputDataBuffer(
@@ -733,6 +760,68 @@ def test_block_ref_bundler_uniform(
     assert flat_out == list(range(n))
 
 
+def test_block_ref_bundler_min_bytes():
+    bundles = make_ref_bundles([[i] for i in range(6)])
+    bundle_size = bundles[0].size_bytes()
+    bundler = _BlockRefBundler(None)
+    bundler.add_bundle(bundles[0])
+    assert bundler.has_bundle()
+    assert _get_bundles(bundler.get_next_bundle()) == [0]
+
+    # Bundle up to the byte target once it's set.
+    bundler.set_min_bytes_per_bundle(2 * bundle_size)
+    out_bundles = []
+    for bundle in bundles[1:]:
+        bundler.add_bundle(bundle)
+        while bundler.has_bundle():
+            out_bundles.append(_get_bundles(bundler.get_next_bundle()))
+    bundler.done_adding_bundles()
+    if bundler.has_bundle():
+        out_bundles.append(_get_bundles(bundler.get_next_bundle()))
+    assert out_bundles == [[1, 2], [3, 4], [5]]
+
+    # The row target takes precedence over the byte target.
+    bundler = _BlockRefBundler(3)
+    bundler.set_min_bytes_per_bundle(bundle_size)
+    for bundle in make_ref_bundles([[1], [2]]):
+        bundler.add_bundle(bundle)
+    assert not bundler.has_bundle()
+
+
+def test_adaptive_task_sizer():
+    def make_task(wall_times_s):
+        inputs = make_ref_bundles([[1]])[0]
+        output = make_ref_bundles([[1] for _ in wall_times_s])
+        output = RefBundle(
+            [block for bundle in output for block in bundle.blocks], owns_blocks=True
+        )
+        for (_, meta), wall_time_s in zip(output.blocks, wall_times_s):
+            meta.exec_stats = MagicMock(wall_time_s=wall_time_s)
+        return _TaskState(inputs, output)
+
+    task = make_task([1, 1])
+    input_size = task.inputs.size_bytes()
+    sizer = _AdaptiveTaskSizer(
+        target_task_duration_s=10, min_bundle_bytes=1, max_bundle_bytes=100 * 1024**3
+    )
+    assert sizer.target_bundle_bytes() is None
+
+    # Tasks with unknown durations are ignored.
+    sizer.observe(make_task([1, None]))
+    assert sizer.target_bundle_bytes() is None
+
+    # The task processed its input in 2s, so 10s tasks take 5x as much input.
+    sizer.observe(task)
+    assert sizer.target_bundle_bytes() == 5 * input_size
+
+    # Targets are bounded by the block size limits.
+    sizer = _AdaptiveTaskSizer(
+        target_task_duration_s=10, min_bundle_bytes=1, max_bundle_bytes=input_size
+    )
+    sizer.observe(task)
+    assert sizer.target_bundle_bytes() == input_size
+
+
 if __name__ == "__main__":
     import sys
 
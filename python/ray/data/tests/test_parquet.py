@@ -516,6 +516,97 @@ def test_parquet_read_partitioned_with_filter(ray_start_regular_shared, tmp_path
     assert ds.count() == 2
 
 
+def test_parquet_read_row_group_pruning(ray_start_regular_shared, tmp_path):
+    table = pa.table({"id": list(range(100)), "group": ["a"] * 50 + [None] * 50})
+    path = os.path.join(tmp_path, "test.parquet")
+    pq.write_table(table, path, row_group_size=10)
+
+    # Only the row groups whose statistics can match the filter are read.
+    filter_expr = pa.dataset.field("id") >= 85
+    reader = _ParquetDatasourceReader(path, filter=filter_expr)
+    (read_task,) = reader.get_read_tasks(1)
+    assert [p._row_groups for p in read_task._serialized_pieces] == [[8, 9]]
+    ds = ray.data.read_parquet(path, filter=filter_expr)
+    assert [row["id"] for row in ds.take_all()] == list(range(85, 100))
+
+    # Filters pushed down into the task are combined with the existing filter.
+    read_task = read_task.with_filter(pa.dataset.field("id") < 91)
+    assert [p._row_groups for p in read_task._serialized_pieces] == [[8, 9]]
+    result = pa.concat_tables(list(read_task()))
+    assert result["id"].to_pylist() == list(range(85, 91))
+
+    # Row groups with only nulls are pruned.
+    reader = _ParquetDatasourceReader(path)
+    (read_task,) = reader.get_read_tasks(1)
+    read_task = read_task.with_filter(pa.dataset.field("group") == "a")
+    assert [p._row_groups for p in read_task._serialized_pieces] == [[0, 1, 2, 3, 4]]
+    full_size = reader.get_read_tasks(1)[0].get_metadata().size_bytes
+    assert read_task.get_metadata().size_bytes < full_size
+    read_task = read_task.with_filter(pa.dataset.field("id") > 100)
+    assert read_task.is_empty()
+    assert sum(t.num_rows for t in read_task()) == 0
+
+
+def test_parquet_metadata_cache(
+    ray_start_regular_shared, restore_data_context, tmp_path, monkeypatch
+):
+    data_path = os.path.join(tmp_path, "data")
+    os.mkdir(data_path)
+    for i in range(3):
+        table = pa.table({"one": list(range(i * 10, (i + 1) * 10))})
+        pq.write_table(table, os.path.join(data_path, f"{i}.parquet"))
+    cache_dir = os.path.join(tmp_path, "cache")
+    ctx = ray.data.DataContext.get_current()
+    ctx.parquet_metadata_cache_dir = cache_dir
+
+    reader = _ParquetDatasourceReader(data_path)
+    assert len(set(reader._cache_keys)) == 3
+    cache_files = [f for _, _, files in os.walk(cache_dir) for f in files]
+    assert len([f for f in cache_files if f.endswith(".footer")]) == 3
+
+    # Cached footers and encoding ratios are used instead of reading the files.
+    fetched_pieces = []
+
+    def prefetch_file_metadata(self, pieces, **ray_remote_args):
+        fetched_pieces.extend(pieces)
+        return [p.metadata for p in pieces]
+
+    def sample_piece(*args):
+        raise AssertionError("Sampled a cached file.")
+
+    monkeypatch.setattr(
+        DefaultParquetMetadataProvider,
+        "prefetch_file_metadata",
+        prefetch_file_metadata,
+    )
+    monkeypatch.setattr(
+        ray.data.datasource.parquet_datasource, "_sample_piece", sample_piece
+    )
+    cached_reader = _ParquetDatasourceReader(data_path)
+    assert fetched_pieces == []
+    assert cached_reader._encoding_ratio == reader._encoding_ratio
+    assert [m.num_rows for m in cached_reader._metadata] == [10, 10, 10]
+    assert (
+        cached_reader.estimate_inmemory_data_size()
+        == reader.estimate_inmemory_data_size()
+    )
+    assert ray.data.read_parquet(data_path).count() == 30
+
+    # Rewritten files are not served from the cache.
+    monkeypatch.undo()
+    table = pa.table({"one": list(range(20))})
+    pq.write_table(table, os.path.join(data_path, "0.parquet"))
+    monkeypatch.setattr(
+        DefaultParquetMetadataProvider,
+        "prefetch_file_metadata",
+        prefetch_file_metadata,
+    )
+    reader = _ParquetDatasourceReader(data_path)
+    assert [p.path for p in fetched_pieces] == [os.path.join(data_path, "0.parquet")]
+    assert [m.num_rows for m in reader._metadata] == [20, 10, 10]
+    assert ray.data.read_parquet(data_path).count() == 40
+
+
 def test_parquet_read_partitioned_explicit(ray_start_regular_shared, tmp_path):
     df = pd.DataFrame(
         {"one": [1, 1, 1, 3, 3, 3], "two": ["a", "b", "c", "e", "f", "g"]}
@@ -849,6 +940,42 @@ def test_parquet_write_with_udf(ray_start_regular_shared, tmp_path):
     assert expected_df.equals(dfds)
 
 
+def test_parquet_write_rolling_files(ray_start_regular_shared, tmp_path):
+    ds = ray.data.range(10000, parallelism=20)
+    ds._set_uuid("data")
+
+    # Roll files by row count.
+    path = os.path.join(tmp_path, "rows")
+    ds.write_parquet(path, max_rows_per_file=300)
+    files = os.listdir(path)
+    assert all(pq.read_metadata(os.path.join(path, f)).num_rows <= 300 for f in files)
+    assert sorted(pd.read_parquet(path)["id"]) == list(range(10000))
+
+    # Roll files by size. Each write task is given enough blocks to fill a file.
+    path = os.path.join(tmp_path, "bytes")
+    target = 20 * 1024
+    ds.write_parquet(path, target_file_size_bytes=target, row_group_size=100)
+    files = os.listdir(path)
+    assert len(files) > 1
+    for f in files:
+        assert f.startswith("data_") and f.endswith(".parquet")
+        # Files are rolled within a row group of the target size.
+        assert os.path.getsize(os.path.join(path, f)) < 2 * target
+    assert sorted(pd.read_parquet(path)["id"]) == list(range(10000))
+
+    # Write partitions without repartitioning first.
+    path = os.path.join(tmp_path, "partitioned")
+    ds.map(lambda row: {"id": row["id"], "part": row["id"] % 3}).write_parquet(
+        path, partition_cols=["part"]
+    )
+    assert sorted(os.listdir(path)) == ["part=0", "part=1", "part=2"]
+    for part in range(3):
+        df = pd.read_parquet(os.path.join(path, f"part={part}"))
+        assert list(df.columns) == ["id"]
+        assert sorted(df["id"]) == list(range(part, 10000, 3))
+    assert ray.data.read_parquet(path).count() == 10000
+
+
 @pytest.mark.parametrize(
     "fs,data_path,endpoint_url",
     [
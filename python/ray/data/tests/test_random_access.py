@@ -29,6 +29,20 @@ def test_basic(ray_start_regular_shared, pandas):
     results = rad.multiget([-1] + list(range(10)) + [100])
     assert results == [None] + [expected(i) for i in range(10)] + [None]
 
+    # Test multiget with Arrow results, which have null rows for missing keys.
+    keys = [99, -1, 5, 50, 51, 100]
+    table = rad.multiget(keys, batch_format="pyarrow")
+    assert isinstance(table, pyarrow.Table)
+    assert table.to_pylist() == [
+        expected(99),
+        {"id": None, "embedding": None},
+        expected(5),
+        expected(50),
+        expected(51),
+        {"id": None, "embedding": None},
+    ]
+    assert rad.multiget([], batch_format="pyarrow").num_rows == 0
+
 
 def test_empty_blocks(ray_start_regular_shared):
     ds = ray.data.range(10).repartition(20)
@@ -5,6 +5,10 @@ from unittest.mock import MagicMock
 import pytest
 
 import ray
+from ray.data._internal.execution import backpressure_policy
+from ray.data._internal.execution.backpressure_policy import (
+    DownstreamThroughputBackpressurePolicy,
+)
 from ray.data._internal.execution.interfaces import (
     ExecutionOptions,
     ExecutionResources,
@@ -208,6 +212,65 @@ def test_select_operator_to_run():
     )
 
 
+def test_downstream_throughput_backpressure_policy(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(backpressure_policy.time, "perf_counter", lambda: now[0])
+    opt = ExecutionOptions()
+    inputs = make_ref_bundles([[x] for x in range(20)])
+    o1 = InputDataBuffer(inputs)
+    o2 = MapOperator.create(make_transform(lambda block: [b * -1 for b in block]), o1)
+    o3 = MapOperator.create(make_transform(lambda block: [b * 2 for b in block]), o2)
+    topo, _ = build_streaming_topology(o3, opt)
+    policy = DownstreamThroughputBackpressurePolicy(topo)
+    bundles = make_ref_bundles([[x] for x in range(10)])
+    bundle_size = bundles[0].size_bytes()
+    for bundle in bundles:
+        topo[o2].add_output(bundle)
+    topo[o1].outqueue.append(inputs[0])
+
+    # Nothing is known about the throughput of o3 yet.
+    assert policy.can_add_input(o2)
+
+    # o3 has queued inputs, but didn't consume any.
+    now[0] += 1
+    assert not policy.can_add_input(o2)
+    assert policy.get_metrics(o2)["outqueue_limit_bytes"] == 2 * bundle_size
+    assert (
+        select_operator_to_run(
+            topo,
+            NO_USAGE,
+            ExecutionResources(),
+            True,
+            "dummy",
+            AutoscalingState(),
+            backpressure_policies=[policy],
+        )
+        == o3
+    )
+    assert topo[o2].num_backpressured == 1
+    assert topo[o2].get_metrics()["num_backpressured"] == 1
+
+    # o3 consumed 10 bundles in the last second. Smoothed with the previous sample,
+    # this allows o2 to buffer 25 bundles.
+    topo[o3].inqueue_bytes_consumed[0] += 10 * bundle_size
+    now[0] += 1
+    assert policy.get_metrics(o2)["downstream_throughput_bytes_per_s"] == (
+        5 * bundle_size
+    )
+    assert policy.can_add_input(o2)
+
+    # Starved consumers don't lower the throughput estimate.
+    topo[o2].outqueue.clear()
+    now[0] += 1
+    assert policy.get_metrics(o2)["downstream_throughput_bytes_per_s"] == (
+        5 * bundle_size
+    )
+
+    # The output operator is never throttled by the policy.
+    assert policy.can_add_input(o3)
+    assert policy.get_metrics(o3) == {}
+
+
 def test_dispatch_next_task():
     inputs = make_ref_bundles([[x] for x in range(20)])
     o1 = InputDataBuffer(inputs)
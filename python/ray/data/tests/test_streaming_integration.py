@@ -1,4 +1,6 @@
 import itertools
+import json
+import os
 import random
 import threading
 import time
@@ -74,6 +76,37 @@ def test_pipelined_execution(ray_start_10_cpus_shared):
     assert output == expected, (output, expected)
 
 
+def test_execution_trace(ray_start_10_cpus_shared, restore_data_context, tmp_path):
+    DataContext.get_current().trace_dir = str(tmp_path)
+    ds = ray.data.range(100, parallelism=10).map_batches(lambda batch: batch)
+    assert sum(len(batch["id"]) for batch in ds.iter_batches(batch_size=10)) == 100
+
+    [trace_file] = os.listdir(tmp_path)
+    with open(os.path.join(tmp_path, trace_file)) as f:
+        events = json.load(f)
+    tracks = {
+        event["tid"]: event["args"]["name"]
+        for event in events
+        if event["name"] == "thread_name"
+    }
+    task_events = [event for event in events if event["name"] == "task"]
+    assert len(task_events) == 10
+    assert sum(event["args"]["num_rows"] for event in task_events) == 100
+    assert all("(task " in tracks[event["tid"]] for event in task_events)
+    assert len([event for event in events if event["name"] == "run"]) == 10
+    assert len([event for event in events if event["name"] == "output"]) >= 10
+    wait_tracks = {tracks[event["tid"]] for event in events if event["name"] == "wait"}
+    assert any(track.startswith("iter_batches") for track in wait_tracks)
+    assert any("consumer" in track for track in wait_tracks)
+
+    # The events of later executions are appended to the same trace file.
+    assert sum(len(batch["id"]) for batch in ds.iter_batches(batch_size=10)) == 100
+    with open(os.path.join(tmp_path, trace_file)) as f:
+        events = json.load(f)
+    assert len([event for event in events if event["name"] == "task"]) == 20
+    assert len([event for event in events if event["name"] == "process_name"]) == 1
+
+
 def test_output_split_e2e(ray_start_10_cpus_shared):
     executor = StreamingExecutor(ExecutionOptions())
     inputs = make_ref_bundles([[x] for x in range(20)])
@@ -174,6 +207,41 @@ def test_streaming_split_e2e(ray_start_10_cpus_shared):
                 assert lengths == [300, 300, 400], lengths
 
 
+@pytest.mark.parametrize("shuffle", ["randomize_block_order", "random_shuffle"])
+def test_streaming_split_cache_first_epoch(ray_start_10_cpus_shared, shuffle):
+    @ray.remote
+    class Counter:
+        def __init__(self):
+            self.count = 0
+
+        def inc(self, n):
+            self.count += n
+
+        def get(self):
+            return self.count
+
+    counter = Counter.remote()
+
+    def count_rows(batch):
+        ray.get(counter.inc.remote(len(batch["id"])))
+        return batch
+
+    ds = ray.data.range(100, parallelism=10).map_batches(count_rows)
+    # The map must not be fused into the shuffle, so its output can be cached.
+    ds = getattr(ds, shuffle)()
+    i1, i2 = ds.streaming_split(2, cache_first_epoch=True)
+
+    @ray.remote
+    def consume(it, epochs):
+        return [[row["id"] for row in it.iter_rows()] for _ in range(epochs)]
+
+    out1, out2 = ray.get([consume.remote(i1, 3), consume.remote(i2, 3)])
+    for ids1, ids2 in zip(out1, out2):
+        assert sorted(ids1 + ids2) == list(range(100))
+    # The map only ran in the first epoch.
+    assert ray.get(counter.get.remote()) == 100
+
+
 def test_streaming_split_barrier(ray_start_10_cpus_shared):
     ds = ray.data.range(20, parallelism=20)
     (
@@ -226,6 +294,43 @@ def test_streaming_split_invalid_iterator(ray_start_10_cpus_shared):
         )
 
 
+def test_streaming_split_lease_and_release(
+    ray_start_10_cpus_shared, restore_data_context
+):
+    DataContext.get_current().streaming_split_lease_size = 4
+    ds = ray.data.range(100, parallelism=100)
+    i1, i2 = ds.streaming_split(2, equal=False)
+    coord = i1._coord_actor
+    epoch, _ = ray.get([coord.start_epoch.remote(0), coord.start_epoch.remote(1)])
+
+    def get_ids(blocks):
+        return [i for b, _ in blocks for i in ray.get(b)["id"]]
+
+    # A lease hands out several blocks at once.
+    leased = []
+    while len(leased) < 2:
+        leased = ray.get(coord.lease.remote(epoch, 0, 4))
+        assert leased
+        assert len(leased) <= 4
+    # Split 0 stops after consuming one block, returning the rest.
+    ray.get(coord.release.remote(epoch, 0, leased[1:], 1))
+
+    # Split 1 leases its own blocks as well as the returned ones.
+    ids = []
+    while True:
+        blocks = ray.get(coord.lease.remote(epoch, 1, 4))
+        if not blocks:
+            break
+        ids.extend(get_ids(blocks))
+    assert len(ids) == len(set(ids))
+    assert set(get_ids(leased[1:])) <= set(ids)
+    assert not set(get_ids(leased[:1])) & set(ids)
+
+    stats = i2.stats()
+    assert "Streaming split 1 of 2" in stats, stats
+    assert "queued in the coordinator" in stats, stats
+
+
 def test_e2e_option_propagation(ray_start_10_cpus_shared, restore_data_context):
     DataContext.get_current().new_execution_backend = True
     DataContext.get_current().use_streaming_executor = True
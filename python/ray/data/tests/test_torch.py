@@ -303,6 +303,43 @@ def test_iter_torch_batches_tensor_ds(ray_start_10_cpus_shared):
         np.testing.assert_array_equal(arr, combined_iterations)
 
 
+def test_convert_arrow_batch_to_torch_tensor_batch():
+    import pyarrow as pa
+    import torch
+
+    from ray.air._internal.torch_utils import convert_arrow_batch_to_torch_tensor_batch
+    from ray.air.util.tensor_extensions.arrow import ArrowTensorArray
+
+    arr = np.arange(24, dtype=np.float32).reshape((6, 2, 2))
+    table = pa.table(
+        {
+            "data": ArrowTensorArray.from_numpy(arr),
+            "label": np.arange(6),
+            "flag": [True, False] * 3,
+        }
+    )
+
+    batch = convert_arrow_batch_to_torch_tensor_batch(table)
+    # Single-chunk tensor columns are views of the Arrow buffers.
+    data_view = table["data"].chunk(0).to_numpy()
+    assert batch["data"].data_ptr() == data_view.__array_interface__["data"][0]
+    np.testing.assert_array_equal(batch["data"].numpy(), arr)
+    np.testing.assert_array_equal(batch["label"].numpy(), np.arange(6))
+    # Boolean columns are converted through NumPy.
+    assert batch["flag"].dtype == torch.bool
+    np.testing.assert_array_equal(batch["flag"].numpy(), [True, False] * 3)
+
+    # Multi-chunk columns are copied into a single tensor.
+    table = pa.concat_tables([table.slice(0, 2), table.slice(2)])
+    assert table["data"].num_chunks == 2
+    batch = convert_arrow_batch_to_torch_tensor_batch(
+        table, dtypes={"data": torch.float64, "label": None, "flag": None}
+    )
+    assert batch["data"].dtype == torch.float64
+    np.testing.assert_array_equal(batch["data"].numpy(), arr)
+    np.testing.assert_array_equal(batch["label"].numpy(), np.arange(6))
+
+
 # This test catches an error in stream_split_iterator dealing with empty blocks,
 # which is difficult to reproduce outside of TorchTrainer.
 def test_torch_trainer_crash(ray_start_10_cpus_shared):
@@ -28,6 +28,9 @@ def get_object_locations(
 
         - object_size (int): The size of data + metadata in bytes.
 
+        - did_spill (bool): Whether the object has been spilled to external
+          storage. The node that spilled it is included in ``node_ids``.
+
     Raises:
         RuntimeError: if the processes were not started by ray.init().
         ray.exceptions.GetTimeoutError: if it couldn't finish the
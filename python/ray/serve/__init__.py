@@ -21,6 +21,7 @@ try:
     from ray.serve.air_integrations import PredictorDeployment
     from ray.serve.batching import batch
     from ray.serve.config import HTTPOptions
+    from ray.serve.response_cache import response_cache
 except ModuleNotFoundError as e:
     e.msg += (
         '. You can run `pip install "ray[serve]"` to install all Ray Serve'
@@ -52,4 +53,5 @@ __all__ = [
     "Deployment",
     "multiplexed",
     "get_multiplexed_model_id",
+    "response_cache",
 ]
@@ -326,6 +326,10 @@ class RunningReplicaInfo:
     max_concurrent_queries: int
     is_cross_language: bool = False
     multiplexed_model_ids: List[str] = field(default_factory=list)
+    prefer_local_routing: bool = False
+    # The node the replica runs on, if known. This isn't part of the hash since it
+    # doesn't change while the replica is running.
+    node_id: Optional[str] = None
 
     def __post_init__(self):
         # Set hash value when object is constructed.
@@ -343,6 +347,7 @@ class RunningReplicaInfo:
                     str(self.max_concurrent_queries),
                     str(self.is_cross_language),
                     str(self.multiplexed_model_ids),
+                    str(self.prefer_local_routing),
                 ]
             )
         )
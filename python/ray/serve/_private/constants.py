@@ -192,3 +192,38 @@ SERVE_MULTIPLEXED_MODEL_ID = "serve_multiplexed_model_id"
 RAY_SERVE_ENABLE_EXPERIMENTAL_STREAMING = (
     os.environ.get("RAY_SERVE_ENABLE_EXPERIMENTAL_STREAMING", "0") == "1"
 )
+
+# The policy that handles use to choose a replica for each request. Either
+# "round_robin", or "power_of_two_choices" to send each request to the less loaded
+# of two randomly sampled replicas.
+RAY_SERVE_REPLICA_SCHEDULER = os.environ.get(
+    "RAY_SERVE_REPLICA_SCHEDULER", "round_robin"
+)
+
+# With the "power_of_two_choices" policy, the number of queries of other handles that
+# a replica reported is ignored after this many seconds, since it's only refreshed
+# when a query of the handle finishes on the replica.
+RAY_SERVE_REPLICA_LOAD_REPORT_TIMEOUT_S = float(
+    os.environ.get("RAY_SERVE_REPLICA_LOAD_REPORT_TIMEOUT_S", 1)
+)
+
+# The maximum number of HTTP responses cached by each HTTP proxy. Only responses with
+# a `Cache-Control: max-age=<seconds>` header are cached, by the method, path, query
+# string and body of the request. Disabled by default.
+RAY_SERVE_HTTP_PROXY_RESPONSE_CACHE_MAX_ENTRIES = int(
+    os.environ.get("RAY_SERVE_HTTP_PROXY_RESPONSE_CACHE_MAX_ENTRIES", 0)
+)
+
+# When turned on, replicas don't return a tracker object with the result of each
+# request. Instead, they report the completed requests of each handle in batches,
+# in response to a single pending call per replica.
+RAY_SERVE_BATCHED_REQUEST_TRACKING = (
+    os.environ.get("RAY_SERVE_BATCHED_REQUEST_TRACKING", "0") == "1"
+)
+
+# With batched request tracking, the pending `wait_for_completed_requests` calls
+# return after this many seconds even if no request completed, so that replicas can
+# drop the state of handles that stopped polling for twice as long.
+RAY_SERVE_BATCHED_REQUEST_TRACKING_TIMEOUT_S = float(
+    os.environ.get("RAY_SERVE_BATCHED_REQUEST_TRACKING_TIMEOUT_S", 30)
+)
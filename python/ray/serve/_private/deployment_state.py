@@ -290,6 +290,13 @@ class ActorReplicaWrapper:
             )
             return DEFAULT_MAX_CONCURRENT_QUERIES
 
+    @property
+    def prefer_local_routing(self) -> bool:
+        if self.deployment_config:
+            return self.deployment_config.prefer_local_routing
+        else:
+            return False
+
     @property
     def graceful_shutdown_timeout_s(self) -> float:
         if self.deployment_config:
@@ -815,6 +822,8 @@ class DeploymentReplica(VersionedReplica):
             max_concurrent_queries=self._actor.max_concurrent_queries,
             is_cross_language=self._actor.is_cross_language,
             multiplexed_model_ids=self.multiplexed_model_ids,
+            prefer_local_routing=self._actor.prefer_local_routing,
+            node_id=self.actor_node_id,
         )
 
     def record_multiplexed_model_ids(self, multiplexed_model_ids: List[str]):
@@ -1,5 +1,6 @@
 import asyncio
 from asyncio.tasks import FIRST_COMPLETED
+import hashlib
 import json
 import os
 import logging
@@ -34,6 +35,7 @@ from ray.serve._private.constants import (
     SERVE_NAMESPACE,
     DEFAULT_LATENCY_BUCKET_MS,
     RAY_SERVE_ENABLE_EXPERIMENTAL_STREAMING,
+    RAY_SERVE_HTTP_PROXY_RESPONSE_CACHE_MAX_ENTRIES,
 )
 from ray.serve._private.long_poll import LongPollClient, LongPollNamespace
 from ray.serve._private.logging_utils import (
@@ -43,6 +45,7 @@ from ray.serve._private.logging_utils import (
 )
 
 from ray.serve._private.utils import get_random_letters
+from ray.serve.response_cache import _MISSING, _ResponseCache
 
 logger = logging.getLogger(SERVE_LOGGER_NAME)
 
@@ -131,9 +134,162 @@ async def _handle_streaming_response(
     return status_code
 
 
-async def _send_request_to_handle(handle, scope, receive, send) -> str:
+class HTTPResponseCache:
+    """Caches the HTTP responses that replicas mark as cacheable.
+
+    A response is cached if its status is 200 and it has a `Cache-Control` header
+    with a `max-age` or `s-maxage` directive, for that many seconds, unless the header
+    also has a `no-store`, `no-cache` or `private` directive, or the response has a
+    `Vary` header. The responses are keyed on the method, path, query string, body
+    and multiplexed model ID of the requests.
+
+    Requests with an `Authorization` or `Cookie` header only share the responses
+    marked `public` or with an `s-maxage` directive, and requests with a
+    `Cache-Control: no-cache` or `no-store` header bypass the cache.
+    """
+
+    def __init__(self, max_entries: int):
+        # Maps the keys to the responses, and whether they can be shared with
+        # requests that have credentials.
+        self._cache = _ResponseCache(max_entries)
+
+        self.hit_counter = metrics.Counter(
+            "serve_http_response_cache_hits",
+            description="The number of HTTP requests answered by the response cache.",
+            tag_keys=("route", "application"),
+        )
+        self.miss_counter = metrics.Counter(
+            "serve_http_response_cache_misses",
+            description=(
+                "The number of HTTP requests that weren't answered by the response "
+                "cache."
+            ),
+            tag_keys=("route", "application"),
+        )
+
+    @staticmethod
+    def make_key(scope: Scope, http_body_bytes: bytes) -> Optional[Tuple]:
+        """Return the cache key of the request, or None if it bypasses the cache."""
+        multiplexed_model_id = ""
+        for key, value in scope["headers"]:
+            key = key.decode().lower()
+            if key == SERVE_MULTIPLEXED_MODEL_ID:
+                multiplexed_model_id = value.decode()
+            elif key == "cache-control":
+                directives = _parse_cache_control(value)
+                if "no-cache" in directives or "no-store" in directives:
+                    return None
+        return (
+            scope["method"],
+            scope["root_path"] + scope["path"],
+            scope["query_string"],
+            multiplexed_model_id,
+            hashlib.sha256(http_body_bytes).digest(),
+        )
+
+    @staticmethod
+    def has_credentials(scope: Scope) -> bool:
+        """Whether the request has an `Authorization` or `Cookie` header."""
+        return any(
+            key.lower() in (b"authorization", b"cookie") for key, _ in scope["headers"]
+        )
+
+    def get(self, key: Tuple, has_credentials: bool) -> Optional[Any]:
+        """Return the response cached under the key, if any."""
+        request_context = ray.serve.context._serve_request_context.get()
+        tags = {
+            "route": request_context.route,
+            "application": request_context.app_name,
+        }
+        entry = self._cache.get(key)
+        # Responses to requests without credentials may still differ from the ones
+        # to requests with credentials, unless the replica marks them as shared.
+        if entry is _MISSING or (has_credentials and not entry[1]):
+            self.miss_counter.inc(tags=tags)
+            return None
+        self.hit_counter.inc(tags=tags)
+        return entry[0]
+
+    def put(self, key: Tuple, response: Any, has_credentials: bool):
+        """Cache the response under the key, if it's cacheable."""
+        ttl_s, shared = self._get_cache_policy(response)
+        if ttl_s is None or ttl_s <= 0:
+            return
+        # Responses to requests with credentials may be specific to the user.
+        if has_credentials and not shared:
+            return
+        self._cache.put(key, (response, shared), ttl_s)
+
+    @staticmethod
+    def _get_cache_policy(response: Any) -> Tuple[Optional[float], bool]:
+        """Return the TTL of the response, or None if it can't be cached, and
+        whether it can be shared with requests that have credentials.
+        """
+        if isinstance(response, RawASGIResponse):
+            headers = response.messages[0].get("headers", [])
+        elif isinstance(response, starlette.responses.Response):
+            # Streaming responses and background tasks can't be replayed.
+            if isinstance(response, starlette.responses.StreamingResponse):
+                return None, False
+            if response.background is not None:
+                return None, False
+            headers = response.raw_headers
+        else:
+            return None, False
+        if response.status_code != 200:
+            return None, False
+
+        directives = {}
+        for key, value in headers:
+            key = key.lower()
+            # The cache key doesn't include the request headers that the response
+            # varies on.
+            if key == b"vary":
+                return None, False
+            if key == b"cache-control":
+                directives.update(_parse_cache_control(value))
+        if any(name in directives for name in ("no-store", "no-cache", "private")):
+            return None, False
+
+        # s-maxage is for shared caches, and overrides max-age.
+        max_age = directives.get("s-maxage", directives.get("max-age"))
+        if max_age is None:
+            return None, False
+        try:
+            ttl_s = float(max_age)
+        except ValueError:
+            return None, False
+        return ttl_s, "public" in directives or "s-maxage" in directives
+
+
+def _parse_cache_control(value: bytes) -> Dict[str, str]:
+    """Parse the directives of a `Cache-Control` header into a dict of their args."""
+    directives = {}
+    for directive in value.decode().lower().split(","):
+        name, _, arg = directive.strip().partition("=")
+        directives[name] = arg.strip('"')
+    return directives
+
+
+async def _send_request_to_handle(
+    handle,
+    scope,
+    receive,
+    send,
+    response_cache: Optional[HTTPResponseCache] = None,
+) -> str:
     http_body_bytes = await receive_http_body(scope, receive, send)
 
+    cache_key = None
+    if response_cache is not None:
+        cache_key = response_cache.make_key(scope, http_body_bytes)
+        has_credentials = response_cache.has_credentials(scope)
+    if cache_key is not None:
+        cached_response = response_cache.get(cache_key, has_credentials)
+        if cached_response is not None:
+            await cached_response(scope, receive, send)
+            return str(cached_response.status_code)
+
     # NOTE(edoakes): it's important that we defer building the starlette
     # request until it reaches the replica to avoid unnecessary
     # serialization cost, so we use a simple dataclass here.
@@ -228,6 +384,8 @@ async def _send_request_to_handle(handle, scope, receive, send) -> str:
         return "500"
 
     if isinstance(result, (starlette.responses.Response, RawASGIResponse)):
+        if cache_key is not None:
+            response_cache.put(cache_key, result, has_credentials)
         await result(scope, receive, send)
         return str(result.status_code)
     else:
@@ -395,6 +553,16 @@ class HTTPProxy:
             ),
         )
 
+        # Streaming responses aren't cached.
+        self.response_cache = None
+        if (
+            RAY_SERVE_HTTP_PROXY_RESPONSE_CACHE_MAX_ENTRIES > 0
+            and not RAY_SERVE_ENABLE_EXPERIMENTAL_STREAMING
+        ):
+            self.response_cache = HTTPResponseCache(
+                RAY_SERVE_HTTP_PROXY_RESPONSE_CACHE_MAX_ENTRIES
+            )
+
     def _update_routes(self, endpoints: Dict[EndpointTag, EndpointInfo]) -> None:
         self.route_info: Dict[str, Tuple[EndpointTag, List[str]]] = dict()
         for endpoint, info in endpoints.items():
@@ -503,7 +671,9 @@ class HTTPProxy:
         ray.serve.context._serve_request_context.set(
             ray.serve.context.RequestContext(**request_context_info)
         )
-        status_code = await _send_request_to_handle(handle, scope, receive, send)
+        status_code = await _send_request_to_handle(
+            handle, scope, receive, send, self.response_cache
+        )
         self.request_counter.inc(
             tags={
                 "route": route_path,
@@ -1,12 +1,13 @@
 import aiorwlock
 import asyncio
+from collections import defaultdict
 from importlib import import_module
 import inspect
 import logging
 import os
 import pickle
 import time
-from typing import Any, AsyncGenerator, Callable, Optional, Tuple, Dict
+from typing import Any, AsyncGenerator, Callable, Optional, Tuple, Dict, List
 import traceback
 
 import starlette.responses
@@ -33,6 +34,7 @@ from ray.serve._private.constants import (
     SERVE_LOGGER_NAME,
     SERVE_NAMESPACE,
     DEFAULT_GRACEFUL_SHUTDOWN_WAIT_LOOP_S,
+    RAY_SERVE_BATCHED_REQUEST_TRACKING_TIMEOUT_S,
 )
 from ray.serve.deployment import Deployment
 from ray.serve.exceptions import RayServeException
@@ -213,6 +215,17 @@ def create_replica_wrapper(name: str):
             # Used to guard `initialize_replica` so that it isn't called twice.
             self._replica_init_lock = asyncio.Lock()
 
+            # The sequence numbers of the requests that completed since the last
+            # `wait_for_completed_requests` call of each router, by tracking ID.
+            self._completed_requests: Dict[str, List[int]] = defaultdict(list)
+            self._completion_events: Dict[str, asyncio.Event] = defaultdict(
+                asyncio.Event
+            )
+            # The last time each router sent a request or polled for completed
+            # requests, so that the state of dead routers can be dropped.
+            self._last_tracking_times: Dict[str, float] = dict()
+            self._last_tracking_expiry_time = time.time()
+
         @ray.method(num_returns=2)
         async def handle_request(
             self,
@@ -227,6 +240,78 @@ def create_replica_wrapper(name: str):
             )
             return await self.replica.handle_request(query)
 
+        async def handle_request_with_batched_tracking(
+            self,
+            tracking_id: str,
+            sequence_number: int,
+            pickled_request_metadata: bytes,
+            *request_args,
+            **request_kwargs,
+        ):
+            """Handle a request without returning a tracker object.
+
+            Instead, the completion of the request is reported to the router with the
+            given tracking ID by `wait_for_completed_requests`, together with the
+            other requests that completed in the meantime.
+            """
+            query = Query(
+                request_args,
+                request_kwargs,
+                pickle.loads(pickled_request_metadata),
+                return_num=1,
+            )
+            self._last_tracking_times[tracking_id] = time.time()
+            try:
+                return await self.replica.handle_request(query)
+            finally:
+                self._completed_requests[tracking_id].append(sequence_number)
+                self._completion_events[tracking_id].set()
+                self._expire_tracking_state()
+
+        async def wait_for_completed_requests(
+            self, tracking_id: str
+        ) -> Tuple[List[int], int]:
+            """Wait for requests of the router with the given tracking ID to complete.
+
+            Returns after RAY_SERVE_BATCHED_REQUEST_TRACKING_TIMEOUT_S even if no
+            request completed, so that the calls of dead routers don't wait forever.
+
+            Returns:
+                The sequence numbers of the requests that completed since the last
+                call, and the number of requests that are ongoing on this replica.
+            """
+            self._last_tracking_times[tracking_id] = time.time()
+            try:
+                await asyncio.wait_for(
+                    self._completion_events[tracking_id].wait(),
+                    RAY_SERVE_BATCHED_REQUEST_TRACKING_TIMEOUT_S,
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._last_tracking_times[tracking_id] = time.time()
+            self._completion_events.pop(tracking_id, None)
+            completed_requests = self._completed_requests.pop(tracking_id, [])
+            handle_request_stats = self.replica._get_handle_request_stats() or {}
+            num_ongoing_requests = handle_request_stats.get(
+                "running", 0
+            ) + handle_request_stats.get("pending", 0)
+            return completed_requests, num_ongoing_requests
+
+        def _expire_tracking_state(self):
+            """Drop the completed requests of the routers that haven't sent requests or
+            polled for them for twice the polling timeout, e.g. because they died.
+            """
+            now = time.time()
+            timeout_s = RAY_SERVE_BATCHED_REQUEST_TRACKING_TIMEOUT_S
+            if now - self._last_tracking_expiry_time < timeout_s:
+                return
+            self._last_tracking_expiry_time = now
+            for tracking_id, last_time in list(self._last_tracking_times.items()):
+                if now - last_time > 2 * timeout_s:
+                    del self._last_tracking_times[tracking_id]
+                    self._completed_requests.pop(tracking_id, None)
+                    self._completion_events.pop(tracking_id, None)
+
         async def handle_request_streaming(
             self,
             pickled_request_metadata: bytes,
@@ -470,8 +555,14 @@ class RayServeReplica:
         method_stat_java = actor_stats.get(
             f"{replica_actor_name}.handle_request_from_java"
         )
+        batched_tracking_method_stat = actor_stats.get(
+            f"{replica_actor_name}.handle_request_with_batched_tracking"
+        )
         return merge_dict(
-            merge_dict(method_stat, streaming_method_stat), method_stat_java
+            merge_dict(
+                merge_dict(method_stat, streaming_method_stat), method_stat_java
+            ),
+            batched_tracking_method_stat,
         )
 
     def _collect_autoscaling_metrics(self):
@@ -676,8 +767,15 @@ class RayServeReplica:
             if request.return_num == 1:
                 return result
             else:
-                # Returns a small object for router to track request status.
-                return b"", result
+                # Returns a small object for router to track request status, which
+                # also reports the number of other requests on this replica.
+                handle_request_stats = self._get_handle_request_stats() or {}
+                num_ongoing_requests = (
+                    handle_request_stats.get("running", 0)
+                    + handle_request_stats.get("pending", 0)
+                    - 1
+                )
+                return max(num_ongoing_requests, 0), result
 
     async def prepare_for_shutdown(self):
         """Perform graceful shutdown.
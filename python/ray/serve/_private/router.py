@@ -7,7 +7,8 @@ import logging
 import pickle
 import random
 import sys
-from typing import Any, Dict, List, Optional, Union
+import time
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import ray
 from ray.actor import ActorHandle
@@ -19,10 +20,14 @@ from ray.serve._private.common import RunningReplicaInfo, DeploymentInfo
 from ray.serve._private.constants import (
     SERVE_LOGGER_NAME,
     HANDLE_METRIC_PUSH_INTERVAL_S,
+    RAY_SERVE_BATCHED_REQUEST_TRACKING,
+    RAY_SERVE_REPLICA_LOAD_REPORT_TIMEOUT_S,
+    RAY_SERVE_REPLICA_SCHEDULER,
 )
 from ray.serve._private.long_poll import LongPollClient, LongPollNamespace
 from ray.serve._private.utils import (
     compute_iterable_delta,
+    get_random_letters,
     JavaActorHandleProxy,
     MetricsPusher,
 )
@@ -132,10 +137,38 @@ class RoundRobinReplicaScheduler(ReplicaScheduler):
 
     This is maintained using a "tracker" object ref to determine when a given request
     has finished (to decrement the number of concurrent queries).
+
+    With `batched_request_tracking`, replicas don't return a tracker object per
+    request. Instead, the in flight queries are tracked by sequence numbers, and each
+    replica with in flight queries has a pending `wait_for_completed_requests` call,
+    which returns the sequence numbers of all the queries completed in the meantime.
+
+    If the deployment sets `prefer_local_routing`, the replicas on the same node as
+    the handle are round-robined first, and the other replicas are only used when all
+    of the local ones are overloaded. The option is delivered with the running
+    replicas, so that updates to it apply to existing handles.
     """
 
-    def __init__(self, event_loop: asyncio.AbstractEventLoop):
+    def __init__(
+        self,
+        event_loop: asyncio.AbstractEventLoop,
+        batched_request_tracking: bool = False,
+    ):
+        self._prefer_local_routing = False
+        self._node_id = ray.get_runtime_context().get_node_id()
+
+        self._batched_request_tracking = batched_request_tracking
+        # Identifies the queries of this handle to the replicas.
+        self._tracking_id = get_random_letters(16)
+        self._sequence_numbers = itertools.count()
+        # The pending `wait_for_completed_requests` call of each replica.
+        self.completion_refs: Dict[RunningReplicaInfo, ray.ObjectRef] = dict()
+
         self.in_flight_queries: Dict[RunningReplicaInfo, set] = dict()
+        # The number of queries on each replica that were sent by other handles, as
+        # of the last query of this handle that finished on the replica, and the
+        # time it was reported.
+        self.other_queries: Dict[RunningReplicaInfo, Tuple[int, float]] = dict()
 
         # The iterator used for load balancing among replicas. Using itertools
         # cycle, we implements a round-robin policy, skipping overloaded
@@ -144,6 +177,9 @@ class RoundRobinReplicaScheduler(ReplicaScheduler):
         # policies like: min load, pick min of two replicas, pick replicas on
         # the same node.
         self.replica_iterator = itertools.cycle(self.in_flight_queries.keys())
+        # The same for the replicas on the same node as this handle.
+        self.local_replica_iterator = itertools.cycle([])
+        self.num_local_replicas = 0
 
         # Used to unblock this replica set waiting for free replicas. A newly
         # added replica or updated max_concurrent_queries value means the
@@ -172,6 +208,11 @@ class RoundRobinReplicaScheduler(ReplicaScheduler):
         replicas = list(self.in_flight_queries.keys())
         random.shuffle(replicas)
         self.replica_iterator = itertools.cycle(replicas)
+        local_replicas = [
+            replica for replica in replicas if replica.node_id == self._node_id
+        ]
+        self.local_replica_iterator = itertools.cycle(local_replicas)
+        self.num_local_replicas = len(local_replicas)
 
         # Update the multiplexed_replicas_table
         new_multiplexed_replicas_table = defaultdict(list)
@@ -184,6 +225,10 @@ class RoundRobinReplicaScheduler(ReplicaScheduler):
         added, removed, _ = compute_iterable_delta(
             self.in_flight_queries.keys(), running_replicas
         )
+        # All the replicas have the same value, except while it's being updated.
+        self._prefer_local_routing = any(
+            replica.prefer_local_routing for replica in running_replicas
+        )
 
         for new_replica in added:
             self.in_flight_queries[new_replica] = set()
@@ -193,6 +238,8 @@ class RoundRobinReplicaScheduler(ReplicaScheduler):
             # Replicas might already been deleted due to early detection of
             # actor error.
             self.in_flight_queries.pop(removed_replica, None)
+            self.other_queries.pop(removed_replica, None)
+            self.completion_refs.pop(removed_replica, None)
 
         if len(added) > 0 or len(removed) > 0:
             logger.debug(f"ReplicaSet: +{len(added)}, -{len(removed)} replicas.")
@@ -233,6 +280,19 @@ class RoundRobinReplicaScheduler(ReplicaScheduler):
                 [arg],
             )
             self.in_flight_queries[replica].add(user_ref)
+        elif self._batched_request_tracking:
+            sequence_number = next(self._sequence_numbers)
+            handle_request = replica.actor_handle.handle_request_with_batched_tracking
+            user_ref = handle_request.remote(
+                self._tracking_id,
+                sequence_number,
+                pickle.dumps(query.metadata),
+                *query.args,
+                **query.kwargs,
+            )
+            self.in_flight_queries[replica].add(sequence_number)
+            if replica not in self.completion_refs:
+                self._wait_for_completed_requests(replica)
         else:
             # Directly passing args because it might contain an ObjectRef.
             tracker_ref, user_ref = replica.actor_handle.handle_request.remote(
@@ -274,30 +334,52 @@ class RoundRobinReplicaScheduler(ReplicaScheduler):
                 )
                 return self._assign_replica(query, replica)
 
-        for _ in range(len(self.in_flight_queries.keys())):
-            replica = next(self.replica_iterator)
+        replica = None
+        if self._prefer_local_routing:
+            replica = self._next_available_replica(
+                self.local_replica_iterator, self.num_local_replicas
+            )
+        if replica is None:
+            replica = self._next_available_replica(
+                self.replica_iterator, len(self.in_flight_queries)
+            )
+        if replica is None:
+            return None
+
+        if query.metadata.multiplexed_model_id:
+            # This query has a multiplexed model id, but the model is not
+            # loaded on this replica. Save this replica for future queries
+            # with the same model id.
+            self.multiplexed_replicas_table[query.metadata.multiplexed_model_id].append(
+                replica
+            )
+
+        logger.debug(
+            f"Assigned query {query.metadata.request_id} "
+            f"to replica {replica.replica_tag}."
+        )
+        return self._assign_replica(query, replica)
+
+    def _next_available_replica(
+        self, replica_iterator: Iterator[RunningReplicaInfo], num_replicas: int
+    ) -> Optional[RunningReplicaInfo]:
+        """Return the next replica of the cycle that isn't overloaded, if any."""
+        for _ in range(num_replicas):
+            replica = next(replica_iterator)
             if len(self.in_flight_queries[replica]) >= replica.max_concurrent_queries:
                 # This replica is overloaded, try next one
                 continue
-
-            if query.metadata.multiplexed_model_id:
-                # This query has a multiplexed model id, but the model is not
-                # loaded on this replica. Save this replica for future queries
-                # with the same model id.
-                self.multiplexed_replicas_table[
-                    query.metadata.multiplexed_model_id
-                ].append(replica)
-
-            logger.debug(
-                f"Assigned query {query.metadata.request_id} "
-                f"to replica {replica.replica_tag}."
-            )
-            return self._assign_replica(query, replica)
+            return replica
         return None
 
     @property
     def _all_query_refs(self):
-        return list(itertools.chain.from_iterable(self.in_flight_queries.values()))
+        refs = list(itertools.chain.from_iterable(self.in_flight_queries.values()))
+        if self._batched_request_tracking:
+            # Only the queries of Java replicas are tracked by their object refs.
+            refs = [ref for ref in refs if isinstance(ref, ray.ObjectRef)]
+            refs.extend(self.completion_refs.values())
+        return refs
 
     def _drain_completed_object_refs(self) -> int:
         refs = self._all_query_refs
@@ -305,13 +387,25 @@ class RoundRobinReplicaScheduler(ReplicaScheduler):
         # cause some blocking delay in the event loop. Consider moving this to async?
         done, _ = ray.wait(refs, num_returns=len(refs), timeout=0)
         replicas_to_remove = []
+        if self.completion_refs:
+            replicas_to_remove.extend(self._process_completed_requests(set(done)))
         for replica_info, replica_in_flight_queries in self.in_flight_queries.items():
             completed_queries = replica_in_flight_queries.intersection(done)
             if len(completed_queries):
                 try:
                     # NOTE(simon): this ray.get call should be cheap because all these
                     # refs are ready as indicated by previous `ray.wait` call.
-                    ray.get(list(completed_queries))
+                    queue_lens = ray.get(list(completed_queries))
+                    # Replicas report the number of their other queries with each
+                    # finished one (Java replicas are tracked by the result instead).
+                    if not replica_info.is_cross_language:
+                        num_remaining = len(replica_in_flight_queries) - len(
+                            completed_queries
+                        )
+                        self.other_queries[replica_info] = (
+                            max(min(queue_lens) - num_remaining, 0),
+                            time.time(),
+                        )
                 except RayActorError:
                     logger.debug(
                         f"Removing {replica_info.replica_tag} from replica set "
@@ -331,10 +425,56 @@ class RoundRobinReplicaScheduler(ReplicaScheduler):
         if len(replicas_to_remove) > 0:
             for replica_info in replicas_to_remove:
                 self.in_flight_queries.pop(replica_info, None)
+                self.other_queries.pop(replica_info, None)
+                self.completion_refs.pop(replica_info, None)
             self._reset_replica_iterator()
 
         return len(done)
 
+    def _process_completed_requests(
+        self, done: Set[ray.ObjectRef]
+    ) -> List[RunningReplicaInfo]:
+        """Remove the queries reported by the completed `wait_for_completed_requests`
+        calls from the in flight queries, and return the replicas that exited.
+        """
+        exited_replicas = []
+        for replica_info, completion_ref in list(self.completion_refs.items()):
+            if completion_ref not in done:
+                continue
+            del self.completion_refs[replica_info]
+            try:
+                completed_queries, num_ongoing_requests = ray.get(completion_ref)
+            except RayActorError:
+                logger.debug(
+                    f"Removing {replica_info.replica_tag} from replica set "
+                    "because the actor exited."
+                )
+                exited_replicas.append(replica_info)
+                continue
+            except Exception:
+                logger.exception(
+                    "Handle received unexpected error when waiting for requests."
+                )
+                completed_queries, num_ongoing_requests = [], 0
+
+            replica_in_flight_queries = self.in_flight_queries.get(replica_info)
+            if replica_in_flight_queries is None:
+                continue
+            replica_in_flight_queries.difference_update(completed_queries)
+            self.other_queries[replica_info] = (
+                max(num_ongoing_requests - len(replica_in_flight_queries), 0),
+                time.time(),
+            )
+            if len(replica_in_flight_queries) > 0:
+                self._wait_for_completed_requests(replica_info)
+        return exited_replicas
+
+    def _wait_for_completed_requests(self, replica: RunningReplicaInfo):
+        actor_handle = replica.actor_handle
+        self.completion_refs[replica] = actor_handle.wait_for_completed_requests.remote(
+            self._tracking_id
+        )
+
     async def assign_replica(self, query: Query) -> ray.ObjectRef:
         """Given a query, submit it to a replica and return the object ref.
         This method will keep track of the in flight queries for each replicas
@@ -367,6 +507,72 @@ class RoundRobinReplicaScheduler(ReplicaScheduler):
         return assigned_ref
 
 
+class PowerOfTwoChoicesReplicaScheduler(RoundRobinReplicaScheduler):
+    """Sends each query to the less loaded of two randomly sampled replicas.
+
+    The load of a replica is the number of in flight queries of this handle plus the
+    number of queries of other handles that the replica last reported. That report
+    is only refreshed when a query of this handle finishes on the replica, so it's
+    ignored after `RAY_SERVE_REPLICA_LOAD_REPORT_TIMEOUT_S` seconds. Ties are
+    broken in favor of replicas on the same node as the handle. Like the round robin
+    policy, it respects `max_concurrent_queries`, prefers replicas that have the
+    query's multiplexed model loaded and, if `prefer_local_routing` is set, only
+    samples remote replicas when the local ones are overloaded.
+    """
+
+    def _replica_load(self, replica: RunningReplicaInfo) -> int:
+        load = len(self.in_flight_queries[replica])
+        if replica in self.other_queries:
+            num_other_queries, reported_at = self.other_queries[replica]
+            if time.time() - reported_at < RAY_SERVE_REPLICA_LOAD_REPORT_TIMEOUT_S:
+                load += num_other_queries
+        return load
+
+    def _choose_replica(
+        self, replicas: List[RunningReplicaInfo]
+    ) -> Optional[RunningReplicaInfo]:
+        """Choose the less loaded of two of the replicas that aren't overloaded."""
+        available = [
+            replica
+            for replica in replicas
+            if len(self.in_flight_queries[replica]) < replica.max_concurrent_queries
+        ]
+        if not available:
+            return None
+        return min(
+            random.sample(available, min(len(available), 2)),
+            key=lambda replica: (
+                self._replica_load(replica),
+                replica.node_id != self._node_id,
+            ),
+        )
+
+    def _try_assign_replica(self, query: Query) -> Optional[ray.ObjectRef]:
+        model_id = query.metadata.multiplexed_model_id
+        if model_id and model_id in self.multiplexed_replicas_table:
+            replica = self._choose_replica(self.multiplexed_replicas_table[model_id])
+            if replica is not None:
+                return self._assign_replica(query, replica)
+
+        replica = None
+        if self._prefer_local_routing:
+            replica = self._choose_replica(
+                [
+                    replica
+                    for replica in self.in_flight_queries
+                    if replica.node_id == self._node_id
+                ]
+            )
+        if replica is None:
+            replica = self._choose_replica(list(self.in_flight_queries.keys()))
+        if replica is None:
+            return None
+        if model_id:
+            # Save this replica for future queries with the same model id.
+            self.multiplexed_replicas_table[model_id].append(replica)
+        return self._assign_replica(query, replica)
+
+
 class Router:
     def __init__(
         self,
@@ -383,8 +589,14 @@ class Router:
         self._event_loop = event_loop
         if _stream:
             self._replica_scheduler = RoundRobinStreamingReplicaScheduler()
+        elif RAY_SERVE_REPLICA_SCHEDULER == "power_of_two_choices":
+            self._replica_scheduler = PowerOfTwoChoicesReplicaScheduler(
+                event_loop, RAY_SERVE_BATCHED_REQUEST_TRACKING
+            )
         else:
-            self._replica_scheduler = RoundRobinReplicaScheduler(event_loop)
+            self._replica_scheduler = RoundRobinReplicaScheduler(
+                event_loop, RAY_SERVE_BATCHED_REQUEST_TRACKING
+            )
 
         # -- Metrics Registration -- #
         self.num_router_requests = metrics.Counter(
@@ -73,6 +73,8 @@ class DeploymentVersion:
         return (
             self.deployment_config.max_concurrent_queries
             != new_version.deployment_config.max_concurrent_queries
+            or self.deployment_config.prefer_local_routing
+            != new_version.deployment_config.prefer_local_routing
         )
 
     def compute_hashes(self):
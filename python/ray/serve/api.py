@@ -254,6 +254,7 @@ def deployment(
     graceful_shutdown_timeout_s: Default[float] = DEFAULT.VALUE,
     health_check_period_s: Default[float] = DEFAULT.VALUE,
     health_check_timeout_s: Default[float] = DEFAULT.VALUE,
+    prefer_local_routing: Default[bool] = DEFAULT.VALUE,
     is_driver_deployment: Optional[bool] = DEFAULT.VALUE,
 ) -> Callable[[Callable], Deployment]:
     """Decorator that converts a Python class to a `Deployment`.
@@ -301,6 +302,10 @@ def deployment(
             no more work to be done before shutting down.
         graceful_shutdown_timeout_s: Duration that a replica can be gracefully shutting
             down before being forcefully killed.
+        prefer_local_routing: Whether handles and HTTP proxies send requests to the
+            replicas on their own node first, and to replicas on other nodes only
+            when the local ones are at `max_concurrent_queries`. This saves the
+            cross-node transfer of the arguments and results. Defaults to False.
         is_driver_deployment: [EXPERIMENTAL] when set, exactly one replica of this
             deployment runs on every node (like a daemon set).
 
@@ -350,6 +355,7 @@ def deployment(
         graceful_shutdown_timeout_s=graceful_shutdown_timeout_s,
         health_check_period_s=health_check_period_s,
         health_check_timeout_s=health_check_timeout_s,
+        prefer_local_routing=prefer_local_routing,
     )
     config.user_configured_option_names = set(user_configured_option_names)
 
@@ -1,3 +1,4 @@
+import math
 import time
 import asyncio
 from functools import wraps
@@ -17,6 +18,7 @@ from typing import (
 )
 
 from ray.util.annotations import PublicAPI
+from ray.serve import metrics
 from ray.serve.exceptions import RayServeException
 from ray._private.utils import get_or_create_event_loop
 from ray.serve._private.utils import extract_self_if_method_call
@@ -61,12 +63,137 @@ def _batch_args_kwargs(
     return recover_args(batched_flattened_args)
 
 
+class _AdaptiveBatchSizer:
+    """Tunes the batch size and timeout of a batch queue to meet a target latency.
+
+    The execution time of a batch of size b is modeled as `overhead + b * per_item`,
+    fitted by exponentially weighted least squares on the measured batches, and the
+    requests are assumed to arrive at the rate given by the exponentially weighted
+    mean interval between them. The batch size is the largest one (up to
+    `max_batch_size`) whose expected time to fill plus execution time is within the
+    target latency, and the timeout is its expected time to fill. So under low load
+    batches are sent right away, and under high load they grow as large as the target
+    latency allows. Batches also take all of the queued requests (up to
+    `max_batch_size`), so that a backlog is drained, and while all the measured
+    batches have the same size, a larger size is probed, since the fit can't tell the
+    overhead from the per-item time.
+    """
+
+    def __init__(
+        self,
+        target_latency_s: float,
+        max_batch_size: int,
+        initial_timeout_s: float,
+        decay: float = 0.9,
+    ):
+        self.target_latency_s = target_latency_s
+        self.max_batch_size = max_batch_size
+        self.initial_timeout_s = initial_timeout_s
+        self.decay = decay
+
+        self._last_arrival_time: Optional[float] = None
+        self._mean_interval_s: Optional[float] = None
+        # Exponentially weighted sums of the weights, batch sizes, latencies and
+        # their products, for the least squares fit.
+        self._sum_w = 0.0
+        self._sum_b = 0.0
+        self._sum_t = 0.0
+        self._sum_bb = 0.0
+        self._sum_bt = 0.0
+
+    def record_arrival(self, arrival_time: float):
+        if self._last_arrival_time is not None:
+            interval_s = max(arrival_time - self._last_arrival_time, 0)
+            if self._mean_interval_s is None:
+                self._mean_interval_s = interval_s
+            else:
+                self._mean_interval_s = (
+                    self.decay * self._mean_interval_s + (1 - self.decay) * interval_s
+                )
+        self._last_arrival_time = arrival_time
+
+    def record_batch(self, batch_size: int, latency_s: float):
+        d = self.decay
+        self._sum_w = d * self._sum_w + 1
+        self._sum_b = d * self._sum_b + batch_size
+        self._sum_t = d * self._sum_t + latency_s
+        self._sum_bb = d * self._sum_bb + batch_size * batch_size
+        self._sum_bt = d * self._sum_bt + batch_size * latency_s
+
+    def get_batch_size_and_timeout(self, num_queued: int = 0) -> Tuple[int, float]:
+        """Return the batch size and timeout for the next batch.
+
+        Args:
+            num_queued: the number of requests that are already queued, which don't
+                need to be waited for.
+        """
+        if self._sum_w == 0:
+            # Use the maximum batch size until there's a measurement.
+            return self.max_batch_size, self.initial_timeout_s
+
+        fit = self._fit()
+        if fit is None:
+            # All the batches had about the same size, so the overhead can't be told
+            # apart from the per-item time. Assume that the execution time is
+            # proportional to the size, but probe a larger size if enough requests
+            # are queued, so that the next fits can tell them apart.
+            overhead_s, per_item_s = 0.0, self._sum_t / self._sum_b
+            min_batch_size = round(self._sum_b / self._sum_w) + 1
+        else:
+            overhead_s, per_item_s = fit
+            min_batch_size = 1
+
+        interval_s = self._mean_interval_s
+        if interval_s is None:
+            # Only a single request arrived so far.
+            interval_s = float("inf")
+        # Solve (b - q) * interval_s + overhead_s + b * per_item_s <= target for b,
+        # where q is the number of queued requests (at least the first one).
+        num_ready = max(num_queued, 1)
+        denominator = interval_s + per_item_s
+        if denominator == 0:
+            target_batch_size = self.max_batch_size
+        elif math.isinf(denominator):
+            target_batch_size = 1
+        else:
+            target_batch_size = int(
+                (self.target_latency_s - overhead_s + num_ready * interval_s)
+                / denominator
+            )
+        target_batch_size = min(max(target_batch_size, 1), self.max_batch_size)
+        # Only wait for the requests of the batch size that meets the target, but
+        # take up to the probed size and the whole backlog if they're queued, since
+        # the queued requests would only wait longer for the next batch.
+        batch_size = max(target_batch_size, min_batch_size, num_queued)
+        batch_size = min(batch_size, self.max_batch_size)
+        if target_batch_size <= num_ready:
+            timeout_s = 0.0
+        else:
+            timeout_s = (target_batch_size - num_ready) * interval_s
+        return batch_size, timeout_s
+
+    def _fit(self) -> Optional[Tuple[float, float]]:
+        """Return the fitted overhead and per-item execution time, or None if the
+        batches had about the same size.
+        """
+        denominator = self._sum_w * self._sum_bb - self._sum_b * self._sum_b
+        if denominator <= 1e-9 * self._sum_w * self._sum_bb:
+            return None
+        per_item_s = (
+            self._sum_w * self._sum_bt - self._sum_b * self._sum_t
+        ) / denominator
+        per_item_s = max(per_item_s, 0.0)
+        overhead_s = max((self._sum_t - per_item_s * self._sum_b) / self._sum_w, 0.0)
+        return overhead_s, per_item_s
+
+
 class _BatchQueue:
     def __init__(
         self,
         max_batch_size: int,
         timeout_s: float,
         handle_batch_func: Optional[Callable] = None,
+        target_latency_s: Optional[float] = None,
     ) -> None:
         """Async queue that accepts individual items and returns batches.
 
@@ -83,12 +210,36 @@ class _BatchQueue:
                 batch.
             handle_batch_func(Optional[Callable]): callback to run in the
                 background to handle batches if provided.
+            target_latency_s: if provided, max_batch_size and timeout_s are
+                tuned after each batch to meet this latency, with max_batch_size
+                as the upper bound (see _AdaptiveBatchSizer).
         """
         self.queue: asyncio.Queue[_SingleRequest] = asyncio.Queue()
         self.full_batch_event = asyncio.Event()
         self.max_batch_size = max_batch_size
         self.timeout_s = timeout_s
 
+        self._batch_sizer = None
+        if target_latency_s is not None:
+            self._batch_sizer = _AdaptiveBatchSizer(
+                target_latency_s, max_batch_size, timeout_s
+            )
+            function_name = getattr(handle_batch_func, "__name__", "")
+            self.batch_size_gauge = metrics.Gauge(
+                "serve_adaptive_batch_size",
+                description="The current batch size of an adaptive @serve.batch.",
+                tag_keys=("function",),
+            )
+            self.batch_size_gauge.set_default_tags({"function": function_name})
+            self.batch_wait_timeout_gauge = metrics.Gauge(
+                "serve_adaptive_batch_wait_timeout_s",
+                description=(
+                    "The current batch wait timeout of an adaptive @serve.batch."
+                ),
+                tag_keys=("function",),
+            )
+            self.batch_wait_timeout_gauge.set_default_tags({"function": function_name})
+
         self._handle_batch_task = None
         if handle_batch_func is not None:
             self._handle_batch_task = get_or_create_event_loop().create_task(
@@ -96,10 +247,24 @@ class _BatchQueue:
             )
 
     def put(self, request: Tuple[_SingleRequest, asyncio.Future]) -> None:
+        if self._batch_sizer is not None:
+            self._batch_sizer.record_arrival(time.time())
         self.queue.put_nowait(request)
         # Signal when the full batch is ready. The event will be reset
         # in wait_for_batch.
-        if self.queue.qsize() == self.max_batch_size:
+        if self.queue.qsize() >= self.max_batch_size:
+            self.full_batch_event.set()
+
+    def _record_batch(self, batch_size: int, latency_s: float) -> None:
+        """Tune the batch size and timeout with the latency of a batch."""
+        self._batch_sizer.record_batch(batch_size, latency_s)
+        batch_size, timeout_s = self._batch_sizer.get_batch_size_and_timeout(
+            self.queue.qsize()
+        )
+        self.max_batch_size, self.timeout_s = batch_size, timeout_s
+        self.batch_size_gauge.set(self.max_batch_size)
+        self.batch_wait_timeout_gauge.set(self.timeout_s)
+        if self.queue.qsize() >= self.max_batch_size:
             self.full_batch_event.set()
 
     async def wait_for_batch(self) -> List[Any]:
@@ -196,6 +361,7 @@ class _BatchQueue:
             self_arg = batch[0].self_arg
             args, kwargs = _batch_args_kwargs([item.flattened_args for item in batch])
             futures = [item.future for item in batch]
+            start_time = time.time()
 
             # Method call.
             if self_arg is not None:
@@ -218,6 +384,9 @@ class _BatchQueue:
                     for future in futures:
                         future.set_exception(e)
 
+            if self._batch_sizer is not None:
+                self._record_batch(len(batch), time.time() - start_time)
+
     def __del__(self):
         if (
             self._handle_batch_task is None
@@ -246,7 +415,9 @@ def batch(func: F) -> G:
 # "Decorator factory" use case (called with arguments).
 @overload
 def batch(
-    max_batch_size: int = 10, batch_wait_timeout_s: float = 0.0
+    max_batch_size: int = 10,
+    batch_wait_timeout_s: float = 0.0,
+    target_batch_latency_s: Optional[float] = None,
 ) -> Callable[[F], G]:
     pass
 
@@ -256,6 +427,7 @@ def batch(
     _func: Optional[Callable] = None,
     max_batch_size: int = 10,
     batch_wait_timeout_s: float = 0.0,
+    target_batch_latency_s: Optional[float] = None,
 ):
     """Converts a function to asynchronously handle batches.
 
@@ -290,11 +462,24 @@ def batch(
 
             app = BatchedDeployment.bind()
 
+    If `target_batch_latency_s` is set, the batch size and wait timeout are
+    instead tuned after each batch, using the measured execution times of the
+    batches and the arrival rate of the requests. The batches are made as large
+    as possible (up to `max_batch_size`) while the expected time that the first
+    request of a batch waits for it to fill up, plus the expected execution time
+    of the batch, stays within the target. The current batch size and timeout of
+    each replica are reported by the `serve_adaptive_batch_size` and
+    `serve_adaptive_batch_wait_timeout_s` metrics.
+
     Arguments:
         max_batch_size: the maximum batch size that will be executed in
             one call to the underlying function.
         batch_wait_timeout_s: the maximum duration to wait for
-            `max_batch_size` elements before running the current batch.
+            `max_batch_size` elements before running the current batch. With
+            `target_batch_latency_s`, this is only used for the first batch.
+        target_batch_latency_s: if set, the target latency of the requests in
+            seconds, from their arrival to the end of the execution of their
+            batch, to which the batch size and wait timeout are tuned.
     """
     # `_func` will be None in the case when the decorator is parametrized.
     # See the comment at the end of this function for a detailed explanation.
@@ -322,6 +507,13 @@ def batch(
     if batch_wait_timeout_s < 0:
         raise ValueError("batch_wait_timeout_s must be a float >= 0")
 
+    if target_batch_latency_s is not None:
+        if not isinstance(target_batch_latency_s, (float, int)):
+            raise TypeError("target_batch_latency_s must be a float > 0")
+
+        if target_batch_latency_s <= 0:
+            raise ValueError("target_batch_latency_s must be a float > 0")
+
     def _batch_decorator(_func):
         async def batch_handler_generator(
             first_future: asyncio.Future,
@@ -357,7 +549,12 @@ def batch(
             # runs, we just get a reference to the attribute.
             batch_queue_attr = f"__serve_batch_queue_{_func.__name__}"
             if not hasattr(batch_queue_object, batch_queue_attr):
-                batch_queue = _BatchQueue(max_batch_size, batch_wait_timeout_s, _func)
+                batch_queue = _BatchQueue(
+                    max_batch_size,
+                    batch_wait_timeout_s,
+                    _func,
+                    target_batch_latency_s,
+                )
                 setattr(batch_queue_object, batch_queue_attr, batch_queue)
             else:
                 batch_queue = getattr(batch_queue_object, batch_queue_attr)
@@ -139,6 +139,10 @@ class DeploymentConfig(BaseModel):
         health_check_timeout_s (Optional[float]):
             Timeout that the controller will wait for a response from the
             replica's health check before marking it unhealthy.
+        prefer_local_routing (bool):
+            Whether handles and HTTP proxies send requests to the replicas on
+            their own node, and only to other replicas when the local ones are
+            at max_concurrent_queries.
         user_configured_option_names (Set[str]):
             The names of options manually configured by the user.
     """
@@ -175,6 +179,10 @@ class DeploymentConfig(BaseModel):
         default=None, update_type=DeploymentOptionUpdateType.LightWeight
     )
 
+    prefer_local_routing: bool = Field(
+        default=False, update_type=DeploymentOptionUpdateType.NeedsReconfigure
+    )
+
     # This flag is used to let replica know they are deplyed from
     # a different language.
     is_cross_language: bool = False
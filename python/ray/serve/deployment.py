@@ -410,6 +410,7 @@ class Deployment:
         graceful_shutdown_timeout_s: Default[float] = DEFAULT.VALUE,
         health_check_period_s: Default[float] = DEFAULT.VALUE,
         health_check_timeout_s: Default[float] = DEFAULT.VALUE,
+        prefer_local_routing: Default[bool] = DEFAULT.VALUE,
         is_driver_deployment: bool = DEFAULT.VALUE,
         _internal: bool = False,
     ) -> "Deployment":
@@ -499,6 +500,9 @@ class Deployment:
         if health_check_timeout_s is not DEFAULT.VALUE:
             new_config.health_check_timeout_s = health_check_timeout_s
 
+        if prefer_local_routing is not DEFAULT.VALUE:
+            new_config.prefer_local_routing = prefer_local_routing
+
         if is_driver_deployment is DEFAULT.VALUE:
             is_driver_deployment = self._is_driver_deployment
 
@@ -535,6 +539,7 @@ class Deployment:
         graceful_shutdown_timeout_s: Default[float] = DEFAULT.VALUE,
         health_check_period_s: Default[float] = DEFAULT.VALUE,
         health_check_timeout_s: Default[float] = DEFAULT.VALUE,
+        prefer_local_routing: Default[bool] = DEFAULT.VALUE,
         is_driver_deployment: bool = DEFAULT.VALUE,
         _internal: bool = False,
     ) -> None:
@@ -563,6 +568,7 @@ class Deployment:
             graceful_shutdown_timeout_s=graceful_shutdown_timeout_s,
             health_check_period_s=health_check_period_s,
             health_check_timeout_s=health_check_timeout_s,
+            prefer_local_routing=prefer_local_routing,
             _internal=_internal,
             is_driver_deployment=is_driver_deployment,
         )
@@ -629,6 +635,7 @@ def deployment_to_schema(
         "graceful_shutdown_timeout_s": d._config.graceful_shutdown_timeout_s,
         "health_check_period_s": d._config.health_check_period_s,
         "health_check_timeout_s": d._config.health_check_timeout_s,
+        "prefer_local_routing": d._config.prefer_local_routing,
         "ray_actor_options": ray_actor_options_schema,
         "is_driver_deployment": d._is_driver_deployment,
     }
@@ -679,6 +686,7 @@ def schema_to_deployment(s: DeploymentSchema) -> Deployment:
         graceful_shutdown_timeout_s=s.graceful_shutdown_timeout_s,
         health_check_period_s=s.health_check_period_s,
         health_check_timeout_s=s.health_check_timeout_s,
+        prefer_local_routing=s.prefer_local_routing,
     )
     config.user_configured_option_names = s.get_user_configured_option_names()
 
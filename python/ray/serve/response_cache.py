@@ -0,0 +1,265 @@
+import asyncio
+import hashlib
+import pickle
+import time
+from collections import OrderedDict
+from functools import wraps
+from inspect import isasyncgenfunction, iscoroutinefunction, isgeneratorfunction
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from ray.util.annotations import PublicAPI
+from ray.serve import metrics
+from ray.serve._private.utils import extract_self_if_method_call
+
+# Returned by `_ResponseCache.get` for missing and expired keys, since None can be a
+# cached response.
+_MISSING = object()
+
+
+class _ResponseCache:
+    """LRU cache of responses, whose entries can expire after a TTL.
+
+    This is used both for the results of methods decorated with
+    `@serve.response_cache` in replicas, and for the HTTP responses cached by the
+    HTTP proxy.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        # Maps the keys to the responses and their expiration times, from the least
+        # to the most recently used.
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:
+        """Return the response cached under the key, or _MISSING."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        response, expiration_time = entry
+        if time.monotonic() >= expiration_time:
+            del self._entries[key]
+            return _MISSING
+        self._entries.move_to_end(key)
+        return response
+
+    def put(self, key: Hashable, response: Any, ttl_s: Optional[float] = None):
+        """Cache the response under the key, evicting the least recently used one if
+        the cache is full.
+        """
+        expiration_time = float("inf") if ttl_s is None else time.monotonic() + ttl_s
+        self._entries[key] = (response, expiration_time)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+def _hash_args(args: Tuple[Any], kwargs: Dict[str, Any]) -> Optional[bytes]:
+    """Hash the arguments of a call by value, or return None if they can't be pickled.
+
+    The arguments are pickled rather than hashed with `hash()`, since most objects
+    are hashed by identity, which would never match another call.
+    """
+    try:
+        pickled_args = pickle.dumps((args, sorted(kwargs.items())))
+    except Exception:
+        return None
+    return hashlib.sha256(pickled_args).digest()
+
+
+class _ResponseCacheWrapper:
+    """Caches the results of a function or of the method of an object."""
+
+    def __init__(self, func: Callable, ttl_s: Optional[float], max_entries: int):
+        self._func = func
+        self._ttl_s = ttl_s
+        self._cache = _ResponseCache(max_entries)
+        # The pending calls of coroutine functions, so that concurrent calls with the
+        # same arguments wait for the first one instead of calling the function.
+        self._pending_calls: Dict[bytes, asyncio.Future] = dict()
+
+        self.hit_counter = metrics.Counter(
+            "serve_response_cache_hits",
+            description="The number of calls answered by the response cache.",
+            tag_keys=("method",),
+        )
+        self.hit_counter.set_default_tags({"method": func.__name__})
+        self.miss_counter = metrics.Counter(
+            "serve_response_cache_misses",
+            description=(
+                "The number of calls with cacheable arguments that weren't answered "
+                "by the response cache."
+            ),
+            tag_keys=("method",),
+        )
+        self.miss_counter.set_default_tags({"method": func.__name__})
+
+    def call(self, args: Tuple[Any], kwargs: Dict[str, Any]) -> Any:
+        key = _hash_args(args, kwargs)
+        if key is None:
+            return self._func(*args, **kwargs)
+
+        response = self._cache.get(key)
+        if response is not _MISSING:
+            self.hit_counter.inc()
+            return response
+
+        self.miss_counter.inc()
+        response = self._func(*args, **kwargs)
+        self._cache.put(key, response, self._ttl_s)
+        return response
+
+    async def call_async(self, args: Tuple[Any], kwargs: Dict[str, Any]) -> Any:
+        key = _hash_args(args, kwargs)
+        if key is None:
+            return await self._func(*args, **kwargs)
+
+        response = self._cache.get(key)
+        if response is not _MISSING:
+            self.hit_counter.inc()
+            return response
+        if key in self._pending_calls:
+            self.hit_counter.inc()
+            return await asyncio.shield(self._pending_calls[key])
+
+        self.miss_counter.inc()
+        future = asyncio.get_running_loop().create_future()
+        self._pending_calls[key] = future
+        try:
+            response = await self._func(*args, **kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            # Don't cache errors, but pass them on to the concurrent calls.
+            future.set_exception(e)
+            # Mark the exception as retrieved in case there are no concurrent calls.
+            future.exception()
+            raise
+        else:
+            self._cache.put(key, response, self._ttl_s)
+            future.set_result(response)
+            return response
+        finally:
+            del self._pending_calls[key]
+
+
+@PublicAPI(stability="alpha")
+def response_cache(
+    _func: Optional[Callable] = None,
+    ttl_s: Optional[float] = None,
+    max_entries: int = 1024,
+):
+    """Caches the results of a function or method of a deployment by its arguments.
+
+    Calls with the same arguments as a previous call return its result without
+    calling the function, until the result expires after `ttl_s` or is evicted in
+    least recently used order to keep at most `max_entries` results. The arguments
+    are compared by value, by hashing their pickled bytes, so calls with arguments
+    that can't be pickled (e.g., a starlette `Request`) are never cached. For async
+    functions, concurrent calls with the same arguments share a single call.
+
+    Only use this for idempotent functions whose results don't depend on anything
+    but their arguments. Note that the cached results are shared by all of the
+    calls, so they shouldn't be modified by the callers.
+
+    The number of hits and misses of the cache on each replica are reported by the
+    `serve_response_cache_hits` and `serve_response_cache_misses` metrics.
+
+    HTTP responses can also be cached by the HTTP proxies, before they reach the
+    replicas: if the `RAY_SERVE_HTTP_PROXY_RESPONSE_CACHE_MAX_ENTRIES` env var is
+    set, the proxies cache the responses with a `Cache-Control: max-age=<seconds>`
+    header by their method, path, query string and body. Requests with an
+    `Authorization` or `Cookie` header only share the responses that are also marked
+    `public`, and responses with a `Vary` header aren't cached.
+
+    Example:
+
+    .. code-block:: python
+
+            from ray import serve
+
+            @serve.deployment
+            class CachedDeployment:
+                @serve.response_cache(ttl_s=60, max_entries=10000)
+                async def predict(self, text: str) -> str:
+                    return await self.model(text)
+
+    Arguments:
+        ttl_s: the number of seconds after which a cached result expires. By
+            default, results don't expire.
+        max_entries: the maximum number of results cached on each replica.
+    """
+    if _func is not None:
+        if not callable(_func):
+            raise TypeError(
+                "@serve.response_cache can only be used to decorate functions or "
+                "methods."
+            )
+
+        if isasyncgenfunction(_func) or isgeneratorfunction(_func):
+            raise TypeError(
+                "@serve.response_cache can't be used to decorate generators."
+            )
+
+    if ttl_s is not None:
+        if not isinstance(ttl_s, (float, int)):
+            raise TypeError("ttl_s must be a float > 0")
+        if ttl_s <= 0:
+            raise ValueError("ttl_s must be a float > 0")
+
+    if not isinstance(max_entries, int):
+        raise TypeError("max_entries must be an integer >= 1")
+
+    if max_entries < 1:
+        raise ValueError("max_entries must be an integer >= 1")
+
+    def _response_cache_decorator(_func):
+        def get_wrapper(
+            args: Tuple[Any],
+        ) -> Tuple[_ResponseCacheWrapper, Tuple[Any]]:
+            """Return the cache of the function or object, and the cached args."""
+            self = extract_self_if_method_call(args, _func)
+            if self is None:
+                # For functions, inject the cache as an attribute of the function.
+                cache_object = _func
+            else:
+                # For methods, inject the cache as an attribute of the object, and
+                # leave the object out of the cache keys.
+                cache_object = self
+
+            cache_attr = f"__serve_response_cache_{_func.__name__}"
+            if not hasattr(cache_object, cache_attr):
+                wrapper = _ResponseCacheWrapper(
+                    _func if self is None else _func.__get__(self), ttl_s, max_entries
+                )
+                setattr(cache_object, cache_attr, wrapper)
+            else:
+                wrapper = getattr(cache_object, cache_attr)
+            return wrapper, args if self is None else args[1:]
+
+        @wraps(_func)
+        def response_cache_wrapper(*args, **kwargs):
+            wrapper, args = get_wrapper(args)
+            return wrapper.call(args, kwargs)
+
+        @wraps(_func)
+        async def async_response_cache_wrapper(*args, **kwargs):
+            wrapper, args = get_wrapper(args)
+            return await wrapper.call_async(args, kwargs)
+
+        if iscoroutinefunction(_func):
+            return async_response_cache_wrapper
+        else:
+            return response_cache_wrapper
+
+    # Like `serve.batch`, this handles both non-parametrized
+    # (@serve.response_cache) and parametrized (@serve.response_cache(**kwargs))
+    # usage.
+    return (
+        _response_cache_decorator(_func)
+        if callable(_func)
+        else _response_cache_decorator
+    )
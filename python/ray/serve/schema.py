@@ -228,6 +228,14 @@ class DeploymentSchema(
         ),
         gt=0,
     )
+    prefer_local_routing: bool = Field(
+        default=DEFAULT.VALUE,
+        description=(
+            "Whether to send requests to the replicas on the same node as the "
+            "handle or HTTP proxy first, and to replicas on other nodes only when "
+            "the local ones are at max_concurrent_queries. Defaults to false."
+        ),
+    )
     ray_actor_options: RayActorOptionsSchema = Field(
         default=DEFAULT.VALUE, description="Options set for each replica actor."
     )
@@ -283,6 +291,7 @@ def _deployment_info_to_schema(name: str, info: DeploymentInfo) -> DeploymentSch
         graceful_shutdown_timeout_s=info.deployment_config.graceful_shutdown_timeout_s,
         health_check_period_s=info.deployment_config.health_check_period_s,
         health_check_timeout_s=info.deployment_config.health_check_timeout_s,
+        prefer_local_routing=info.deployment_config.prefer_local_routing,
         ray_actor_options=info.replica_config.ray_actor_options,
         is_driver_deployment=info.is_driver_deployment,
     )
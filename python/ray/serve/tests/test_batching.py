@@ -8,6 +8,7 @@ from concurrent.futures.thread import ThreadPoolExecutor
 
 import ray
 from ray import serve
+from ray.serve.batching import _AdaptiveBatchSizer
 from ray.serve.exceptions import RayServeException
 from ray._private.utils import get_or_create_event_loop
 
@@ -137,6 +138,18 @@ async def test_decorator_validation():
             async def method(self, requests):
                 pass
 
+    class TargetLatency:
+        @serve.batch(max_batch_size=10, target_batch_latency_s=0.1)
+        async def method(self, requests):
+            pass
+
+    with pytest.raises(ValueError):
+
+        class ZeroTargetLatency:
+            @serve.batch(target_batch_latency_s=0)
+            async def method(self, requests):
+                pass
+
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize("use_class", [True, False])
@@ -403,6 +416,71 @@ async def test_batch_generator_streaming_response_integration_test(serve_instanc
         assert response.text == "".join([prompt_prefix + str(idx)] * NUM_YIELDS)
 
 
+def test_adaptive_batch_sizer():
+    sizer = _AdaptiveBatchSizer(
+        target_latency_s=0.05, max_batch_size=64, initial_timeout_s=0.5
+    )
+    # The configured values are used until a batch is measured.
+    assert sizer.get_batch_size_and_timeout() == (64, 0.5)
+
+    # Under high load, the batches are as large as the target latency allows:
+    # (b - 1) * 1ms to fill the batch + 10ms + b * 2ms to execute it <= 50ms.
+    for i in range(100):
+        sizer.record_arrival(i * 0.001)
+    for batch_size in [64, 10, 20, 5]:
+        sizer.record_batch(batch_size, 0.01 + 0.002 * batch_size)
+    batch_size, timeout_s = sizer.get_batch_size_and_timeout()
+    assert batch_size == 13
+    assert timeout_s == pytest.approx(0.012)
+
+    # Under low load, the batches are sent right away.
+    for i in range(100):
+        sizer.record_arrival(1 + i * 10)
+    assert sizer.get_batch_size_and_timeout() == (1, 0)
+
+
+def test_adaptive_batch_sizer_cold_start():
+    sizer = _AdaptiveBatchSizer(
+        target_latency_s=0.1, max_batch_size=64, initial_timeout_s=0.01
+    )
+    # A lone first request under high load, taking 60ms + 1ms per request.
+    for i in range(100):
+        sizer.record_arrival(i * 0.001)
+    sizer.record_batch(1, 0.061)
+
+    # The overhead can't be told apart from the per-item time yet, so a larger size
+    # is probed, and the queued requests are all taken.
+    assert sizer.get_batch_size_and_timeout() == (2, 0)
+    assert sizer.get_batch_size_and_timeout(num_queued=50) == (50, 0)
+    assert sizer.get_batch_size_and_timeout(num_queued=100) == (64, 0)
+
+    # The batches then grow as large as the target latency allows:
+    # (b - 1) * 1ms to fill the batch + 60ms + b * 1ms to execute it <= 100ms.
+    for _ in range(10):
+        batch_size, _ = sizer.get_batch_size_and_timeout()
+        sizer.record_batch(batch_size, 0.06 + 0.001 * batch_size)
+    batch_size, timeout_s = sizer.get_batch_size_and_timeout()
+    assert batch_size == 20
+    assert timeout_s == pytest.approx(0.019)
+
+
+def test_adaptive_batching(serve_instance):
+    @serve.deployment
+    class AdaptiveBatching:
+        @serve.batch(max_batch_size=32, target_batch_latency_s=0.5)
+        async def handle_batch(self, requests):
+            await asyncio.sleep(0.01)
+            return [(request, len(requests)) for request in requests]
+
+        async def __call__(self, request):
+            return await self.handle_batch(request)
+
+    handle = serve.run(AdaptiveBatching.bind())
+    results = ray.get([handle.remote(i) for i in range(100)])
+    assert [result for result, _ in results] == list(range(100))
+    assert max(batch_size for _, batch_size in results) > 1
+
+
 if __name__ == "__main__":
     import sys
 
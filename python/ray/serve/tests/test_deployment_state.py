@@ -119,6 +119,10 @@ class MockReplicaActorWrapper:
     def max_concurrent_queries(self) -> int:
         return 100
 
+    @property
+    def prefer_local_routing(self) -> bool:
+        return False
+
     @property
     def pid(self) -> Optional[int]:
         return None
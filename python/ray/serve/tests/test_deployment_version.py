@@ -150,6 +150,20 @@ def test_max_concurrent_queries():
     assert hash(v1) != hash(v3)
 
 
+def test_prefer_local_routing():
+    v1 = DeploymentVersion("1", DeploymentConfig(prefer_local_routing=False), {})
+    v2 = DeploymentVersion("1", DeploymentConfig(prefer_local_routing=False), {})
+    v3 = DeploymentVersion("1", DeploymentConfig(prefer_local_routing=True), {})
+
+    assert v1 == v2
+    assert hash(v1) == hash(v2)
+    assert v1 != v3
+    assert hash(v1) != hash(v3)
+    # The handles get the option with the running replicas.
+    assert v1.requires_long_poll_broadcast(v3)
+    assert not v1.requires_actor_reconfigure(v3)
+
+
 def test_health_check_period_s():
     v1 = DeploymentVersion("1", DeploymentConfig(health_check_period_s=5), {})
     v2 = DeploymentVersion("1", DeploymentConfig(health_check_period_s=5), {})
@@ -0,0 +1,198 @@
+import asyncio
+import sys
+
+import pytest
+import requests
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+
+import ray
+from ray import serve
+from ray.serve.response_cache import _MISSING, _ResponseCache
+
+
+def test_lru_and_ttl(monkeypatch):
+    now = 0
+    monkeypatch.setattr("ray.serve.response_cache.time.monotonic", lambda: now)
+
+    cache = _ResponseCache(max_entries=2)
+    cache.put("a", 1, ttl_s=10)
+    cache.put("b", None)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") is _MISSING
+
+    # "a" is more recently used than "b", so "b" is evicted.
+    cache.get("a")
+    cache.put("c", 3)
+    assert cache.get("b") is _MISSING
+    assert len(cache) == 2
+
+    # "a" expires, while "c" doesn't have a TTL.
+    now = 10
+    assert cache.get("a") is _MISSING
+    assert cache.get("c") == 3
+    assert len(cache) == 1
+
+
+def test_decorator_validation():
+    @serve.response_cache
+    async def function():
+        pass
+
+    @serve.response_cache(ttl_s=1, max_entries=10)
+    async def function2():
+        pass
+
+    with pytest.raises(TypeError, match="generators"):
+
+        @serve.response_cache
+        async def generator():
+            yield
+
+    with pytest.raises(ValueError):
+
+        @serve.response_cache(ttl_s=0)
+        async def function3():
+            pass
+
+    with pytest.raises(ValueError):
+
+        @serve.response_cache(max_entries=0)
+        async def function4():
+            pass
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_response_cache(serve_instance, use_async):
+    @serve.deployment
+    class Model:
+        def __init__(self):
+            self.num_calls = 0
+
+        if use_async:
+
+            @serve.response_cache(max_entries=2)
+            async def predict(self, x, scale=1):
+                self.num_calls += 1
+                return x * scale
+
+        else:
+
+            @serve.response_cache(max_entries=2)
+            def predict(self, x, scale=1):
+                self.num_calls += 1
+                return x * scale
+
+        async def __call__(self, x, scale=1):
+            result = self.predict(x, scale=scale)
+            if use_async:
+                result = await result
+            return result, self.num_calls
+
+    handle = serve.run(Model.bind())
+    assert ray.get(handle.remote(2)) == (2, 1)
+    assert ray.get(handle.remote(2)) == (2, 1)
+    assert ray.get(handle.remote(2, scale=3)) == (6, 2)
+    assert ray.get(handle.remote([1, 2])) == ([1, 2], 3)
+
+    # The least recently used result was evicted.
+    assert ray.get(handle.remote(2)) == (2, 4)
+
+
+def test_concurrent_calls(serve_instance):
+    num_calls = 0
+
+    @serve.response_cache
+    async def predict(x):
+        nonlocal num_calls
+        num_calls += 1
+        await asyncio.sleep(0.1)
+        if x < 0:
+            raise ValueError("negative")
+        return x
+
+    async def run():
+        # Concurrent calls with the same arguments share the first call.
+        assert await asyncio.gather(*[predict(1) for _ in range(5)]) == [1] * 5
+        assert num_calls == 1
+
+        # Errors aren't cached.
+        for _ in range(2):
+            results = await asyncio.gather(
+                *[predict(-1) for _ in range(2)], return_exceptions=True
+            )
+            assert all(isinstance(result, ValueError) for result in results)
+        assert num_calls == 3
+
+    asyncio.run(run())
+
+
+@pytest.fixture
+def serve_with_http_response_cache(monkeypatch):
+    # The env var must be set before Ray starts, so that the HTTP proxy inherits it.
+    serve.shutdown()
+    ray.shutdown()
+    monkeypatch.setenv("RAY_SERVE_HTTP_PROXY_RESPONSE_CACHE_MAX_ENTRIES", "10")
+    ray.init()
+    serve.start()
+    yield
+    serve.shutdown()
+    ray.shutdown()
+
+
+def test_http_proxy_response_cache(serve_with_http_response_cache):
+    @serve.deployment
+    class Model:
+        def __init__(self):
+            self.num_calls = 0
+
+        async def __call__(self, request: Request):
+            self.num_calls += 1
+            headers = {}
+            cache = request.query_params.get("cache")
+            if cache == "public":
+                headers["Cache-Control"] = "public, max-age=60"
+            elif cache == "default":
+                headers["Cache-Control"] = "max-age=60"
+            elif cache == "vary":
+                headers["Cache-Control"] = "public, max-age=60"
+                headers["Vary"] = "Accept-Language"
+            return PlainTextResponse(str(self.num_calls), headers=headers)
+
+    serve.run(Model.bind())
+
+    # Responses marked as cacheable are answered by the proxy.
+    url = "http://localhost:8000/?cache=public"
+    assert requests.get(url).text == "1"
+    assert requests.get(url).text == "1"
+    assert requests.post(url, data=b"body").text == "2"
+    assert requests.post(url, data=b"body").text == "2"
+    assert requests.post(url, data=b"other body").text == "3"
+
+    # Requests with `Cache-Control: no-cache` bypass the cache.
+    headers = {"Cache-Control": "no-cache"}
+    assert requests.get(url, headers=headers).text == "4"
+    assert requests.get(url).text == "1"
+
+    # Other responses aren't cached.
+    assert requests.get("http://localhost:8000/").text == "5"
+    assert requests.get("http://localhost:8000/").text == "6"
+    url = "http://localhost:8000/?cache=vary"
+    assert requests.get(url).text == "7"
+    assert requests.get(url).text == "8"
+
+    # Only public responses are shared with requests that have credentials.
+    url = "http://localhost:8000/?cache=default"
+    assert requests.get(url, headers={"Authorization": "Bearer a"}).text == "9"
+    assert requests.get(url, headers={"Authorization": "Bearer b"}).text == "10"
+    assert requests.get(url).text == "11"
+    assert requests.get(url).text == "11"
+    assert requests.get(url, headers={"Authorization": "Bearer a"}).text == "12"
+    url = "http://localhost:8000/?cache=public"
+    assert requests.get(url, headers={"Authorization": "Bearer a"}).text == "1"
+    assert requests.get(url, headers={"Authorization": "Bearer b"}).text == "1"
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-v", "-s", __file__]))
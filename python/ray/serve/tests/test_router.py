@@ -10,7 +10,12 @@ import pytest
 import ray
 from ray._private.utils import get_or_create_event_loop
 from ray.serve._private.common import RunningReplicaInfo
-from ray.serve._private.router import Query, RoundRobinReplicaScheduler, RequestMetadata
+from ray.serve._private.router import (
+    PowerOfTwoChoicesReplicaScheduler,
+    Query,
+    RoundRobinReplicaScheduler,
+    RequestMetadata,
+)
 from ray._private.test_utils import SignalActor
 
 pytestmark = pytest.mark.asyncio
@@ -153,6 +158,191 @@ async def test_replica_scheduler(ray_instance):
     assert num_queries_set == {2, 1}
 
 
+async def test_power_of_two_choices_replica_scheduler(ray_instance, monkeypatch):
+    signal = SignalActor.remote()
+
+    @ray.remote(num_cpus=0)
+    class MockWorker:
+        _num_queries = 0
+
+        def __init__(self, queue_len):
+            self._queue_len = queue_len
+
+        @ray.method(num_returns=2)
+        async def handle_request(self, request):
+            self._num_queries += 1
+            await signal.wait.remote()
+            return self._queue_len, "DONE"
+
+        async def num_queries(self):
+            return self._num_queries
+
+    rs = PowerOfTwoChoicesReplicaScheduler(get_or_create_event_loop())
+    replicas = [
+        RunningReplicaInfo(
+            deployment_name="my_deployment",
+            replica_tag=str(i),
+            actor_handle=MockWorker.remote(queue_len),
+            max_concurrent_queries=2,
+            node_id=node_id,
+        )
+        for i, (node_id, queue_len) in enumerate(
+            [("remote-node-id", 0), (ray.get_runtime_context().get_node_id(), 10)]
+        )
+    ]
+    rs.update_running_replicas(replicas)
+
+    # The replicas are equally loaded, so the local one is chosen.
+    query = Query([], {}, RequestMetadata("request-id", "endpoint"))
+    refs = [await rs.assign_replica(query)]
+    assert len(rs.in_flight_queries[replicas[1]]) == 1
+
+    # The queries are then balanced across the replicas.
+    for _ in range(3):
+        refs.append(await rs.assign_replica(query))
+    assert len(rs.in_flight_queries[replicas[0]]) == 2
+    assert len(rs.in_flight_queries[replicas[1]]) == 2
+
+    # Both replicas are at max_concurrent_queries.
+    pending_task = get_or_create_event_loop().create_task(rs.assign_replica(query))
+    await asyncio.sleep(0.2)
+    assert not pending_task.done()
+
+    await signal.send.remote()
+    assert await asyncio.gather(*refs) == ["DONE"] * 4
+    assert await (await pending_task) == "DONE"
+
+    # The local replica reported queries of other handles, so the remote one is
+    # less loaded.
+    timeout_name = "ray.serve._private.router.RAY_SERVE_REPLICA_LOAD_REPORT_TIMEOUT_S"
+    monkeypatch.setattr(timeout_name, 60)
+    rs._drain_completed_object_refs()
+    assert rs._replica_load(replicas[0]) == 0
+    assert rs._replica_load(replicas[1]) > 0
+    assert rs._choose_replica(replicas) == replicas[0]
+
+    # The report is ignored once it's stale.
+    monkeypatch.setattr(timeout_name, 0)
+    assert rs._replica_load(replicas[1]) == 0
+    assert rs._choose_replica(replicas) == replicas[1]
+
+
+async def test_batched_request_tracking(ray_instance):
+    signal = SignalActor.remote()
+
+    @ray.remote(num_cpus=0)
+    class MockWorker:
+        def __init__(self):
+            self.completed = []
+            self.event = asyncio.Event()
+
+        async def handle_request_with_batched_tracking(
+            self, tracking_id, sequence_number, request
+        ):
+            await signal.wait.remote()
+            self.completed.append(sequence_number)
+            self.event.set()
+            return "DONE"
+
+        async def wait_for_completed_requests(self, tracking_id):
+            await self.event.wait()
+            self.event.clear()
+            completed, self.completed = self.completed, []
+            return completed, 0
+
+    rs = RoundRobinReplicaScheduler(
+        get_or_create_event_loop(), batched_request_tracking=True
+    )
+    replicas = [
+        RunningReplicaInfo(
+            deployment_name="my_deployment",
+            replica_tag=str(i),
+            actor_handle=MockWorker.remote(),
+            max_concurrent_queries=1,
+        )
+        for i in range(2)
+    ]
+    rs.update_running_replicas(replicas)
+
+    # The queries are tracked by sequence numbers instead of tracker refs.
+    query = Query([], {}, RequestMetadata("request-id", "endpoint"))
+    first_ref = await rs.assign_replica(query)
+    second_ref = await rs.assign_replica(query)
+    assert set().union(*rs.in_flight_queries.values()) == {0, 1}
+    assert len(rs.completion_refs) == 2
+
+    # Both replicas are at max_concurrent_queries.
+    third_ref_pending_task = get_or_create_event_loop().create_task(
+        rs.assign_replica(query)
+    )
+    await asyncio.sleep(0.2)
+    assert not third_ref_pending_task.done()
+
+    # The replicas report the completed queries, which unblocks the third one.
+    await signal.send.remote()
+    assert await first_ref == "DONE"
+    assert await second_ref == "DONE"
+    third_ref = await third_ref_pending_task
+    assert await third_ref == "DONE"
+
+    assert sum(len(queries) for queries in rs.in_flight_queries.values()) == 1
+    assert len(rs.completion_refs) == 1
+
+
+@pytest.mark.parametrize(
+    "scheduler_cls", [RoundRobinReplicaScheduler, PowerOfTwoChoicesReplicaScheduler]
+)
+async def test_prefer_local_routing(ray_instance, scheduler_cls):
+    signal = SignalActor.remote()
+
+    @ray.remote(num_cpus=0)
+    class MockWorker:
+        @ray.method(num_returns=2)
+        async def handle_request(self, request):
+            await signal.wait.remote()
+            return 0, "DONE"
+
+    rs = scheduler_cls(get_or_create_event_loop())
+    local_node_id = ray.get_runtime_context().get_node_id()
+    actor_handles = [MockWorker.remote() for _ in range(3)]
+
+    def get_replicas(prefer_local_routing):
+        return [
+            RunningReplicaInfo(
+                deployment_name="my_deployment",
+                replica_tag=str(i),
+                actor_handle=actor_handles[i],
+                max_concurrent_queries=2,
+                prefer_local_routing=prefer_local_routing,
+                node_id=node_id,
+            )
+            for i, node_id in enumerate(
+                ["remote-node-id", local_node_id, local_node_id]
+            )
+        ]
+
+    # The option is delivered with the running replicas, so it can be updated.
+    rs.update_running_replicas(get_replicas(False))
+    assert not rs._prefer_local_routing
+    replicas = get_replicas(True)
+    rs.update_running_replicas(replicas)
+    assert rs._prefer_local_routing
+
+    # The local replicas take queries until they're saturated.
+    query = Query([], {}, RequestMetadata("request-id", "endpoint"))
+    refs = [await rs.assign_replica(query) for _ in range(4)]
+    assert len(rs.in_flight_queries[replicas[0]]) == 0
+    assert len(rs.in_flight_queries[replicas[1]]) == 2
+    assert len(rs.in_flight_queries[replicas[2]]) == 2
+
+    # Then the queries spill over to the remote replica.
+    refs.append(await rs.assign_replica(query))
+    assert len(rs.in_flight_queries[replicas[0]]) == 1
+
+    await signal.send.remote()
+    assert await asyncio.gather(*refs) == ["DONE"] * 5
+
+
 if __name__ == "__main__":
     import sys
 
@@ -36,6 +36,7 @@ def test_get_locations(ray_start_regular):
         location = locations[obj_ref]
         assert location["object_size"] > sizes[idx]
         assert location["node_ids"] == [node_id]
+        assert not location["did_spill"]
 
 
 def test_get_locations_inlined(ray_start_regular):
@@ -1,4 +1,5 @@
 import argparse
+import time
 import numpy as np
 from typing import Optional, Union, List
 
@@ -39,6 +40,19 @@ def iter_torch_batches(
     return ds
 
 
+def iter_torch_batches_throughput(
+    ds: Dataset,
+    batch_size: Optional[int],
+    pin_memory: bool = False,
+) -> float:
+    """Return the throughput in GB/s of converting the dataset to tensors."""
+    num_bytes = 0
+    start_time = time.perf_counter()
+    for batch in ds.iter_torch_batches(batch_size=batch_size, pin_memory=pin_memory):
+        num_bytes += sum(t.numel() * t.element_size() for t in batch.values())
+    return num_bytes / 1e9 / (time.perf_counter() - start_time)
+
+
 def to_tf(
     ds: Dataset,
     feature_columns: Union[str, List[str]],
@@ -145,6 +159,30 @@ def run_iter_tensor_batches_benchmark(benchmark: Benchmark, data_size_gb: int):
             )
 
 
+def run_iter_torch_batches_throughput_benchmark(
+    benchmark: Benchmark, data_size_gb: int
+):
+    # Fixed-shape image tensors, which are converted from the Arrow buffers directly.
+    shape = (3, 224, 224)
+    num_rows = data_size_gb * 1024**3 // (np.prod(shape) * 4)
+    ds = ray.data.range_tensor(num_rows, shape=shape)
+    ds = ds.map_batches(
+        lambda batch: {"data": batch["data"].astype(np.float32)}
+    ).materialize()
+
+    for batch_size in [None, 32, 256]:
+        for pin_memory in [False, True]:
+            test_name = (
+                f"iter-torch-batches-throughput-{batch_size}-pin_memory-{pin_memory}"
+            )
+            print(f"Running case: {test_name}")
+            throughput = iter_torch_batches_throughput(
+                ds, batch_size=batch_size, pin_memory=pin_memory
+            )
+            benchmark.result[test_name] = {"throughput_gb_s": throughput}
+            print(f"Result of case {test_name}: {benchmark.result[test_name]}")
+
+
 if __name__ == "__main__":
     ray.init()
 
@@ -164,5 +202,6 @@ if __name__ == "__main__":
     benchmark = Benchmark("iter-tensor-batches")
 
     run_iter_tensor_batches_benchmark(benchmark, args.data_size_gb)
+    run_iter_torch_batches_throughput_benchmark(benchmark, args.data_size_gb)
 
     benchmark.write_result()